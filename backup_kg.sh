@@ -9,27 +9,41 @@ fi
 FUSEKI_URL="$1"
 DATASET_NAME="$2"
 BACKUP_DIR="knowledge_base/live_kg_backups"
-BACKUP_FILE="$BACKUP_DIR/backup_$(date +\%Y_\%m_\%d-\%H_\%M_\%S).nt.gz"
-KG_SNAPSHOT_FILE="$BACKUP_DIR/kg_snapshot_$(date +\%Y_\%m_\%d-\%H_\%M_\%S).txt"
-
-# construct URL for backup request
-BACKUP_URL="$FUSEKI_URL/$DATASET_NAME/data?graph=default"
-
-# trigger backup using curl and compress the result using gzip
-curl -H "Accept: application/n-triples" "$BACKUP_URL" | gzip > "$BACKUP_FILE"
-
-# check HTTP response code to ensure the backup was successful (200 OK)
-HTTP_STATUS=$(curl -s -o /dev/null -w "%{http_code}" "$BACKUP_URL")
-
-echo "HTTP status: $HTTP_STATUS"
+TIMESTAMP=$(date +\%Y_\%m_\%d-\%H_\%M_\%S)
+# max number of differential backups in a row before the next full backup (bounds the chain applied for a restore)
+MAX_DELTA_CHAIN=10
+KG_SNAPSHOT_FILE="$BACKUP_DIR/kg_snapshot_$TIMESTAMP.txt"
+
+# most recent previous backup (full or differential) and number of differential backups since the last full backup
+PREVIOUS_BACKUP=$(ls -t "$BACKUP_DIR"/backup_*.nt.gz "$BACKUP_DIR"/backup_*.delta.gz 2>/dev/null | head -n 1)
+DELTA_CHAIN=$(ls -t "$BACKUP_DIR"/backup_*.nt.gz "$BACKUP_DIR"/backup_*.delta.gz 2>/dev/null | awk '/\.nt\.gz$/ {exit} {n++} END {print n + 0}')
+
+# stream the KG in one request, compress it on the fly and check HTTP status, number of triples and checksums
+# (the backup is only kept if it is complete, checksum manifest: <backup>.manifest.json) - differential backups only
+# store the triples added / removed since the previous backup
+if [ -n "$PREVIOUS_BACKUP" ] && [ "$DELTA_CHAIN" -lt "$MAX_DELTA_CHAIN" ]; then
+  BACKUP_FILE="$BACKUP_DIR/backup_$TIMESTAMP.delta.gz"
+  python obd_ontology/backup.py backup --kg_url "$FUSEKI_URL" --dataset "$DATASET_NAME" --output "$BACKUP_FILE" --base "$PREVIOUS_BACKUP"
+else
+  BACKUP_FILE="$BACKUP_DIR/backup_$TIMESTAMP.nt.gz"
+  python obd_ontology/backup.py backup --kg_url "$FUSEKI_URL" --dataset "$DATASET_NAME" --output "$BACKUP_FILE"
+fi
 
-# check if file was successfully created
-if [ -s "$BACKUP_FILE" ]; then
+if [ $? -eq 0 ]; then
   echo "backup completed successfully"
 else
   echo "backup failed"
 fi
 
+# most recent previous snapshot - the sections of unchanged entities are reused (if it has a manifest)
+PREVIOUS_SNAPSHOT=$(ls -t "$BACKUP_DIR"/kg_snapshot_*.txt 2>/dev/null | head -n 1)
+
 echo "creating KG snapshot.."
-python obd_ontology/knowledge_snapshot.py --perspective expert >> "$KG_SNAPSHOT_FILE"
-python obd_ontology/knowledge_snapshot.py --perspective diag >> "$KG_SNAPSHOT_FILE"
+# both perspectives (expert and diag) in one run, i.e., the KG is fetched once
+if [ -n "$PREVIOUS_SNAPSHOT" ]; then
+  python obd_ontology/incremental_snapshot.py --kg_url "$FUSEKI_URL" --dataset "$DATASET_NAME" --perspective all \
+    --output "$KG_SNAPSHOT_FILE" --previous "$PREVIOUS_SNAPSHOT"
+else
+  python obd_ontology/incremental_snapshot.py --kg_url "$FUSEKI_URL" --dataset "$DATASET_NAME" --perspective all \
+    --output "$KG_SNAPSHOT_FILE"
+fi
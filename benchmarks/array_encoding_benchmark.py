@@ -0,0 +1,44 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# @author Tim Bohne
+
+import argparse
+import timeit
+
+import numpy as np
+
+from obd_ontology.array_codec import ARRAY_ENCODINGS, decode_array, encode_array
+
+
+def legacy_parse(literal: str) -> list:
+    """
+    Parses a decimal text literal the way the consumers of the time series did before the array codec.
+
+    :param literal: decimal text literal, e.g., "[13.3, 13.6, 14.6]"
+    :return: parsed values
+    """
+    return [float(val) for val in literal[1:-1].split(",")]
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Size, encoding and decoding time of the array literals in the KG')
+    parser.add_argument('--samples', type=int, default=50000, help='number of values of the synthetic time series')
+    parser.add_argument('--repeat', type=int, default=20, help='number of encodings / decodings per variant')
+    args = parser.parse_args()
+
+    # synthetic voltage signal (as recorded by the oscilloscope)
+    time_series = (12 + 2 * np.sin(np.linspace(0, 200, args.samples))
+                   + np.random.default_rng(42).normal(0, 0.1, args.samples)).tolist()
+    text_literal = encode_array(time_series)
+    decode_s = min(timeit.repeat(lambda: legacy_parse(text_literal), number=args.repeat, repeat=3)) / args.repeat
+    print(f"{'text (legacy parse)':<20} {len(text_literal):>10} chars | {'':<19} | decode: {decode_s * 1000:8.3f} ms")
+    for encoding in ARRAY_ENCODINGS:
+        for compress in ([False] if encoding == "text" else [False, True]):
+            literal = encode_array(time_series, encoding, compress)
+            encode_s = min(
+                timeit.repeat(lambda: encode_array(time_series, encoding, compress), number=args.repeat, repeat=3)
+            ) / args.repeat
+            decode_s = min(timeit.repeat(lambda: decode_array(literal), number=args.repeat, repeat=3)) / args.repeat
+            name = encoding + ("+zlib" if compress else "")
+            print(f"{name:<20} {len(literal):>10} chars | encode: {encode_s * 1000:8.3f} ms"
+                  f" | decode: {decode_s * 1000:8.3f} ms")
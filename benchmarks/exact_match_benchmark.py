@@ -0,0 +1,151 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# @author Tim Bohne
+
+import argparse
+import random
+from typing import Callable, Dict, Tuple
+
+from transport_benchmark import measure, report
+
+from obd_ontology.config import ONTOLOGY_PREFIX
+from obd_ontology.connection_controller import ConnectionController
+from obd_ontology.sparql_terms import sparql_literal
+
+RDF_TYPE = "<http://www.w3.org/1999/02/22-rdf-syntax-ns#type>"
+
+# lookup -> (legacy query with `FILTER(STR(?var) = ...)`, query with bound literal first, as emitted by the KG query
+# tool), `{value}` is the looked up value
+LOOKUPS: Dict[str, Tuple[str, str]] = {
+    "suspect component by name": (
+        """
+        SELECT ?comp WHERE {{
+            ?comp a <{onto}SuspectComponent> .
+            ?comp <{onto}component_name> ?comp_name .
+            FILTER(STR(?comp_name) = "{value}")
+        }}
+        """,
+        """
+        SELECT ?comp WHERE {{
+            ?comp <{onto}component_name> {literal} .
+            ?comp a <{onto}SuspectComponent> .
+        }}
+        """
+    ),
+    "channel by name": (
+        """
+        SELECT ?chan WHERE {{
+            ?chan a <{onto}Channel> .
+            ?chan <{onto}channel_name> ?chan_name .
+            FILTER(STR(?chan_name) = "{value}")
+        }}
+        """,
+        """
+        SELECT ?chan WHERE {{
+            ?chan <{onto}channel_name> {literal} .
+            ?chan a <{onto}Channel> .
+        }}
+        """
+    ),
+    "fault condition by DTC": (
+        """
+        SELECT ?condition_desc WHERE {{
+            ?dtc a <{onto}DTC> .
+            ?dtc <{onto}represents> ?condition .
+            ?dtc <{onto}code> ?dtc_code .
+            ?condition <{onto}condition_description> ?condition_desc .
+            FILTER(STR(?dtc_code) = "{value}")
+        }}
+        """,
+        """
+        SELECT ?condition_desc WHERE {{
+            ?dtc <{onto}code> {literal} .
+            ?dtc a <{onto}DTC> .
+            ?dtc <{onto}represents> ?condition .
+            ?condition <{onto}condition_description> ?condition_desc .
+        }}
+        """
+    )
+}
+# lookup -> function generating the looked up value of the i-th instance
+LOOKUP_VALUES: Dict[str, Callable[[int], str]] = {
+    "suspect component by name": lambda i: "comp_" + str(i),
+    "channel by name": lambda i: "chan_" + str(i),
+    "fault condition by DTC": lambda i: "P" + str(i).zfill(6)
+}
+
+
+def generate_instances(
+        connection: ConnectionController, first: int, num_of_instances: int, batch_size: int = 10000
+) -> None:
+    """
+    Enters synthetic DTCs (incl. fault conditions), suspect components and channels with the indices
+    `first`, ..., `num_of_instances - 1` into the KG.
+
+    :param connection: connection to the KG
+    :param first: index of the first instance to be generated
+    :param num_of_instances: number of instances per class (after the generation)
+    :param batch_size: number of instances per upload
+    """
+    onto = ONTOLOGY_PREFIX
+    for start in range(first, num_of_instances, batch_size):
+        lines = []
+        for i in range(start, min(start + batch_size, num_of_instances)):
+            lines += [
+                f"<{onto}dtc_{i}> {RDF_TYPE} <{onto}DTC> .",
+                f"<{onto}dtc_{i}> <{onto}code> {sparql_literal(LOOKUP_VALUES['fault condition by DTC'](i))} .",
+                f"<{onto}dtc_{i}> <{onto}represents> <{onto}fc_{i}> .",
+                f"<{onto}fc_{i}> {RDF_TYPE} <{onto}FaultCondition> .",
+                f"<{onto}fc_{i}> <{onto}condition_description> \"fault condition {i}\" .",
+                f"<{onto}comp_{i}> {RDF_TYPE} <{onto}SuspectComponent> .",
+                f"<{onto}comp_{i}> <{onto}component_name> "
+                f"{sparql_literal(LOOKUP_VALUES['suspect component by name'](i))} .",
+                f"<{onto}chan_{i}> {RDF_TYPE} <{onto}Channel> .",
+                f"<{onto}chan_{i}> <{onto}channel_name> {sparql_literal(LOOKUP_VALUES['channel by name'](i))} ."
+            ]
+        connection.backend.add("\n".join(lines).encode(), "application/n-triples")
+
+
+def benchmark_lookups(connection: ConnectionController, num_of_instances: int, num_of_queries: int) -> None:
+    """
+    Compares the latency of the `FILTER(STR(?var) = ...)` lookups to the bound-literal lookups.
+
+    :param connection: connection to the KG
+    :param num_of_instances: number of instances per class stored in the KG
+    :param num_of_queries: number of lookups per variant
+    """
+    for lookup, (filter_query, bound_query) in LOOKUPS.items():
+        values = [LOOKUP_VALUES[lookup](random.randrange(num_of_instances)) for _ in range(num_of_queries)]
+        for variant, template in [("FILTER(STR(?var) = ...)", filter_query), ("bound literal", bound_query)]:
+            queries = iter([
+                template.format(onto=ONTOLOGY_PREFIX, value=value, literal=sparql_literal(value)) for value in values
+            ])
+            latencies = measure(lambda: connection.query_knowledge_graph(next(queries), False), len(values))
+            report(lookup + " - " + variant, latencies)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Lookup latency: FILTER(STR(?var) = ...) vs. bound literals')
+    parser.add_argument('--sizes', type=str, default="10000,100000", help='comma-separated instances per class')
+    parser.add_argument('--queries', type=int, default=50, help='number of lookups per variant')
+    parser.add_argument(
+        '--kg_url', type=str, default=None, required=False,
+        help='base URL of an empty scratch KG (e.g., a dedicated Fuseki dataset) - synthetic instances are added to '
+             'it; by default, an embedded in-memory KG per size is used'
+    )
+    args = parser.parse_args()
+    random.seed(42)
+
+    num_of_generated = 0
+    for size in sorted(int(size) for size in args.sizes.split(",")):
+        if args.kg_url is None:
+            kg_url = "memory://exact_match_benchmark_" + str(size)
+            num_of_generated = 0
+        else:
+            # scratch KG is reused for all sizes - only the missing instances are added
+            kg_url = args.kg_url
+        connection = ConnectionController(namespace=ONTOLOGY_PREFIX, fuseki_url=kg_url)
+        print("\ngenerating", size, "DTCs / suspect components / channels in", kg_url, "..")
+        generate_instances(connection, num_of_generated, size)
+        num_of_generated = size
+        benchmark_lookups(connection, size, args.queries)
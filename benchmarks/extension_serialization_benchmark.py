@@ -0,0 +1,94 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# @author Tim Bohne
+
+import argparse
+import time
+from typing import Callable, List
+
+from rdflib import Graph, Literal, Namespace, RDF
+
+from obd_ontology.config import ONTOLOGY_PREFIX, EXTENSION_STREAM_CHUNK_BYTES
+from obd_ontology.connection_controller import ConnectionController
+from obd_ontology.fact import Fact
+from obd_ontology.ntriples import NTriplesStream
+
+
+def generate_facts(num_of_facts: int) -> List[Fact]:
+    """
+    Generates facts as entered by the ontology instance generator (instance type, property values and relations).
+
+    :param num_of_facts: number of facts to be generated
+    :return: generated facts
+    """
+    onto_namespace = Namespace(ONTOLOGY_PREFIX)
+    facts = []
+    for i in range(num_of_facts // 4 + 1):
+        instance = "oscillogram_classification_" + str(i)
+        facts += [
+            Fact((instance, RDF.type, onto_namespace["OscillogramClassification"].toPython())),
+            Fact((instance, onto_namespace.uncertainty, 0.45), property_fact=True),
+            Fact((instance, onto_namespace.model_id, "model_" + str(i % 10)), property_fact=True),
+            Fact((instance, onto_namespace.classifies, "oscillogram_" + str(i)))
+        ]
+    return facts[:num_of_facts]
+
+
+def turtle_body(connection: ConnectionController, facts: List[Fact]) -> int:
+    """
+    Serializes the facts the way `extend_knowledge_graph` did before the N-Triples stream, i.e., as Turtle via an
+    intermediate rdflib graph.
+
+    :param connection: connection controller (URI completion)
+    :param facts: facts to be serialized
+    :return: size (bytes) of the request body
+    """
+    graph = Graph()
+    for fact in facts:
+        if fact.property_fact:
+            graph.add((connection.get_uri(fact.triple[0]), connection.get_uri(fact.triple[1]), Literal(fact.triple[2])))
+        else:
+            graph.add(
+                (connection.get_uri(fact.triple[0]), connection.get_uri(fact.triple[1]),
+                 connection.get_uri(fact.triple[2]))
+            )
+    return len(graph.serialize(format="ttl").encode())
+
+
+def ntriples_body(connection: ConnectionController, facts: List[Fact]) -> int:
+    """
+    Serializes the facts as streamed N-Triples request body (as sent by `extend_knowledge_graph`).
+
+    :param connection: connection controller (fact serialization)
+    :param facts: facts to be serialized
+    :return: size (bytes) of the request body
+    """
+    return sum(len(chunk) for chunk in NTriplesStream(facts, connection.fact_to_ntriples, EXTENSION_STREAM_CHUNK_BYTES))
+
+
+def report(name: str, fn: Callable[[ConnectionController, List[Fact]], int], facts: List[Fact]) -> None:
+    """
+    Measures and prints the serialization time of the request body.
+
+    :param name: name of the measured variant
+    :param fn: function serializing the facts
+    :param facts: facts to be serialized
+    """
+    # new connection controller per variant - no cached IRI terms from previous runs
+    connection = ConnectionController(namespace=ONTOLOGY_PREFIX, fuseki_url="memory://serialization_benchmark")
+    start = time.perf_counter()
+    num_of_bytes = fn(connection, facts)
+    seconds = time.perf_counter() - start
+    print(f"{len(facts):>9} facts - {name:<20} {seconds:9.3f} s | {len(facts) / seconds:>10.0f} facts/s"
+          f" | {num_of_bytes / 1e6:8.1f} MB")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='KG extension body: Turtle via rdflib graph vs. streamed N-Triples')
+    parser.add_argument('--sizes', type=str, default="1000,100000,1000000", help='comma-separated numbers of facts')
+    args = parser.parse_args()
+
+    for size in [int(s) for s in args.sizes.split(",")]:
+        fact_list = generate_facts(size)
+        report("Turtle (rdflib)", turtle_body, fact_list)
+        report("N-Triples stream", ntriples_body, fact_list)
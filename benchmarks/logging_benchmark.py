@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# @author Tim Bohne
+
+import argparse
+import logging
+import os
+import time
+from typing import Callable
+
+from obd_ontology.component_knowledge import ComponentKnowledge
+from obd_ontology.dtc_knowledge import DTCKnowledge
+from obd_ontology.expert_knowledge_enhancer import ExpertKnowledgeEnhancer
+from obd_ontology.log import PACKAGE_LOGGER, set_log_level
+
+CHANNELS = ["chan0", "chan1", "chan2"]
+
+
+def component_knowledge(num_of_components: int) -> list:
+    """
+    Generates synthetic component knowledge.
+
+    :param num_of_components: number of components
+    :return: component knowledge
+    """
+    return [
+        ComponentKnowledge("C" + str(i), True, ["C" + str(j) for j in range(max(0, i - 3), i)], CHANNELS[:1], CHANNELS)
+        for i in range(num_of_components)
+    ]
+
+
+def dtc_knowledge(num_of_dtcs: int, num_of_components: int) -> list:
+    """
+    Generates synthetic DTC knowledge (each DTC with three suspect components).
+
+    :param num_of_dtcs: number of DTCs
+    :param num_of_components: number of components
+    :return: DTC knowledge
+    """
+    return [
+        DTCKnowledge(
+            "P" + str(i).zfill(4), [], "FC " + str(i % 7), ["S" + str(i % 4)],
+            ["C" + str((i + j) % num_of_components) for j in range(3)]
+        ) for i in range(num_of_dtcs)
+    ]
+
+
+def sequential_import(enhancer: ExpertKnowledgeEnhancer, num_of_components: int, num_of_dtcs: int) -> None:
+    """
+    Enters the synthetic knowledge entity by entity (queries + one upload per entity).
+
+    :param enhancer: expert knowledge enhancer
+    :param num_of_components: number of components
+    :param num_of_dtcs: number of DTCs
+    """
+    for chan in CHANNELS:
+        enhancer.add_channel_to_knowledge_graph(chan)
+    for comp in component_knowledge(num_of_components):
+        enhancer.add_component_to_knowledge_graph(
+            comp.suspect_component, comp.affected_by, comp.oscilloscope, comp.associated_chan, comp.chan_of_interest
+        )
+    for dtc in dtc_knowledge(num_of_dtcs, num_of_components):
+        enhancer.add_dtc_to_knowledge_graph(
+            dtc.dtc, dtc.occurs_with, dtc.fault_condition, dtc.symptoms, dtc.suspect_components
+        )
+
+
+def bulk_import(enhancer: ExpertKnowledgeEnhancer, num_of_components: int, num_of_dtcs: int) -> None:
+    """
+    Enters the synthetic knowledge via the bulk import.
+
+    :param enhancer: expert knowledge enhancer
+    :param num_of_components: number of components
+    :param num_of_dtcs: number of DTCs
+    """
+    enhancer.bulk_import(
+        channels=CHANNELS, components=component_knowledge(num_of_components),
+        dtcs=dtc_knowledge(num_of_dtcs, num_of_components)
+    )
+
+
+def report(name: str, fn: Callable[[ExpertKnowledgeEnhancer, int, int], None], level: str, num_of_components: int,
+           num_of_dtcs: int) -> None:
+    """
+    Measures and prints the duration of the import with the specified log level (fresh embedded KG per run).
+
+    :param name: name of the import variant
+    :param fn: import function
+    :param level: log level
+    :param num_of_components: number of components
+    :param num_of_dtcs: number of DTCs
+    """
+    set_log_level(level)
+    enhancer = ExpertKnowledgeEnhancer(kg_url="memory://logging_benchmark_" + name + "_" + level)
+    start = time.perf_counter()
+    fn(enhancer, num_of_components, num_of_dtcs)
+    seconds = time.perf_counter() - start
+    set_log_level("WARNING")
+    print(f"{name:<12} log level {level:<8} {seconds:8.2f} s")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Duration of expert knowledge imports per log level')
+    parser.add_argument('--components', type=int, default=200, help='number of synthetic components')
+    parser.add_argument('--dtcs', type=int, default=1000, help='number of synthetic DTCs')
+    parser.add_argument(
+        '--stdout', action='store_true', help='keep the log output (stderr, default: discarded via os.devnull)'
+    )
+    args = parser.parse_args()
+
+    if not args.stdout:
+        # formatting and writing costs are measured, but the terminal is not flooded
+        for handler in logging.getLogger(PACKAGE_LOGGER).handlers:
+            handler.setStream(open(os.devnull, "w"))
+    # warm-up (imports, query preparation, etc.) - not measured
+    sequential_import(ExpertKnowledgeEnhancer(kg_url="memory://logging_benchmark_warm_up"), 10, 10)
+    for import_name, import_fn in [("sequential", sequential_import), ("bulk", bulk_import)]:
+        for log_level in ["DEBUG", "INFO", "WARNING"]:
+            report(import_name, import_fn, log_level, args.components, args.dtcs)
@@ -0,0 +1,413 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# @author Tim Bohne
+
+import argparse
+import contextlib
+import glob
+import gzip
+import inspect
+import json
+import os
+import platform
+import random
+import re
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, Iterator, List, Tuple, Union
+
+from obd_ontology import knowledge_snapshot, query_catalogue
+from obd_ontology.backends import LocalGraphBackend, get_backend
+from obd_ontology.config import ONTOLOGY_PREFIX
+from obd_ontology.knowledge_graph_query_tool import KnowledgeGraphQueryTool
+from obd_ontology.query_metrics import get_query_metrics_registry
+from obd_ontology.sparql_template import SparqlTemplate
+
+# bundled KGs (relative to the repository root)
+KNOWLEDGE_BASE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "knowledge_base")
+DEFAULT_KGS = (
+        sorted(glob.glob(os.path.join(KNOWLEDGE_BASE, "knowledge_graphs", "*.nq.gz")))
+        + [os.path.join(KNOWLEDGE_BASE, "knowledge_graphs", "paper_kg.nt")]
+        + sorted(glob.glob(os.path.join(KNOWLEDGE_BASE, "live_kg_backups", "*.nt.gz")))
+)
+# realistic base of the synthetically scaled KGs - the largest live backup
+DEFAULT_SCALE_KG = os.path.join(KNOWLEDGE_BASE, "live_kg_backups", "backup_2024_01_10-16_34_51.nt.gz")
+
+ONTOLOGY_IRI = re.compile(r'<' + re.escape(ONTOLOGY_PREFIX) + r'([^>]*)>')
+RDF_TYPE = "<http://www.w3.org/1999/02/22-rdf-syntax-ns#type>"
+# properties identifying entities by name - their values get the suffix of the copy when the KG is scaled
+NAME_PROPERTIES = frozenset("<" + ONTOLOGY_PREFIX + prop + ">" for prop in (
+    "code", "component_name", "channel_name", "subsystem_name", "set_name", "condition_description",
+    "symptom_description", "category_description", "path_description", "model_id", "VIN"
+))
+# `VALUES ?var { $param }` clause of a template (list parameter)
+VALUES_CLAUSE = re.compile(r'VALUES\s+\?(\w+)\s*\{\s*\$(\w+)\s*\}')
+PROJECTION = re.compile(r'SELECT\s.*?\sWHERE', re.S)
+# max number of distinct parameter bindings a sampling query fetches (samples are drawn from them)
+MAX_CANDIDATES = 1000
+# max number of values bound to a list parameter (e.g., the DTC codes of `query_dtc_profiles`)
+MAX_LIST_VALUES = 10
+# relative slowdown of p50 / p95 (new vs. base run) considered a regression, differences below the noise floor (ms)
+# are ignored
+REGRESSION_THRESHOLD = 0.2
+NOISE_FLOOR_MS = 0.05
+
+
+def read_lines(path: str) -> Iterator[str]:
+    """
+    Reads the statements of the specified N-Triples / N-Quads file (optionally gzipped).
+
+    :param path: path of the KG file
+    :return: statements (lines)
+    """
+    with (gzip.open(path, "rt", encoding="utf-8") if path.endswith(".gz") else open(path, encoding="utf-8")) as f:
+        for line in f:
+            if line.strip() != "" and not line.startswith("#"):
+                yield line
+
+
+def scaled_statements(path: str, factor: int) -> Iterator[bytes]:
+    """
+    Generates `factor` disjoint copies of the instance data of the specified KG (synthetic scaling): in copy `k > 0`,
+    each instance IRI (subject of an `rdf:type` statement with an ontology class) and each name (`NAME_PROPERTIES`)
+    gets the suffix `_x<k>`, other literals are kept as they are and statements without instances (ontology axioms)
+    are only contained once.
+
+    :param path: path of the N-Triples / N-Quads file to be scaled
+    :param factor: number of copies
+    :return: N-Triples / N-Quads statements (chunks of lines)
+    """
+    instances = set()
+    for line in read_lines(path) if factor > 1 else []:
+        terms = line.split(" ", 3)
+        if len(terms) > 2 and terms[1] == RDF_TYPE and terms[2].startswith("<" + ONTOLOGY_PREFIX):
+            instances.add(terms[0][len(ONTOLOGY_PREFIX) + 1:-1])
+    for k in range(factor):
+        suffix = "_x" + str(k)
+        chunk = []
+        for line in read_lines(path):
+            if k == 0:
+                chunk.append(line)
+            else:
+                renamed = ONTOLOGY_IRI.sub(
+                    lambda m: "<" + ONTOLOGY_PREFIX + m.group(1) + suffix + ">" if m.group(1) in instances
+                    else m.group(0), line
+                )
+                if renamed != line:
+                    subj, pred, obj = renamed.split(" ", 2)
+                    if pred in NAME_PROPERTIES and obj.startswith('"'):
+                        # the literal is the last term apart from the (optional) graph IRI
+                        end = obj.rindex('"')
+                        renamed = subj + " " + pred + " " + obj[:end] + suffix + obj[end:]
+                    chunk.append(renamed)
+            if len(chunk) == 10000:
+                yield "".join(chunk).encode()
+                chunk = []
+        yield "".join(chunk).encode()
+
+
+def rss_mb() -> Union[float, None]:
+    """
+    Returns the current resident set size of the process (Linux only).
+
+    :return: resident set size (MB), None if not available
+    """
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 1e6
+    except (OSError, ValueError):
+        return None
+
+
+def load_kg(path: str, factor: int = 1) -> Tuple[str, Dict[str, Any]]:
+    """
+    Loads the specified KG (scaled by `factor`) into an embedded in-memory store.
+
+    :param path: path of the KG file (.nq, .nt, optionally gzipped)
+    :param factor: scale factor (number of copies of the instance data)
+    :return: (KG URL of the store, load statistics)
+    """
+    name = os.path.basename(path) + ("" if factor == 1 else "_x" + str(factor))
+    kg_url = "memory://benchmark_" + name
+    rss_before = rss_mb()
+    start = time.perf_counter()
+    backend = get_backend(kg_url)
+    media_type = LocalGraphBackend.get_file_format(path)[1]
+    for chunk in scaled_statements(path, factor):
+        backend.add(chunk, media_type)
+    load_seconds = time.perf_counter() - start
+    rss_after = rss_mb()
+    status, content = backend.query("SELECT (COUNT(*) AS ?n) WHERE { ?s ?p ?o }")
+    num_of_triples = int(json.loads(content)["results"]["bindings"][0]["n"]["value"])
+    return kg_url, {
+        "kg": name, "triples": num_of_triples, "load_seconds": load_seconds,
+        "store_rss_mb": None if rss_before is None else rss_after - rss_before
+    }
+
+
+def sampling_query(template: SparqlTemplate, params: List[str]) -> Tuple[str, Dict[str, str]]:
+    """
+    Derives a query for parameter bindings with non-empty results from the specified template, i.e., the parameters
+    become (projected) variables.
+
+    :param template: query catalogue template
+    :param params: template parameters to be sampled
+    :return: (sampling query, parameter -> variable)
+    """
+    text = template.text
+    variables = {param: var for var, param in VALUES_CLAUSE.findall(text)}
+    text = VALUES_CLAUSE.sub("", text)
+    for param in params:
+        if param not in variables:
+            variables[param] = "bench_" + param
+            text = re.sub(r'\$' + param + r'\b', "?" + variables[param], text)
+    projection = "SELECT DISTINCT " + " ".join("?" + variables[param] for param in params) + " WHERE"
+    text = PROJECTION.sub(lambda m: projection, text, count=1) + " LIMIT " + str(MAX_CANDIDATES)
+    return SparqlTemplate(text, namespace=template.namespace).bind(), variables
+
+
+def sample_arguments(qt: KnowledgeGraphQueryTool, method: str, num_of_samples: int) -> List[Tuple]:
+    """
+    Samples representative arguments for the specified query method, i.e., argument tuples the query has results for.
+
+    The method is called once with placeholder arguments to capture the query catalogue template it uses and which
+    argument is bound to which template parameter.
+
+    :param qt: KG query tool
+    :param method: name of the query method
+    :param num_of_samples: max number of argument tuples
+    :return: argument tuples (empty: no representative arguments)
+    """
+    params = [p for p in inspect.signature(getattr(qt, method)).parameters if p != "verbose"]
+    if len(params) == 0:
+        return [()]
+    placeholders = ["bench_arg_" + str(i) for i in range(len(params))]
+    captured = []
+    connection = qt.fuseki_connection
+    query_knowledge_graph = connection.query_knowledge_graph
+
+    def capture(query: str, verbose: bool) -> List[Dict]:
+        captured.append(query)
+        return query_knowledge_graph(query, verbose)
+
+    connection.query_knowledge_graph = capture
+    try:
+        getattr(qt, method)(*placeholders, verbose=False)
+    except Exception:
+        pass  # e.g., indexing of the (empty) result - the query is captured anyway
+    finally:
+        del connection.query_knowledge_graph
+    bound = next((q for q in captured if getattr(q, "name", None) is not None), None)
+    if bound is None:
+        return []
+    template = getattr(query_catalogue, bound.name)
+    # argument index -> template parameter
+    arg_params = {}
+    for idx, placeholder in enumerate(placeholders):
+        arg_params[idx] = next((p for p, value in bound.params.items() if value == placeholder), None)
+    if None in arg_params.values():
+        return []
+    query, variables = sampling_query(template, list(arg_params.values()))
+    status, content = connection.backend.query(query)
+    rows = json.loads(content)["results"]["bindings"]
+    if len(rows) == 0:
+        return []
+    random.shuffle(rows)
+    values = {}
+    for param in arg_params.values():
+        var = variables[param]
+        values[param] = [
+            row[var]["value"].split("#", 1)[1] if param in template.instance_params else row[var]["value"]
+            for row in rows
+        ]
+    list_params = {param for var, param in VALUES_CLAUSE.findall(template.text)}
+    samples = []
+    for row_idx in range(min(num_of_samples, len(rows))):
+        samples.append(tuple(
+            sorted(set(values[param]))[:MAX_LIST_VALUES] if param in list_params else values[param][row_idx]
+            for param in arg_params.values()
+        ))
+    return samples
+
+
+def measure(fn: Callable[[], Any], repeat: int) -> Dict[str, Any]:
+    """
+    Measures the latency of `repeat` calls of the specified function (plus the Python heap peak of one extra call).
+
+    :param fn: function to be measured
+    :param repeat: number of measured calls
+    :return: latency percentiles (ms), throughput (calls/s), Python heap peak (KB)
+    """
+    latencies = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        latencies.append((time.perf_counter() - start) * 1000)
+    # separate (unmeasured) call - tracing slows down the allocations
+    tracemalloc.start()
+    fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    latencies.sort()
+    return {
+        "calls": len(latencies), "p50_ms": statistics.median(latencies),
+        "p95_ms": latencies[min(len(latencies) - 1, int(round(0.95 * (len(latencies) - 1))))],
+        "mean_ms": statistics.fmean(latencies), "throughput_per_s": len(latencies) / (sum(latencies) / 1000),
+        "python_peak_kb": peak / 1024
+    }
+
+
+def benchmark_queries(qt: KnowledgeGraphQueryTool, num_of_samples: int, repeat: int) -> Iterator[Dict[str, Any]]:
+    """
+    Benchmarks every query method of the KG query tool with representative arguments.
+
+    :param qt: KG query tool
+    :param num_of_samples: number of argument tuples per method
+    :param repeat: number of calls per argument tuple
+    :return: result for each method
+    """
+    for method in sorted(name for name in dir(qt) if name.startswith("query_")):
+        result = {"benchmark": "query:" + method}
+        try:
+            samples = sample_arguments(qt, method, num_of_samples)
+            if len(samples) == 0:
+                yield {**result, "skipped": "no representative arguments in the KG"}
+                continue
+            calls = iter(samples * repeat)
+            fn = getattr(qt, method)
+            result.update(measure(lambda: fn(*next(calls), verbose=False), len(samples) * repeat - 1))
+        except Exception as e:
+            result["error"] = type(e).__name__ + ": " + str(e)[:200]
+        yield result
+
+
+def benchmark_snapshot(qt: KnowledgeGraphQueryTool, repeat: int) -> Iterator[Dict[str, Any]]:
+    """
+    Benchmarks every perspective of the knowledge snapshot (output discarded).
+
+    :param qt: KG query tool
+    :param repeat: number of snapshots per perspective
+    :return: result for each perspective
+    """
+    knowledge_snapshot.qt = qt
+    perspectives = sorted(
+        name for name, fn in inspect.getmembers(knowledge_snapshot, inspect.isfunction)
+        if name.startswith("knowledge_snapshot_") and name.endswith("_perspective")
+    )
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        for perspective in perspectives:
+            result = {"benchmark": "snapshot:" + perspective[len("knowledge_snapshot_"):-len("_perspective")]}
+            try:
+                result.update(measure(getattr(knowledge_snapshot, perspective), repeat))
+            except Exception as e:
+                result["error"] = type(e).__name__ + ": " + str(e)[:200]
+            yield result
+
+
+def run(args: argparse.Namespace) -> Dict[str, Any]:
+    """
+    Runs the benchmark suite on the specified (and scaled) KGs.
+
+    :param args: command line arguments
+    :return: benchmark results
+    """
+    random.seed(args.seed)
+    # slow queries are part of the results, not logged
+    get_query_metrics_registry().slow_query_threshold = None
+    kgs = [(path, 1) for path in args.kgs] + [(args.scale_kg, factor) for factor in args.scales]
+    results = []
+    for path, factor in kgs:
+        kg_url, kg_stats = load_kg(path, factor)
+        print(f"{kg_stats['kg']}: {kg_stats['triples']} triples, loaded in {kg_stats['load_seconds']:.2f} s",
+              file=sys.stderr)
+        qt = KnowledgeGraphQueryTool(kg_url=kg_url)
+        for result in benchmark_queries(qt, args.samples, args.repeat):
+            results.append({"kg": kg_stats["kg"], **result})
+        for result in benchmark_snapshot(qt, args.snapshot_repeat):
+            results.append({"kg": kg_stats["kg"], **result})
+            print(f"\t{result['benchmark']}: " + (
+                f"p50 {result['p50_ms']:.1f} ms" if "p50_ms" in result else result.get("error", "")
+            ), file=sys.stderr)
+        results.append({"kg": kg_stats["kg"], "benchmark": "load", **kg_stats})
+    return {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"), "python": platform.python_version(),
+            "platform": platform.platform(), "engine": LocalGraphBackend("memory://benchmark_engine").engine,
+            "samples": args.samples, "repeat": args.repeat, "snapshot_repeat": args.snapshot_repeat,
+            "seed": args.seed
+        },
+        "results": results
+    }
+
+
+def compare(base: Dict[str, Any], new: Dict[str, Any], threshold: float, noise_floor_ms: float) -> List[Dict]:
+    """
+    Compares two benchmark runs and determines the regressions (p50 or p95 slower than `threshold`).
+
+    :param base: results of the base run
+    :param new: results of the new run
+    :param threshold: relative slowdown considered a regression, e.g., 0.2 (20 %)
+    :param noise_floor_ms: absolute differences below this are ignored
+    :return: comparison for each benchmark contained in both runs
+    """
+    base_results = {(r["kg"], r["benchmark"]): r for r in base["results"] if "p50_ms" in r}
+    comparison = []
+    for r in new["results"]:
+        b = base_results.get((r["kg"], r["benchmark"]))
+        if b is None or "p50_ms" not in r:
+            continue
+        entry = {"kg": r["kg"], "benchmark": r["benchmark"], "regression": False}
+        for metric in ("p50_ms", "p95_ms"):
+            entry["base_" + metric], entry["new_" + metric] = b[metric], r[metric]
+            entry[metric[:3] + "_change"] = r[metric] / b[metric] - 1 if b[metric] > 0 else 0.0
+            if r[metric] - b[metric] > noise_floor_ms and entry[metric[:3] + "_change"] > threshold:
+                entry["regression"] = True
+        comparison.append(entry)
+    return comparison
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark suite for the query catalogue and the knowledge snapshot')
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    run_parser = subparsers.add_parser("run", help="run the benchmarks and write the results (JSON)")
+    run_parser.add_argument('--kgs', type=str, nargs="*", default=DEFAULT_KGS, help='KG files (.nq / .nt[.gz])')
+    run_parser.add_argument('--scale_kg', type=str, default=DEFAULT_SCALE_KG, help='base KG of the scaled KGs')
+    run_parser.add_argument(
+        '--scales', type=int, nargs="*", default=[2, 4], help='scale factors (copies of the instance data of scale_kg)'
+    )
+    run_parser.add_argument('--samples', type=int, default=5, help='argument tuples per query method')
+    run_parser.add_argument('--repeat', type=int, default=10, help='calls per argument tuple')
+    run_parser.add_argument('--snapshot_repeat', type=int, default=3, help='runs per snapshot perspective')
+    run_parser.add_argument('--seed', type=int, default=42, help='seed of the argument sampling')
+    run_parser.add_argument('--output', type=str, default=None, help='result file (default: stdout)')
+    compare_parser = subparsers.add_parser("compare", help="compare two result files and flag regressions")
+    compare_parser.add_argument('base', type=str, help='results of the base run')
+    compare_parser.add_argument('new', type=str, help='results of the new run')
+    compare_parser.add_argument('--threshold', type=float, default=REGRESSION_THRESHOLD, help='relative slowdown')
+    compare_parser.add_argument('--noise_floor_ms', type=float, default=NOISE_FLOOR_MS, help='ignored differences')
+    args = parser.parse_args()
+
+    if args.command == "run":
+        res = json.dumps(run(args), indent=1)
+        if args.output is None:
+            print(res)
+        else:
+            with open(args.output, "w") as out:
+                out.write(res)
+    else:
+        with open(args.base) as base_file, open(args.new) as new_file:
+            base_res, new_res = json.load(base_file), json.load(new_file)
+        for key in ("engine", "samples", "repeat", "snapshot_repeat", "seed"):
+            if base_res["meta"].get(key) != new_res["meta"].get(key):
+                print("warning: different " + key + " - " + str(base_res["meta"].get(key)) + " vs. "
+                      + str(new_res["meta"].get(key)))
+        comp = compare(base_res, new_res, args.threshold, args.noise_floor_ms)
+        regressions = [c for c in comp if c["regression"]]
+        for c in sorted(comp, key=lambda c: c["p50_change"], reverse=True):
+            print(f"{'REGRESSION' if c['regression'] else '':<10} {c['kg']:<40} {c['benchmark']:<70}"
+                  f" p50 {c['base_p50_ms']:9.3f} -> {c['new_p50_ms']:9.3f} ms ({c['p50_change']:+7.1%})"
+                  f" p95 {c['base_p95_ms']:9.3f} -> {c['new_p95_ms']:9.3f} ms ({c['p95_change']:+7.1%})")
+        print(str(len(regressions)) + " regression(s) in " + str(len(comp)) + " benchmarks")
+        sys.exit(1 if len(regressions) > 0 else 0)
@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# @author Tim Bohne
+
+import argparse
+import timeit
+from typing import Callable
+
+from obd_ontology import query_catalogue
+from obd_ontology.config import ONTOLOGY_PREFIX
+from obd_ontology.sparql_terms import sparql_iri, sparql_literal
+
+
+def complete_ontology_entry(entry: str) -> str:
+    """
+    Completes the ontology entry for the specified concept / relation (as the KG query tool did per query).
+
+    :param entry: ontology entry (concept / relation) to be completed
+    :return: completed ontology entry
+    """
+    return sparql_iri(ONTOLOGY_PREFIX.replace('#', '#' + entry))
+
+
+def legacy_priority_query(dtc: str, comp: str) -> str:
+    """
+    Constructs the priority query the way the KG query tool did before the query catalogue, i.e., completing every
+    ontology entry and formatting the whole query string per call (with escaped literals for a fair comparison).
+
+    :param dtc: diagnostic trouble code
+    :param comp: suspect component
+    :return: SPARQL query
+    """
+    dtc_entry = complete_ontology_entry('DTC')
+    diag_association_entry = complete_ontology_entry('DiagnosticAssociation')
+    suspect_component_entry = complete_ontology_entry('SuspectComponent')
+    code_entry = complete_ontology_entry('code')
+    has_association_entry = complete_ontology_entry('hasAssociation')
+    comp_name_entry = complete_ontology_entry('component_name')
+    points_to_entry = complete_ontology_entry('pointsTo')
+    prio_entry = complete_ontology_entry('priority_id')
+    dtc_literal = sparql_literal(dtc)
+    comp_literal = sparql_literal(comp)
+    return f"""
+        SELECT ?prio WHERE {{
+            ?dtc {code_entry} {dtc_literal} .
+            ?sus {comp_name_entry} {comp_literal} .
+            ?diag_association a {diag_association_entry} .
+            ?diag_association  {prio_entry} ?prio .
+            ?dtc a {dtc_entry} .
+            ?dtc {has_association_entry} ?diag_association .
+            ?sus a {suspect_component_entry} .
+            ?diag_association {points_to_entry} ?sus .
+        }}
+        """
+
+
+def legacy_date_query(diag_log_id: str) -> str:
+    """
+    Constructs the diag log date query the way the KG query tool did before the query catalogue.
+
+    :param diag_log_id: ID of the diag log instance
+    :return: SPARQL query
+    """
+    diag_log_entry = complete_ontology_entry('DiagLog')
+    date_entry = complete_ontology_entry('date')
+    id_entry = complete_ontology_entry(diag_log_id)
+    return f"""
+        SELECT ?date WHERE {{
+            {id_entry} a {diag_log_entry} .
+            {id_entry} {date_entry} ?date .
+        }}
+        """
+
+
+def report(name: str, fn: Callable[[], str], num_of_calls: int) -> None:
+    """
+    Measures and prints the mean construction time per query.
+
+    :param name: name of the measured variant
+    :param fn: function constructing one query
+    :param num_of_calls: number of constructed queries
+    """
+    seconds = min(timeit.repeat(fn, number=num_of_calls, repeat=5))
+    print(f"{name:<50} {seconds / num_of_calls * 1e6:7.2f} µs / query")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Query construction: per-call f-strings vs. prepared templates')
+    parser.add_argument('--calls', type=int, default=20000, help='number of constructed queries per variant')
+    args = parser.parse_args()
+
+    assert " ".join(legacy_date_query("diag_log_1").split()) \
+        == " ".join(query_catalogue.DATE_BY_DIAG_LOG.bind(diag_log_id="diag_log_1").split())
+    report("priority by DTC + component - f-string", lambda: legacy_priority_query("P0125", "Lambdasonde"), args.calls)
+    report(
+        "priority by DTC + component - template",
+        lambda: query_catalogue.PRIORITY_ID_BY_DTC_AND_SUS_COMP.bind(dtc="P0125", comp="Lambdasonde"), args.calls
+    )
+    report("date by diag log - f-string", lambda: legacy_date_query("diag_log_1"), args.calls)
+    report(
+        "date by diag log - template", lambda: query_catalogue.DATE_BY_DIAG_LOG.bind(diag_log_id="diag_log_1"),
+        args.calls
+    )
@@ -0,0 +1,106 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# @author Tim Bohne
+
+import argparse
+import json
+import statistics
+import threading
+import time
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from typing import Callable, List
+
+import requests
+
+from obd_ontology.config import ONTOLOGY_PREFIX, SPARQL_ENDPOINT
+from obd_ontology.connection_controller import ConnectionController
+
+QUERY = "SELECT ?s ?p ?o WHERE { ?s ?p ?o } LIMIT 25"
+EMPTY_RESULT = json.dumps({"head": {"vars": ["s", "p", "o"]}, "results": {"bindings": []}}).encode()
+
+
+class StandInSPARQLHandler(BaseHTTPRequestHandler):
+    """
+    Minimal local stand-in for the Fuseki SPARQL endpoint (HTTP/1.1, keep-alive), answering every query with an
+    empty result set.
+    """
+    protocol_version = "HTTP/1.1"
+    # headers and body are written separately - avoid the Nagle / delayed ACK stall on kept-alive connections
+    disable_nagle_algorithm = True
+
+    def do_POST(self) -> None:
+        """
+        Consumes the request body and answers with an empty SPARQL JSON result.
+        """
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.send_response(200)
+        self.send_header("Content-Type", "application/sparql-results+json")
+        self.send_header("Content-Length", str(len(EMPTY_RESULT)))
+        self.end_headers()
+        self.wfile.write(EMPTY_RESULT)
+
+    def log_message(self, *args) -> None:
+        """
+        Suppresses the per-request logging of the stand-in server.
+        """
+        pass
+
+
+def measure(fn: Callable[[], None], num_of_queries: int) -> List[float]:
+    """
+    Measures the latency of each of `num_of_queries` calls of the specified function.
+
+    :param fn: function sending one query
+    :param num_of_queries: number of queries to be sent
+    :return: latencies (ms)
+    """
+    latencies = []
+    for _ in range(num_of_queries):
+        start = time.perf_counter()
+        fn()
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+
+def report(name: str, latencies: List[float]) -> None:
+    """
+    Prints latency statistics.
+
+    :param name: name of the measured variant
+    :param latencies: measured latencies (ms)
+    """
+    latencies = sorted(latencies)
+    p95 = latencies[int(0.95 * (len(latencies) - 1))]
+    print(f"{name:<50} mean: {statistics.mean(latencies):7.3f} ms | p50: {statistics.median(latencies):7.3f} ms"
+          f" | p95: {p95:7.3f} ms")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Per-query latency: bare requests.post vs. pooled transport')
+    parser.add_argument('--queries', type=int, default=1000, help='number of queries per variant')
+    parser.add_argument(
+        '--kg_url', type=str, default=None, required=False,
+        help='URL of a running Fuseki server (if not specified, a local stand-in server is used)'
+    )
+    args = parser.parse_args()
+
+    server = None
+    kg_url = args.kg_url
+    if kg_url is None:
+        server = ThreadingHTTPServer(("127.0.0.1", 0), StandInSPARQLHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        kg_url = "http://127.0.0.1:" + str(server.server_address[1])
+    print("benchmarking against", kg_url, "-", args.queries, "queries per variant\n")
+
+    def bare_post() -> None:
+        requests.post(
+            kg_url + SPARQL_ENDPOINT, QUERY.encode(),
+            headers={'Content-Type': 'application/sparql-query', 'Accept': 'application/json'}
+        ).json()
+
+    connection = ConnectionController(namespace=ONTOLOGY_PREFIX, fuseki_url=kg_url)
+    report("bare requests.post (new connection)", measure(bare_post, args.queries))
+    report("pooled keep-alive transport", measure(lambda: connection.query_knowledge_graph(QUERY, False), args.queries))
+
+    if server is not None:
+        server.shutdown()
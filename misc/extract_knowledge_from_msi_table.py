@@ -9,7 +9,10 @@ from typing import List, Dict
 import numpy as np
 import pandas
 
-from obd_ontology.config import VALID_SPECIAL_CHARACTERS, DTC_REGEX
+from obd_ontology.backends import FILE_SCHEME, get_backend
+from obd_ontology.component_knowledge import ComponentKnowledge
+from obd_ontology.config import VALID_SPECIAL_CHARACTERS, DTC_REGEX, FUSEKI_URL
+from obd_ontology.dtc_knowledge import DTCKnowledge
 from obd_ontology.expert_knowledge_enhancer import ExpertKnowledgeEnhancer
 
 EXPERT_KNOWLEDGE_ENHANCER = ExpertKnowledgeEnhancer()
@@ -107,24 +110,21 @@ def remove_invalid_characters(item: str) -> str:
     return temp_item
 
 
-def add_components_to_knowledge_graph(dtc_dict: Dict[str, List]) -> None:
+def extract_component_knowledge(dtc_dict: Dict[str, List]) -> List[ComponentKnowledge]:
     """
-    Extracts all components from the DTC dictionary and adds them to the knowledge graph.
+    Extracts all components from the DTC dictionary.
 
     :param dtc_dict: dictionary with DTCs as keys and a list containing fault condition and tuples of position
     (priority of the component) and component as values, e.g., [fault_cond, (1, comp1), (2, comp2)]
+    :return: knowledge of the components to be added to the knowledge graph
     """
-    counter = 0
     all_comps = []
     for dtc_data in dtc_dict.values():
         if len(dtc_data) > 1:
             for comp_tuple in dtc_data[1:]:
                 all_comps.append(comp_tuple[1])
     all_comps = set(all_comps)
-    for comp in all_comps:
-        EXPERT_KNOWLEDGE_ENHANCER.add_component_to_knowledge_graph(comp, [], False)
-        counter += 1
-    print("Added {} components to the knowledge graph.".format(counter))
+    return [ComponentKnowledge(suspect_component=comp, oscilloscope=False, affected_by=[]) for comp in all_comps]
 
 
 def remove_duplicates_from_list(some_list: List[str]) -> List[str]:
@@ -141,16 +141,15 @@ def remove_duplicates_from_list(some_list: List[str]) -> List[str]:
     return list_without_duplicates
 
 
-def add_dtcs_to_knowledge_graph(dtc_dict: Dict[str, List]) -> None:
+def extract_dtc_knowledge(dtc_dict: Dict[str, List]) -> List[DTCKnowledge]:
     """
-    Adds DTCs from the DTC dictionary to the knowledge graph.
-
-    Only DTCs with a fault condition and at least one linked component are added.
+    Extracts the DTCs (incl. fault condition and ordered suspect components) from the DTC dictionary.
 
     :param dtc_dict: dictionary with DTCs as keys and a list containing fault condition and tuples of position
     (priority of the component) and component as values, e.g., [fault_cond, (1, comp1), (2, comp2)]
+    :return: knowledge of the DTCs to be added to the knowledge graph
     """
-    counter = 0
+    dtc_knowledge = []
     for dtc in dtc_dict:
         dtc_data = dtc_dict[dtc]
         fault_cond = dtc_data[0]
@@ -161,15 +160,28 @@ def add_dtcs_to_knowledge_graph(dtc_dict: Dict[str, List]) -> None:
             ordered_components = remove_duplicates_from_list(ordered_components)
         else:
             ordered_components = []
-        EXPERT_KNOWLEDGE_ENHANCER.add_dtc_to_knowledge_graph(dtc, [], fault_cond, [], ordered_components)
-        counter += 1
-    print("Added {} DTCs to the knowledge graph.".format(counter))
+        dtc_knowledge.append(DTCKnowledge(
+            dtc=dtc, occurs_with=[], fault_condition=fault_cond, symptoms=[], suspect_components=ordered_components
+        ))
+    return dtc_knowledge
 
 
 if __name__ == '__main__':
     parser = argparse.ArgumentParser()
     parser.add_argument('--file_path', type=str, help='path to the excel file', required=True)
+    parser.add_argument(
+        '--kg_url', type=str, default=FUSEKI_URL, required=False,
+        help='URL of the KG server or embedded KG file (file://<path>.nq.gz)'
+    )
     args = parser.parse_args()
+    EXPERT_KNOWLEDGE_ENHANCER = ExpertKnowledgeEnhancer(kg_url=args.kg_url)
     dtc_dict = create_dtc_dictionary(args.file_path)
-    add_components_to_knowledge_graph(dtc_dict)
-    add_dtcs_to_knowledge_graph(dtc_dict)
+    # components and DTCs are imported as one batch (components precede the DTCs referring to them)
+    component_knowledge = extract_component_knowledge(dtc_dict)
+    dtc_knowledge = extract_dtc_knowledge(dtc_dict)
+    EXPERT_KNOWLEDGE_ENHANCER.bulk_import(components=component_knowledge, dtcs=dtc_knowledge)
+    print("Added {} components and {} DTCs to the knowledge graph.".format(
+        len(component_knowledge), len(dtc_knowledge)
+    ))
+    if args.kg_url.startswith(FILE_SCHEME):
+        get_backend(args.kg_url).save()
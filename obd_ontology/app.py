@@ -2,12 +2,13 @@
 # -*- coding: utf-8 -*-
 # @author Patricia Windler, Tim Bohne
 
+import hmac
 import logging
 import os
 import re
 from typing import List, Union
 
-from flask import Flask, render_template, redirect, flash, url_for, session, jsonify, wrappers
+from flask import Flask, render_template, redirect, flash, url_for, session, jsonify, wrappers, request, abort
 from flask_wtf.csrf import CSRFProtect
 
 from obd_ontology.app_classes import SuspectComponentsForm, DTCForm, ComponentSetForm
@@ -15,6 +16,8 @@ from obd_ontology.config import VALID_SPECIAL_CHARACTERS, DTC_REGEX
 from obd_ontology.expert_knowledge_enhancer import ExpertKnowledgeEnhancer
 from obd_ontology.fact import Fact
 from obd_ontology.knowledge_graph_query_tool import KnowledgeGraphQueryTool
+from obd_ontology.log import get_logger
+from obd_ontology.query_metrics import get_query_metrics_registry
 from obd_ontology.util import make_tuple_list
 
 app = Flask(
@@ -26,6 +29,8 @@ app = Flask(
 CERT_FILE = os.getenv('CERT_FILE')
 KEY_FILE = os.getenv('KEY_FILE')
 CONTEXT = (CERT_FILE, KEY_FILE) if CERT_FILE and KEY_FILE else 'adhoc'
+# token for the admin endpoints (`Authorization: Bearer <token>`), if not set, the admin endpoints are disabled
+ADMIN_TOKEN = os.getenv('ADMIN_TOKEN')
 
 app.config['SECRET_KEY'] = os.getenv('SECRET_KEY', 'for dev')
 # transmit cookies via HTTPS
@@ -38,8 +43,10 @@ csrf = CSRFProtect(app)
 csrf.init_app(app)
 
 logging.basicConfig(level=logging.ERROR)
+logger = get_logger(__name__)
 
-KG_QUERY_TOOL = KnowledgeGraphQueryTool()
+# expert knowledge changes rarely - cached query results are invalidated by the enhancer's KG modifications
+KG_QUERY_TOOL = KnowledgeGraphQueryTool(use_cache=True)
 EXPERT_KNOWLEDGE_ENHANCER = ExpertKnowledgeEnhancer()
 
 
@@ -60,6 +67,33 @@ def get_session_values() -> wrappers.Response:
     })
 
 
+def check_admin_access() -> None:
+    """
+    Aborts the request if it is not authorized to access the admin endpoints (403) or if they are disabled, i.e.,
+    no `ADMIN_TOKEN` is configured (404) - the client address is no proof of authorization, e.g., behind a reverse
+    proxy, all requests come from localhost.
+    """
+    if not ADMIN_TOKEN:
+        abort(404)
+    if not hmac.compare_digest(request.headers.get('Authorization', ''), 'Bearer ' + ADMIN_TOKEN):
+        abort(403)
+
+
+@app.route('/admin/query_metrics')
+def get_query_metrics() -> wrappers.Response:
+    """
+    Exposes the query metrics (per named KG query) and the recent slow queries of the process - as JSON or, with
+    `?format=prometheus`, in the Prometheus text format.
+
+    :return: query metrics response
+    """
+    check_admin_access()
+    registry = get_query_metrics_registry()
+    if request.args.get('format') == 'prometheus':
+        return app.response_class(registry.to_prometheus(), content_type='text/plain; version=0.0.4; charset=utf-8')
+    return app.response_class(registry.to_json(), mimetype='application/json')
+
+
 def get_session_variable_list(name: str) -> List[str]:
     """
     Returns the session variable for a given name, or, if not existent, an empty list. It is expected to be only used
@@ -295,7 +329,7 @@ def dtc_sanity_check(dtc: str) -> bool:
     :return whether the specified DTC matches the pattern
     """
     pattern = re.compile(DTC_REGEX)
-    print("match:", pattern.match(dtc))
+    logger.debug("match: %s", pattern.match(dtc))
     return pattern.match(dtc) and len(dtc) == 5
 
 
@@ -385,9 +419,9 @@ def add_diagnostic_association_removal_facts(dtc_name: str, facts_to_be_removed:
             comp, subsystem_name, False
         )
         if len(dtcs_associated_with_comp) > 1:
-            print("there is at least one other DTC causing the `contains` relation, not removing it..")
+            logger.info("there is at least one other DTC causing the `contains` relation, not removing it..")
         else:
-            print("there is no other DTC causing the `contains` relation, removing it..")
+            logger.info("there is no other DTC causing the `contains` relation, removing it..")
             subsystem_uuid = KG_QUERY_TOOL.query_vehicle_subsystem_by_name(subsystem_name)[0].split("#")[1]
             facts_to_be_removed.append(EXPERT_KNOWLEDGE_ENHANCER.generate_contains_fact(
                 subsystem_uuid, comp_uuid, False
@@ -658,19 +692,16 @@ def display_dtc_info(form: DTCForm) -> None:
     if existing_dtc is None:
         flash("Keine Daten verfügbar")
     else:
-        session["occurs_with_list"] = KG_QUERY_TOOL.query_co_occurring_trouble_codes(existing_dtc)
-        suspect_components = KG_QUERY_TOOL.query_suspect_components_by_dtc(existing_dtc, False)
-        ordered_sus_comp = {
-            int(KG_QUERY_TOOL.query_priority_id_by_dtc_and_sus_comp(existing_dtc, comp, False)[0]):
-                comp for comp in suspect_components
-        }
-        session["component_list"] = [ordered_sus_comp[i] for i in range(len(suspect_components))]
-        session["symptom_list"] = KG_QUERY_TOOL.query_symptoms_by_dtc(existing_dtc)
+        profiles = KG_QUERY_TOOL.query_dtc_profiles([existing_dtc], False)
+        if len(profiles) == 0:
+            flash("Keine Daten verfügbar")
+            return
+        profile = profiles[0]
+        session["occurs_with_list"] = profile.occurs_with
+        session["component_list"] = [comp.name for comp in profile.suspect_components]
+        session["symptom_list"] = profile.symptoms
         form.dtc_name.data = existing_dtc
-        try:
-            form.fault_condition.data = KG_QUERY_TOOL.query_fault_condition_by_dtc(existing_dtc)[0]
-        except IndexError:
-            form.fault_condition.data = ""
+        form.fault_condition.data = profile.fault_condition
 
 
 def reset_dtc_warning(form: DTCForm) -> None:
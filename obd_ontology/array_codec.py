@@ -0,0 +1,136 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# @author Tim Bohne
+
+import base64
+import re
+import zlib
+from typing import List, Union
+
+import numpy as np
+
+# encoding -> (little-endian) dtype of the binary encodings, "text" is the legacy decimal text literal, e.g.,
+# "[13.3, 13.6, 14.6]"
+ARRAY_DTYPES = {"float32": np.dtype("<f4"), "float16": np.dtype("<f2")}
+ARRAY_ENCODINGS = ("text",) + tuple(ARRAY_DTYPES)
+# format marker of binary encoded literals, e.g., "float32+zlib;base64,<payload>"
+BINARY_LITERAL = re.compile(r'(float32|float16)(\+zlib)?;base64,')
+# footer of legacy literals stored as pandas Series representation, e.g., "0    13.3\n1    13.6\nName: Kanal A, dtype:
+# float64" - long series are truncated in this representation ("...", only the first and last values are stored)
+PANDAS_SERIES_FOOTER = re.compile(r'(?:Name: (.*?), )?(?:Length: (\d+), )?dtype: \w+$')
+
+
+class TruncatedArrayError(ValueError):
+    """
+    Raised for array literals that do not contain all values of the array (legacy pandas Series representation).
+    """
+
+
+def encode_array(values: Union[List[float], np.ndarray], encoding: str = "text", compress: bool = False) -> str:
+    """
+    Encodes the specified array (e.g., time series, heatmap) as string literal to be stored in the KG.
+
+    The binary encodings store the base64 encoded little-endian values (optionally zlib compressed), prefixed by a
+    format marker - about 4 (float32) or 2 (float16) characters per value instead of the ~20 characters of the
+    decimal text representation.
+
+    :param values: array to be encoded
+    :param encoding: "text" (legacy decimal text literal) | "float32" | "float16"
+    :param compress: whether the binary representation should be zlib compressed (ignored for "text")
+    :return: encoded literal
+    """
+    if encoding == "text":
+        # via `tolist` - NumPy scalars (e.g., in lists of np.float64) would otherwise be printed as "np.float64(...)"
+        return str(np.asarray(values).tolist())
+    if encoding not in ARRAY_DTYPES:
+        raise ValueError("unknown array encoding: " + encoding + " - expected one of " + str(ARRAY_ENCODINGS))
+    payload = np.ascontiguousarray(values, dtype=ARRAY_DTYPES[encoding]).tobytes()
+    if compress:
+        payload = zlib.compress(payload)
+    return encoding + ("+zlib" if compress else "") + ";base64," + base64.b64encode(payload).decode("ascii")
+
+
+def encode_arrays(values: np.ndarray, encoding: str = "text", compress: bool = False) -> List[str]:
+    """
+    Encodes each row of the specified two-dimensional array (e.g., parallel recorded time series) as string literal.
+    The array is converted to the target dtype once, the rows are encoded from the converted buffer.
+
+    :param values: array to be encoded (one row per literal)
+    :param encoding: "text" (legacy decimal text literal) | "float32" | "float16"
+    :param compress: whether the binary representation should be zlib compressed (ignored for "text")
+    :return: encoded literal for each row
+    """
+    if encoding == "text":
+        return [str(row) for row in np.asarray(values).tolist()]
+    if encoding not in ARRAY_DTYPES:
+        raise ValueError("unknown array encoding: " + encoding + " - expected one of " + str(ARRAY_ENCODINGS))
+    values = np.ascontiguousarray(values, dtype=ARRAY_DTYPES[encoding])
+    marker = encoding + ("+zlib" if compress else "") + ";base64,"
+    literals = []
+    for row in values:
+        payload = zlib.compress(row.tobytes()) if compress else row.tobytes()
+        literals.append(marker + base64.b64encode(payload).decode("ascii"))
+    return literals
+
+
+def decode_array(literal: str) -> np.ndarray:
+    """
+    Decodes the specified array literal - binary encoded as well as legacy decimal text literals (and legacy pandas
+    Series representations, see `decode_pandas_series`).
+
+    :param literal: encoded array literal (as stored in the KG)
+    :return: decoded array (float32 / float16 for binary literals, float64 for text literals)
+    """
+    marker = BINARY_LITERAL.match(literal)
+    if marker is None and "\n" in literal:
+        return decode_pandas_series(literal)
+    if marker is None:
+        values = literal.strip().strip("[]")
+        if values.strip() == "":
+            return np.empty(0)
+        return np.array(values.split(","), dtype=float)
+    payload = base64.b64decode(literal[marker.end():])
+    if marker.group(2) is not None:
+        payload = zlib.decompress(payload)
+    return np.frombuffer(payload, dtype=ARRAY_DTYPES[marker.group(1)])
+
+
+def decode_pandas_series(literal: str) -> np.ndarray:
+    """
+    Decodes the specified legacy literal stored as pandas Series representation (one "<index> <value>" line per
+    value, followed by a "Name: ..., dtype: ..." footer).
+
+    :param literal: pandas Series representation
+    :return: decoded array (float64)
+    """
+    lines = literal.strip().split("\n")
+    footer = PANDAS_SERIES_FOOTER.match(lines[-1].strip())
+    if footer is None:
+        raise ValueError("unknown array literal format: " + literal[:100])
+    lines = lines[:-1]
+    if any(line.strip() == "..." for line in lines):
+        name = "" if footer.group(1) is None else " of '" + footer.group(1) + "'"
+        length = "" if footer.group(2) is None else " of " + footer.group(2)
+        raise TruncatedArrayError(
+            "array literal truncated - legacy pandas Series representation" + name + " only contains "
+            + str(len(lines) - 1) + length + " values"
+        )
+    return np.array([line.split()[-1] for line in lines], dtype=float)
+
+
+def is_binary_array_literal(literal: str) -> bool:
+    """
+    Checks whether the specified literal is a binary encoded array.
+
+    :param literal: literal to be checked
+    :return: whether it's a binary encoded array
+    """
+    return BINARY_LITERAL.match(literal) is not None
+
+
+if __name__ == '__main__':
+    time_series = [13.3, 13.6, 14.6, 16.7, 8.5, 9.7, 5.5, 3.6, 12.5, 12.7]
+    for enc in ARRAY_ENCODINGS:
+        for comp in (False, True):
+            lit = encode_array(time_series, enc, comp)
+            print(enc, comp, len(lit), lit, decode_array(lit))
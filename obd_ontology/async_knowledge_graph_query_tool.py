@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# @author Tim Bohne
+
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Coroutine
+
+from obd_ontology.config import FUSEKI_URL, ASYNC_MAX_CONCURRENCY
+from obd_ontology.knowledge_graph_query_tool import KnowledgeGraphQueryTool
+
+
+class AsyncKnowledgeGraphQueryTool:
+    """
+    Asynchronous counterpart of the `KnowledgeGraphQueryTool`.
+
+    Each `query_*` method of the KG query tool is available as coroutine with the same signature, so that independent
+    lookups (e.g., per DTC or per component) can be awaited concurrently via `asyncio.gather`. The queries are executed
+    by the synchronous tool on a bounded pool of worker threads sharing the pooled keep-alive transport, i.e., the SPARQL
+    queries and the response processing are exactly those of the `KnowledgeGraphQueryTool`.
+    """
+
+    def __init__(self, kg_url: str = FUSEKI_URL, max_concurrency: int = ASYNC_MAX_CONCURRENCY) -> None:
+        """
+        Initializes the async KG query tool.
+
+        :param kg_url: URL of the server hosting the knowledge graph
+        :param max_concurrency: max number of concurrently executed queries
+        """
+        self.query_tool = KnowledgeGraphQueryTool(kg_url=kg_url)
+        self.executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="kg_query")
+
+    async def run(self, fn: Callable, *args, **kwargs) -> Any:
+        """
+        Executes the specified blocking function on the worker pool.
+
+        :param fn: function to be executed
+        :return: result of the function
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, functools.partial(fn, *args, **kwargs))
+
+    def close(self) -> None:
+        """
+        Shuts down the worker pool.
+        """
+        self.executor.shutdown(wait=True)
+
+
+def make_async_query(name: str) -> Callable[..., Coroutine]:
+    """
+    Creates the coroutine counterpart of the specified `KnowledgeGraphQueryTool` method.
+
+    :param name: name of the query method
+    :return: coroutine function
+    """
+
+    @functools.wraps(getattr(KnowledgeGraphQueryTool, name))
+    async def async_query(self: AsyncKnowledgeGraphQueryTool, *args, **kwargs) -> Any:
+        return await self.run(getattr(self.query_tool, name), *args, **kwargs)
+
+    return async_query
+
+
+for query_name in dir(KnowledgeGraphQueryTool):
+    if query_name.startswith("query_"):
+        setattr(AsyncKnowledgeGraphQueryTool, query_name, make_async_query(query_name))
+
+
+if __name__ == '__main__':
+    async def main() -> None:
+        async_qt = AsyncKnowledgeGraphQueryTool()
+        dtcs = await async_qt.query_all_dtc_instances(False)
+        # independent per-DTC lookups are sent concurrently
+        fault_conditions = await asyncio.gather(*[async_qt.query_fault_condition_by_dtc(dtc, False) for dtc in dtcs])
+        for dtc, fault_cond in zip(dtcs, fault_conditions):
+            print(dtc, "-->", fault_cond)
+        async_qt.close()
+
+    asyncio.run(main())
@@ -0,0 +1,371 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# @author Tim Bohne
+
+import gzip
+import os
+import threading
+from typing import Dict, Iterable, Iterator, Tuple, Union
+
+from rdflib import ConjunctiveGraph, Literal
+
+from obd_ontology.config import LOCAL_KG_ENGINE, SPARQL_ENDPOINT, DATA_ENDPOINT, UPDATE_ENDPOINT, DUMP_CHUNK_BYTES
+from obd_ontology.http_transport import PooledTransport, get_shared_transport
+from obd_ontology.ntriples import serialize_rdflib_literal
+
+MEMORY_SCHEME = "memory://"
+FILE_SCHEME = "file://"
+# file extension (without ".gz") -> (rdflib format, media type)
+RDF_FILE_FORMATS = {
+    ".nq": ("nquads", "application/n-quads"),
+    ".nt": ("nt", "application/n-triples"),
+    ".ttl": ("turtle", "text/turtle")
+}
+
+
+class KnowledgeGraphBackend:
+    """
+    Interface of the stores the `ConnectionController` can operate on.
+
+    Every backend accepts SPARQL queries (answered in the SPARQL 1.1 JSON results format), RDF data to be added and
+    SPARQL updates, and reports the outcome of each operation as HTTP status code.
+    """
+
+    def query(self, query: str) -> Tuple[int, bytes]:
+        """
+        Executes the specified SPARQL query.
+
+        :param query: SPARQL query
+        :return: (status code, query results in the SPARQL JSON format)
+        """
+        raise NotImplementedError
+
+    def add(self, data: Union[bytes, Iterable[bytes]], content_type: str) -> int:
+        """
+        Adds the specified RDF data to the knowledge graph.
+
+        :param data: serialized RDF data (or chunks of it, e.g., `NTriplesStream`)
+        :param content_type: media type of the serialization, e.g., `text/turtle`
+        :return: status code
+        """
+        raise NotImplementedError
+
+    def update(self, update: str) -> int:
+        """
+        Executes the specified SPARQL update.
+
+        :param update: SPARQL update
+        :return: status code
+        """
+        raise NotImplementedError
+
+    def dump(self, chunk_bytes: int = DUMP_CHUNK_BYTES) -> Tuple[int, Iterator[bytes]]:
+        """
+        Streams the default graph of the knowledge graph as N-Triples.
+
+        :param chunk_bytes: (approximate) size of the chunks
+        :return: (status code, N-Triples chunks)
+        """
+        raise NotImplementedError
+
+
+class FusekiBackend(KnowledgeGraphBackend):
+    """
+    Knowledge graph hosted by an 'Apache Jena Fuseki' server, accessed via the pooled HTTP transport.
+    """
+
+    def __init__(self, transport: PooledTransport, dataset: Union[str, None] = None) -> None:
+        """
+        Initializes the Fuseki backend.
+
+        :param transport: pooled transport for the communication with the server
+        :param dataset: name of the dataset hosting the KG, e.g., `OBD` (None: endpoints configured in `config.py`)
+        """
+        self.transport = transport
+        if dataset is None:
+            self.sparql_endpoint, self.data_endpoint, self.update_endpoint = \
+                SPARQL_ENDPOINT, DATA_ENDPOINT, UPDATE_ENDPOINT
+        else:
+            self.sparql_endpoint, self.data_endpoint, self.update_endpoint = \
+                "/" + dataset + "/sparql", "/" + dataset + "/data", "/" + dataset + "/update"
+
+    def query(self, query: str) -> Tuple[int, bytes]:
+        """
+        Sends the specified SPARQL query to the query endpoint of the server.
+
+        :param query: SPARQL query
+        :return: (HTTP status code, query results in the SPARQL JSON format)
+        """
+        res = self.transport.post(
+            self.sparql_endpoint, query.encode(),
+            headers={'Content-Type': 'application/sparql-query', 'Accept': 'application/json'}, read_only=True
+        )
+        return res.status_code, res.content
+
+    def add(self, data: Union[bytes, Iterable[bytes]], content_type: str) -> int:
+        """
+        Sends the specified RDF data to the data endpoint of the server (chunks are streamed, i.e., sent with chunked
+        transfer encoding).
+
+        :param data: serialized RDF data (or chunks of it, e.g., `NTriplesStream`)
+        :param content_type: media type of the serialization, e.g., `text/turtle`
+        :return: HTTP status code
+        """
+        return self.transport.post(
+            self.data_endpoint, data=data, headers={'Content-Type': content_type}
+        ).status_code
+
+    def update(self, update: str) -> int:
+        """
+        Sends the specified SPARQL update to the update endpoint of the server.
+
+        :param update: SPARQL update
+        :return: HTTP status code
+        """
+        return self.transport.post(
+            self.update_endpoint, data=update.encode(), headers={'Content-Type': 'application/sparql-update'}
+        ).status_code
+
+    def dump(self, chunk_bytes: int = DUMP_CHUNK_BYTES) -> Tuple[int, Iterator[bytes]]:
+        """
+        Streams the default graph from the data endpoint of the server (one request, read chunk by chunk).
+
+        :param chunk_bytes: size of the chunks
+        :return: (HTTP status code, N-Triples chunks)
+        """
+        res = self.transport.get(
+            self.data_endpoint, params={"graph": "default"}, headers={'Accept': 'application/n-triples'}, stream=True
+        )
+        return res.status_code, res.iter_content(chunk_size=chunk_bytes)
+
+
+class LocalGraphBackend(KnowledgeGraphBackend):
+    """
+    Embedded in-process knowledge graph store - no server, no network round trips.
+
+    The store is either empty (`memory://<name>`) or loaded from a KG file (`file://<path>` with one of the extensions
+    .nq, .nt, .ttl, optionally gzipped), e.g., `file://knowledge_base/knowledge_graphs/unit_test_kg.nq.gz`. Changes
+    are kept in memory until `save` is called. A `file://` URL pointing to a directory (instead of a KG file) opens a
+    persistent on-disk Oxigraph store.
+
+    Queries are evaluated by Oxigraph (`pyoxigraph`) if installed, otherwise by rdflib, which is considerably slower
+    for the larger joins of the KG query tool.
+    """
+
+    def __init__(self, kg_url: str, engine: str = LOCAL_KG_ENGINE) -> None:
+        """
+        Initializes the local graph backend.
+
+        :param kg_url: `memory://<name>` or `file://<path>`
+        :param engine: query engine - "auto", "oxigraph" or "rdflib"
+        """
+        self.kg_url = kg_url
+        self.path = kg_url[len(FILE_SCHEME):] if kg_url.startswith(FILE_SCHEME) else None
+        persistent = self.path is not None and self.get_file_format(self.path) is None
+        if engine == "auto":
+            engine = "oxigraph" if persistent or self.oxigraph_available() else "rdflib"
+        if persistent and engine != "oxigraph":
+            raise ValueError("persistent on-disk KG stores require the Oxigraph engine: " + kg_url)
+        self.engine = engine
+        # rdflib graphs are not thread-safe, Oxigraph handles concurrent access itself
+        self.lock = threading.RLock()
+        if self.engine == "oxigraph":
+            from pyoxigraph import Store
+            self.store = Store(self.path) if persistent else Store()
+        elif self.engine == "rdflib":
+            self.store = ConjunctiveGraph()
+        else:
+            raise ValueError("unknown local KG engine: " + engine)
+        if self.path is not None and not persistent and os.path.isfile(self.path):
+            self.load(self.path)
+
+    @staticmethod
+    def oxigraph_available() -> bool:
+        """
+        Checks whether the optional `pyoxigraph` package is installed.
+
+        :return: whether Oxigraph is available
+        """
+        try:
+            import pyoxigraph  # noqa: F401
+            return True
+        except ImportError:
+            return False
+
+    @staticmethod
+    def get_file_format(path: str) -> Union[Tuple[str, str], None]:
+        """
+        Determines the RDF serialization format of the specified KG file based on its extension.
+
+        :param path: path of the KG file
+        :return: (rdflib format, media type) or None if it is no supported KG file
+        """
+        if path.endswith(".gz"):
+            path = path[:-len(".gz")]
+        return RDF_FILE_FORMATS.get(os.path.splitext(path)[1])
+
+    def load(self, path: str) -> None:
+        """
+        Loads the specified KG file into the store.
+
+        :param path: path of the KG file (.nq, .nt, .ttl, optionally gzipped)
+        """
+        rdflib_format, media_type = self.get_file_format(path)
+        with (gzip.open(path, "rb") if path.endswith(".gz") else open(path, "rb")) as f:
+            if self.engine == "oxigraph":
+                from pyoxigraph import RdfFormat
+                self.store.bulk_load(f, RdfFormat.from_media_type(media_type))
+            else:
+                with self.lock:
+                    self.store.parse(f, format=rdflib_format)
+
+    def save(self, path: str = None) -> None:
+        """
+        Writes the current state of the KG to the specified file.
+
+        :param path: path of the KG file (.nq, .nt, .ttl, optionally gzipped), by default the file it was loaded from
+        """
+        path = self.path if path is None else path
+        file_format = None if path is None else self.get_file_format(path)
+        if file_format is None:
+            if self.engine == "oxigraph" and path is not None:
+                self.store.flush()
+                return
+            raise ValueError("no KG file (.nq, .nt, .ttl) specified to save " + self.kg_url + " to")
+        rdflib_format, media_type = file_format
+        with (gzip.open(path, "wb") if path.endswith(".gz") else open(path, "wb")) as f:
+            if self.engine == "oxigraph":
+                from pyoxigraph import RdfFormat, DefaultGraph
+                rdf_format = RdfFormat.from_media_type(media_type)
+                if rdf_format.supports_datasets:
+                    self.store.dump(f, rdf_format)
+                else:
+                    self.store.dump(f, rdf_format, from_graph=DefaultGraph())
+            else:
+                with self.lock:
+                    self.store.serialize(f, format=rdflib_format, encoding="utf-8")
+
+    def query(self, query: str) -> Tuple[int, bytes]:
+        """
+        Evaluates the specified SPARQL query on the embedded store.
+
+        :param query: SPARQL query
+        :return: (status code, query results in the SPARQL JSON format)
+        """
+        if self.engine == "oxigraph":
+            from pyoxigraph import QueryResultsFormat
+            return 200, self.store.query(query).serialize(format=QueryResultsFormat.JSON)
+        with self.lock:
+            return 200, self.store.query(query).serialize(format="json")
+
+    def add(self, data: Union[bytes, Iterable[bytes]], content_type: str) -> int:
+        """
+        Adds the specified RDF data to the embedded store.
+
+        :param data: serialized RDF data (or chunks of it, e.g., `NTriplesStream`)
+        :param content_type: media type of the serialization, e.g., `text/turtle`
+        :return: status code
+        """
+        if not isinstance(data, bytes):
+            data = b"".join(data)
+        if self.engine == "oxigraph":
+            from pyoxigraph import RdfFormat
+            self.store.load(data, RdfFormat.from_media_type(content_type))
+        else:
+            rdflib_format = {media_type: fmt for fmt, media_type in RDF_FILE_FORMATS.values()}[content_type]
+            with self.lock:
+                self.store.parse(data=data, format=rdflib_format)
+        return 200
+
+    def update(self, update: str) -> int:
+        """
+        Applies the specified SPARQL update to the embedded store.
+
+        :param update: SPARQL update
+        :return: status code
+        """
+        if self.engine == "oxigraph":
+            self.store.update(update)
+        else:
+            with self.lock:
+                self.store.update(update)
+        return 200
+
+    def dump(self, chunk_bytes: int = DUMP_CHUNK_BYTES) -> Tuple[int, Iterator[bytes]]:
+        """
+        Streams the default graph of the embedded store as N-Triples (serialized statement by statement, i.e., the
+        complete serialization is never held in memory).
+
+        :param chunk_bytes: (approximate) size of the chunks
+        :return: (status code, N-Triples chunks)
+        """
+        if self.engine == "oxigraph":
+            from pyoxigraph import DefaultGraph
+            statements = (
+                str(quad.subject) + " " + str(quad.predicate) + " " + str(quad.object) + " .\n"
+                for quad in self.store.quads_for_pattern(None, None, None, DefaultGraph())
+            )
+        else:
+            with self.lock:
+                triples = list(self.store.triples((None, None, None)))
+            statements = (
+                s.n3() + " " + p.n3() + " " + (serialize_rdflib_literal(o) if isinstance(o, Literal) else o.n3())
+                + " .\n" for s, p, o in triples
+            )
+        return 200, self.chunk_statements(statements, chunk_bytes)
+
+    @staticmethod
+    def chunk_statements(statements: Iterable[str], chunk_bytes: int) -> Iterator[bytes]:
+        """
+        Groups the specified serialized statements into encoded chunks.
+
+        :param statements: serialized statements (incl. line breaks)
+        :param chunk_bytes: (approximate) size of the chunks
+        :return: encoded chunks
+        """
+        chunk = []
+        chunk_len = 0
+        for statement in statements:
+            chunk.append(statement)
+            chunk_len += len(statement)
+            if chunk_len >= chunk_bytes:
+                yield "".join(chunk).encode()
+                chunk = []
+                chunk_len = 0
+        if len(chunk) > 0:
+            yield "".join(chunk).encode()
+
+
+def is_local_kg_url(kg_url: str) -> bool:
+    """
+    Checks whether the specified KG URL refers to an embedded (in-process) KG store.
+
+    :param kg_url: URL of the knowledge graph
+    :return: whether it is a local KG
+    """
+    return kg_url.startswith(MEMORY_SCHEME) or kg_url.startswith(FILE_SCHEME)
+
+
+_local_backends: Dict[str, LocalGraphBackend] = {}
+_local_backends_lock = threading.Lock()
+
+
+def get_backend(kg_url: str, dataset: Union[str, None] = None) -> KnowledgeGraphBackend:
+    """
+    Returns the backend for the specified KG URL.
+
+    Embedded stores are shared by all connections using the same URL (created / loaded on first use), i.e., the KG
+    query tool, the instance generator, etc. operate on the same data.
+
+    :param kg_url: `http(s)://` URL of a Fuseki server, `memory://<name>` or `file://<path>`
+    :param dataset: name of the dataset on the Fuseki server (None: endpoints configured in `config.py`)
+    :return: KG backend
+    """
+    if not is_local_kg_url(kg_url):
+        return FusekiBackend(get_shared_transport(kg_url), dataset)
+    if dataset is not None:
+        raise ValueError("datasets can only be selected on KG servers, not for embedded KGs: " + kg_url)
+    with _local_backends_lock:
+        if kg_url not in _local_backends:
+            _local_backends[kg_url] = LocalGraphBackend(kg_url)
+        return _local_backends[kg_url]
@@ -0,0 +1,914 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# @author Tim Bohne
+
+import argparse
+import datetime
+import gzip
+import hashlib
+import heapq
+import json
+import os
+import tempfile
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, BinaryIO, Callable, Deque, Dict, Iterable, Iterator, List, Tuple, Union
+
+from obd_ontology.backends import LocalGraphBackend, get_backend
+from obd_ontology.config import FUSEKI_URL, ONTOLOGY_PREFIX, DUMP_CHUNK_BYTES, BACKUP_COMPRESSION_THREADS, \
+    BACKUP_BLOCK_BYTES, SORT_BUFFER_BYTES
+from obd_ontology.connection_controller import ConnectionController
+from obd_ontology.log import get_logger
+from obd_ontology.ntriples import canonicalize_ntriples_line
+
+logger = get_logger(__name__)
+
+MANIFEST_VERSION = 1
+# compression -> file extension of the backup
+COMPRESSIONS = {"gzip": ".gz", "zstd": ".zst", "none": ""}
+# full backups (N-Triples) and differential backups (statements added ("+") / removed ("-") w.r.t. a base backup)
+FULL_BACKUP_EXTENSION = ".nt"
+DELTA_BACKUP_EXTENSION = ".delta"
+DEFAULT_COMPRESSION_LEVELS = {"gzip": 6, "zstd": 3}
+
+
+def import_zstandard() -> Any:
+    """
+    Imports the optional `zstandard` package (required for zstd compressed backups).
+
+    :return: `zstandard` module
+    """
+    try:
+        import zstandard
+        return zstandard
+    except ImportError:
+        raise RuntimeError("zstd compressed backups require the optional zstandard package")
+
+
+def get_compression(path: str) -> str:
+    """
+    Determines the compression of the specified backup file by its extension.
+
+    :param path: path of the backup, e.g., `backup.nt.gz`
+    :return: compression ("gzip" | "zstd" | "none")
+    """
+    for compression, extension in COMPRESSIONS.items():
+        if path.endswith(FULL_BACKUP_EXTENSION + extension) or path.endswith(DELTA_BACKUP_EXTENSION + extension):
+            return compression
+    raise ValueError("unknown backup file extension (.nt or .delta, optionally .gz / .zst, expected): " + path)
+
+
+def is_delta(path: str) -> bool:
+    """
+    Checks whether the specified backup is a differential backup (by its extension).
+
+    :param path: path of the backup, e.g., `backup.delta.gz`
+    :return: whether it is a differential backup
+    """
+    return any(path.endswith(DELTA_BACKUP_EXTENSION + extension) for extension in COMPRESSIONS.values())
+
+
+def get_manifest_path(path: str) -> str:
+    """
+    Returns the path of the checksum manifest of the specified backup.
+
+    :param path: path of the backup
+    :return: path of the manifest
+    """
+    return path + ".manifest.json"
+
+
+class HashingFile:
+    """
+    Binary file wrapper computing the SHA-256 digest and size of all bytes written to / read from the file.
+    """
+
+    def __init__(self, file: BinaryIO) -> None:
+        """
+        Initializes the hashing file.
+
+        :param file: wrapped binary file
+        """
+        self.file = file
+        self.hash = hashlib.sha256()
+        self.size = 0
+
+    def write(self, data: bytes) -> int:
+        self.hash.update(data)
+        self.size += len(data)
+        return self.file.write(data)
+
+    def read(self, size: int = -1) -> bytes:
+        data = self.file.read(size)
+        self.hash.update(data)
+        self.size += len(data)
+        return data
+
+    def flush(self) -> None:
+        self.file.flush()
+
+    def close(self) -> None:
+        self.file.flush()
+
+
+class ParallelGzipWriter:
+    """
+    Gzip compression on multiple threads - the data is split into blocks that are compressed concurrently as
+    independent gzip members and written in order. The concatenation of gzip members is a valid gzip file (readable by
+    `gzip`, `zcat`, etc.). At most two blocks per thread are pending at any time, i.e., memory use is constant.
+    """
+
+    def __init__(
+            self, file: Union[BinaryIO, HashingFile], level: int, threads: int, block_bytes: int = BACKUP_BLOCK_BYTES
+    ) -> None:
+        """
+        Initializes the parallel gzip writer.
+
+        :param file: binary file the compressed data is written to
+        :param level: gzip compression level (1 - 9)
+        :param threads: number of threads compressing blocks concurrently
+        :param block_bytes: size of the blocks (gzip members)
+        """
+        self.file = file
+        self.level = level
+        self.block_bytes = block_bytes
+        self.max_pending = 2 * threads
+        self.pool = ThreadPoolExecutor(max_workers=threads)
+        self.pending: Deque[Future] = deque()
+        self.block = bytearray()
+        self.num_of_blocks = 0
+
+    def write(self, data: bytes) -> None:
+        self.block += data
+        if len(self.block) >= self.block_bytes:
+            self.submit()
+
+    def submit(self) -> None:
+        """
+        Submits the current block for compression and writes the compressed blocks exceeding the pending limit.
+        """
+        # zlib releases the GIL while compressing, i.e., the blocks are compressed in parallel
+        self.pending.append(self.pool.submit(gzip.compress, bytes(self.block), self.level, mtime=0))
+        self.block = bytearray()
+        self.num_of_blocks += 1
+        while len(self.pending) > self.max_pending:
+            self.file.write(self.pending.popleft().result())
+
+    def close(self) -> None:
+        if len(self.block) > 0 or self.num_of_blocks == 0:
+            # an empty backup is still a valid gzip file (one empty member)
+            self.submit()
+        while len(self.pending) > 0:
+            self.file.write(self.pending.popleft().result())
+        self.pool.shutdown()
+
+
+def open_compressor(
+        file: Union[BinaryIO, HashingFile], compression: str, level: Union[int, None] = None,
+        threads: Union[int, None] = BACKUP_COMPRESSION_THREADS
+) -> Any:
+    """
+    Opens a compressing writer (`write` / `close`) on top of the specified file.
+
+    :param file: binary file the compressed data is written to
+    :param compression: "gzip" | "zstd" | "none"
+    :param level: compression level (None: default level of the compression)
+    :param threads: number of compression threads (None: number of CPUs)
+    :return: compressing writer
+    """
+    threads = (os.cpu_count() or 1) if threads is None else threads
+    if threads < 1:
+        raise ValueError("number of compression threads has to be at least 1")
+    if level is None:
+        level = DEFAULT_COMPRESSION_LEVELS.get(compression)
+    if compression == "gzip":
+        return ParallelGzipWriter(file, level, threads)
+    if compression == "zstd":
+        zstandard = import_zstandard()
+        return zstandard.ZstdCompressor(level=level, threads=threads).stream_writer(file, closefd=False)
+    if compression == "none":
+        return file
+    raise ValueError("unknown compression: " + compression)
+
+
+def open_decompressor(file: Union[BinaryIO, HashingFile], compression: str) -> Any:
+    """
+    Opens a decompressing reader (`read`) on top of the specified file.
+
+    :param file: binary file containing the compressed data
+    :param compression: "gzip" | "zstd" | "none"
+    :return: decompressing reader
+    """
+    if compression == "gzip":
+        return gzip.GzipFile(fileobj=file, mode="rb")
+    if compression == "zstd":
+        return import_zstandard().ZstdDecompressor().stream_reader(file, read_across_frames=True, closefd=False)
+    if compression == "none":
+        return file
+    raise ValueError("unknown compression: " + compression)
+
+
+class NTriplesDigest:
+    """
+    Incrementally computes the SHA-256 digest, size and number of statements of streamed N-Triples.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes the N-Triples digest.
+        """
+        self.hash = hashlib.sha256()
+        self.size = 0
+        self.statements = 0
+        # incomplete last line of the previous chunk
+        self.tail = b""
+
+    def update(self, chunk: bytes) -> None:
+        """
+        Adds the specified chunk (arbitrary boundaries) to the digest.
+
+        :param chunk: N-Triples chunk
+        """
+        self.hash.update(chunk)
+        self.size += len(chunk)
+        lines = (self.tail + chunk).split(b"\n")
+        self.tail = lines.pop()
+        self.statements += sum(1 for line in lines if line.strip() and not line.lstrip().startswith(b"#"))
+
+    def finish(self) -> None:
+        """
+        Checks that the N-Triples are complete, i.e., end with a complete statement.
+        """
+        if self.tail.strip():
+            raise RuntimeError(
+                "N-Triples truncated - incomplete last statement: " + self.tail[:100].decode(errors="replace")
+            )
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {"content_sha256": self.hash.hexdigest(), "content_size": self.size, "statements": self.statements}
+
+
+def count_statements(connection: ConnectionController) -> int:
+    """
+    Queries the number of statements in the default graph of the knowledge graph.
+
+    :param connection: connection to the knowledge graph
+    :return: number of statements
+    """
+    res = connection.query_knowledge_graph("SELECT (COUNT(*) AS ?num) WHERE { ?s ?p ?o }", False)
+    return int(res[0]["num"]["value"])
+
+
+def connect(kg_url: str, dataset: Union[str, None]) -> ConnectionController:
+    """
+    Establishes the connection to the knowledge graph to be backed up / restored.
+
+    :param kg_url: URL of the KG server (or embedded KG)
+    :param dataset: name of the dataset on the KG server (None: endpoints configured in `config.py`)
+    :return: connection to the knowledge graph
+    """
+    return ConnectionController(namespace=ONTOLOGY_PREFIX, fuseki_url=kg_url, backend=get_backend(kg_url, dataset))
+
+
+def write_backup(
+        output_path: str, chunks: Iterable[bytes], check: Callable[[], None], level: Union[int, None] = None,
+        threads: Union[int, None] = BACKUP_COMPRESSION_THREADS
+) -> Tuple[str, int]:
+    """
+    Compresses the specified chunks into the specified backup file (compression by the file extension).
+
+    The chunks are written to `<output_path>.part`, which is only moved to `output_path` if the check passes.
+
+    :param output_path: path of the backup
+    :param chunks: chunks to be written
+    :param check: check of the written data (raises an error if the backup is not valid)
+    :param level: compression level (None: default level of the compression)
+    :param threads: number of compression threads (None: number of CPUs)
+    :return: (SHA-256 digest, size) of the backup file
+    """
+    compression = get_compression(output_path)
+    part_path = output_path + ".part"
+    try:
+        with open(part_path, "wb") as f:
+            file = HashingFile(f)
+            writer = open_compressor(file, compression, level, threads)
+            for chunk in chunks:
+                writer.write(chunk)
+            writer.close()
+        check()
+        os.replace(part_path, output_path)
+    except BaseException:
+        if os.path.exists(part_path):
+            os.remove(part_path)
+        raise
+    return file.hash.hexdigest(), file.size
+
+
+def write_manifest(output_path: str, manifest: Dict[str, Any]) -> None:
+    """
+    Writes the checksum manifest of the specified backup (`<backup>.manifest.json`).
+
+    :param output_path: path of the backup
+    :param manifest: manifest (file digest, content digest, number of statements, etc.)
+    """
+    with open(get_manifest_path(output_path), "w") as f:
+        f.write(json.dumps({
+            "version": MANIFEST_VERSION, "file": os.path.basename(output_path),
+            "compression": get_compression(output_path), **manifest,
+            "created": datetime.datetime.now().isoformat(timespec="seconds")
+        }, indent=2))
+
+
+def check_statements(connection: ConnectionController, content: NTriplesDigest) -> None:
+    """
+    Checks that the specified (streamed) dump of the knowledge graph is complete.
+
+    :param connection: connection to the knowledge graph
+    :param content: digest of the dump
+    """
+    content.finish()
+    num_of_statements = count_statements(connection)
+    if num_of_statements != content.statements:
+        raise RuntimeError(
+            "incomplete backup - " + str(content.statements) + " of " + str(num_of_statements) + " statements"
+        )
+
+
+def backup_knowledge_graph(
+        output_path: str, kg_url: str = FUSEKI_URL, level: Union[int, None] = None,
+        threads: Union[int, None] = BACKUP_COMPRESSION_THREADS, dataset: Union[str, None] = None
+) -> Dict[str, Any]:
+    """
+    Backs up the default graph of the knowledge graph (compression by the file extension: .nt, .nt.gz, .nt.zst).
+
+    The N-Triples are streamed from the KG in one request and compressed on the fly, while the statements are counted
+    and hashed in the same pass. The backup is only moved to `output_path` if the dump was complete and its number of
+    statements matches the KG - the checksum manifest (`<backup>.manifest.json`) is written next to it.
+
+    :param output_path: path of the backup
+    :param kg_url: URL of the KG server (or embedded KG)
+    :param level: compression level (None: default level of the compression)
+    :param threads: number of compression threads (None: number of CPUs)
+    :param dataset: name of the dataset on the KG server (None: endpoints configured in `config.py`)
+    :return: manifest of the backup
+    """
+    if is_delta(output_path):
+        raise ValueError("full backups require the extension .nt (optionally .gz / .zst): " + output_path)
+    start = time.perf_counter()
+    connection = connect(kg_url, dataset)
+    content = NTriplesDigest()
+
+    def chunks() -> Iterator[bytes]:
+        for chunk in connection.dump_knowledge_graph():
+            content.update(chunk)
+            yield chunk
+
+    file_hash, file_size = write_backup(
+        output_path, chunks(), lambda: check_statements(connection, content), level, threads
+    )
+    manifest = {"sha256": file_hash, "size": file_size, **content.as_dict(), "kg_url": kg_url, "dataset": dataset}
+    write_manifest(output_path, manifest)
+    logger.info("backup of %d statements written in %.2f s", content.statements, time.perf_counter() - start)
+    return manifest
+
+
+def iter_lines(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """
+    Splits the specified chunks (arbitrary boundaries) into lines.
+
+    :param chunks: chunks
+    :return: lines (incl. line breaks, a missing final line break is added)
+    """
+    rest = b""
+    for chunk in chunks:
+        lines = (rest + chunk).split(b"\n")
+        rest = lines.pop()
+        for line in lines:
+            yield line + b"\n"
+    if len(rest) > 0:
+        yield rest + b"\n"
+
+
+def join_lines(lines: Iterable[bytes], chunk_bytes: int = DUMP_CHUNK_BYTES) -> Iterator[bytes]:
+    """
+    Groups the specified lines into chunks.
+
+    :param lines: lines (incl. line breaks)
+    :param chunk_bytes: (approximate) size of the chunks
+    :return: chunks
+    """
+    chunk = []
+    chunk_len = 0
+    for line in lines:
+        chunk.append(line)
+        chunk_len += len(line)
+        if chunk_len >= chunk_bytes:
+            yield b"".join(chunk)
+            chunk = []
+            chunk_len = 0
+    if len(chunk) > 0:
+        yield b"".join(chunk)
+
+
+def canonical_statements(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """
+    Brings the statements of the specified N-Triples chunks into canonical form (see `canonicalize_ntriples_line`).
+
+    :param chunks: N-Triples chunks
+    :return: canonical statements (incl. line breaks)
+    """
+    for line in iter_lines(chunks):
+        statement = canonicalize_ntriples_line(line.decode())
+        if statement is not None:
+            yield statement.encode() + b"\n"
+
+
+def external_sort(lines: Iterable[bytes], buffer_bytes: int = SORT_BUFFER_BYTES) -> Iterator[bytes]:
+    """
+    Sorts the specified lines and removes duplicates in bounded memory (external merge sort) - runs of up to
+    `buffer_bytes` are sorted in memory and spilled to temporary files, which are merged in one streaming pass.
+
+    :param lines: lines (incl. line breaks)
+    :param buffer_bytes: max size of the lines sorted in memory
+    :return: sorted unique lines
+    """
+    with tempfile.TemporaryDirectory(prefix="kg_sort_") as tmp_dir:
+        runs: List[str] = []
+        buffer: List[bytes] = []
+        buffer_len = 0
+        for line in lines:
+            buffer.append(line)
+            buffer_len += len(line)
+            if buffer_len >= buffer_bytes:
+                runs.append(write_sorted_run(buffer, tmp_dir, len(runs)))
+                buffer = []
+                buffer_len = 0
+        if len(runs) == 0:
+            buffer.sort()
+            merged = iter(buffer)
+            files = []
+        else:
+            if len(buffer) > 0:
+                runs.append(write_sorted_run(buffer, tmp_dir, len(runs)))
+                buffer = []
+            files = [open(run, "rb") for run in runs]
+            merged = heapq.merge(*files)
+        try:
+            previous = None
+            for line in merged:
+                if line != previous:
+                    yield line
+                    previous = line
+        finally:
+            for f in files:
+                f.close()
+
+
+def write_sorted_run(lines: List[bytes], directory: str, idx: int) -> str:
+    """
+    Sorts the specified lines and writes them to a run file of the external merge sort.
+
+    :param lines: lines (incl. line breaks)
+    :param directory: directory of the run files
+    :param idx: index of the run
+    :return: path of the run file
+    """
+    lines.sort()
+    path = os.path.join(directory, "run_" + str(idx))
+    with open(path, "wb") as f:
+        for chunk in join_lines(lines):
+            f.write(chunk)
+    return path
+
+
+def diff_sorted(old: Iterator[bytes], new: Iterator[bytes]) -> Iterator[bytes]:
+    """
+    Compares two sorted sequences of unique statements in one merge pass.
+
+    :param old: sorted statements of the old KG state
+    :param new: sorted statements of the new KG state
+    :return: changes in statement order ("+<statement>": added, "-<statement>": removed)
+    """
+    old_line = next(old, None)
+    new_line = next(new, None)
+    while old_line is not None or new_line is not None:
+        if new_line is None or (old_line is not None and old_line < new_line):
+            yield b"-" + old_line
+            old_line = next(old, None)
+        elif old_line is None or new_line < old_line:
+            yield b"+" + new_line
+            new_line = next(new, None)
+        else:
+            old_line = next(old, None)
+            new_line = next(new, None)
+
+
+def apply_delta(base: Iterator[bytes], changes: Iterable[bytes]) -> Iterator[bytes]:
+    """
+    Applies the specified changes (cf. `diff_sorted`) to the sorted statements of the base KG state in one merge pass.
+
+    :param base: sorted statements of the base KG state
+    :param changes: changes in statement order
+    :return: sorted statements of the resulting KG state
+    """
+    base_line = next(base, None)
+    for change in changes:
+        line = change[1:]
+        while base_line is not None and base_line < line:
+            yield base_line
+            base_line = next(base, None)
+        if change[:1] == b"-":
+            if base_line != line:
+                raise RuntimeError("delta does not match its base - removed statement missing: " + line.decode()[:200])
+            base_line = next(base, None)
+        else:
+            if base_line == line:
+                raise RuntimeError("delta does not match its base - added statement present: " + line.decode()[:200])
+            yield line
+    while base_line is not None:
+        yield base_line
+        base_line = next(base, None)
+
+
+def sorted_statements(path: str) -> Iterator[bytes]:
+    """
+    Streams the canonical statements of the KG state of the specified backup in sorted order - full backups are sorted
+    externally, differential backups are applied to the sorted state of their base (recursively, i.e., the complete
+    delta chain is applied in one streaming pass).
+
+    :param path: path of the backup
+    :return: sorted canonical statements (incl. line breaks)
+    """
+    if not is_delta(path):
+        return external_sort(canonical_statements(read_file(path)))
+    manifest = load_manifest(path)
+    if manifest is None:
+        raise RuntimeError("no manifest for differential backup " + path)
+    if file_sha256(path) != manifest["sha256"]:
+        raise RuntimeError("checksum mismatch: " + path)
+    base_path = get_base_path(path, manifest)
+    if file_sha256(base_path) != manifest["base_sha256"]:
+        raise RuntimeError("base of " + path + " was modified or replaced: " + base_path)
+    return apply_delta(sorted_statements(base_path), iter_lines(read_file(path)))
+
+
+def get_base_path(path: str, manifest: Dict[str, Any]) -> str:
+    """
+    Returns the path of the base backup of the specified differential backup.
+
+    :param path: path of the differential backup
+    :param manifest: manifest of the differential backup
+    :return: path of the base backup
+    """
+    return os.path.join(os.path.dirname(path), manifest["base"])
+
+
+def delta_chain(path: str) -> List[str]:
+    """
+    Determines the chain of backups the KG state of the specified backup is reconstructed from.
+
+    :param path: path of the backup
+    :return: paths of the backups (full backup first)
+    """
+    chain = [path]
+    while is_delta(chain[0]):
+        manifest = load_manifest(chain[0])
+        if manifest is None:
+            raise RuntimeError("no manifest for differential backup " + chain[0])
+        chain.insert(0, get_base_path(chain[0], manifest))
+    return chain
+
+
+def differential_backup_knowledge_graph(
+        output_path: str, base_path: str, kg_url: str = FUSEKI_URL, level: Union[int, None] = None,
+        threads: Union[int, None] = BACKUP_COMPRESSION_THREADS, dataset: Union[str, None] = None
+) -> Dict[str, Any]:
+    """
+    Backs up the default graph of the knowledge graph as differential backup, i.e., only the statements added /
+    removed w.r.t. the KG state of the base backup (full or differential) are stored (extension .delta, optionally
+    .gz / .zst).
+
+    The dump is brought into canonical form and sorted in bounded memory (external merge sort) and compared with the
+    sorted state of the base in one merge pass. As for full backups, the dump is checked for completeness and the
+    manifest contains the digest of the resulting KG state (sorted canonical N-Triples) to verify reconstructions.
+
+    :param output_path: path of the differential backup
+    :param base_path: path of the base backup
+    :param kg_url: URL of the KG server (or embedded KG)
+    :param level: compression level (None: default level of the compression)
+    :param threads: number of compression threads (None: number of CPUs)
+    :param dataset: name of the dataset on the KG server (None: endpoints configured in `config.py`)
+    :return: manifest of the backup
+    """
+    if not is_delta(output_path):
+        raise ValueError("differential backups require the extension .delta (optionally .gz / .zst): " + output_path)
+    start = time.perf_counter()
+    base_sha256 = file_sha256(base_path)
+    connection = connect(kg_url, dataset)
+    dump = NTriplesDigest()
+    content = NTriplesDigest()
+    num_of_changes = {b"+": 0, b"-": 0}
+
+    def dump_chunks() -> Iterator[bytes]:
+        for chunk in connection.dump_knowledge_graph():
+            dump.update(chunk)
+            yield chunk
+
+    def state() -> Iterator[bytes]:
+        for line in external_sort(canonical_statements(dump_chunks())):
+            content.update(line)
+            yield line
+
+    def changes() -> Iterator[bytes]:
+        for change in diff_sorted(sorted_statements(base_path), state()):
+            num_of_changes[change[:1]] += 1
+            yield change
+
+    def check() -> None:
+        dump.finish()
+        check_statements(connection, content)
+
+    file_hash, file_size = write_backup(output_path, join_lines(changes()), check, level, threads)
+    manifest = {
+        "sha256": file_hash, "size": file_size, **content.as_dict(),
+        "base": os.path.relpath(base_path, os.path.dirname(os.path.abspath(output_path))), "base_sha256": base_sha256,
+        "added": num_of_changes[b"+"], "removed": num_of_changes[b"-"], "kg_url": kg_url,
+        "dataset": dataset
+    }
+    write_manifest(output_path, manifest)
+    logger.info(
+        "differential backup (%d added, %d removed statements) written in %.2f s", manifest["added"],
+        manifest["removed"], time.perf_counter() - start
+    )
+    return manifest
+
+
+def reconstruct_backup(
+        path: str, output_path: str, level: Union[int, None] = None,
+        threads: Union[int, None] = BACKUP_COMPRESSION_THREADS
+) -> Dict[str, Any]:
+    """
+    Reconstructs the KG state of the specified (differential) backup as full backup (sorted canonical N-Triples).
+
+    :param path: path of the backup
+    :param output_path: path of the full backup (.nt, optionally .gz / .zst)
+    :param level: compression level (None: default level of the compression)
+    :param threads: number of compression threads (None: number of CPUs)
+    :return: manifest of the full backup
+    """
+    if is_delta(output_path):
+        raise ValueError("full backups require the extension .nt (optionally .gz / .zst): " + output_path)
+    manifest = load_manifest(path)
+    content = NTriplesDigest()
+
+    def chunks() -> Iterator[bytes]:
+        for chunk in read_backup(path):
+            content.update(chunk)
+            yield chunk
+
+    def check() -> None:
+        content.finish()
+        if is_delta(path) and content.hash.hexdigest() != manifest["content_sha256"]:
+            raise RuntimeError("reconstructed KG state does not match the manifest of " + path)
+
+    file_hash, file_size = write_backup(output_path, chunks(), check, level, threads)
+    reconstruction = {
+        "sha256": file_hash, "size": file_size, **content.as_dict(),
+        "kg_url": None if manifest is None else manifest.get("kg_url")
+    }
+    write_manifest(output_path, reconstruction)
+    return reconstruction
+
+
+def load_manifest(path: str) -> Union[Dict[str, Any], None]:
+    """
+    Loads the checksum manifest of the specified backup.
+
+    :param path: path of the backup
+    :return: manifest (None if there is no manifest)
+    """
+    manifest_path = get_manifest_path(path)
+    if not os.path.exists(manifest_path):
+        return None
+    with open(manifest_path, "r") as f:
+        manifest = json.load(f)
+    if manifest.get("version") != MANIFEST_VERSION:
+        raise RuntimeError("unsupported backup manifest version: " + str(manifest.get("version")))
+    return manifest
+
+
+def read_backup(path: str, chunk_bytes: int = DUMP_CHUNK_BYTES) -> Iterator[bytes]:
+    """
+    Streams the N-Triples of the KG state of the specified backup (differential backups are reconstructed from their
+    delta chain).
+
+    :param path: path of the backup
+    :param chunk_bytes: (approximate) size of the chunks
+    :return: N-Triples chunks
+    """
+    if is_delta(path):
+        return join_lines(sorted_statements(path), chunk_bytes)
+    return read_file(path, chunk_bytes)
+
+
+def read_file(path: str, chunk_bytes: int = DUMP_CHUNK_BYTES) -> Iterator[bytes]:
+    """
+    Streams the decompressed content of the specified backup file.
+
+    :param path: path of the backup
+    :param chunk_bytes: size of the chunks
+    :return: chunks
+    """
+    with open(path, "rb") as f:
+        reader = open_decompressor(f, get_compression(path))
+        while True:
+            chunk = reader.read(chunk_bytes)
+            if not chunk:
+                break
+            yield chunk
+
+
+def verify_backup(path: str) -> Dict[str, Any]:
+    """
+    Verifies the specified backup against its checksum manifest (file digest, content digest, number of statements)
+    in one pass over the file. For differential backups, the KG state is reconstructed from the delta chain.
+
+    :param path: path of the backup
+    :return: manifest of the backup
+    """
+    manifest = load_manifest(path)
+    if manifest is None:
+        raise RuntimeError("no manifest for " + path)
+    content = NTriplesDigest()
+    if is_delta(path):
+        # the digests of the chain's files are checked while reconstructing
+        for chunk in read_backup(path):
+            content.update(chunk)
+        content.finish()
+        if content.as_dict() != {key: manifest[key] for key in ("content_sha256", "content_size", "statements")}:
+            raise RuntimeError("content mismatch (" + str(content.statements) + " statements): " + path)
+        return manifest
+    with open(path, "rb") as f:
+        file = HashingFile(f)
+        reader = open_decompressor(file, get_compression(path))
+        while True:
+            chunk = reader.read(DUMP_CHUNK_BYTES)
+            if not chunk:
+                break
+            content.update(chunk)
+        # trailing bytes not consumed by the decompressor
+        while file.read(DUMP_CHUNK_BYTES):
+            pass
+    content.finish()
+    if file.hash.hexdigest() != manifest["sha256"]:
+        raise RuntimeError("checksum mismatch: " + path)
+    if content.as_dict() != {key: manifest[key] for key in ("content_sha256", "content_size", "statements")}:
+        raise RuntimeError("content mismatch (" + str(content.statements) + " statements): " + path)
+    return manifest
+
+
+def file_sha256(path: str) -> str:
+    """
+    Computes the SHA-256 digest of the specified file.
+
+    :param path: path of the file
+    :return: hex digest
+    """
+    file_hash = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(DUMP_CHUNK_BYTES), b""):
+            file_hash.update(block)
+    return file_hash.hexdigest()
+
+
+class BackupStream:
+    """
+    Request body streaming the N-Triples of a backup.
+
+    Re-iterable (as opposed to a generator), i.e., if the request is sent again, the backup is read from the start
+    again - the content digest and the completeness flag always refer to the last (re-)sent body.
+    """
+
+    def __init__(self, path: str, chunk_bytes: int = DUMP_CHUNK_BYTES) -> None:
+        """
+        Initializes the backup stream.
+
+        :param path: path of the backup
+        :param chunk_bytes: (approximate) size of the chunks
+        """
+        self.path = path
+        self.chunk_bytes = chunk_bytes
+        self.content = NTriplesDigest()
+        self.complete = False
+
+    def __iter__(self) -> Iterator[bytes]:
+        self.content = NTriplesDigest()
+        self.complete = False
+        for chunk in read_backup(self.path, self.chunk_bytes):
+            self.content.update(chunk)
+            yield chunk
+        self.complete = True
+
+
+def restore_knowledge_graph(
+        path: str, kg_url: str = FUSEKI_URL, clear: bool = False, verify: bool = True,
+        dataset: Union[str, None] = None
+) -> Dict[str, Any]:
+    """
+    Restores the specified backup, i.e., streams its N-Triples into the knowledge graph in one chunked request.
+
+    If the backup has a manifest, its file digest is checked before the KG is modified (`verify`), the content digest
+    and the number of statements are checked while streaming.
+
+    :param path: path of the backup
+    :param kg_url: URL of the KG server (or embedded KG)
+    :param clear: whether the default graph should be cleared first (otherwise, the backup is merged into the KG)
+    :param verify: whether the file digest should be checked before restoring
+    :param dataset: name of the dataset on the KG server (None: endpoints configured in `config.py`)
+    :return: digest of the restored content (digest, size, number of statements)
+    """
+    start = time.perf_counter()
+    manifest = load_manifest(path)
+    if manifest is None:
+        logger.warning("no manifest for %s - restoring unverified backup", path)
+    elif verify and file_sha256(path) != manifest["sha256"]:
+        raise RuntimeError("checksum mismatch: " + path)
+    body = BackupStream(path)
+    connection = connect(kg_url, dataset)
+    connection.restore_knowledge_graph(body, clear)
+    if not body.complete:
+        raise RuntimeError("incomplete restore - the backup was not sent completely")
+    content = body.content
+    content.finish()
+    if isinstance(connection.backend, LocalGraphBackend) and connection.backend.path is not None:
+        connection.backend.save()
+    if manifest is not None and content.hash.hexdigest() != manifest["content_sha256"]:
+        raise RuntimeError("restored content does not match the manifest of " + path)
+    logger.info("%d statements restored in %.2f s", content.statements, time.perf_counter() - start)
+    return content.as_dict()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Streaming backup / restore of the knowledge graph')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    backup_parser = subparsers.add_parser('backup', help='stream the KG into a compressed N-Triples backup')
+    backup_parser.add_argument(
+        '--output', type=str, required=True,
+        help='backup file (compression by extension: .nt, .nt.gz, .nt.zst - zstd requires the zstandard package)'
+    )
+    backup_parser.add_argument(
+        '--base', type=str, default=None, required=False,
+        help='base backup (full or differential) - creates a differential backup (extension .delta[.gz | .zst])'
+    )
+    backup_parser.add_argument('--level', type=int, default=None, required=False, help='compression level')
+    backup_parser.add_argument(
+        '--threads', type=int, default=BACKUP_COMPRESSION_THREADS, required=False,
+        help='number of compression threads (default: number of CPUs)'
+    )
+    restore_parser = subparsers.add_parser('restore', help='stream a backup into the KG')
+    restore_parser.add_argument('--input', type=str, required=True, help='backup file')
+    restore_parser.add_argument(
+        '--clear', action='store_true', default=False, help='clear the KG first (otherwise, the backup is merged)'
+    )
+    restore_parser.add_argument(
+        '--no_verify', action='store_true', default=False, help='skip the checksum check before restoring'
+    )
+    verify_parser = subparsers.add_parser('verify', help='verify a backup against its checksum manifest')
+    verify_parser.add_argument('--input', type=str, required=True, help='backup file')
+    reconstruct_parser = subparsers.add_parser(
+        'reconstruct', help='reconstruct the KG state of a differential backup as full backup'
+    )
+    reconstruct_parser.add_argument('--input', type=str, required=True, help='(differential) backup file')
+    reconstruct_parser.add_argument('--output', type=str, required=True, help='full backup file (.nt[.gz | .zst])')
+    for subparser in (backup_parser, restore_parser):
+        subparser.add_argument(
+            '--kg_url', type=str, default=FUSEKI_URL, required=False,
+            help='URL of the KG server or embedded KG, e.g., file://<kg>.nt'
+        )
+        subparser.add_argument(
+            '--dataset', type=str, default=None, required=False,
+            help='dataset on the KG server, e.g., OBD (default: endpoints configured in config.py)'
+        )
+    args = parser.parse_args()
+
+    if args.command == 'backup' and args.base is not None:
+        res = differential_backup_knowledge_graph(
+            args.output, args.base, args.kg_url, args.level, args.threads, args.dataset
+        )
+        print(
+            f"differential backup completed: {args.output} - {res['added']} added, {res['removed']} removed "
+            f"statements ({res['statements']} statements), {res['size']} bytes"
+        )
+    elif args.command == 'backup':
+        res = backup_knowledge_graph(args.output, args.kg_url, args.level, args.threads, args.dataset)
+        print(f"backup completed: {args.output} - {res['statements']} statements, {res['size']} bytes")
+    elif args.command == 'restore':
+        res = restore_knowledge_graph(args.input, args.kg_url, args.clear, not args.no_verify, args.dataset)
+        print(f"restore completed: {res['statements']} statements")
+    elif args.command == 'reconstruct':
+        res = reconstruct_backup(args.input, args.output)
+        print(f"reconstruction completed: {args.output} - {res['statements']} statements")
+    else:
+        res = verify_backup(args.input)
+        print(f"backup verified: {args.input} - {res['statements']} statements")
@@ -0,0 +1,129 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# @author Tim Bohne
+
+import hashlib
+import os
+import re
+import tempfile
+from typing import List, Union
+
+import numpy as np
+
+from obd_ontology.array_codec import decode_array
+
+# KG literal referencing an array in the blob store, e.g., "blob:sha256:<digest>;dtype=<f4;length=20000"
+BLOB_REFERENCE = re.compile(r'blob:sha256:([0-9a-f]{64});dtype=([^;]+);length=(\d+)$')
+
+
+class BlobStore:
+    """
+    Content-addressed local store for large diagnostic arrays (time series, heatmaps).
+
+    Each array is saved once as `.npy` file named after the SHA-256 digest of its dtype and content (identical arrays
+    share the file), so that the KG only contains a small reference literal (digest, dtype and length) instead of the
+    values. Stored arrays are loaded as read-only memory maps, i.e., without reading / copying the values upfront.
+    """
+
+    def __init__(self, directory: str) -> None:
+        """
+        Initializes the blob store.
+
+        :param directory: directory containing the `.npy` files (created if it does not exist)
+        """
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def digest(array: np.ndarray) -> str:
+        """
+        Computes the content address of the specified array.
+
+        :param array: array to compute the content address for
+        :return: SHA-256 digest (hex) of the dtype, shape (multidimensional arrays) and values
+        """
+        sha = hashlib.sha256(array.dtype.str.encode("ascii"))
+        if array.ndim != 1:
+            # one-dimensional arrays (time series) keep the addresses of the flat layout
+            sha.update(str(array.shape).encode("ascii"))
+        sha.update(np.ascontiguousarray(array).data)
+        return sha.hexdigest()
+
+    def path(self, digest: str) -> str:
+        """
+        Returns the path of the `.npy` file for the specified digest (files are sharded by the first two characters).
+
+        :param digest: content address of the array
+        :return: path of the `.npy` file
+        """
+        return os.path.join(self.directory, digest[:2], digest + ".npy")
+
+    def put(self, values: Union[List[float], np.ndarray], dtype: Union[str, np.dtype, None] = None) -> str:
+        """
+        Saves the specified array (e.g., time series, heatmap) in the blob store (if not already present) - the shape is
+        kept, i.e., a two-dimensional heatmap is loaded as such.
+
+        :param values: array to be saved
+        :param dtype: dtype the array is saved with (None: dtype of the array, float64 for lists)
+        :return: reference literal to be stored in the KG (length: number of values)
+        """
+        array = np.ascontiguousarray(values, dtype=dtype)
+        digest = self.digest(array)
+        path = self.path(digest)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # written to a temporary file first - concurrent readers never see partially written files
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                np.save(f, array)
+            os.replace(tmp_path, path)
+        return "blob:sha256:" + digest + ";dtype=" + array.dtype.str + ";length=" + str(array.size)
+
+    def get(self, reference: str) -> np.memmap:
+        """
+        Loads the array referenced by the specified literal as read-only memory map.
+
+        :param reference: reference literal (as stored in the KG)
+        :return: memory-mapped array
+        """
+        match = BLOB_REFERENCE.match(reference)
+        if match is None:
+            raise ValueError("not a blob reference: " + reference[:80])
+        digest, dtype, length = match.groups()
+        array = np.load(self.path(digest), mmap_mode="r")
+        if array.dtype.str != dtype or array.size != int(length):
+            raise ValueError("blob " + digest + " does not match its reference (" + reference + ")")
+        return array
+
+
+def is_blob_reference(literal: str) -> bool:
+    """
+    Checks whether the specified literal references an array in the blob store.
+
+    :param literal: literal to be checked
+    :return: whether it's a blob reference
+    """
+    return BLOB_REFERENCE.match(literal) is not None
+
+
+def load_array(literal: str, blob_store: Union[BlobStore, None] = None) -> np.ndarray:
+    """
+    Loads the array represented by the specified KG literal - blob references are resolved via the blob store
+    (memory map), encoded arrays are decoded.
+
+    :param literal: array literal (as stored in the KG)
+    :param blob_store: blob store containing the referenced arrays
+    :return: array
+    """
+    if is_blob_reference(literal):
+        if blob_store is None:
+            raise ValueError("no blob store configured to resolve " + literal)
+        return blob_store.get(literal)
+    return decode_array(literal)
+
+
+if __name__ == '__main__':
+    store = BlobStore(os.path.join(tempfile.gettempdir(), "obd_blob_store"))
+    ref = store.put([13.3, 13.6, 14.6, 16.7, 8.5, 9.7, 5.5, 3.6, 12.5, 12.7], dtype="<f4")
+    print(ref)
+    print(load_array(ref, store))
@@ -10,3 +10,70 @@ DATA_ENDPOINT = "/OBD/data"
 UPDATE_ENDPOINT = "/OBD/update"
 VALID_SPECIAL_CHARACTERS = " ,()-:&/"
 DTC_REGEX = "[PCBU][012]\d{3}"
+# max number of facts removed per `DELETE DATA` request
+DELETION_CHUNK_SIZE = 1000
+# max number of facts uploaded per request in bulk extensions of the KG
+EXTENSION_CHUNK_SIZE = 50000
+# size (bytes) of the chunks in which the N-Triples body of a KG extension is serialized and streamed to the server
+EXTENSION_STREAM_CHUNK_BYTES = 1024 * 1024
+# size (bytes) of the chunks in which N-Triples dumps of the KG (e.g., for the one-pass knowledge snapshot) are read
+DUMP_CHUNK_BYTES = 1024 * 1024
+# compression of KG backups: "gzip" | "zstd" (requires the optional `zstandard` package), number of threads compressing
+# blocks concurrently (None: number of CPUs) and size (bytes) of the independently compressed blocks (gzip members)
+BACKUP_COMPRESSION = "gzip"
+BACKUP_COMPRESSION_THREADS = None
+BACKUP_BLOCK_BYTES = 1024 * 1024
+# max size (bytes) of the statements sorted in memory by the external merge sort of differential (delta) backups -
+# larger KGs are sorted in runs spilled to temporary files
+SORT_BUFFER_BYTES = 64 * 1024 * 1024
+
+# pooled HTTP transport (shared by all connections to the same KG server)
+HTTP_POOL_SIZE = 10
+HTTP_MAX_RETRIES = 3
+HTTP_BACKOFF_FACTOR = 0.3
+HTTP_CONNECT_TIMEOUT = 3.05
+# read timeouts (seconds) per endpoint -- uploads of large fact lists take considerably longer than queries
+HTTP_READ_TIMEOUTS = {SPARQL_ENDPOINT: 60, DATA_ENDPOINT: 300, UPDATE_ENDPOINT: 120}
+# max number of concurrently executed queries of the async KG query tool (should not exceed the HTTP pool size)
+ASYNC_MAX_CONCURRENCY = HTTP_POOL_SIZE
+# number of worker threads rendering the knowledge snapshot sections (should not exceed the HTTP pool size)
+SNAPSHOT_WORKERS = HTTP_POOL_SIZE
+
+# read-through query result cache (invalidated by every KG extension / removal of the same process)
+QUERY_CACHE_MAX_ENTRIES = 1024
+QUERY_CACHE_MAX_BYTES = 64 * 1024 * 1024
+# seconds until a cached result expires (bounds staleness w.r.t. other processes writing to the KG), None: no expiry
+QUERY_CACHE_TTL = 600
+
+# embedded (in-process) KG stores, addressed via `memory://<name>` or `file://<path>` instead of the server URL
+# engine: "auto" (Oxigraph if `pyoxigraph` is installed, rdflib otherwise) | "oxigraph" | "rdflib"
+LOCAL_KG_ENGINE = "auto"
+
+# max number of names resolved to instances per `VALUES` query of the instance resolver
+RESOLVER_BATCH_SIZE = 500
+
+# encoding of the arrays (time series, heatmaps) entered into the KG by the ontology instance generator:
+# "text" (legacy decimal text literal) | "float32" | "float16" (base64 encoded binary literal, optionally compressed)
+ARRAY_ENCODING = "text"
+ARRAY_COMPRESSION = False
+# directory of the content-addressed blob store for time series and heatmaps (the KG only contains references to the
+# `.npy` files), None: arrays are stored in the KG as literals (`ARRAY_ENCODING`)
+BLOB_STORE_DIR = None
+
+# write-behind fact buffer (diagnosis sessions of the ontology instance generator): number of buffered facts
+# triggering a flush (None: only explicit flushes) and seconds between background flushes (None: no background thread)
+FACT_BUFFER_FLUSH_SIZE = 10000
+FACT_BUFFER_FLUSH_INTERVAL = None
+
+# log level of the package ("WARNING": silent apart from warnings / errors, "INFO": progress and query banners,
+# "DEBUG": additionally the sent queries and the individual facts), can be changed at runtime via `log.set_log_level`
+LOG_LEVEL = "WARNING"
+
+# query instrumentation (wall / server time, bytes, rows and cache status per named query, see `query_metrics.py`):
+# queries taking longer than the threshold (seconds) are logged with their parameters and SPARQL (None: no slow-query
+# log), the last `SLOW_QUERY_LOG_SIZE` slow queries are kept in memory - the slow-query log is written to
+# `SLOW_QUERY_LOG_FILE` (None: stderr), never to the console output of the package
+QUERY_METRICS_ENABLED = True
+SLOW_QUERY_THRESHOLD = 1.0
+SLOW_QUERY_LOG_SIZE = 100
+SLOW_QUERY_LOG_FILE = None
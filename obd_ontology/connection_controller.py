@@ -2,104 +2,307 @@
 # -*- coding: utf-8 -*-
 # @author Tim Bohne
 
+import json
+import logging
 import re
-from typing import List, Dict, Union
+import time
+from typing import Iterable, Iterator, List, Dict, Tuple, Union
 
-import requests
-from rdflib import Namespace, RDF, Literal, Graph, URIRef
+from rdflib import Namespace, RDF, Graph, URIRef
 from termcolor import colored
 
-from obd_ontology.config import ONTOLOGY_PREFIX, FUSEKI_URL, SPARQL_ENDPOINT, DATA_ENDPOINT, UPDATE_ENDPOINT
+from obd_ontology.backends import KnowledgeGraphBackend, FusekiBackend, get_backend
+from obd_ontology.config import ONTOLOGY_PREFIX, FUSEKI_URL, DELETION_CHUNK_SIZE, EXTENSION_CHUNK_SIZE, \
+    EXTENSION_STREAM_CHUNK_BYTES, QUERY_METRICS_ENABLED
 from obd_ontology.fact import Fact
+from obd_ontology.http_transport import PooledTransport
+from obd_ontology.log import get_logger, log_lines
+from obd_ontology.ntriples import NTriplesStream, serialize_deletion_literal, serialize_iri, serialize_literal
+from obd_ontology.query_cache import QueryCache, get_shared_query_cache, invalidate_shared_query_cache
+from obd_ontology.query_metrics import QueryMetricsRegistry, get_query_metrics_registry
+
+logger = get_logger(__name__)
+
+# max number of cached IRI terms per connection controller
+IRI_TERM_CACHE_SIZE = 100000
 
 
 class ConnectionController:
     """
     Establishes the connection to the knowledge graph hosted by the 'Apache Jena Fuseki' server.
     Performs queries as well as knowledge graph extensions via HTTP requests.
+
+    Alternatively, the KG can be an embedded in-process store (`memory://<name>` or `file://<path>` instead of the
+    server URL, see `LocalGraphBackend`) with exactly the same query / extension / removal contract.
+
+    All connection controllers pointing to the same server share one pooled keep-alive transport. Optionally, query
+    results are served from a read-through cache (shared per server), which is invalidated by every KG modification
+    performed by a connection controller of the same process.
+
+    Each query is measured (wall time, server round trip time, response size, number of rows, cache status) and
+    recorded per query name (name of the query catalogue template the query is bound from) in the query metrics
+    registry shared by the process.
     """
 
-    def __init__(self, namespace: str, fuseki_url: str = FUSEKI_URL) -> None:
+    def __init__(
+            self, namespace: str, fuseki_url: str = FUSEKI_URL, transport: PooledTransport = None,
+            use_cache: bool = False, backend: KnowledgeGraphBackend = None,
+            query_metrics: Union[QueryMetricsRegistry, None] = None
+    ) -> None:
         """
         Initializes the connection controller.
 
         :param namespace: ontology namespace (prefix URI)
-        :param fuseki_url: URL of the 'Fuseki' server hosting the knowledge graph
+        :param fuseki_url: URL of the 'Fuseki' server hosting the knowledge graph (or `memory://` / `file://` URL)
+        :param transport: optional custom transport (by default, the one shared for `fuseki_url` is used)
+        :param use_cache: whether query results should be cached
+        :param backend: optional custom backend (by default, it is determined by `fuseki_url`)
+        :param query_metrics: optional custom query metrics registry (by default, the shared one is used if
+                              `QUERY_METRICS_ENABLED`)
         """
         self.namespace = Namespace(namespace)
         self.fuseki_url = fuseki_url
+        if backend is None:
+            backend = get_backend(fuseki_url) if transport is None else FusekiBackend(transport)
+        self.backend = backend
+        self.query_cache: Union[QueryCache, None] = get_shared_query_cache(fuseki_url) if use_cache else None
+        if query_metrics is None and QUERY_METRICS_ENABLED:
+            query_metrics = get_query_metrics_registry()
+        self.query_metrics = query_metrics
         self.graph = Graph()
         self.graph.bind("", self.namespace)
+        # triple element -> serialized IRI term (instance IDs, predicates and classes recur in many facts)
+        self.iri_terms: Dict[str, str] = {}
 
     def query_knowledge_graph(self, query: str, verbose: bool) -> List[Dict]:
         """
         Sends an HTTP request containing the specified query to the knowledge graph server.
 
-        :param query: query to be sent to knowledge graph server
+        :param query: query to be sent to knowledge graph server (queries bound from a template, see `SparqlTemplate`,
+                      are recorded under the name of the template)
         :param verbose: if true, queries are logged
         :return: query results (JSON list)
         """
+        start = time.perf_counter()
         if verbose:
-            print("query knowledge graph..")
-            print(query)
-        res = requests.post(
-            self.fuseki_url + SPARQL_ENDPOINT, query.encode(),
-            headers={'Content-Type': 'application/sparql-query', 'Accept': 'application/json'}
-        )
-        if res.status_code != 200:
-            print("HTTP status code:", res.status_code)
-        return res.json()["results"]["bindings"]
+            logger.debug("query knowledge graph..\n%s", query)
+        if self.query_cache is not None:
+            cached_res = self.query_cache.get(query)
+            if cached_res is not None:
+                if verbose:
+                    logger.debug("(cached result)")
+                self.record_query(query, start, 0.0, 0, len(cached_res), "hit")
+                return cached_res
+            cache_generation = self.query_cache.generation()
+        request_start = time.perf_counter()
+        status_code, content = self.backend.query(query)
+        server_seconds = time.perf_counter() - request_start
+        if status_code != 200:
+            logger.warning("HTTP status code: %s", status_code)
+        bindings = json.loads(content)["results"]["bindings"]
+        if self.query_cache is not None and status_code == 200:
+            self.query_cache.put(query, bindings, len(content), cache_generation)
+        cache_status = "uncached" if self.query_cache is None else "miss"
+        self.record_query(query, start, server_seconds, len(content), len(bindings), cache_status, status_code != 200)
+        return bindings
+
+    def record_query(
+            self, query: str, start: float, server_seconds: float, num_of_bytes: int, num_of_rows: int,
+            cache_status: str, error: bool = False
+    ) -> None:
+        """
+        Records the measurements of the specified query in the query metrics registry (if there is one).
+
+        :param query: executed query
+        :param start: `time.perf_counter` timestamp of the start of the query call
+        :param server_seconds: duration of the server round trip (0 for cache hits)
+        :param num_of_bytes: size of the server response (0 for cache hits)
+        :param num_of_rows: number of result rows
+        :param cache_status: "hit" | "miss" | "uncached"
+        :param error: whether the server responded with an error status
+        """
+        if self.query_metrics is not None:
+            self.query_metrics.record(
+                getattr(query, "name", None), getattr(query, "params", None), query, time.perf_counter() - start,
+                server_seconds, num_of_bytes, num_of_rows, cache_status, error
+            )
+
+    def dump_knowledge_graph(self) -> Iterator[bytes]:
+        """
+        Streams the complete (default graph of the) knowledge graph as N-Triples in one request.
+
+        :return: N-Triples chunks
+        """
+        status_code, chunks = self.backend.dump()
+        if status_code != 200:
+            raise RuntimeError("KG dump failed - HTTP status code: " + str(status_code))
+        return chunks
+
+    def restore_knowledge_graph(self, chunks: Iterable[bytes], clear: bool = False) -> None:
+        """
+        Streams the specified N-Triples (e.g., a backup) into the knowledge graph.
+
+        The chunks are sent as the body of one request (chunked transfer encoding), i.e., they are never held in memory
+        completely and blank node labels (e.g., of OWL restrictions) refer to the same nodes throughout the backup.
+
+        :param chunks: N-Triples chunks
+        :param clear: whether the default graph should be cleared first (restore instead of merge)
+        """
+        if clear:
+            status_code = self.backend.update("CLEAR DEFAULT")
+            invalidate_shared_query_cache(self.fuseki_url)
+            if not 200 <= status_code < 300:
+                raise RuntimeError("clearing the KG failed - HTTP status code: " + str(status_code))
+        status_code = self.backend.add(chunks, 'application/n-triples')
+        invalidate_shared_query_cache(self.fuseki_url)
+        if not 200 <= status_code < 300:
+            raise RuntimeError("KG restore failed - HTTP status code: " + str(status_code))
 
     def extend_knowledge_graph(self, facts: List[Fact]) -> None:
         """
         Sends an HTTP request containing the facts to be entered into the knowledge graph to the knowledge graph server.
 
+        The facts are serialized as N-Triples while the request body is streamed to the server (chunks of
+        `EXTENSION_STREAM_CHUNK_BYTES`), i.e., without building an intermediate graph and Turtle serialization.
+
         :param facts: facts to be entered into the knowledge graph
         """
-        print(colored("\nextending knowledge graph..", "green", "on_grey", ["bold"]))
-        graph = Graph()
-        for fact in facts:
-            # for very long facts, only print the first segment (e.g., heatmaps)
-            print("fact:", str(fact)[:200] + "..." if len(str(fact)) > 0 else fact)
-            if fact.property_fact:
-                graph.add((self.get_uri(fact.triple[0]), self.get_uri(fact.triple[1]), Literal(fact.triple[2])))
-            else:
-                graph.add((self.get_uri(fact.triple[0]), self.get_uri(fact.triple[1]), self.get_uri(fact.triple[2])))
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("%s", colored("\nextending knowledge graph..", "green", "on_grey", ["bold"]))
+        # for very long facts, only the first segment is logged (e.g., heatmaps)
+        log_lines(logger, logging.DEBUG, "fact:", facts)
+        body = NTriplesStream(facts, self.fact_to_ntriples, EXTENSION_STREAM_CHUNK_BYTES)
+        status_code = self.backend.add(body, 'application/n-triples')
+        invalidate_shared_query_cache(self.fuseki_url)
+        if status_code != 200:
+            logger.warning("HTTP status code: %s", status_code)
 
-        res = requests.post(
-            self.fuseki_url + DATA_ENDPOINT, data=graph.serialize(format="ttl").encode(),
-            headers={'Content-Type': 'text/turtle'}
-        )
-        if res.status_code != 200:
-            print("HTTP status code:", res.status_code)
+    def extend_knowledge_graph_in_chunks(
+            self, facts: Iterable[Fact], chunk_size: int = EXTENSION_CHUNK_SIZE
+    ) -> Tuple[int, List[int]]:
+        """
+        Enters the specified facts into the knowledge graph in N-Triples requests of up to `chunk_size` facts each.
 
-    def remove_outdated_facts_from_knowledge_graph(self, facts: List[Fact]) -> None:
+        Intended for bulk extensions - the facts are consumed lazily and serialized chunk by chunk (only one chunk is
+        kept in memory), duplicate statements within a chunk are only sent once and the facts are not logged
+        individually.
+
+        :param facts: facts to be entered into the knowledge graph
+        :param chunk_size: max number of facts per request
+        :return: (number of sent statements, HTTP status code for each sent request (chunk))
         """
-        Sends an HTTP request containing the facts to be removed from the knowledge graph.
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("%s", colored(
+                "\nextending knowledge graph (chunks of " + str(chunk_size) + " facts)..", "green", "on_grey", ["bold"]
+            ))
+        num_of_statements = 0
+        status_codes = []
+        for idx, chunk in enumerate(self.serialize_in_chunks(facts, chunk_size)):
+            status_code = self.backend.add("\n".join(chunk).encode(), 'application/n-triples')
+            logger.info("*** EXTENSION CHUNK %d - %d facts - HTTP status code: %s", idx + 1, len(chunk), status_code)
+            if status_code != 200:
+                logger.warning("HTTP status code: %s", status_code)
+            num_of_statements += len(chunk)
+            status_codes.append(status_code)
+        invalidate_shared_query_cache(self.fuseki_url)
+        return num_of_statements, status_codes
 
-        :param facts: facts to be removed from the knowledge graph
+    def serialize_in_chunks(self, facts: Iterable[Fact], chunk_size: int) -> Iterator[List[str]]:
+        """
+        Serializes the specified facts as chunks of up to `chunk_size` distinct N-Triples statements.
+
+        Duplicates are only removed within each chunk, i.e., memory is bounded by the chunk size - statements repeated
+        in different chunks are sent again (without effect on the KG, which is a set of triples).
+
+        :param facts: facts to be serialized
+        :param chunk_size: max number of statements per chunk
+        :return: chunks of N-Triples statements
         """
-        print(colored("\nremoving facts from knowledge graph..", "green", "on_grey", ["bold"]))
+        chunk = []
+        in_chunk = set()
         for fact in facts:
-            print("fact:", fact)
-            if fact.property_fact:
-                f = (self.get_uri(fact.triple[0]), self.get_uri(fact.triple[1]), Literal(fact.triple[2]))
-                # TODO: check for better ways to handle these special cases
-                if "<http://www.w3.org/2001/XMLSchema#boolean>" in f[2]:
-                    query = f"DELETE DATA {{ <{f[0]}> <{f[1]}> {f[2]} . }}"
-                else:
-                    query = f"DELETE DATA {{ <{f[0]}> <{f[1]}> \"{f[2]}\" . }}"
-            else:
-                f = (self.get_uri(fact.triple[0]), self.get_uri(fact.triple[1]), self.get_uri(fact.triple[2]))
-                query = f"DELETE DATA {{ <{f[0]}> <{f[1]}> <{f[2]}> . }}"
-            print("*** DELETION QUERY:", query)
-            res = requests.post(
-                self.fuseki_url + UPDATE_ENDPOINT,
-                data=query.encode(),
-                headers={'Content-Type': 'application/sparql-update'}
+            statement = self.fact_to_ntriples(fact)
+            if statement in in_chunk:
+                continue
+            in_chunk.add(statement)
+            chunk.append(statement)
+            if len(chunk) == chunk_size:
+                yield chunk
+                chunk = []
+                in_chunk = set()
+        if len(chunk) > 0:
+            yield chunk
+
+    def remove_outdated_facts_from_knowledge_graph(
+            self, facts: List[Fact], chunk_size: int = DELETION_CHUNK_SIZE, all_or_nothing: bool = False
+    ) -> List[int]:
+        """
+        Sends HTTP requests containing the facts to be removed from the knowledge graph.
+
+        Instead of one request per fact, the facts are combined in `DELETE DATA` updates of up to `chunk_size` facts
+        each. In the all-or-nothing mode, all chunks are sent as a single update request, which the server executes as
+        one transaction, i.e., either all facts are removed or none of them.
+
+        :param facts: facts to be removed from the knowledge graph
+        :param chunk_size: max number of facts per `DELETE DATA` update
+        :param all_or_nothing: whether all facts should be removed in a single transaction
+        :return: HTTP status code for each sent request (chunk)
+        """
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("%s", colored("\nremoving facts from knowledge graph..", "green", "on_grey", ["bold"]))
+        log_lines(logger, logging.DEBUG, "fact:", facts)
+        chunks = [facts[i:i + chunk_size] for i in range(0, len(facts), chunk_size)]
+        updates = [
+            "DELETE DATA {\n" + "\n".join(self.fact_to_ntriples(fact, deletion=True) for fact in chunk) + "\n}"
+            for chunk in chunks
+        ]
+        if all_or_nothing and len(updates) > 1:
+            # multiple operations in one request are executed atomically
+            updates = [" ;\n".join(updates)]
+            chunks = [facts]
+        status_codes = []
+        for idx, (chunk, update) in enumerate(zip(chunks, updates)):
+            status_code = self.backend.update(update)
+            logger.info(
+                "*** DELETION CHUNK %d/%d - %d facts - HTTP status code: %s", idx + 1, len(updates), len(chunk),
+                status_code
             )
-            if res.status_code != 200 and res.status_code != 204:
-                print("HTTP status code:", res.status_code)
+            if status_code != 200 and status_code != 204:
+                logger.warning("HTTP status code: %s", status_code)
+            status_codes.append(status_code)
+        invalidate_shared_query_cache(self.fuseki_url)
+        return status_codes
+
+    def fact_to_ntriples(self, fact: Fact, deletion: bool = False) -> str:
+        """
+        Serializes the specified fact as N-Triples statement.
+
+        :param fact: fact to be serialized
+        :param deletion: whether the fact is to be removed (already serialized typed literals are kept as they are)
+        :return: N-Triples statement
+        """
+        subj = self.iri_term(fact.triple[0])
+        pred = self.iri_term(fact.triple[1])
+        if fact.property_fact:
+            obj = serialize_deletion_literal(fact.triple[2]) if deletion else serialize_literal(fact.triple[2])
+        else:
+            obj = self.iri_term(fact.triple[2])
+        return subj + " " + pred + " " + obj + " ."
+
+    def iri_term(self, triple_ele: str) -> str:
+        """
+        Returns the N-Triples IRI term for the specified triple element (cached).
+
+        :param triple_ele: triple element to get IRI term for
+        :return: N-Triples IRI term
+        """
+        term = self.iri_terms.get(triple_ele)
+        if term is None:
+            if len(self.iri_terms) >= IRI_TERM_CACHE_SIZE:
+                self.iri_terms.clear()
+            term = serialize_iri(str(self.get_uri(triple_ele)))
+            self.iri_terms[triple_ele] = term
+        return term
 
     def get_uri(self, triple_ele: str) -> Union[URIRef, str]:
         """
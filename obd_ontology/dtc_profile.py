@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# @author Tim Bohne
+
+from typing import List, Tuple
+
+
+class SuspectComponentProfile:
+    """
+    Representation of a suspect component in the context of a DTC, i.e., including the priority of the corresponding
+    diagnostic association.
+    """
+
+    def __init__(
+            self, name: str, priority: int, use_oscilloscope: bool, affected_by: List[str], verifies: List[str],
+            contained_in: List[str]
+    ) -> None:
+        """
+        Initializes the suspect component profile.
+
+        :param name: name of the suspect component
+        :param priority: priority ID of the diagnostic association (DTC -> component)
+        :param use_oscilloscope: whether oscilloscope measurements are possible for the component
+        :param affected_by: components the suspect component is affected by
+        :param verifies: component sets verified by the suspect component
+        :param contained_in: vehicle subsystems containing the suspect component
+        """
+        self.name = name
+        self.priority = priority
+        self.use_oscilloscope = use_oscilloscope
+        self.affected_by = affected_by
+        self.verifies = verifies
+        self.contained_in = contained_in
+
+    def __str__(self) -> str:
+        """
+        Returns a string representation of the suspect component profile.
+
+        :return: string representation of suspect component profile
+        """
+        return "Suspect Component: " + self.name + "\nPriority: " + str(self.priority) + "\nUse Oscilloscope: " \
+            + str(self.use_oscilloscope) + "\nAffected By: " + str(self.affected_by) + "\nVerifies: " \
+            + str(self.verifies) + "\nContained In: " + str(self.contained_in)
+
+
+class DTCProfile:
+    """
+    Representation of all the knowledge stored in the KG for a DTC, i.e., the result of one bulk profile query.
+    """
+
+    def __init__(
+            self, code: str, occurs_with: List[str], category: str, code_type: str, fault_condition: str,
+            vehicles: List[Tuple[str, str, str, str]], symptoms: List[str], subsystem: str, vehicle_parts: List[str],
+            suspect_components: List[SuspectComponentProfile]
+    ) -> None:
+        """
+        Initializes the DTC profile.
+
+        :param code: diagnostic trouble code
+        :param occurs_with: other DTCs frequently occurring with the considered one
+        :param category: description of the fault category ("" if not available)
+        :param code_type: code type ("" if not available)
+        :param fault_condition: fault condition description ("" if not available)
+        :param vehicles: vehicles (model, HSN, TSN, VIN) in which the DTC occurred in the past
+        :param symptoms: symptoms associated with the DTC
+        :param subsystem: name of the indicated vehicle subsystem ("" if not available)
+        :param vehicle_parts: vehicle parts of the indicated subsystem
+        :param suspect_components: suspect components ordered by priority
+        """
+        self.code = code
+        self.occurs_with = occurs_with
+        self.category = category
+        self.code_type = code_type
+        self.fault_condition = fault_condition
+        self.vehicles = vehicles
+        self.symptoms = symptoms
+        self.subsystem = subsystem
+        self.vehicle_parts = vehicle_parts
+        self.suspect_components = suspect_components
+
+    def __str__(self) -> str:
+        """
+        Returns a string representation of the DTC profile.
+
+        :return: string representation of DTC profile
+        """
+        return "DTC: " + self.code + "\nCategory: " + self.category + "\nCode Type: " + self.code_type \
+            + "\nFault Condition: " + self.fault_condition + "\nSymptoms: " + str(self.symptoms) + "\nSubsystem: " \
+            + self.subsystem + "\nVehicle Parts: " + str(self.vehicle_parts) + "\nSuspect Components: " \
+            + str([comp.name for comp in self.suspect_components]) + "\nOccurs With: " + str(self.occurs_with) \
+            + "\nVehicles: " + str(self.vehicles)
@@ -2,22 +2,29 @@
 # -*- coding: utf-8 -*-
 # @author Tim Bohne
 
+import logging
+import time
 import uuid
-from typing import List, Tuple
+from typing import Dict, List, Tuple, Union
 
 from dtc_parser.parser import DTCParser
 from rdflib import Namespace, RDF
+from termcolor import colored
 
 from obd_ontology.component_knowledge import ComponentKnowledge
 from obd_ontology.component_set_knowledge import ComponentSetKnowledge
-from obd_ontology.config import ONTOLOGY_PREFIX, FUSEKI_URL
+from obd_ontology.config import ONTOLOGY_PREFIX, FUSEKI_URL, EXTENSION_CHUNK_SIZE
 from obd_ontology.connection_controller import ConnectionController
 from obd_ontology.dtc_knowledge import DTCKnowledge
 from obd_ontology.fact import Fact
+from obd_ontology.instance_resolver import InstanceResolver
 from obd_ontology.knowledge_graph_query_tool import KnowledgeGraphQueryTool
+from obd_ontology.log import get_logger
 from obd_ontology.model_knowledge import ModelKnowledge
 from obd_ontology.sub_component_knowledge import SubComponentKnowledge
 
+logger = get_logger(__name__)
+
 
 class ExpertKnowledgeEnhancer:
     """
@@ -39,7 +46,9 @@ class ExpertKnowledgeEnhancer:
         # establish connection to 'Apache Jena Fuseki' server
         self.fuseki_connection = ConnectionController(namespace=ONTOLOGY_PREFIX, fuseki_url=kg_url)
         self.onto_namespace = Namespace(ONTOLOGY_PREFIX)
-        self.knowledge_graph_query_tool = KnowledgeGraphQueryTool()
+        self.knowledge_graph_query_tool = KnowledgeGraphQueryTool(kg_url=kg_url)
+        # name -> instance resolution, memoized for one import batch (i.e., one `add_..._to_knowledge_graph` call)
+        self.instance_resolver = InstanceResolver(kg_url=kg_url)
 
     def generate_condition_description_fact(self, fc_uuid: str, fault_cond: str, prop: bool) -> Fact:
         """
@@ -257,17 +266,18 @@ class ExpertKnowledgeEnhancer:
         dtc_parser = DTCParser()
         parsed_code = dtc_parser.parse_code_machine_readable(dtc_knowledge.dtc)
         subsystem_name = parsed_code["vehicle_subsystem"]
-        subsystem_instance = self.knowledge_graph_query_tool.query_vehicle_subsystem_by_name(subsystem_name)
+        subsystem_instance = self.instance_resolver.get_id("VehicleSubsystem", subsystem_name)
         vehicle_part = parsed_code["vehicle_part"]
 
         # check whether DTC to be added is already part of the KG
-        dtc_instance = self.knowledge_graph_query_tool.query_dtc_instance_by_code(dtc_knowledge.dtc)
-        if len(dtc_instance) > 0:
-            print("Specified DTC (" + dtc_knowledge.dtc + ") already present in KG")
-            dtc_uuid = dtc_instance[0].split("#")[1]
-            assert len(subsystem_instance) > 0  # subsystem already part of KG
-            subsystem_uuid = subsystem_instance[0].split("#")[1]
+        dtc_instance = self.instance_resolver.get_id("DTC", dtc_knowledge.dtc)
+        if dtc_instance is not None:
+            logger.info("Specified DTC (%s) already present in KG", dtc_knowledge.dtc)
+            dtc_uuid = dtc_instance
+            assert subsystem_instance is not None  # subsystem already part of KG
+            subsystem_uuid = subsystem_instance
         else:
+            self.instance_resolver.register("DTC", dtc_knowledge.dtc, dtc_uuid)
             code_type = parsed_code["code_type"]
             code_type = "generic" if "generic" in code_type else "manufacturer-specific"
             fact_list = [
@@ -275,10 +285,11 @@ class ExpertKnowledgeEnhancer:
                 Fact((dtc_uuid, self.onto_namespace.code, dtc_knowledge.dtc), property_fact=True),
                 Fact((dtc_uuid, self.onto_namespace.code_type, code_type), property_fact=True)
             ]
-            if len(subsystem_instance) > 0:  # subsystems already part of KG
-                subsystem_uuid = subsystem_instance[0].split("#")[1]
+            if subsystem_instance is not None:  # subsystems already part of KG
+                subsystem_uuid = subsystem_instance
             else:  # creating new subsystem
                 subsystem_uuid = "vehicle_subsystem_" + uuid.uuid4().hex
+                self.instance_resolver.register("VehicleSubsystem", subsystem_name, subsystem_uuid)
                 fact_list.append(Fact((subsystem_uuid, RDF.type, self.onto_namespace["VehicleSubsystem"].toPython())))
                 fact_list.append(
                     Fact((subsystem_uuid, self.onto_namespace.subsystem_name, subsystem_name), property_fact=True)
@@ -305,11 +316,12 @@ class ExpertKnowledgeEnhancer:
         cat_desc = dtc_parser.parse_code_machine_readable(dtc_knowledge.dtc)["fault_description"]
         fact_list = []
         # check whether fault category to be added is already part of the KG
-        fault_cat_instance = self.knowledge_graph_query_tool.query_fault_cat_by_description(cat_desc)
-        if len(fault_cat_instance) > 0:
-            print("Specified fault cat (" + cat_desc + ") already present in KG")
-            fault_cat_uuid = fault_cat_instance[0].split("#")[1]
+        fault_cat_instance = self.instance_resolver.get_id("FaultCategory", cat_desc)
+        if fault_cat_instance is not None:
+            logger.info("Specified fault cat (%s) already present in KG", cat_desc)
+            fault_cat_uuid = fault_cat_instance
         else:
+            self.instance_resolver.register("FaultCategory", cat_desc, fault_cat_uuid)
             fact_list = [
                 Fact((fault_cat_uuid, RDF.type, self.onto_namespace["FaultCategory"].toPython())),
                 Fact((fault_cat_uuid, self.onto_namespace.category_description, cat_desc), property_fact=True)
@@ -329,14 +341,15 @@ class ExpertKnowledgeEnhancer:
         fault_cond = dtc_knowledge.fault_condition
         fact_list = []
         # check whether fault condition to be added is already part of the KG
-        fault_cond_instance = self.knowledge_graph_query_tool.query_fault_condition_by_description(fault_cond)
-        if len(fault_cond_instance) > 0:
-            print("Specified fault condition (" + fault_cond + ") already present in KG, updating description")
-            fault_cond_uuid = fault_cond_instance[0].split("#")[1]
+        fault_cond_instance = self.instance_resolver.get_id("FaultCondition", fault_cond)
+        if fault_cond_instance is not None:
+            logger.info("Specified fault condition (%s) already present in KG, updating description", fault_cond)
+            fault_cond_uuid = fault_cond_instance
             fact_list.append(
                 Fact((fault_cond_uuid, self.onto_namespace.condition_description, fault_cond), property_fact=True)
             )
         else:
+            self.instance_resolver.register("FaultCondition", fault_cond, fault_cond_uuid)
             fact_list = [
                 Fact((fault_cond_uuid, RDF.type, self.onto_namespace["FaultCondition"].toPython())),
                 Fact((fault_cond_uuid, self.onto_namespace.condition_description, fault_cond), property_fact=True),
@@ -353,24 +366,26 @@ class ExpertKnowledgeEnhancer:
         :return: generated fact list
         """
         fact_list = []
+        # check whether the symptoms to be added (and their `manifestedBy` relations) are already part of the KG
+        self.instance_resolver.resolve("Symptom", dtc_knowledge.symptoms)
+        self.instance_resolver.resolve("manifestedBy", dtc_knowledge.symptoms)
         # there can be more than one symptom instance per DTC
         for symptom in dtc_knowledge.symptoms:
             symptom_uuid = "symptom_" + uuid.uuid4().hex
-            # check whether symptom to be added is already part of the KG
-            symptom_instance = self.knowledge_graph_query_tool.query_symptoms_by_desc(symptom)
-            if len(symptom_instance) > 0:
-                print("Specified symptom (" + symptom + ") already present in KG")
-                symptom_uuid = symptom_instance[0].split("#")[1]
+            symptom_instance = self.instance_resolver.get_id("Symptom", symptom)
+            if symptom_instance is not None:
+                logger.info("Specified symptom (%s) already present in KG", symptom)
+                symptom_uuid = symptom_instance
             else:
+                self.instance_resolver.register("Symptom", symptom, symptom_uuid)
                 fact_list.append(Fact((symptom_uuid, RDF.type, self.onto_namespace["Symptom"].toPython())))
                 fact_list.append(
                     Fact((symptom_uuid, self.onto_namespace.symptom_description, symptom), property_fact=True)
                 )
             # there can be more than one `manifestedBy` relation per symptom
-            fault_condition_instances_already_present = \
-                self.knowledge_graph_query_tool.query_fault_condition_instances_by_symptom(symptom)
-            if fault_cond_uuid not in [fc.split("#")[1] for fc in fault_condition_instances_already_present]:
+            if fault_cond_uuid not in self.instance_resolver.get_ids("manifestedBy", symptom):
                 # symptom can already be present, but not associated with this fault condition
+                self.instance_resolver.register("manifestedBy", symptom, fault_cond_uuid)
                 fact_list.append(Fact((fault_cond_uuid, self.onto_namespace.manifestedBy, symptom_uuid)))
         return fact_list
 
@@ -387,20 +402,20 @@ class ExpertKnowledgeEnhancer:
         :return: generated fact list
         """
         fact_list = []
+        components_by_name = self.instance_resolver.resolve("SuspectComponent", dtc_knowledge.suspect_components)
+        dtc_parser = DTCParser()
+        subsystem_name = dtc_parser.parse_code_machine_readable(dtc_knowledge.dtc)["vehicle_subsystem"]
         # there can be more than one suspect component instance per DTC
         for idx, comp in enumerate(dtc_knowledge.suspect_components):
-            component_by_name = self.knowledge_graph_query_tool.query_suspect_component_by_name(comp)
             # ensure that all the suspect components considered here are already part of the KG
-            assert len(component_by_name) == 1
-            comp_uuid = component_by_name[0].split("#")[1]
+            assert len(components_by_name[comp]) == 1
+            comp_uuid = components_by_name[comp][0]
             # making sure that there is only one diagnostic association, i.e., one priority ID, between any pair
             # of DTC and suspect component
-            diag_association = self.knowledge_graph_query_tool.query_priority_id_by_dtc_and_sus_comp(
-                dtc_knowledge.dtc, comp
-            )
-            if len(diag_association) > 0:
-                print("Diagnostic association between", dtc_knowledge.dtc, "and", comp, "already defined in KG")
+            if comp in self.instance_resolver.get_ids("hasAssociation", dtc_knowledge.dtc):
+                logger.info("Diagnostic association between %s and %s already defined in KG", dtc_knowledge.dtc, comp)
             else:
+                self.instance_resolver.register("hasAssociation", dtc_knowledge.dtc, comp)
                 # TODO: shouldn't the diagnostic association be deletable, too?
                 # creating diagnostic association between DTC and SuspectComponent
                 diag_association_uuid = "diag_association_" + uuid.uuid4().hex
@@ -414,17 +429,13 @@ class ExpertKnowledgeEnhancer:
                 fact_list.append(Fact((diag_association_uuid, self.onto_namespace.pointsTo, comp_uuid)))
 
                 # automatically adding the suspect component to the vehicle subsystem associated with the DTC
-                dtc_parser = DTCParser()
-                subsystem_name = dtc_parser.parse_code_machine_readable(dtc_knowledge.dtc)["vehicle_subsystem"]
                 # only add fact if it's not already part of the KG (important because suspect components can be
                 # associated with many DTCs)
-                components_by_subsystem = self.knowledge_graph_query_tool.query_suspect_components_by_subsystem_name(
-                    subsystem_name, False
-                )
-                if comp in components_by_subsystem:
-                    print("comp:", comp, "already in:", subsystem_name, "- not adding it..")
+                if comp in self.instance_resolver.get_ids("contains", subsystem_name):
+                    logger.debug("comp: %s already in: %s - not adding it..", comp, subsystem_name)
                 else:
-                    print("comp:", comp, "not yet part of:", subsystem_name, "- adding it..")
+                    logger.debug("comp: %s not yet part of: %s - adding it..", comp, subsystem_name)
+                    self.instance_resolver.register("contains", subsystem_name, comp)
                     fact_list.append(Fact((subsystem_uuid, self.onto_namespace.contains, comp_uuid)))
         return fact_list
 
@@ -436,15 +447,24 @@ class ExpertKnowledgeEnhancer:
         :return: generated fact list
         """
         fact_list = []
+        # resolve all referenced components / channels at once
+        self.instance_resolver.resolve(
+            "SuspectComponent",
+            [name for comp in comp_knowledge_list for name in [comp.suspect_component] + comp.affected_by]
+        )
+        self.instance_resolver.resolve(
+            "Channel", [chan for comp in comp_knowledge_list for chan in comp.associated_chan + comp.chan_of_interest]
+        )
         for comp_knowledge in comp_knowledge_list:
             comp_name = comp_knowledge.suspect_component
             comp_uuid = "comp_" + uuid.uuid4().hex
             # check whether component to be added is already part of the KG
-            comp_instance = self.knowledge_graph_query_tool.query_suspect_component_by_name(comp_name)
-            if len(comp_instance) > 0:
-                print("Specified component (" + comp_name + ") already present in KG")
-                comp_uuid = comp_instance[0].split("#")[1]
+            comp_instance = self.instance_resolver.get_id("SuspectComponent", comp_name)
+            if comp_instance is not None:
+                logger.info("Specified component (%s) already present in KG", comp_name)
+                comp_uuid = comp_instance
             else:
+                self.instance_resolver.register("SuspectComponent", comp_name, comp_uuid)
                 fact_list.append(Fact((comp_uuid, RDF.type, self.onto_namespace["SuspectComponent"].toPython())))
                 fact_list.append(Fact((comp_uuid, self.onto_namespace.component_name, comp_name), property_fact=True))
 
@@ -454,17 +474,15 @@ class ExpertKnowledgeEnhancer:
 
             # draw channel connections - assumes that the channels are already part of the KG
             for chan in comp_knowledge.associated_chan:
-                associated_chan_instance = self.knowledge_graph_query_tool.query_channel_by_name(chan)
-                associated_chan_uuid = associated_chan_instance[0].split("#")[1]
+                associated_chan_uuid = self.instance_resolver.get_ids("Channel", chan)[0]
                 fact_list.append(Fact((comp_uuid, self.onto_namespace.hasChannel, associated_chan_uuid)))
             for coi in comp_knowledge.chan_of_interest:
-                channel_instance = self.knowledge_graph_query_tool.query_channel_by_name(coi)
-                channel_uuid = channel_instance[0].split("#")[1]
+                channel_uuid = self.instance_resolver.get_ids("Channel", coi)[0]
                 fact_list.append(Fact((comp_uuid, self.onto_namespace.hasCOI, channel_uuid)))
 
             for comp in comp_knowledge.affected_by:
                 # all components in the affected_by list should be defined in the KG, i.e., should have ex. 1 result
-                assert len(self.knowledge_graph_query_tool.query_suspect_component_by_name(comp)) == 1
+                assert len(self.instance_resolver.get_ids("SuspectComponent", comp)) == 1
                 fact_list.append(Fact((comp_uuid, self.onto_namespace.affected_by, comp), property_fact=True))
 
         return fact_list
@@ -477,15 +495,25 @@ class ExpertKnowledgeEnhancer:
         :return: generated fact list
         """
         fact_list = []
+        # resolve all referenced (sub)components / channels at once
+        self.instance_resolver.resolve("SubComponent", [sub_comp.sub_component for sub_comp in sub_comp_knowledge_list])
+        self.instance_resolver.resolve(
+            "SuspectComponent", [sub_comp.associated_suspect_component for sub_comp in sub_comp_knowledge_list]
+        )
+        self.instance_resolver.resolve(
+            "Channel", [sub_comp.associated_chan for sub_comp in sub_comp_knowledge_list]
+            + [sub_comp.chan_of_interest for sub_comp in sub_comp_knowledge_list]
+        )
         for sub_comp_knowledge in sub_comp_knowledge_list:
             sub_comp_name = sub_comp_knowledge.sub_component
             sub_comp_uuid = "sub_comp_" + uuid.uuid4().hex
             # check whether subcomponent to be added is already part of the KG
-            sub_comp_instance = self.knowledge_graph_query_tool.query_sub_component_by_name(sub_comp_name)
-            if len(sub_comp_instance) > 0:
-                print("Specified subcomponent (" + sub_comp_name + ") already present in KG")
-                sub_comp_uuid = sub_comp_instance[0].split("#")[1]
+            sub_comp_instance = self.instance_resolver.get_id("SubComponent", sub_comp_name)
+            if sub_comp_instance is not None:
+                logger.info("Specified subcomponent (%s) already present in KG", sub_comp_name)
+                sub_comp_uuid = sub_comp_instance
             else:
+                self.instance_resolver.register("SubComponent", sub_comp_name, sub_comp_uuid)
                 fact_list.append(Fact((sub_comp_uuid, RDF.type, self.onto_namespace["SubComponent"].toPython())))
                 fact_list.append(
                     Fact((sub_comp_uuid, self.onto_namespace.component_name, sub_comp_name), property_fact=True)
@@ -497,22 +525,15 @@ class ExpertKnowledgeEnhancer:
                 )
             )
             # connect to associated suspect component
-            suspect_comp_instance = self.knowledge_graph_query_tool.query_suspect_component_by_name(
-                sub_comp_knowledge.associated_suspect_component
-            )
-            suspect_comp_uuid = suspect_comp_instance[0].split("#")[1]
+            suspect_comp_uuid = self.instance_resolver.get_ids(
+                "SuspectComponent", sub_comp_knowledge.associated_suspect_component
+            )[0]
             fact_list.append(Fact((sub_comp_uuid, self.onto_namespace.elementOf, suspect_comp_uuid)))
 
             # draw channel connections - assumes that the channels are already part of the KG
-            associated_chan_instance = self.knowledge_graph_query_tool.query_channel_by_name(
-                sub_comp_knowledge.associated_chan
-            )
-            associated_chan_uuid = associated_chan_instance[0].split("#")[1]
+            associated_chan_uuid = self.instance_resolver.get_ids("Channel", sub_comp_knowledge.associated_chan)[0]
             fact_list.append(Fact((sub_comp_uuid, self.onto_namespace.hasChannel, associated_chan_uuid)))
-            channel_instance = self.knowledge_graph_query_tool.query_channel_by_name(
-                sub_comp_knowledge.chan_of_interest
-            )
-            channel_uuid = channel_instance[0].split("#")[1]
+            channel_uuid = self.instance_resolver.get_ids("Channel", sub_comp_knowledge.chan_of_interest)[0]
             fact_list.append(Fact((sub_comp_uuid, self.onto_namespace.hasCOI, channel_uuid)))
 
         return fact_list
@@ -528,29 +549,30 @@ class ExpertKnowledgeEnhancer:
         comp_set_name = comp_set_knowledge.component_set
         comp_set_uuid = "component_set_" + uuid.uuid4().hex
         # check whether component set to be added is already part of the KG
-        comp_set_instance = self.knowledge_graph_query_tool.query_component_set_by_name(comp_set_name)
-        if len(comp_set_instance) > 0:
-            print("Specified component set (" + comp_set_name + ") already present in KG")
-            comp_set_uuid = comp_set_instance[0].split("#")[1]
+        comp_set_instance = self.instance_resolver.get_id("ComponentSet", comp_set_name)
+        if comp_set_instance is not None:
+            logger.info("Specified component set (%s) already present in KG", comp_set_name)
+            comp_set_uuid = comp_set_instance
         else:
+            self.instance_resolver.register("ComponentSet", comp_set_name, comp_set_uuid)
             fact_list = [
                 Fact((comp_set_uuid, RDF.type, self.onto_namespace["ComponentSet"].toPython())),
                 Fact((comp_set_uuid, self.onto_namespace.set_name, comp_set_name), property_fact=True)
             ]
+        assert isinstance(comp_set_knowledge.verified_by, list)
+        # relate knowledge to already existing facts (all components resolved at once)
+        components_by_name = self.instance_resolver.resolve(
+            "SuspectComponent", comp_set_knowledge.includes + comp_set_knowledge.verified_by
+        )
         for containing_comp in comp_set_knowledge.includes:
-            # relate knowledge to already existing facts
-            sus_comp = self.knowledge_graph_query_tool.query_suspect_component_by_name(containing_comp)
             # should already be defined in KG
-            assert len(sus_comp) == 1
-            comp_uuid = sus_comp[0].split("#")[1]
+            assert len(components_by_name[containing_comp]) == 1
+            comp_uuid = components_by_name[containing_comp][0]
             fact_list.append(Fact((comp_set_uuid, self.onto_namespace.includes, comp_uuid)))
 
-        assert isinstance(comp_set_knowledge.verified_by, list)
         for verifying_comp in comp_set_knowledge.verified_by:
-            # relate knowledge to already existing facts
-            verifying_comp_instance = self.knowledge_graph_query_tool.query_suspect_component_by_name(verifying_comp)
-            assert len(verifying_comp_instance) == 1
-            verifying_comp_uuid = verifying_comp_instance[0].split("#")[1]
+            assert len(components_by_name[verifying_comp]) == 1
+            verifying_comp_uuid = components_by_name[verifying_comp][0]
             fact_list.append(Fact((verifying_comp_uuid, self.onto_namespace.verifies, comp_set_uuid)))
 
         return fact_list
@@ -580,9 +602,11 @@ class ExpertKnowledgeEnhancer:
         ]
 
         # input channel requirements
+        channels_by_name = self.instance_resolver.resolve(
+            "Channel", [channel for _, channel in model_knowledge.input_chan_req]
+        )
         for idx, channel in model_knowledge.input_chan_req:
-            channel_instance = self.knowledge_graph_query_tool.query_channel_by_name(channel)
-            channel_uuid = channel_instance[0].split("#")[1]
+            channel_uuid = channels_by_name[channel][0]
             input_chan_req_uuid = "input_chan_req_" + uuid.uuid4().hex
             fact_list.append(
                 Fact((input_chan_req_uuid, RDF.type, self.onto_namespace["InputChannelRequirement"].toPython()))
@@ -594,8 +618,7 @@ class ExpertKnowledgeEnhancer:
             fact_list.append(Fact((model_uuid, self.onto_namespace.hasRequirement, input_chan_req_uuid)))
 
         # suspect component to be assessed
-        sus_comp = self.knowledge_graph_query_tool.query_suspect_component_by_name(model_knowledge.classified_comp)
-        sus_comp_uuid = sus_comp[0].split("#")[1]
+        sus_comp_uuid = self.instance_resolver.get_ids("SuspectComponent", model_knowledge.classified_comp)[0]
         fact_list.append(Fact((model_uuid, self.onto_namespace.assesses, sus_comp_uuid)))
         return fact_list
 
@@ -607,6 +630,7 @@ class ExpertKnowledgeEnhancer:
         :return: generated fact list
         """
         channel_uuid = "channel_" + uuid.uuid4().hex
+        self.instance_resolver.register("Channel", channel_name, channel_uuid)
         fact_list = [
             Fact((channel_uuid, RDF.type, self.onto_namespace["Channel"].toPython())),
             Fact((channel_uuid, self.onto_namespace.channel_name, channel_name), property_fact=True)
@@ -655,6 +679,7 @@ class ExpertKnowledgeEnhancer:
             dtc=dtc, occurs_with=occurs_with, fault_condition=fault_condition, symptoms=symptoms,
             suspect_components=suspect_components
         )
+        self.instance_resolver.clear()
         fact_list = self.generate_dtc_related_facts(new_dtc_knowledge)
         self.fuseki_connection.extend_knowledge_graph(fact_list)
 
@@ -681,6 +706,7 @@ class ExpertKnowledgeEnhancer:
             suspect_component=suspect_component, oscilloscope=oscilloscope, affected_by=affected_by,
             associated_chan=associated_chan, chan_of_interest=chan_of_interest
         )
+        self.instance_resolver.clear()
         fact_list = self.generate_suspect_component_facts([new_component_knowledge])
         self.fuseki_connection.extend_knowledge_graph(fact_list)
 
@@ -708,6 +734,7 @@ class ExpertKnowledgeEnhancer:
             associated_chan=sub_component,
             chan_of_interest=sub_component
         )
+        self.instance_resolver.clear()
         fact_list = self.generate_sub_component_facts([new_sub_component_knowledge])
         self.fuseki_connection.extend_knowledge_graph(fact_list)
 
@@ -728,6 +755,7 @@ class ExpertKnowledgeEnhancer:
         new_comp_set_knowledge = ComponentSetKnowledge(
             component_set=component_set, includes=includes, verified_by=verified_by
         )
+        self.instance_resolver.clear()
         fact_list = self.generate_component_set_facts(new_comp_set_knowledge)
         self.fuseki_connection.extend_knowledge_graph(fact_list)
 
@@ -756,6 +784,7 @@ class ExpertKnowledgeEnhancer:
         new_model_knowledge = ModelKnowledge(
             input_len, exp_norm_method, measuring_instruction, model_id, classified_comp, input_chan_req, architecture
         )
+        self.instance_resolver.clear()
         fact_list = self.generate_model_facts(new_model_knowledge)
         self.fuseki_connection.extend_knowledge_graph(fact_list)
 
@@ -766,9 +795,138 @@ class ExpertKnowledgeEnhancer:
         :param channel_name: name of the channel
         """
         assert isinstance(channel_name, str)
+        self.instance_resolver.clear()
         fact_list = self.generate_channel_facts(channel_name)
         self.fuseki_connection.extend_knowledge_graph(fact_list)
 
+    def resolve_import_batch(
+            self, channels: List[str], components: List[ComponentKnowledge],
+            component_sets: List[ComponentSetKnowledge], models: List[ModelKnowledge], dtcs: List[DTCKnowledge]
+    ) -> None:
+        """
+        Resolves everything the specified knowledge refers to that is already part of the KG with one (batched) query
+        per class / relation, i.e., the subsequent fact generation does not have to query the KG.
+
+        :param channels: names of the channels to be added
+        :param components: suspect component knowledge to be added
+        :param component_sets: component set knowledge to be added
+        :param models: model knowledge to be added
+        :param dtcs: DTC knowledge to be added
+        """
+        self.instance_resolver.clear()
+        dtc_parser = DTCParser()
+        parsed_codes = [dtc_parser.parse_code_machine_readable(dtc.dtc) for dtc in dtcs]
+        subsystem_names = [parsed_code["vehicle_subsystem"] for parsed_code in parsed_codes]
+        symptoms = [symptom for dtc in dtcs for symptom in dtc.symptoms]
+        self.instance_resolver.resolve(
+            "Channel",
+            channels + [chan for comp in components for chan in comp.associated_chan + comp.chan_of_interest]
+            + [chan for model in models for _, chan in model.input_chan_req]
+        )
+        self.instance_resolver.resolve(
+            "SuspectComponent",
+            [name for comp in components for name in [comp.suspect_component] + comp.affected_by]
+            + [name for comp_set in component_sets for name in comp_set.includes + comp_set.verified_by]
+            + [model.classified_comp for model in models] + [name for dtc in dtcs for name in dtc.suspect_components]
+        )
+        self.instance_resolver.resolve("ComponentSet", [comp_set.component_set for comp_set in component_sets])
+        self.instance_resolver.resolve("DTC", [dtc.dtc for dtc in dtcs])
+        self.instance_resolver.resolve("VehicleSubsystem", subsystem_names)
+        self.instance_resolver.resolve(
+            "FaultCategory", [parsed_code["fault_description"] for parsed_code in parsed_codes]
+        )
+        self.instance_resolver.resolve("FaultCondition", [dtc.fault_condition for dtc in dtcs])
+        self.instance_resolver.resolve("Symptom", symptoms)
+        self.instance_resolver.resolve("manifestedBy", symptoms)
+        self.instance_resolver.resolve("hasAssociation", [dtc.dtc for dtc in dtcs])
+        self.instance_resolver.resolve("contains", subsystem_names)
+
+    def bulk_import(
+            self, channels: Union[List[str], None] = None, components: Union[List[ComponentKnowledge], None] = None,
+            component_sets: Union[List[ComponentSetKnowledge], None] = None,
+            models: Union[List[ModelKnowledge], None] = None, dtcs: Union[List[DTCKnowledge], None] = None,
+            chunk_size: int = EXTENSION_CHUNK_SIZE
+    ) -> Dict[str, float]:
+        """
+        Adds the specified knowledge to the knowledge graph as one import batch.
+
+        In contrast to the `add_..._to_knowledge_graph` methods, which query and extend the KG per entity, the import
+        is performed in three stages:
+            1. resolve everything already present in the KG with a handful of batched queries
+            2. generate the facts for all entities in memory (entities referenced repeatedly, e.g., symptoms or
+               subsystems shared by several DTCs, are only created once)
+            3. upload the combined fact set in chunked N-Triples requests
+
+        The entities are generated in the order channels, components, component sets, models, DTCs, i.e., entities can
+        refer to entities of the same batch that precede them in this order. If a chunk is not entered (non-2xx status
+        code), a RuntimeError is raised - the chunks entered before remain in the KG.
+
+        :param channels: names of the channels to be added
+        :param components: suspect component knowledge to be added
+        :param component_sets: component set knowledge to be added
+        :param models: model knowledge to be added
+        :param dtcs: DTC knowledge to be added
+        :param chunk_size: max number of facts per upload request
+        :return: import statistics (entities, facts, seconds, entities / s, facts / s)
+        """
+        channels = [] if channels is None else channels
+        components = [] if components is None else components
+        component_sets = [] if component_sets is None else component_sets
+        models = [] if models is None else models
+        dtcs = [] if dtcs is None else dtcs
+        start = time.perf_counter()
+        self.resolve_import_batch(channels, components, component_sets, models, dtcs)
+        resolved = time.perf_counter()
+
+        fact_list = []
+        for channel_name in channels:
+            fact_list += self.generate_channel_facts(channel_name)
+        fact_list += self.generate_suspect_component_facts(components)
+        for comp_set_knowledge in component_sets:
+            fact_list += self.generate_component_set_facts(comp_set_knowledge)
+        for model_knowledge in models:
+            fact_list += self.generate_model_facts(model_knowledge)
+        for dtc_knowledge in dtcs:
+            fact_list += self.generate_dtc_related_facts(dtc_knowledge)
+        generated = time.perf_counter()
+
+        try:
+            num_of_facts, status_codes = self.fuseki_connection.extend_knowledge_graph_in_chunks(fact_list, chunk_size)
+        finally:
+            # the instances registered for the batch are either in the KG now or (failed upload) not at all
+            self.instance_resolver.clear()
+        failed = [status_code for status_code in status_codes if not 200 <= status_code < 300]
+        if len(failed) > 0:
+            raise RuntimeError(
+                "bulk import failed - " + str(len(failed)) + " of " + str(len(status_codes))
+                + " chunks not entered (partially imported), HTTP status codes: " + ", ".join(str(c) for c in failed)
+            )
+        end = time.perf_counter()
+
+        num_of_entities = len(channels) + len(components) + len(component_sets) + len(models) + len(dtcs)
+        seconds = end - start
+        stats = {
+            "entities": num_of_entities,
+            "facts": num_of_facts,
+            "requests": len(status_codes),
+            "seconds": seconds,
+            "entities_per_second": num_of_entities / seconds if seconds > 0 else 0.0,
+            "facts_per_second": num_of_facts / seconds if seconds > 0 else 0.0
+        }
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("%s", colored(
+                "bulk import: " + str(num_of_entities) + " entities, " + str(num_of_facts) + " facts in "
+                + str(len(status_codes)) + " requests", "green", "on_grey", ["bold"]
+            ))
+        logger.info(
+            "resolution: %.2f s, fact generation: %.2f s, upload: %.2f s", resolved - start, generated - resolved,
+            end - generated
+        )
+        logger.info(
+            "throughput: %.1f entities/s, %.1f triples/s", stats["entities_per_second"], stats["facts_per_second"]
+        )
+        return stats
+
 
 if __name__ == '__main__':
     expert_knowledge_enhancer = ExpertKnowledgeEnhancer()
@@ -0,0 +1,172 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# @author Tim Bohne
+
+import logging
+import threading
+from typing import List, Union
+
+from termcolor import colored
+
+from obd_ontology.config import FACT_BUFFER_FLUSH_SIZE, FACT_BUFFER_FLUSH_INTERVAL, EXTENSION_CHUNK_SIZE
+from obd_ontology.connection_controller import ConnectionController
+from obd_ontology.fact import Fact
+from obd_ontology.log import get_logger
+
+logger = get_logger(__name__)
+
+
+class FactBuffer:
+    """
+    Write-behind buffer for KG extensions (unit of work), e.g., for all facts generated during one diagnosis.
+
+    Offers the `extend_knowledge_graph` method of the `ConnectionController`, but only collects the facts in memory.
+    They are entered into the KG in bulk (chunked N-Triples requests) when the buffer is flushed - explicitly, when
+    `flush_size` facts are buffered, or periodically every `flush_interval` seconds by a background thread (which also
+    performs the size-triggered flushes, so that the caller is not blocked by KG I/O). Facts that are not yet flushed
+    can be discarded (`rollback`). Buffered facts are not visible to KG queries until they are flushed.
+    """
+
+    def __init__(
+            self, fuseki_connection: ConnectionController, flush_size: Union[int, None] = FACT_BUFFER_FLUSH_SIZE,
+            flush_interval: Union[float, None] = FACT_BUFFER_FLUSH_INTERVAL, chunk_size: int = EXTENSION_CHUNK_SIZE
+    ) -> None:
+        """
+        Initializes the fact buffer.
+
+        :param fuseki_connection: connection to the KG the buffered facts are entered into
+        :param flush_size: number of buffered facts triggering a flush (None: no size-triggered flushes)
+        :param flush_interval: seconds between background flushes (None: no background thread, i.e., size-triggered
+                               flushes are performed synchronously)
+        :param chunk_size: max number of facts per request
+        """
+        self.fuseki_connection = fuseki_connection
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval
+        self.chunk_size = chunk_size
+        self.facts: List[Fact] = []
+        self.num_of_flushed_facts = 0
+        self.num_of_requests = 0
+        # error of the last background flush, raised by the next explicit flush
+        self.error: Union[Exception, None] = None
+        self.lock = threading.Lock()
+        # serializes flushes, i.e., facts are entered in the order they were buffered
+        self.flush_lock = threading.Lock()
+        self.flush_requested = threading.Condition(self.lock)
+        self.closed = False
+        self.worker = None
+        if flush_interval is not None:
+            self.worker = threading.Thread(target=self.run_background_flushes, name="fact_buffer", daemon=True)
+            self.worker.start()
+
+    def __len__(self) -> int:
+        """
+        Returns the number of buffered (not yet flushed) facts.
+
+        :return: number of buffered facts
+        """
+        with self.lock:
+            return len(self.facts)
+
+    def extend_knowledge_graph(self, facts: List[Fact]) -> None:
+        """
+        Buffers the facts to be entered into the knowledge graph.
+
+        :param facts: facts to be entered into the knowledge graph
+        """
+        with self.lock:
+            if self.closed:
+                raise RuntimeError("fact buffer already closed")
+            self.facts.extend(facts)
+            flush_due = self.flush_size is not None and len(self.facts) >= self.flush_size
+            if flush_due and self.worker is not None:
+                self.flush_requested.notify()
+        if flush_due and self.worker is None:
+            self.flush()
+
+    def flush(self) -> List[int]:
+        """
+        Enters all buffered facts into the knowledge graph. If the flush fails (exception or non-2xx status code), the
+        facts remain buffered and an exception is raised.
+
+        :return: HTTP status code for each sent request (chunk)
+        """
+        with self.flush_lock:
+            with self.lock:
+                error, self.error = self.error, None
+                facts, self.facts = self.facts, []
+            if error is not None:
+                self.requeue(facts)
+                raise error
+            if len(facts) == 0:
+                return []
+            try:
+                _, status_codes = self.fuseki_connection.extend_knowledge_graph_in_chunks(facts, self.chunk_size)
+            except Exception:
+                self.requeue(facts)
+                raise
+            failed = [status_code for status_code in status_codes if not 200 <= status_code < 300]
+            if len(failed) > 0:
+                # chunks that were entered successfully are entered again by the next flush, which does not change
+                # the KG (facts are IRI / literal triples, i.e., no blank nodes)
+                self.requeue(facts)
+                raise RuntimeError("flush failed - HTTP status codes: " + ", ".join(str(code) for code in failed))
+            self.num_of_flushed_facts += len(facts)
+            self.num_of_requests += len(status_codes)
+            return status_codes
+
+    def requeue(self, facts: List[Fact]) -> None:
+        """
+        Puts the specified facts (of a failed flush) back in front of the buffered facts.
+
+        :param facts: facts to be buffered again
+        """
+        with self.lock:
+            self.facts = facts + self.facts
+
+    def rollback(self) -> int:
+        """
+        Discards all buffered (not yet flushed) facts.
+
+        :return: number of discarded facts
+        """
+        with self.flush_lock, self.lock:
+            num_of_facts = len(self.facts)
+            self.facts = []
+            self.error = None
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(colored("\nrollback - discarded %d buffered facts", "yellow", "on_grey", ["bold"]), num_of_facts)
+        return num_of_facts
+
+    def run_background_flushes(self) -> None:
+        """
+        Flushes the buffer every `flush_interval` seconds or when `flush_size` facts are buffered (background thread).
+        """
+        while True:
+            with self.lock:
+                if not self.closed:
+                    self.flush_requested.wait(self.flush_interval)
+                if self.closed:
+                    return
+            try:
+                self.flush()
+            except Exception as e:
+                with self.lock:
+                    self.error = e
+
+    def close(self, commit: bool = True) -> List[int]:
+        """
+        Stops the background flushes and flushes (commit) or discards (rollback) the remaining facts.
+
+        :param commit: whether the remaining facts should be entered into the knowledge graph
+        :return: HTTP status code for each sent request (chunk) of the final flush
+        """
+        with self.lock:
+            self.closed = True
+            self.flush_requested.notify()
+        if self.worker is not None:
+            self.worker.join()
+        if not commit:
+            self.rollback()
+            return []
+        return self.flush()
@@ -0,0 +1,547 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# @author Tim Bohne
+
+import argparse
+import datetime
+import gzip
+import itertools
+import random
+import time
+import uuid
+from typing import Dict, List, TextIO, Tuple
+
+import numpy as np
+from rdflib import Graph
+from rdflib.compare import to_canonical_graph
+
+from obd_ontology.array_codec import ARRAY_ENCODINGS, encode_array
+from obd_ontology.config import ONTOLOGY_PREFIX, ARRAY_ENCODING, ARRAY_COMPRESSION
+from obd_ontology.ntriples import serialize_iri, serialize_literal
+
+RDF_TYPE = serialize_iri("http://www.w3.org/1999/02/22-rdf-syntax-ns#type")
+# first character of a DTC -> vehicle part (as parsed by the `dtc_parser`)
+VEHICLE_PARTS = {
+    "P": "powertrain (engine, transmission, and associated accessories)",
+    "C": "chassis (covering mechanical systems and functions: steering, suspension, and braking)",
+    "B": "body (parts mainly found in the passenger compartment area)",
+    "U": "network & vehicle integration (functions that are shared among computers and systems on the vehicle)"
+}
+# relative frequency of the DTC categories (powertrain codes dominate in practice)
+VEHICLE_PART_WEIGHTS = {"P": 0.7, "C": 0.1, "B": 0.1, "U": 0.1}
+# second character in 0-3, three hex digits
+CODES_PER_VEHICLE_PART = 4 * 16 ** 3
+# third character of powertrain DTCs -> vehicle subsystem
+POWERTRAIN_SUBSYSTEMS = {
+    "0": "fuel and air metering and auxiliary emission controls", "1": "fuel and air metering",
+    "2": "fuel and air metering (injector circuit)", "3": "ignition system or misfire",
+    "4": "auxiliary emission controls", "5": "vehicle speed controls and idle control system",
+    "6": "computer output circuit", "7": "transmission", "8": "transmission", "9": "transmission"
+}
+VEHICLE_MODELS = ["VW Polo 9N", "VW Golf VII", "Opel Astra K", "Opel Corsa F", "Ford Focus IV", "BMW 3er G20",
+                  "Audi A4 B9", "Skoda Octavia IV", "Seat Leon IV", "Renault Clio V"]
+HEATMAP_GEN_METHOD = "XCM GradCAM variable attribution map"
+# diagnoses are dated within this period
+FIRST_DIAG_DATE = datetime.date(2022, 1, 1)
+NUM_OF_DIAG_DAYS = 4 * 365
+# skew of the Zipf-like popularity of components, DTCs and symptoms (few frequent, many rare ones)
+POPULARITY_SKEW = 1.1
+
+
+class SyntheticKGGenerator:
+    """
+    Generates statistically realistic synthetic KGs (expert knowledge + diagnosis data) of arbitrary size for scaling
+    tests, written directly as N-Triples / N-Quads file (no Fuseki server, no `Fact` objects).
+
+    The statements are the ones the `ExpertKnowledgeEnhancer` and `OntologyInstanceGenerator` enter into the KG, i.e.,
+    the generated KGs can be queried with the `KnowledgeGraphQueryTool`. The output is streamed, i.e., the memory
+    consumption only depends on the size of the expert knowledge (DTCs, components), not on the number of diagnosis
+    logs, oscillograms or the signal length. All random choices (incl. the instance IDs) are derived from the seed, so
+    that the same parameters always produce the same file.
+    """
+
+    def __init__(
+            self, num_of_dtcs: int = 1000, num_of_components: int = 500, affected_by_depth: int = 3,
+            affected_by_fan_out: int = 2, num_of_symptoms: int = 200, num_of_vehicles: int = 100,
+            num_of_diag_logs: int = 1000, oscillograms_per_log: int = 3, signal_length: int = 500,
+            suspect_components_per_dtc: int = 3, oscilloscope_ratio: float = 0.8, seed: int = 42,
+            array_encoding: str = ARRAY_ENCODING, array_compression: bool = ARRAY_COMPRESSION,
+            namespace: str = ONTOLOGY_PREFIX
+    ) -> None:
+        """
+        Initializes the synthetic KG generator.
+
+        :param num_of_dtcs: number of DTCs (each with fault condition, category, subsystem and suspect components)
+        :param num_of_components: number of suspect components (each with channel, model and sub component)
+        :param affected_by_depth: depth of the `affected_by` trees the components are arranged in (0: no relations)
+        :param affected_by_fan_out: number of components affecting each (inner) component of the trees
+        :param num_of_symptoms: number of symptoms shared by the fault conditions
+        :param num_of_vehicles: number of vehicles the diagnosis logs are created for
+        :param num_of_diag_logs: number of diagnosis logs
+        :param oscillograms_per_log: number of oscillograms (classified by the component models) per diagnosis log
+        :param signal_length: number of values per oscillogram / heatmap
+        :param suspect_components_per_dtc: max number of suspect components (diagnostic associations) per DTC
+        :param oscilloscope_ratio: ratio of the components that are checked with an oscilloscope (the others are
+                                   checked by manual inspections)
+        :param seed: seed of the random choices
+        :param array_encoding: encoding of the time series and heatmaps, "text" | "float32" | "float16"
+        :param array_compression: whether binary encoded arrays are zlib compressed
+        :param namespace: namespace of the generated instances
+        """
+        if affected_by_fan_out < 1:
+            raise ValueError("affected_by fan-out must be at least 1")
+        if num_of_dtcs > len(VEHICLE_PARTS) * CODES_PER_VEHICLE_PART:
+            raise ValueError("at most " + str(len(VEHICLE_PARTS) * CODES_PER_VEHICLE_PART) + " DTCs can be generated")
+        if array_encoding not in ARRAY_ENCODINGS:
+            raise ValueError("unknown array encoding: " + array_encoding + " - expected one of " + str(ARRAY_ENCODINGS))
+        self.num_of_dtcs = num_of_dtcs
+        self.num_of_components = num_of_components
+        self.affected_by_depth = affected_by_depth
+        self.affected_by_fan_out = affected_by_fan_out
+        self.num_of_symptoms = num_of_symptoms
+        self.num_of_vehicles = num_of_vehicles
+        self.num_of_diag_logs = num_of_diag_logs
+        self.oscillograms_per_log = oscillograms_per_log
+        self.signal_length = signal_length
+        self.suspect_components_per_dtc = suspect_components_per_dtc
+        self.oscilloscope_ratio = oscilloscope_ratio
+        self.seed = seed
+        self.array_encoding = array_encoding
+        self.array_compression = array_compression
+        self.namespace = namespace
+        self.rng = random.Random(seed)
+        self.signal_rng = np.random.default_rng(seed)
+        self.out = None
+        # entity name -> N-Triples IRI term
+        self.terms: Dict[str, str] = {}
+        self.num_of_statements = 0
+        # expert knowledge referenced by the diagnosis data (kept in memory, all other data is streamed)
+        self.components: List[Tuple[str, str, str, str, bool]] = []  # (IRI, name, channel IRI, model ID, oscilloscope)
+        self.affecting_components: List[List[int]] = []
+        self.dtcs: List[Tuple[str, str, List[Tuple[str, int]]]] = []  # (IRI, fault cond IRI, [(DA IRI, comp idx)])
+        self.vehicles: List[str] = []
+        self.dtc_weights: List[float] = []
+
+    def generate(self, out: TextIO, ontology: str = None) -> int:
+        """
+        Generates the synthetic KG and writes it (N-Triples, which is also valid N-Quads for the default graph) to the
+        specified text stream.
+
+        :param out: text stream to write the statements to
+        :param ontology: path of an ontology file whose axioms should be written first, e.g.,
+                         "knowledge_base/raw_obd_ontology.owl" (None: instance data only)
+        :return: number of written statements
+        """
+        self.out = out
+        self.num_of_statements = 0
+        if ontology is not None:
+            self.write_ontology(ontology)
+        self.generate_components()
+        self.generate_component_sets()
+        self.generate_dtcs()
+        self.generate_vehicles()
+        for _ in range(self.num_of_diag_logs):
+            self.generate_diag_log()
+        return self.num_of_statements
+
+    def iri(self, name: str) -> str:
+        """
+        Returns the N-Triples term of the specified ontology entity, e.g., class or property (cached).
+
+        :param name: name of the entity / instance (without namespace)
+        :return: N-Triples IRI term
+        """
+        term = self.terms.get(name)
+        if term is None:
+            term = self.terms[name] = serialize_iri(self.namespace + name)
+        return term
+
+    def new_instance(self, prefix: str) -> str:
+        """
+        Returns the N-Triples term of a new instance (deterministic, seeded ID in the format of the generated UUIDs).
+
+        :param prefix: prefix of the instance name, e.g., "dtc_"
+        :return: N-Triples IRI term
+        """
+        return serialize_iri(self.namespace + prefix + "%032x" % self.rng.getrandbits(128))
+
+    def write(self, statements: List[Tuple[str, str, str]]) -> None:
+        """
+        Writes the specified statements (already serialized terms).
+
+        :param statements: (subject, predicate, object) terms
+        """
+        self.out.write("".join(s + " " + p + " " + o + " .\n" for s, p, o in statements))
+        self.num_of_statements += len(statements)
+
+    def write_ontology(self, path: str) -> None:
+        """
+        Writes the axioms of the specified ontology file.
+
+        :param path: path of the ontology file (RDF/XML, Turtle, etc.)
+        """
+        graph = Graph()
+        graph.parse(path)
+        # canonical blank node IDs and sorted statements - the rdflib serialization is not deterministic
+        canonical_graph = to_canonical_graph(graph)
+        lines = sorted(line for line in canonical_graph.serialize(format="nt").splitlines() if line.strip() != "")
+        self.out.write("\n".join(lines) + "\n")
+        self.num_of_statements += len(lines)
+
+    def popularity_weights(self, n: int) -> List[float]:
+        """
+        Returns cumulative Zipf-like weights for `n` items in random order, i.e., few items are chosen frequently.
+
+        :param n: number of items
+        :return: cumulative weights
+        """
+        weights = [1.0 / (rank + 1) ** POPULARITY_SKEW for rank in range(n)]
+        self.rng.shuffle(weights)
+        return list(itertools.accumulate(weights))
+
+    def affecting_component_indices(self, idx: int) -> List[int]:
+        """
+        Returns the indices of the components affecting the specified component - the components are arranged in
+        complete trees of depth `affected_by_depth` (heap layout), each component is affected by its children.
+
+        :param idx: component index
+        :return: indices of the affecting components
+        """
+        fan_out = self.affected_by_fan_out
+        tree_size = sum(fan_out ** level for level in range(self.affected_by_depth + 1))
+        root, pos = idx - idx % tree_size, idx % tree_size
+        children = range(pos * fan_out + 1, pos * fan_out + fan_out + 1)
+        return [root + child for child in children if child < tree_size and root + child < self.num_of_components]
+
+    def generate_components(self) -> None:
+        """
+        Generates the suspect components with their channel, sub component and classification model.
+        """
+        p = self.iri
+        for idx in range(self.num_of_components):
+            comp_name = "C" + str(idx)
+            chan_name = "signal_" + comp_name
+            comp, chan = self.new_instance("comp_"), self.new_instance("channel_")
+            sub_comp = self.new_instance("sub_comp_")
+            model, input_chan_req = self.new_instance("model_"), self.new_instance("input_chan_req_")
+            model_id = comp_name + "_XCM_v1_" + "%022x" % self.rng.getrandbits(88)
+            oscilloscope = self.rng.random() < self.oscilloscope_ratio
+            affecting = self.affecting_component_indices(idx)
+            self.components.append((comp, comp_name, chan, model_id, oscilloscope))
+            self.affecting_components.append(affecting)
+            statements = [
+                (chan, RDF_TYPE, p("Channel")), (chan, p("channel_name"), serialize_literal(chan_name)),
+                (comp, RDF_TYPE, p("SuspectComponent")), (comp, p("component_name"), serialize_literal(comp_name)),
+                (comp, p("use_oscilloscope"), serialize_literal(oscilloscope)), (comp, p("hasChannel"), chan),
+                (comp, p("hasCOI"), chan),
+                (sub_comp, RDF_TYPE, p("SubComponent")),
+                (sub_comp, p("component_name"), serialize_literal(chan_name + " (" + comp_name + ")")),
+                (sub_comp, p("use_oscilloscope"), serialize_literal(oscilloscope)),
+                (sub_comp, p("elementOf"), comp), (sub_comp, p("hasChannel"), chan), (sub_comp, p("hasCOI"), chan),
+                (model, RDF_TYPE, p("Model")), (model, p("input_length"), serialize_literal(self.signal_length)),
+                (model, p("exp_normalization_method"), serialize_literal("z_norm")),
+                (model, p("measuring_instruction"), serialize_literal("")),
+                (model, p("model_id"), serialize_literal(model_id)),
+                (model, p("architecture"), serialize_literal("XCM")),
+                (input_chan_req, RDF_TYPE, p("InputChannelRequirement")),
+                (input_chan_req, p("channel_idx"), serialize_literal(0)), (input_chan_req, p("expects"), chan),
+                (model, p("hasRequirement"), input_chan_req), (model, p("assesses"), comp)
+            ]
+            statements += [
+                (comp, p("affected_by"), serialize_literal("C" + str(affecting_idx))) for affecting_idx in affecting
+            ]
+            self.write(statements)
+
+    def generate_component_sets(self) -> None:
+        """
+        Generates component sets (one per 20 components), each including 2-4 components and verified by another one.
+        """
+        p = self.iri
+        for set_idx in range(self.num_of_components // 20):
+            comp_set = self.new_instance("component_set_")
+            members = self.rng.sample(range(self.num_of_components), 5)
+            statements = [(comp_set, RDF_TYPE, p("ComponentSet")), (comp_set, p("set_name"), serialize_literal(
+                "component set " + str(set_idx)
+            ))]
+            statements += [
+                (comp_set, p("includes"), self.components[idx][0]) for idx in members[:self.rng.randint(2, 4)]
+            ]
+            statements.append((self.components[members[4]][0], p("verifies"), comp_set))
+            self.write(statements)
+
+    def dtc_codes(self) -> List[str]:
+        """
+        Returns distinct DTCs, e.g., "P0172" (vehicle part according to `VEHICLE_PART_WEIGHTS`, generic and
+        manufacturer-specific codes).
+
+        :return: DTCs
+        """
+        codes = set()
+        # vehicle parts with unused codes -> number of used codes
+        available = {part: 0 for part in VEHICLE_PART_WEIGHTS}
+        while len(codes) < self.num_of_dtcs:
+            part = self.rng.choices(list(available), [VEHICLE_PART_WEIGHTS[part] for part in available])[0]
+            code = part + str(self.rng.randint(0, 3)) + "%03X" % self.rng.getrandbits(12)
+            if code not in codes:
+                codes.add(code)
+                available[part] += 1
+                if available[part] == CODES_PER_VEHICLE_PART:
+                    del available[part]
+        return sorted(codes)
+
+    def generate_dtcs(self) -> None:
+        """
+        Generates the DTCs with subsystem, fault category, fault condition, symptoms, co-occurring DTCs and diagnostic
+        associations (suspect components ordered by priority).
+        """
+        p = self.iri
+        codes = self.dtc_codes()
+        self.rng.shuffle(codes)
+        subsystems: Dict[str, str] = {}
+        categories = [self.new_instance("fault_cat_") for _ in range(max(1, self.num_of_dtcs // 10))]
+        for idx, cat in enumerate(categories):
+            self.write([(cat, RDF_TYPE, p("FaultCategory")), (cat, p("category_description"), serialize_literal(
+                "fault category " + str(idx)
+            ))])
+        symptoms = [self.new_instance("symptom_") for _ in range(self.num_of_symptoms)]
+        for idx, symptom in enumerate(symptoms):
+            self.write([(symptom, RDF_TYPE, p("Symptom")), (symptom, p("symptom_description"), serialize_literal(
+                "symptom " + str(idx)
+            ))])
+        symptom_weights = self.popularity_weights(len(symptoms))
+        comp_weights = self.popularity_weights(self.num_of_components)
+        subsystem_components = set()
+        for code in codes:
+            dtc, fault_cond = self.new_instance("dtc_"), self.new_instance("fault_cond_")
+            subsystem_name = POWERTRAIN_SUBSYSTEMS[code[2]] if code[0] == "P" and code[2] in POWERTRAIN_SUBSYSTEMS \
+                else VEHICLE_PARTS[code[0]].split(" ")[0] + " subsystem " + code[2]
+            statements = [
+                (dtc, RDF_TYPE, p("DTC")), (dtc, p("code"), serialize_literal(code)),
+                (dtc, p("code_type"), serialize_literal("generic" if code[1] in "02" else "manufacturer-specific"))
+            ]
+            subsystem = subsystems.get(subsystem_name)
+            if subsystem is None:
+                subsystem = subsystems[subsystem_name] = self.new_instance("vehicle_subsystem_")
+                statements += [
+                    (subsystem, RDF_TYPE, p("VehicleSubsystem")),
+                    (subsystem, p("subsystem_name"), serialize_literal(subsystem_name)),
+                    (subsystem, p("vehicle_part"), serialize_literal(VEHICLE_PARTS[code[0]]))
+                ]
+            statements.append((dtc, p("indicates"), subsystem))
+            statements += [
+                (dtc, p("occurs_with_DTC"), serialize_literal(other))
+                for other in self.rng.sample(codes, min(len(codes), self.rng.randint(0, 2))) if other != code
+            ]
+            statements += [
+                (dtc, p("hasCategory"), self.rng.choice(categories)),
+                (fault_cond, RDF_TYPE, p("FaultCondition")),
+                (fault_cond, p("condition_description"), serialize_literal("FC " + code)),
+                (dtc, p("represents"), fault_cond)
+            ]
+            if len(symptoms) > 0:
+                statements += [(fault_cond, p("manifestedBy"), symptom) for symptom in dict.fromkeys(
+                    self.rng.choices(symptoms, cum_weights=symptom_weights, k=self.rng.randint(0, 3))
+                )]
+            associations = []
+            suspect_components = self.rng.choices(
+                range(self.num_of_components), cum_weights=comp_weights,
+                k=self.rng.randint(1, self.suspect_components_per_dtc)
+            ) if self.num_of_components > 0 else []
+            for priority, comp_idx in enumerate(dict.fromkeys(suspect_components)):
+                comp = self.components[comp_idx][0]
+                diag_association = self.new_instance("diag_association_")
+                associations.append((diag_association, comp_idx))
+                statements += [
+                    (diag_association, RDF_TYPE, p("DiagnosticAssociation")),
+                    (dtc, p("hasAssociation"), diag_association),
+                    (diag_association, p("priority_id"), serialize_literal(priority)),
+                    (diag_association, p("pointsTo"), comp)
+                ]
+                if (subsystem, comp) not in subsystem_components:
+                    subsystem_components.add((subsystem, comp))
+                    statements.append((subsystem, p("contains"), comp))
+            self.dtcs.append((dtc, fault_cond, associations))
+            self.write(statements)
+        self.dtc_weights = self.popularity_weights(len(self.dtcs))
+
+    def generate_vehicles(self) -> None:
+        """
+        Generates the vehicles the diagnosis logs are created for.
+        """
+        p = self.iri
+        for idx in range(self.num_of_vehicles):
+            vehicle_uuid = uuid.UUID(int=self.rng.getrandbits(128), version=4)
+            vehicle = serialize_iri(self.namespace + "vehicle_" + str(vehicle_uuid))
+            self.vehicles.append(vehicle)
+            self.write([
+                (vehicle, RDF_TYPE, p("Vehicle")),
+                (vehicle, p("model"), serialize_literal(self.rng.choice(VEHICLE_MODELS))),
+                (vehicle, p("HSN"), serialize_literal(str(self.rng.randint(10 ** 8, 10 ** 9 - 1)))),
+                (vehicle, p("TSN"), serialize_literal(str(self.rng.randint(10 ** 8, 10 ** 9 - 1)))),
+                (vehicle, p("VIN"), serialize_literal("W0L" + str(idx).zfill(14)))
+            ])
+
+    def signal(self) -> np.ndarray:
+        """
+        Returns a synthetic sensor signal (noisy periodic voltage curve, two decimals as the recorded signals).
+
+        :return: signal of length `signal_length`
+        """
+        t = np.linspace(0, self.signal_rng.uniform(2, 20) * np.pi, self.signal_length)
+        values = self.signal_rng.uniform(0.5, 14) + self.signal_rng.uniform(0.1, 2) * np.sin(t)
+        return np.round(values + self.signal_rng.normal(0, 0.05, self.signal_length), 2)
+
+    def heatmap(self) -> np.ndarray:
+        """
+        Returns a synthetic heatmap (attribution values in [0, 1] with a few peaks).
+
+        :return: heatmap of length `signal_length`
+        """
+        values = np.convolve(self.signal_rng.random(self.signal_length) ** 8, np.ones(25) / 25, mode="same")
+        return np.round(values / max(values.max(), 1e-9), 4)
+
+    def encode(self, values: np.ndarray) -> str:
+        """
+        Encodes the specified array as literal term.
+
+        :param values: array to be encoded
+        :return: N-Triples literal term
+        """
+        return serialize_literal(encode_array(values, self.array_encoding, self.array_compression))
+
+    def generate_diag_log(self) -> None:
+        """
+        Generates one diagnosis log: vehicle, date, DTCs, fault path and the diagnostic steps.
+
+        The steps follow the diagnosis of the first DTC: its suspect components are checked in the order of their
+        priority (`ledTo` from the diagnostic association); for anomalies, the components affecting the anomalous one
+        are checked next (`reasonFor` from the anomalous classification). Components checked with an oscilloscope are
+        classified based on an oscillogram (+ heatmap), the others by manual inspections. Recorded oscillograms are
+        grouped in parallel recording sets according to `max_num_of_parallel_rec`.
+        """
+        p = self.iri
+        diag_log = self.new_instance("diag_log_")
+        max_num_of_parallel_rec = self.rng.choice([1, 2, 4, 8])
+        date = FIRST_DIAG_DATE + datetime.timedelta(days=self.rng.randrange(NUM_OF_DIAG_DAYS))
+        statements = [
+            (diag_log, RDF_TYPE, p("DiagLog")), (diag_log, p("date"), serialize_literal(date.isoformat())),
+            (diag_log, p("max_num_of_parallel_rec"), serialize_literal(max_num_of_parallel_rec))
+        ]
+        if len(self.vehicles) > 0:
+            statements.append((diag_log, p("createdFor"), self.rng.choice(self.vehicles)))
+        if len(self.dtcs) == 0:
+            self.write(statements)
+            return
+        dtc_indices = self.rng.choices(range(len(self.dtcs)), cum_weights=self.dtc_weights, k=self.rng.randint(1, 3))
+        dtc_indices = list(dict.fromkeys(dtc_indices))
+        statements += [(self.dtcs[idx][0], p("appearsIn"), diag_log) for idx in dtc_indices]
+        _, fault_cond, associations = self.dtcs[dtc_indices[0]]
+
+        # diagnostic steps: (reason, relation to reason, component index)
+        pending = [(da, "ledTo", comp_idx) for da, comp_idx in reversed(associations)]
+        num_of_oscillograms = 0
+        path = []
+        osci_set, osci_set_size = None, max_num_of_parallel_rec
+        max_steps = 2 * self.oscillograms_per_log + len(associations)
+        while len(pending) > 0 and num_of_oscillograms < self.oscillograms_per_log and len(path) < max_steps:
+            reason, relation, comp_idx = pending.pop()
+            comp, comp_name, chan, model_id, oscilloscope = self.components[comp_idx]
+            anomaly = self.rng.random() < 0.3
+            path.append(comp_name)
+            if oscilloscope:
+                classification = self.new_instance("oscillogram_classification_")
+                osci, heatmap = self.new_instance("oscillogram_"), self.new_instance("heatmap_")
+                if osci_set_size >= max_num_of_parallel_rec:
+                    osci_set, osci_set_size = self.new_instance("parallel_rec_oscillogram_set_"), 0
+                    statements.append((osci_set, RDF_TYPE, p("ParallelRecOscillogramSet")))
+                osci_set_size += 1
+                num_of_oscillograms += 1
+                uncertainty = self.rng.random() * 0.5 if anomaly else 0.5 + self.rng.random() * 0.5
+                statements += [
+                    (osci, RDF_TYPE, p("Oscillogram")), (osci, p("time_series"), self.encode(self.signal())),
+                    (osci, p("partOf"), osci_set), (osci, p("records"), chan),
+                    (heatmap, RDF_TYPE, p("Heatmap")),
+                    (heatmap, p("generation_method"), serialize_literal(HEATMAP_GEN_METHOD)),
+                    (heatmap, p("generated_heatmap"), self.encode(self.heatmap())),
+                    (heatmap, p("overlays"), osci),
+                    (classification, RDF_TYPE, p("OscillogramClassification")),
+                    (classification, p("prediction"), serialize_literal(anomaly)),
+                    (classification, p("uncertainty"), serialize_literal(round(uncertainty, 7))),
+                    (classification, p("model_id"), serialize_literal(model_id)),
+                    (classification, p("checks"), comp), (classification, p("classifies"), osci),
+                    (classification, p("produces"), heatmap)
+                ]
+            else:
+                classification = self.new_instance("manual_inspection_")
+                statements += [
+                    (classification, RDF_TYPE, p("ManualInspection")),
+                    (classification, p("prediction"), serialize_literal(anomaly)),
+                    (classification, p("checks"), comp)
+                ]
+            statements += [(reason, p(relation), classification), (classification, p("diagStep"), diag_log)]
+            if anomaly:
+                affecting = self.affecting_components[comp_idx]
+                pending += [(classification, "reasonFor", affecting_idx) for affecting_idx in reversed(affecting)]
+            # flush the oscillograms step by step (bounded memory for long signals)
+            self.write(statements)
+            statements = []
+
+        fault_path = self.new_instance("fault_path_")
+        self.write(statements + [
+            (fault_path, RDF_TYPE, p("FaultPath")),
+            (fault_path, p("path_description"), serialize_literal(" -> ".join(reversed(path)))),
+            (fault_cond, p("resultedIn"), fault_path), (diag_log, p("entails"), fault_path)
+        ])
+
+
+def open_output(path: str) -> TextIO:
+    """
+    Opens the specified output file for writing (gzipped if the path ends with ".gz").
+
+    :param path: path of the output file, e.g., "synthetic_kg.nq.gz"
+    :return: text stream
+    """
+    if path.endswith(".gz"):
+        # fast compression level - the generator would otherwise be bound by the compression
+        return gzip.open(path, "wt", encoding="utf-8", compresslevel=1)
+    return open(path, "w", encoding="utf-8")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Generates a synthetic KG (expert knowledge + diagnosis data) of the specified size as N-Triples / '
+                    'N-Quads file (.nt / .nq, optionally .gz)'
+    )
+    parser.add_argument('--output', type=str, required=True, help='output file, e.g., synthetic_kg.nq.gz')
+    parser.add_argument('--dtcs', type=int, default=1000, help='number of DTCs')
+    parser.add_argument('--components', type=int, default=500, help='number of suspect components')
+    parser.add_argument('--affected_by_depth', type=int, default=3, help='depth of the affected_by trees')
+    parser.add_argument('--affected_by_fan_out', type=int, default=2, help='fan-out of the affected_by trees')
+    parser.add_argument('--symptoms', type=int, default=200, help='number of symptoms')
+    parser.add_argument('--vehicles', type=int, default=100, help='number of vehicles')
+    parser.add_argument('--diag_logs', type=int, default=1000, help='number of diagnosis logs')
+    parser.add_argument('--oscillograms_per_log', type=int, default=3, help='number of oscillograms per diagnosis log')
+    parser.add_argument('--signal_length', type=int, default=500, help='number of values per oscillogram / heatmap')
+    parser.add_argument('--seed', type=int, default=42, help='seed of the random choices')
+    parser.add_argument(
+        '--array_encoding', type=str, default=ARRAY_ENCODING, choices=ARRAY_ENCODINGS,
+        help='encoding of the time series and heatmaps'
+    )
+    parser.add_argument('--array_compression', action='store_true', help='zlib compression of binary encoded arrays')
+    parser.add_argument(
+        '--ontology', type=str, default=None,
+        help='ontology file whose axioms are written first, e.g., knowledge_base/raw_obd_ontology.owl'
+    )
+    args = parser.parse_args()
+
+    generator = SyntheticKGGenerator(
+        num_of_dtcs=args.dtcs, num_of_components=args.components, affected_by_depth=args.affected_by_depth,
+        affected_by_fan_out=args.affected_by_fan_out, num_of_symptoms=args.symptoms, num_of_vehicles=args.vehicles,
+        num_of_diag_logs=args.diag_logs, oscillograms_per_log=args.oscillograms_per_log,
+        signal_length=args.signal_length, seed=args.seed, array_encoding=args.array_encoding,
+        array_compression=args.array_compression
+    )
+    start = time.perf_counter()
+    with open_output(args.output) as f:
+        num_of_statements = generator.generate(f, args.ontology)
+    print(f"{num_of_statements} statements written to {args.output} in {time.perf_counter() - start:.1f} s")
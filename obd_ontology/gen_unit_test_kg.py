@@ -2,6 +2,10 @@
 # -*- coding: utf-8 -*-
 # @author Tim Bohne
 
+import argparse
+
+from obd_ontology.backends import FILE_SCHEME, get_backend
+from obd_ontology.config import FUSEKI_URL
 from obd_ontology.expert_knowledge_enhancer import ExpertKnowledgeEnhancer
 
 AFFECTED_BY_MAPPING = {
@@ -19,8 +23,14 @@ if __name__ == '__main__':
     """
     Generates the KG required for the smach unit tests.
     """
+    parser = argparse.ArgumentParser(description='Generates the KG required for the smach unit tests')
+    parser.add_argument(
+        '--kg_url', type=str, default=FUSEKI_URL, required=False,
+        help='URL of the KG server or embedded KG file, e.g., file://knowledge_base/knowledge_graphs/unit_test_kg.nq.gz'
+    )
+    args = parser.parse_args()
 
-    expert_knowledge_enhancer = ExpertKnowledgeEnhancer()
+    expert_knowledge_enhancer = ExpertKnowledgeEnhancer(kg_url=args.kg_url)
 
     # initially, add all components to the KG without affected_by relations (satisfy requirements)
     # [odd ones: use_oscilloscope := True; even ones: use_oscilloscope := False] - to also include manual inspections
@@ -56,3 +66,5 @@ if __name__ == '__main__':
     # add DTCs (components must exist before linking to them)
     for dtc, comp in DTC_MAPPING.items():
         expert_knowledge_enhancer.add_dtc_to_knowledge_graph(dtc, [], "FC " + dtc, [], [comp])
+    if args.kg_url.startswith(FILE_SCHEME):
+        get_backend(args.kg_url).save()
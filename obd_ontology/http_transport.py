@@ -0,0 +1,154 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# @author Tim Bohne
+
+import threading
+from typing import Dict, Iterable, Tuple, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from obd_ontology.config import HTTP_POOL_SIZE, HTTP_MAX_RETRIES, HTTP_BACKOFF_FACTOR, HTTP_CONNECT_TIMEOUT, \
+    HTTP_READ_TIMEOUTS
+
+
+class PooledTransport:
+    """
+    Keep-alive HTTP transport for the communication with the knowledge graph server.
+
+    Wraps a `requests.Session` whose urllib3 connection pool is reused across requests, i.e., consecutive SPARQL
+    queries and updates do not have to establish a new TCP connection each time. Failed connection attempts as well
+    as temporary server errors of read-only requests are retried a bounded number of times with exponential backoff.
+    """
+
+    def __init__(
+            self, base_url: str, pool_size: int = HTTP_POOL_SIZE, max_retries: int = HTTP_MAX_RETRIES,
+            backoff_factor: float = HTTP_BACKOFF_FACTOR, connect_timeout: float = HTTP_CONNECT_TIMEOUT,
+            read_timeouts: Dict[str, float] = None
+    ) -> None:
+        """
+        Initializes the pooled transport.
+
+        :param base_url: URL of the server hosting the knowledge graph
+        :param pool_size: max number of connections kept alive in the pool
+        :param max_retries: max number of retries per request (connection errors and, for GET requests and read-only
+                            POST requests, read errors and 502 / 503 / 504 responses)
+        :param backoff_factor: backoff factor for the exponentially increasing sleep time between retries
+        :param connect_timeout: timeout (seconds) for establishing a connection
+        :param read_timeouts: read timeouts (seconds) per endpoint
+        """
+        self.base_url = base_url
+        self.connect_timeout = connect_timeout
+        self.read_timeouts = dict(HTTP_READ_TIMEOUTS if read_timeouts is None else read_timeouts)
+        # POST bodies are only resent if the connection could not be established, i.e., before anything was sent -
+        # re-adding N-Triples is not idempotent as soon as they contain blank nodes (every upload creates fresh
+        # nodes) and streamed bodies (e.g., backup restores) can only be consumed once; read and status errors are
+        # only retried for GET requests and read-only POST requests (queries, see `post`)
+        self.session = self.create_session(pool_size, Retry(
+            total=max_retries, backoff_factor=backoff_factor, status_forcelist=(502, 503, 504),
+            allowed_methods=frozenset(["GET"]), raise_on_status=False
+        ))
+        self.read_only_session = self.create_session(pool_size, Retry(
+            total=max_retries, backoff_factor=backoff_factor, status_forcelist=(502, 503, 504),
+            allowed_methods=frozenset(["POST"]), raise_on_status=False
+        ))
+
+    @staticmethod
+    def create_session(pool_size: int, retry: Retry) -> requests.Session:
+        """
+        Creates a session whose connection pool applies the specified retry policy.
+
+        :param pool_size: max number of connections kept alive in the pool
+        :param retry: retry policy
+        :return: session
+        """
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=retry)
+        session = requests.Session()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def get_timeout(self, endpoint: str) -> Tuple[float, Union[float, None]]:
+        """
+        Returns the (connect, read) timeout for the specified endpoint.
+
+        :param endpoint: endpoint to get timeout for
+        :return: (connect timeout, read timeout)
+        """
+        read_timeout = self.read_timeouts.get(endpoint)
+        if read_timeout is None:
+            # endpoint of another dataset, e.g., `/<dataset>/data` - timeout of the same service
+            service = endpoint.rsplit("/", 1)[-1]
+            read_timeout = next((t for e, t in self.read_timeouts.items() if e.rsplit("/", 1)[-1] == service), None)
+        return self.connect_timeout, read_timeout
+
+    def post(
+            self, endpoint: str, data: Union[bytes, Iterable[bytes]], headers: Dict[str, str], read_only: bool = False
+    ) -> requests.Response:
+        """
+        Sends a POST request to the specified endpoint of the knowledge graph server using a pooled connection.
+
+        :param endpoint: endpoint of the knowledge graph server, e.g., `/OBD/sparql`
+        :param data: request body
+        :param headers: HTTP headers of the request
+        :param read_only: whether the request does not modify the KG (e.g., a query), i.e., can safely be resent
+                          after a read error or temporary server error (502 / 503 / 504)
+        :return: server response
+        """
+        session = self.read_only_session if read_only else self.session
+        return session.post(
+            self.base_url + endpoint, data=data, headers=headers, timeout=self.get_timeout(endpoint)
+        )
+
+    def get(
+            self, endpoint: str, params: Dict[str, str], headers: Dict[str, str], stream: bool = False
+    ) -> requests.Response:
+        """
+        Sends a GET request to the specified endpoint of the knowledge graph server using a pooled connection.
+
+        :param endpoint: endpoint of the knowledge graph server, e.g., `/OBD/data`
+        :param params: query parameters of the request, e.g., {"graph": "default"}
+        :param headers: HTTP headers of the request
+        :param stream: whether the response body should be streamed (read chunk by chunk) instead of being loaded
+        :return: server response
+        """
+        return self.session.get(
+            self.base_url + endpoint, params=params, headers=headers, stream=stream,
+            timeout=self.get_timeout(endpoint)
+        )
+
+    def close(self) -> None:
+        """
+        Closes all pooled connections.
+        """
+        self.session.close()
+        self.read_only_session.close()
+
+
+_shared_transports: Dict[str, PooledTransport] = {}
+_shared_transports_lock = threading.Lock()
+
+
+def get_shared_transport(base_url: str) -> PooledTransport:
+    """
+    Returns the transport shared by all connections to the specified knowledge graph server (created on first use).
+
+    :param base_url: URL of the server hosting the knowledge graph
+    :return: shared pooled transport
+    """
+    with _shared_transports_lock:
+        if base_url not in _shared_transports:
+            _shared_transports[base_url] = PooledTransport(base_url)
+        return _shared_transports[base_url]
+
+
+def set_shared_transport(transport: PooledTransport) -> None:
+    """
+    Registers a custom-configured transport (e.g., larger pool) as the shared transport for its server URL.
+    Only affects connections that are established afterwards.
+
+    :param transport: transport to be shared
+    """
+    with _shared_transports_lock:
+        _shared_transports[transport.base_url] = transport
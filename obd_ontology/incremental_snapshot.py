@@ -0,0 +1,334 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# @author Tim Bohne
+
+import argparse
+import hashlib
+import io
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Set, TextIO, Tuple, Union
+
+from obd_ontology import knowledge_snapshot
+from obd_ontology.backends import get_backend
+from obd_ontology.config import FUSEKI_URL, ONTOLOGY_PREFIX
+from obd_ontology.connection_controller import ConnectionController
+from obd_ontology.knowledge_graph_index import KnowledgeGraphIndex, IndexedQueryTool
+from obd_ontology.knowledge_snapshot import SEPARATOR
+from obd_ontology.log import get_logger
+
+logger = get_logger(__name__)
+
+MANIFEST_VERSION = 1
+MANIFEST_SUFFIX = ".manifest.json"
+# prefixes of the dependency keys: statements of a subject, statements pointing to an IRI / to a literal
+SUBJECT_KEY = "s "
+OBJECT_KEY = "o "
+LITERAL_KEY = "l "
+
+
+class DependencyTrackingIndex(KnowledgeGraphIndex):
+    """
+    KG index that records which parts of the KG are read while a snapshot section is rendered (per thread), i.e., the
+    dependencies of the section, and provides digests of these parts to detect changes between two KG states.
+
+    A dependency is either the set of statements of a subject or the set of statements pointing to an IRI / literal.
+    Since sections are rendered deterministically from what they read, a section whose dependencies have the same
+    digests in two KG states renders to the same text.
+    """
+
+    def __init__(self, namespace: str = ONTOLOGY_PREFIX) -> None:
+        """
+        Initializes the (empty) dependency tracking KG index.
+
+        :param namespace: ontology namespace the local names are resolved in
+        """
+        super().__init__(namespace)
+        self.local = threading.local()
+        self.digests: Dict[str, str] = {}
+
+    @contextmanager
+    def track(self) -> Iterator[Set[str]]:
+        """
+        Records the dependency keys of all reads of the current thread within the context.
+
+        :return: set the dependency keys are added to
+        """
+        dependencies = set()
+        self.local.dependencies = dependencies
+        try:
+            yield dependencies
+        finally:
+            self.local.dependencies = None
+
+    def record(self, key: str) -> None:
+        """
+        Records the specified dependency key (if the current thread is tracking).
+
+        :param key: dependency key
+        """
+        dependencies = getattr(self.local, "dependencies", None)
+        if dependencies is not None:
+            dependencies.add(key)
+
+    def objects(self, subj: str, pred: str) -> List[str]:
+        self.record(SUBJECT_KEY + subj)
+        return super().objects(subj, pred)
+
+    def subjects(self, pred: str, obj: str, literal: bool = False) -> List[str]:
+        self.record((LITERAL_KEY if literal else OBJECT_KEY) + obj)
+        return super().subjects(pred, obj, literal)
+
+    def is_a(self, subj: str, cls: str) -> int:
+        self.record(SUBJECT_KEY + subj)
+        return super().is_a(subj, cls)
+
+    def instances(self, cls: str) -> List[str]:
+        self.record(OBJECT_KEY + self.namespace + cls)
+        return super().instances(cls)
+
+    def digest(self, key: str) -> str:
+        """
+        Returns the digest of the part of the KG specified by the dependency key (cached).
+
+        :param key: dependency key
+        :return: digest (hex) of the statements of the subject / pointing to the IRI or literal
+        """
+        digest = self.digests.get(key)
+        if digest is None:
+            kind, term = key[:2], key[2:]
+            if kind == SUBJECT_KEY:
+                entries = self.statements.get(term, {})
+            else:
+                entries = (self.literal_inverse if kind == LITERAL_KEY else self.inverse).get(term, {})
+            serialized = "\n".join(pred + "\0" + "\0".join(sorted(entries[pred])) for pred in sorted(entries))
+            digest = self.digests[key] = hashlib.blake2b(serialized.encode(), digest_size=16).hexdigest()
+        return digest
+
+
+def print_dtc_code_section(code: str, out: Union[TextIO, None] = None) -> None:
+    """
+    Prints the snapshot section of the DTC with the specified code (profile assembled for this DTC only).
+
+    :param code: diagnostic trouble code
+    :param out: stream to print to (None: stdout)
+    """
+    knowledge_snapshot.print_dtc_section(knowledge_snapshot.qt.query_dtc_profiles([code], False)[0], out)
+
+
+# perspectives of the snapshots in output order - name, title (None: header without sections), entity listing and
+# section printer, cf. the `knowledge_snapshot_*_perspective` functions
+EXPERT_SECTIONS = [
+    ("expert_header", None, None, None),
+    ("dtc", "DTC PERSPECTIVE", lambda qt: list(dict.fromkeys(qt.query_all_dtc_instances(False))),
+     print_dtc_code_section),
+    ("subsystem", "SUBSYSTEM PERSPECTIVE", lambda qt: qt.query_all_vehicle_subsystem_instances(False),
+     knowledge_snapshot.print_subsystem_section),
+    ("component", "COMPONENT PERSPECTIVE", lambda qt: qt.query_all_component_instances(False),
+     knowledge_snapshot.print_component_section),
+    ("component_set", "COMPONENT SET PERSPECTIVE", lambda qt: qt.query_all_component_set_instances(False),
+     knowledge_snapshot.print_component_set_section),
+    ("model", "MODEL PERSPECTIVE", lambda qt: qt.query_all_model_instances(False),
+     knowledge_snapshot.print_model_section),
+    ("channel", "CHANNEL PERSPECTIVE", lambda qt: qt.query_all_channel_instances(False),
+     knowledge_snapshot.print_channel_section)
+]
+DIAG_SECTIONS = [
+    ("diag_header", None, None, None),
+    ("parallel_osci", "PARALLEL OSCILLOGRAM SET PERSPECTIVE",
+     lambda qt: qt.query_all_parallel_rec_oscillogram_set_instances(False),
+     knowledge_snapshot.print_parallel_osci_section),
+    ("oscillogram", "OSCILLOGRAM PERSPECTIVE", lambda qt: qt.query_all_recorded_oscillograms(False),
+     knowledge_snapshot.print_oscillogram_section),
+    ("oscillogram_classification", "OSCILLOGRAM CLASSIFICATION PERSPECTIVE",
+     lambda qt: qt.query_all_oscillogram_classifications(False),
+     knowledge_snapshot.print_oscillogram_classification_section),
+    ("manual_inspection", "MANUAL INSPECTION PERSPECTIVE", lambda qt: qt.query_all_manual_inspection_instances(False),
+     knowledge_snapshot.print_manual_inspection_section),
+    ("diag_log", "DIAGNOSIS LOG PERSPECTIVE", lambda qt: qt.query_all_diag_log_instances(False),
+     knowledge_snapshot.print_diag_log_section),
+    ("fault_path", "FAULT PATH PERSPECTIVE", lambda qt: qt.query_all_fault_path_instances(False),
+     knowledge_snapshot.print_fault_path_section),
+    ("vehicle", "VEHICLE PERSPECTIVE", lambda qt: qt.query_all_vehicle_instances(False),
+     knowledge_snapshot.print_vehicle_section)
+]
+SECTIONS = {"expert": EXPERT_SECTIONS, "diag": DIAG_SECTIONS, "all": EXPERT_SECTIONS + DIAG_SECTIONS}
+HEADERS = {"expert_header": knowledge_snapshot.print_expert_header, "diag_header": knowledge_snapshot.print_diag_header}
+
+
+class IncrementalSnapshot:
+    """
+    Generates knowledge snapshots (index mode) together with a manifest of the per-entity sections (byte range in the
+    snapshot and dependencies on the KG incl. their digests). Given the previous snapshot and its manifest, only the
+    sections of new entities and of entities whose dependencies changed are rendered, all others are spliced in from
+    the previous snapshot - the result is identical to a full snapshot of the current KG.
+    """
+
+    def __init__(
+            self, kg_url: str = FUSEKI_URL, index: Union[DependencyTrackingIndex, None] = None,
+            dataset: Union[str, None] = None
+    ) -> None:
+        """
+        Initializes the incremental snapshot - by default, the complete KG is fetched and indexed.
+
+        :param kg_url: URL of the server hosting the knowledge graph (or `memory://` / `file://` URL)
+        :param index: already built dependency tracking index of the KG (None: fetch and index the KG)
+        :param dataset: name of the dataset on the KG server (None: endpoints configured in `config.py`)
+        """
+        if index is None:
+            start = time.perf_counter()
+            index = DependencyTrackingIndex()
+            connection = ConnectionController(
+                namespace=ONTOLOGY_PREFIX, fuseki_url=kg_url, backend=get_backend(kg_url, dataset)
+            )
+            index.load(connection.dump_knowledge_graph())
+            logger.info("indexed %d statements in %.2f s", index.num_of_statements, time.perf_counter() - start)
+        self.index = index
+        self.qt = IndexedQueryTool(index=index)
+
+    @staticmethod
+    def load_previous(snapshot_path: str, perspective: str) -> Tuple[Union[bytes, None], Dict[str, Any]]:
+        """
+        Loads the specified previous snapshot and its manifest (if both exist and match each other).
+
+        :param snapshot_path: path of the previous snapshot
+        :param perspective: perspective of the snapshot to be generated (previous one has to match)
+        :return: (previous snapshot, manifest) - (None, {}) if not available or not reusable
+        """
+        manifest_path = snapshot_path + MANIFEST_SUFFIX
+        if not os.path.isfile(snapshot_path) or not os.path.isfile(manifest_path):
+            logger.warning("no manifest for previous snapshot %s - generating full snapshot", snapshot_path)
+            return None, {}
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+        with open(snapshot_path, "rb") as f:
+            snapshot = f.read()
+        if manifest.get("version") != MANIFEST_VERSION or manifest.get("perspective") != perspective:
+            logger.warning("manifest of %s incompatible - generating full snapshot", snapshot_path)
+            return None, {}
+        if manifest.get("sha256") != hashlib.sha256(snapshot).hexdigest():
+            logger.warning("%s modified after generation - generating full snapshot", snapshot_path)
+            return None, {}
+        return snapshot, manifest
+
+    def render_section(self, print_section: Callable[[Any, TextIO], None], entity: Any) -> Tuple[bytes, Set[str]]:
+        """
+        Renders the snapshot section of the specified entity and records its dependencies.
+
+        :param print_section: section printer of the perspective
+        :param entity: entity to render the section for
+        :return: (encoded section, dependency keys)
+        """
+        buffer = io.StringIO()
+        with self.index.track() as dependencies:
+            print_section(entity, buffer)
+        return buffer.getvalue().encode(), dependencies
+
+    def generate(self, output_path: str, perspective: str = "all", previous_path: Union[str, None] = None) -> None:
+        """
+        Generates the snapshot (and its manifest) of the specified perspective.
+
+        :param output_path: path of the snapshot to be generated (manifest: path + `MANIFEST_SUFFIX`)
+        :param perspective: perspective of the snapshot [expert | diag | all]
+        :param previous_path: path of the previous snapshot to reuse unchanged sections from (None: full snapshot)
+        """
+        if perspective not in SECTIONS:
+            raise ValueError("unknown perspective: " + perspective)
+        start = time.perf_counter()
+        previous, previous_manifest = (None, {}) if previous_path is None else self.load_previous(
+            previous_path, perspective
+        )
+        # sections of the previous snapshot that are still valid (all dependencies unchanged)
+        previous_keys = previous_manifest.get("dependencies", {}).get("keys", [])
+        previous_digests = previous_manifest.get("dependencies", {}).get("digests", [])
+        changed = {
+            idx for idx, (key, digest) in enumerate(zip(previous_keys, previous_digests))
+            if self.index.digest(key) != digest
+        }
+        reusable = {
+            (name, section["key"]): section for name, sections in previous_manifest.get("perspectives", {}).items()
+            for section in sections if changed.isdisjoint(section["deps"])
+        }
+
+        knowledge_snapshot.qt = self.qt
+        snapshot_hash = hashlib.sha256()
+        perspectives = {}
+        dependency_keys = set()
+        num_of_rendered = num_of_reused = 0
+        with open(output_path, "wb") as out:
+            def write(data: bytes) -> None:
+                out.write(data)
+                snapshot_hash.update(data)
+
+            for name, title, list_entities, print_section in SECTIONS[perspective]:
+                if title is None:
+                    header = io.StringIO()
+                    HEADERS[name](header)
+                    write(header.getvalue().encode())
+                    continue
+                header = io.StringIO()
+                knowledge_snapshot.print_perspective_header(title, header)
+                write(header.getvalue().encode())
+                sections = perspectives[name] = []
+                for entity in list_entities(self.qt):
+                    key = json.dumps(entity, ensure_ascii=False)
+                    old_section = reusable.get((name, key))
+                    if old_section is not None:
+                        data = previous[old_section["offset"]:old_section["offset"] + old_section["length"]]
+                        dependencies = [previous_keys[idx] for idx in old_section["deps"]]
+                        num_of_reused += 1
+                    else:
+                        data, dependencies = self.render_section(print_section, entity)
+                        dependencies = sorted(dependencies)
+                        num_of_rendered += 1
+                    sections.append({"key": key, "offset": out.tell(), "length": len(data), "deps": dependencies})
+                    dependency_keys.update(dependencies)
+                    write(data)
+                write((SEPARATOR + "\n").encode())
+
+        # dependencies are stored once, the sections refer to them by position
+        keys = sorted(dependency_keys)
+        positions = {key: idx for idx, key in enumerate(keys)}
+        for sections in perspectives.values():
+            for section in sections:
+                section["deps"] = [positions[key] for key in section["deps"]]
+        manifest = {
+            "version": MANIFEST_VERSION, "perspective": perspective, "sha256": snapshot_hash.hexdigest(),
+            "dependencies": {"keys": keys, "digests": [self.index.digest(key) for key in keys]},
+            "perspectives": perspectives
+        }
+        with open(output_path + MANIFEST_SUFFIX, "w", encoding="utf-8") as f:
+            # serialized at once - considerably faster than `json.dump`, which streams via the pure Python encoder
+            f.write(json.dumps(manifest, ensure_ascii=False))
+        logger.info(
+            "snapshot %s: %d sections rendered, %d reused (%d changed dependencies) in %.2f s", output_path,
+            num_of_rendered, num_of_reused, len(changed), time.perf_counter() - start
+        )
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Incremental knowledge snapshot - re-renders only the sections of changed entities'
+    )
+    parser.add_argument('--output', type=str, required=True, help='snapshot file to be generated (+ manifest)')
+    parser.add_argument(
+        '--previous', type=str, required=False, default=None,
+        help='previous snapshot (generated by this script) to reuse the sections of unchanged entities from'
+    )
+    parser.add_argument(
+        '--perspective', type=str, choices=list(SECTIONS.keys()), required=False, default='all',
+        help='perspective of snapshot [expert | diag | all]'
+    )
+    parser.add_argument(
+        '--kg_url', type=str, default=FUSEKI_URL, required=False,
+        help='URL of the KG server or embedded KG file, e.g., file://<backup>.nt.gz'
+    )
+    parser.add_argument(
+        '--dataset', type=str, default=None, required=False,
+        help='dataset on the KG server, e.g., OBD (default: endpoints configured in config.py)'
+    )
+    args = parser.parse_args()
+    IncrementalSnapshot(kg_url=args.kg_url, dataset=args.dataset).generate(args.output, args.perspective, args.previous)
@@ -0,0 +1,137 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# @author Tim Bohne
+
+import threading
+from typing import Dict, Iterable, List, Union
+
+from obd_ontology import query_catalogue
+from obd_ontology.config import ONTOLOGY_PREFIX, FUSEKI_URL, RESOLVER_BATCH_SIZE
+from obd_ontology.connection_controller import ConnectionController
+from obd_ontology.sparql_template import SparqlTemplate
+
+# ontology class -> query resolving a batch of names (value of the naming property, e.g., `component_name`)
+RESOLVABLE_CLASSES: Dict[str, SparqlTemplate] = {
+    "SuspectComponent": query_catalogue.SUSPECT_COMPONENTS_BY_NAMES,
+    "SubComponent": query_catalogue.SUB_COMPONENTS_BY_NAMES,
+    "Channel": query_catalogue.CHANNELS_BY_NAMES,
+    "VehicleSubsystem": query_catalogue.VEHICLE_SUBSYSTEMS_BY_NAMES,
+    "ComponentSet": query_catalogue.COMPONENT_SETS_BY_NAMES,
+    "Symptom": query_catalogue.SYMPTOMS_BY_DESCRIPTIONS,
+    "FaultCondition": query_catalogue.FAULT_CONDITIONS_BY_DESCRIPTIONS,
+    "FaultCategory": query_catalogue.FAULT_CATS_BY_DESCRIPTIONS,
+    "DTC": query_catalogue.DTCS_BY_CODES
+}
+# relation -> query resolving a batch of names to the related instances / names
+RESOLVABLE_RELATIONS: Dict[str, SparqlTemplate] = {
+    # symptom description -> IDs of the fault conditions manifested by the symptom
+    "manifestedBy": query_catalogue.FAULT_CONDITIONS_BY_SYMPTOM_DESCRIPTIONS,
+    # DTC -> names of the suspect components the DTC has a diagnostic association with
+    "hasAssociation": query_catalogue.ASSOCIATED_COMPONENT_NAMES_BY_CODES,
+    # subsystem name -> names of the suspect components contained in the subsystem
+    "contains": query_catalogue.CONTAINED_COMPONENT_NAMES_BY_SUBSYSTEM_NAMES
+}
+
+
+class InstanceResolver:
+    """
+    Resolves names (e.g., component names, channel names, symptom descriptions) to the IDs of the corresponding
+    instances in the knowledge graph, and names to the instances / names they are related to (`RESOLVABLE_RELATIONS`),
+    e.g., DTCs to the suspect components they have a diagnostic association with.
+
+    All names of a class (relation) are resolved with one `VALUES` query (per `RESOLVER_BATCH_SIZE` names) instead of
+    one query per name. The results (incl. names without instance) are memoized until `clear` is called, i.e., for the
+    lifetime of an import batch - afterwards, the KG may have been modified (by this or another process).
+    """
+
+    def __init__(self, kg_url: str = FUSEKI_URL, batch_size: int = RESOLVER_BATCH_SIZE) -> None:
+        """
+        Initializes the instance resolver.
+
+        :param kg_url: URL of the knowledge graph server
+        :param batch_size: max number of names per query
+        """
+        self.fuseki_connection = ConnectionController(namespace=ONTOLOGY_PREFIX, fuseki_url=kg_url)
+        self.batch_size = batch_size
+        self.lookups = {**RESOLVABLE_CLASSES, **RESOLVABLE_RELATIONS}
+        # class / relation -> name -> instance IDs / related names (empty list: no instance in the KG)
+        self.resolved: Dict[str, Dict[str, List[str]]] = {lookup: {} for lookup in self.lookups}
+        self.lock = threading.Lock()
+
+    def resolve(self, cls: str, names: Iterable[str]) -> Dict[str, List[str]]:
+        """
+        Resolves the specified names of instances of the specified class (relation) - only names that are not yet
+        memoized are queried.
+
+        :param cls: ontology class, e.g., "SuspectComponent", or relation, e.g., "hasAssociation"
+        :param names: names to be resolved
+        :return: name -> instance IDs / related names (empty list if there is no such instance)
+        """
+        if cls not in self.lookups:
+            raise ValueError("no name resolution for " + cls)
+        names = list(dict.fromkeys(names))
+        with self.lock:
+            unresolved = [name for name in names if name not in self.resolved[cls]]
+        for i in range(0, len(unresolved), self.batch_size):
+            batch = unresolved[i:i + self.batch_size]
+            instances = {name: [] for name in batch}
+            query = self.lookups[cls].bind(names=batch)
+            for row in self.fuseki_connection.query_knowledge_graph(query, False):
+                value = row['value']['value']
+                instances[row['name']['value']].append(value.split("#")[1] if row['value']['type'] == "uri" else value)
+            with self.lock:
+                for name, ids in instances.items():
+                    self.resolved[cls].setdefault(name, sorted(ids))
+        with self.lock:
+            return {name: self.resolved[cls][name] for name in names}
+
+    def get_ids(self, cls: str, name: str) -> List[str]:
+        """
+        Returns the IDs of the instances of the specified class with the specified name (instances / names related to
+        the specified name).
+
+        :param cls: ontology class, e.g., "SuspectComponent", or relation, e.g., "hasAssociation"
+        :param name: name to be resolved
+        :return: instance IDs / related names (empty list if there is no such instance)
+        """
+        return self.resolve(cls, [name])[name]
+
+    def get_id(self, cls: str, name: str) -> Union[str, None]:
+        """
+        Returns the ID of the (first) instance of the specified class with the specified name.
+
+        :param cls: ontology class, e.g., "SuspectComponent"
+        :param name: name to be resolved
+        :return: instance ID or None if there is no such instance
+        """
+        ids = self.get_ids(cls, name)
+        return ids[0] if len(ids) > 0 else None
+
+    def register(self, cls: str, name: str, instance_id: str) -> None:
+        """
+        Registers an instance (relation) that is created as part of the current import batch (not yet entered into the
+        KG), so that later references to its name within the batch resolve to it instead of creating a duplicate.
+
+        :param cls: ontology class, e.g., "SuspectComponent", or relation, e.g., "hasAssociation"
+        :param name: name of the new instance (name of the relation's subject)
+        :param instance_id: ID of the new instance (related instance ID / name)
+        """
+        # the instances already present in the KG have to be known before adding the new one
+        self.resolve(cls, [name])
+        with self.lock:
+            ids = self.resolved[cls][name]
+            if instance_id not in ids:
+                self.resolved[cls][name] = ids + [instance_id]
+
+    def clear(self) -> None:
+        """
+        Discards the memoized resolutions, i.e., starts a new import batch.
+        """
+        with self.lock:
+            self.resolved = {lookup: {} for lookup in self.lookups}
+
+
+if __name__ == '__main__':
+    resolver = InstanceResolver()
+    print(resolver.resolve("SuspectComponent", ["Lambdasonde", "Saugrohrdrucksensor", "Batterie"]))
+    print(resolver.get_id("Channel", "chan0"))
@@ -0,0 +1,540 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# @author Tim Bohne
+
+import itertools
+import sys
+import time
+from typing import Dict, Iterable, List, Tuple, Union
+
+from obd_ontology.blob_store import BlobStore
+from obd_ontology.config import ONTOLOGY_PREFIX, FUSEKI_URL, BLOB_STORE_DIR
+from obd_ontology.connection_controller import ConnectionController
+from obd_ontology.dtc_profile import DTCProfile, SuspectComponentProfile
+from obd_ontology.log import get_logger
+from obd_ontology.ntriples import parse_ntriples
+
+logger = get_logger(__name__)
+
+RDF_TYPE = "http://www.w3.org/1999/02/22-rdf-syntax-ns#type"
+
+
+class KnowledgeGraphIndex:
+    """
+    In-memory index of a complete KG (subject -> predicate -> objects and the inverse direction), built from one
+    streamed N-Triples dump, i.e., one request instead of one query per entity and attribute.
+
+    Objects are stored as the values of SPARQL JSON results, i.e., IRIs without angle brackets and literals as their
+    lexical form. Predicates and classes are specified by their local names (in the ontology namespace).
+    """
+
+    def __init__(self, namespace: str = ONTOLOGY_PREFIX) -> None:
+        """
+        Initializes the (empty) KG index.
+
+        :param namespace: ontology namespace the local names are resolved in
+        """
+        self.namespace = namespace
+        # subject -> predicate -> objects
+        self.statements: Dict[str, Dict[str, List[str]]] = {}
+        # IRI / blank node object -> predicate -> subjects
+        self.inverse: Dict[str, Dict[str, List[str]]] = {}
+        # literal object -> predicate -> subjects
+        self.literal_inverse: Dict[str, Dict[str, List[str]]] = {}
+        self.num_of_statements = 0
+
+    def add(self, subj: str, pred: str, obj: str, literal: bool) -> None:
+        """
+        Adds the specified statement to the index.
+
+        :param subj: subject (IRI / blank node)
+        :param pred: predicate (IRI)
+        :param obj: object (IRI / blank node / lexical form of a literal)
+        :param literal: whether the object is a literal
+        """
+        pred = sys.intern(pred)
+        if not literal:
+            obj = sys.intern(obj)
+        self.statements.setdefault(subj, {}).setdefault(pred, []).append(obj)
+        inverse = self.literal_inverse if literal else self.inverse
+        inverse.setdefault(obj, {}).setdefault(pred, []).append(subj)
+        self.num_of_statements += 1
+
+    def load(self, chunks: Iterable[bytes]) -> None:
+        """
+        Adds all statements of the specified N-Triples serialization (e.g., streamed KG dump) to the index.
+
+        :param chunks: encoded N-Triples chunks
+        """
+        add = self.add
+        for subj, pred, obj, literal in parse_ntriples(chunks):
+            add(subj, pred, obj, literal)
+
+    def iri(self, name: str) -> str:
+        """
+        Returns the IRI of the specified ontology entity / instance.
+
+        :param name: local name, e.g., "DiagLog" or "diag_log_<uuid>"
+        :return: IRI
+        """
+        return self.namespace + name
+
+    def objects(self, subj: str, pred: str) -> List[str]:
+        """
+        Returns the objects of the statements with the specified subject and predicate.
+
+        :param subj: subject (IRI)
+        :param pred: local name of the predicate
+        :return: objects
+        """
+        return self.statements.get(subj, {}).get(self.namespace + pred, [])
+
+    def subjects(self, pred: str, obj: str, literal: bool = False) -> List[str]:
+        """
+        Returns the subjects of the statements with the specified predicate and object.
+
+        :param pred: local name of the predicate
+        :param obj: object (IRI or lexical form of a literal)
+        :param literal: whether the object is a literal
+        :return: subjects
+        """
+        inverse = self.literal_inverse if literal else self.inverse
+        return inverse.get(obj, {}).get(self.namespace + pred, [])
+
+    def is_a(self, subj: str, cls: str) -> int:
+        """
+        Checks whether the specified subject is an instance of the specified class.
+
+        :param subj: subject (IRI)
+        :param cls: local name of the class
+        :return: 1 if the subject is an instance of the class, 0 otherwise (number of matching type statements)
+        """
+        return int(self.namespace + cls in self.statements.get(subj, {}).get(RDF_TYPE, []))
+
+    def instances(self, cls: str) -> List[str]:
+        """
+        Returns the instances of the specified class.
+
+        :param cls: local name of the class
+        :return: instances (IRIs)
+        """
+        return self.inverse.get(self.namespace + cls, {}).get(RDF_TYPE, [])
+
+    def named(self, name_pred: str, name: str, cls: str) -> List[str]:
+        """
+        Returns the instances of the specified class with the specified name.
+
+        :param name_pred: local name of the name property, e.g., "component_name"
+        :param name: name of the instances
+        :param cls: local name of the class
+        :return: instances (IRIs)
+        """
+        return [subj for subj in self.subjects(name_pred, name, literal=True) if self.is_a(subj, cls)]
+
+
+class IndexedQueryTool:
+    """
+    Answers the queries of the `KnowledgeGraphQueryTool` that are required for the knowledge snapshot from a
+    `KnowledgeGraphIndex` of the complete KG, i.e., the whole snapshot costs one KG request (the N-Triples dump) and
+    time linear in the size of the KG.
+
+    The methods have the signatures of their counterparts in the `KnowledgeGraphQueryTool` and return the same
+    solutions (join semantics of the corresponding query catalogue templates, incl. multiplicities), but in a
+    deterministic order (sorted) instead of the order of the query engine.
+    """
+
+    def __init__(
+            self, kg_url: str = FUSEKI_URL, index: Union[KnowledgeGraphIndex, None] = None,
+            blob_dir: Union[str, None] = BLOB_STORE_DIR
+    ) -> None:
+        """
+        Initializes the indexed query tool - by default, the complete KG is fetched and indexed.
+
+        :param kg_url: URL of the server hosting the knowledge graph (or `memory://` / `file://` URL)
+        :param index: already built index of the KG (None: fetch and index the KG specified by `kg_url`)
+        :param blob_dir: directory of the blob store resolving array references (time series, heatmaps)
+        """
+        if index is None:
+            start = time.perf_counter()
+            index = KnowledgeGraphIndex()
+            index.load(ConnectionController(namespace=ONTOLOGY_PREFIX, fuseki_url=kg_url).dump_knowledge_graph())
+            logger.info("indexed %d statements in %.2f s", index.num_of_statements, time.perf_counter() - start)
+        self.index = index
+        self.blob_store = BlobStore(blob_dir) if blob_dir is not None else None
+
+    def iri(self, instance_id: str) -> str:
+        """
+        Returns the IRI of the specified instance.
+
+        :param instance_id: ID of the instance (local name)
+        :return: IRI
+        """
+        return self.index.iri(instance_id)
+
+    def values(self, subj: str, cls: str, pred: str) -> List[str]:
+        """
+        Returns the values of the specified property of the specified instance (no values if it is not an instance of
+        the specified class).
+
+        :param subj: instance (IRI)
+        :param cls: local name of the class the instance has to belong to
+        :param pred: local name of the property
+        :return: sorted values
+        """
+        return sorted(self.index.objects(subj, pred)) if self.index.is_a(subj, cls) else []
+
+    def related(self, pred: str, obj: str, cls: str) -> List[str]:
+        """
+        Returns the subjects related to the specified instance via the specified property (no subjects if the instance
+        is not an instance of the specified class).
+
+        :param pred: local name of the property
+        :param obj: instance (IRI) the subjects are related to
+        :param cls: local name of the class the instance has to belong to
+        :return: sorted subjects
+        """
+        return sorted(self.index.subjects(pred, obj)) if self.index.is_a(obj, cls) else []
+
+    def classification_values(self, classification_id: str, pred: str) -> List[str]:
+        """
+        Returns the values of the specified property of the specified oscillogram classification or manual
+        inspection (UNION of both types).
+
+        :param classification_id: ID of the classification / inspection
+        :param pred: local name of the property
+        :return: sorted values
+        """
+        subj = self.iri(classification_id)
+        types = self.index.is_a(subj, "OscillogramClassification") + self.index.is_a(subj, "ManualInspection")
+        return sorted(self.index.objects(subj, pred) * types)
+
+    def query_all_dtc_instances(self, verbose: bool = True) -> List[str]:
+        return sorted(code for dtc in self.index.instances("DTC") for code in self.index.objects(dtc, "code"))
+
+    def query_all_vehicle_subsystem_instances(self, verbose: bool = True) -> List[str]:
+        return sorted(
+            name for sub in self.index.instances("VehicleSubsystem")
+            for name in self.index.objects(sub, "subsystem_name")
+        )
+
+    def query_all_component_instances(self, verbose: bool = True) -> List[str]:
+        return sorted(
+            name for comp in self.index.instances("SuspectComponent")
+            for name in self.index.objects(comp, "component_name")
+        )
+
+    def query_all_component_set_instances(self, verbose: bool = True) -> List[str]:
+        return sorted(
+            name for comp_set in self.index.instances("ComponentSet")
+            for name in self.index.objects(comp_set, "set_name")
+        )
+
+    def query_all_channel_instances(self, verbose: bool = True) -> List[Tuple[str, str]]:
+        return sorted(
+            (chan, name) for chan in self.index.instances("Channel")
+            for name in self.index.objects(chan, "channel_name")
+        )
+
+    def query_all_vehicle_instances(self, verbose: bool = True) -> List[Tuple[str, str, str, str, str]]:
+        preds = ("HSN", "TSN", "VIN", "model")
+        return sorted(
+            (vehicle,) + values for vehicle in self.index.instances("Vehicle")
+            for values in itertools.product(*(self.index.objects(vehicle, pred) for pred in preds))
+        )
+
+    def query_all_model_instances(self, verbose: bool = True) -> List[Tuple[str, str, str, str, str, str]]:
+        preds = ("input_length", "exp_normalization_method", "measuring_instruction", "model_id", "architecture")
+        return sorted(
+            (model,) + values for model in self.index.instances("Model")
+            for values in itertools.product(*(self.index.objects(model, pred) for pred in preds))
+        )
+
+    def query_all_parallel_rec_oscillogram_set_instances(self, verbose: bool = True) -> List[str]:
+        return sorted(self.index.instances("ParallelRecOscillogramSet"))
+
+    def query_all_recorded_oscillograms(self, verbose: bool = True) -> List[str]:
+        return sorted(self.index.instances("Oscillogram"))
+
+    def query_all_oscillogram_classifications(self, verbose: bool = True) -> List[str]:
+        return sorted(self.index.instances("OscillogramClassification"))
+
+    def query_all_manual_inspection_instances(self, verbose: bool = True) -> List[str]:
+        return sorted(self.index.instances("ManualInspection"))
+
+    def query_all_diag_log_instances(self, verbose: bool = True) -> List[str]:
+        return sorted(self.index.instances("DiagLog"))
+
+    def query_all_fault_path_instances(self, verbose: bool = True) -> List[str]:
+        return sorted(self.index.instances("FaultPath"))
+
+    def query_contains_relation_by_subsystem(self, subsystem_name: str, verbose: bool = True) -> List[str]:
+        return sorted(
+            name for sub in self.index.named("subsystem_name", subsystem_name, "VehicleSubsystem")
+            for comp in self.index.objects(sub, "contains") if self.index.is_a(comp, "SuspectComponent")
+            for name in self.index.objects(comp, "component_name")
+        )
+
+    def query_vehicle_part_by_subsystem(self, subsystem: str, verbose: bool = True) -> List[str]:
+        return sorted(
+            part for sub in self.index.named("subsystem_name", subsystem, "VehicleSubsystem")
+            for part in self.index.objects(sub, "vehicle_part")
+        )
+
+    def query_verifies_relations_by_component_set(self, set_name: str, verbose: bool = True) -> List[str]:
+        return sorted(
+            name for comp_set in self.index.named("set_name", set_name, "ComponentSet")
+            for comp in self.index.subjects("verifies", comp_set) if self.index.is_a(comp, "SuspectComponent")
+            for name in self.index.objects(comp, "component_name")
+        )
+
+    def query_includes_relation_by_component_set(self, comp_set_name: str, verbose: bool = True) -> List[str]:
+        return sorted(
+            name for comp_set in self.index.named("set_name", comp_set_name, "ComponentSet")
+            for comp in self.index.objects(comp_set, "includes") if self.index.is_a(comp, "SuspectComponent")
+            for name in self.index.objects(comp, "component_name")
+        )
+
+    def query_oscilloscope_usage_by_suspect_component(self, component_name: str, verbose: bool = True) -> List[bool]:
+        return sorted(
+            usage == "true" for comp in self.index.named("component_name", component_name, "SuspectComponent")
+            for usage in self.index.objects(comp, "use_oscilloscope")
+        )
+
+    def query_affected_by_relations_by_suspect_component(self, component_name: str, verbose: bool = True) -> List[str]:
+        return sorted(
+            affecting for comp in self.index.named("component_name", component_name, "SuspectComponent")
+            for affecting in self.index.objects(comp, "affected_by")
+        )
+
+    def query_verifies_relation_by_suspect_component(self, component_name: str, verbose: bool = True) -> List[str]:
+        return sorted(
+            name for comp in self.index.named("component_name", component_name, "SuspectComponent")
+            for comp_set in self.index.objects(comp, "verifies") if self.index.is_a(comp_set, "ComponentSet")
+            for name in self.index.objects(comp_set, "set_name")
+        )
+
+    def query_sub_components_by_component(self, component_name: str, verbose: bool = True) -> List[str]:
+        return sorted(
+            name for comp in self.index.named("component_name", component_name, "SuspectComponent")
+            for sub_comp in self.index.subjects("elementOf", comp) if self.index.is_a(sub_comp, "SubComponent")
+            for name in self.index.objects(sub_comp, "component_name")
+        )
+
+    def query_oscillograms_by_parallel_osci_set(self, osci_set_id: str, verbose: bool = True) -> List[str]:
+        return self.related("partOf", self.iri(osci_set_id), "ParallelRecOscillogramSet")
+
+    def query_time_series_by_oscillogram_instance(self, osci_id: str, verbose: bool = True) -> List[str]:
+        return self.values(self.iri(osci_id), "Oscillogram", "time_series")
+
+    def query_model_id_by_osci_classification_id(self, osci_classification_id: str, verbose: bool = True) -> List[str]:
+        return self.values(self.iri(osci_classification_id), "OscillogramClassification", "model_id")
+
+    def query_uncertainty_by_osci_classification_id(
+            self, osci_classification_id: str, verbose: bool = True
+    ) -> List[str]:
+        return self.values(self.iri(osci_classification_id), "OscillogramClassification", "uncertainty")
+
+    def query_oscillogram_by_classification_instance(
+            self, osci_classification_id: str, verbose: bool = True
+    ) -> List[str]:
+        return self.values(self.iri(osci_classification_id), "OscillogramClassification", "classifies")
+
+    def query_heatmap_by_classification_instance(self, osci_classification_id: str, verbose: bool = True) -> List[str]:
+        return self.values(self.iri(osci_classification_id), "OscillogramClassification", "produces")
+
+    def query_generation_method_by_heatmap(self, heatmap_id: str, verbose: bool = True) -> List[str]:
+        return self.values(self.iri(heatmap_id), "Heatmap", "generation_method")
+
+    def query_heatmap_string_by_heatmap(self, heatmap_id: str, verbose: bool = True) -> List[str]:
+        return self.values(self.iri(heatmap_id), "Heatmap", "generated_heatmap")
+
+    def query_suspect_component_by_classification(self, classification_id: str, verbose: bool = True) -> List[str]:
+        return self.classification_values(classification_id, "checks")
+
+    def query_prediction_by_classification(self, classification_id: str, verbose: bool = True) -> List[str]:
+        return self.classification_values(classification_id, "prediction")
+
+    def query_reason_for_classification(self, osci_classification_id: str, verbose: bool = True) -> List[str]:
+        return self.related("reasonFor", self.iri(osci_classification_id), "OscillogramClassification")
+
+    def query_led_to_for_classification(self, osci_classification_id: str, verbose: bool = True) -> List[str]:
+        return self.related("ledTo", self.iri(osci_classification_id), "OscillogramClassification")
+
+    def query_reason_for_inspection(self, manual_inspection_id: str, verbose: bool = True) -> List[str]:
+        return self.related("reasonFor", self.iri(manual_inspection_id), "ManualInspection")
+
+    def query_led_to_for_inspection(self, manual_inspection_id: str, verbose: bool = True) -> List[str]:
+        return self.related("ledTo", self.iri(manual_inspection_id), "ManualInspection")
+
+    def query_date_by_diag_log(self, diag_log_id: str, verbose: bool = True) -> List[str]:
+        return self.values(self.iri(diag_log_id), "DiagLog", "date")
+
+    def query_max_num_of_parallel_rec_by_diag_log(self, diag_log_id: str, verbose: bool = True) -> List[str]:
+        return self.values(self.iri(diag_log_id), "DiagLog", "max_num_of_parallel_rec")
+
+    def query_dtcs_by_diag_log(self, diag_log_id: str, verbose: bool = True) -> List[str]:
+        return self.related("appearsIn", self.iri(diag_log_id), "DiagLog")
+
+    def query_fault_path_by_diag_log(self, diag_log_id: str, verbose: bool = True) -> List[str]:
+        return self.values(self.iri(diag_log_id), "DiagLog", "entails")
+
+    def query_vehicle_by_diag_log(self, diag_log_id: str, verbose: bool = True) -> List[str]:
+        return self.values(self.iri(diag_log_id), "DiagLog", "createdFor")
+
+    def query_diag_steps_by_diag_log(self, diag_log_id: str, verbose: bool = True) -> List[str]:
+        return self.related("diagStep", self.iri(diag_log_id), "DiagLog")
+
+    def query_fault_path_description_by_id(self, fault_path_id: str, verbose: bool = True) -> List[str]:
+        return self.values(self.iri(fault_path_id), "FaultPath", "path_description")
+
+    def query_resulted_in_by_fault_path(self, fault_path_id: str, verbose: bool = True) -> List[str]:
+        return self.related("resultedIn", self.iri(fault_path_id), "FaultPath")
+
+    def query_fault_condition_description_by_id(self, fault_condition_id: str, verbose: bool = True) -> List[str]:
+        return self.values(self.iri(fault_condition_id), "FaultCondition", "condition_description")
+
+    def query_dtcs_recorded_in_vehicle(self, vehicle_id: str, verbose: bool = True) -> List[str]:
+        vehicle = self.iri(vehicle_id)
+        if not self.index.is_a(vehicle, "Vehicle"):
+            return []
+        return sorted(
+            code for diag_log in self.index.subjects("createdFor", vehicle) if self.index.is_a(diag_log, "DiagLog")
+            for dtc in self.index.subjects("appearsIn", diag_log) if self.index.is_a(dtc, "DTC")
+            for code in self.index.objects(dtc, "code")
+        )
+
+    def query_suspect_component_name_by_model(self, model_id: str, verbose: bool = True) -> List[str]:
+        return sorted(
+            name for comp in self.values(self.iri(model_id), "Model", "assesses")
+            for name in self.index.objects(comp, "component_name")
+        )
+
+    def query_input_chan_req_by_model(self, model_id: str, verbose: bool = True) -> List[Tuple[str, str]]:
+        return sorted(
+            (input_chan_req, chan_idx) for input_chan_req in self.values(self.iri(model_id), "Model", "hasRequirement")
+            for chan_idx in self.index.objects(input_chan_req, "channel_idx")
+        )
+
+    def query_channel_by_input_req(self, input_req_id: str, verbose: bool = True) -> List[Tuple[str, str]]:
+        return sorted(
+            (chan, name) for chan in self.values(self.iri(input_req_id), "InputChannelRequirement", "expects")
+            for name in self.index.objects(chan, "channel_name")
+        )
+
+    def query_models_by_channel(self, channel_id: str, verbose: bool = True) -> List[str]:
+        return sorted(
+            model for input_req in self.related("expects", self.iri(channel_id), "Channel")
+            for model in self.index.subjects("hasRequirement", input_req) if self.index.is_a(model, "Model")
+        )
+
+    def query_suspect_component_names_by_channel(self, channel_id: str, verbose: bool = True) -> List[Tuple[str, str]]:
+        return sorted(
+            (comp, name) for comp in self.related("hasChannel", self.iri(channel_id), "Channel")
+            for name in self.index.objects(comp, "component_name")
+        )
+
+    def query_suspect_components_by_channel(self, channel_id: str, verbose: bool = True) -> List[Tuple[str, str]]:
+        return sorted(
+            (comp, name) for comp in self.related("hasCOI", self.iri(channel_id), "Channel")
+            for name in self.index.objects(comp, "component_name")
+        )
+
+    def query_dtc_profiles(self, codes: List[str] = None, verbose: bool = True) -> List[DTCProfile]:
+        """
+        Assembles the complete profiles of the specified DTCs (cf. `KnowledgeGraphQueryTool.query_dtc_profiles`).
+
+        :param codes: diagnostic trouble codes to assemble profiles for (None: all DTCs stored in the KG)
+        :param verbose: unused (signature of the KG query tool)
+        :return: DTC profiles (in the order of `codes`, sorted by code if all DTCs are considered)
+        """
+        index = self.index
+        if codes is None:
+            dtcs = sorted((code, dtc) for dtc in index.instances("DTC") for code in index.objects(dtc, "code"))
+        else:
+            dtcs = sorted((code, dtc) for code in set(codes) for dtc in index.named("code", code, "DTC"))
+        dtc_attributes = {}
+        dtc_components = {}
+        for code, dtc in dtcs:
+            attributes = dtc_attributes.setdefault(code, {
+                "category": [], "code_type": [], "fault_condition": [], "occurs_with": [], "symptom": [],
+                "subsystem": [], "vehicle_part": [], "vehicle": []
+            })
+            conditions = index.objects(dtc, "represents")
+            subsystems = [sub for sub in index.objects(dtc, "indicates") if index.is_a(sub, "VehicleSubsystem")]
+            attributes["category"] += [
+                desc for cat in index.objects(dtc, "hasCategory") if index.is_a(cat, "FaultCategory")
+                for desc in index.objects(cat, "category_description")
+            ]
+            attributes["code_type"] += index.objects(dtc, "code_type")
+            attributes["fault_condition"] += [
+                desc for cond in conditions for desc in index.objects(cond, "condition_description")
+            ]
+            attributes["occurs_with"] += index.objects(dtc, "occurs_with_DTC")
+            attributes["symptom"] += [
+                desc for cond in conditions for symptom in index.objects(cond, "manifestedBy")
+                if index.is_a(symptom, "Symptom") for desc in index.objects(symptom, "symptom_description")
+            ]
+            attributes["subsystem"] += [name for sub in subsystems for name in index.objects(sub, "subsystem_name")]
+            attributes["vehicle_part"] += [part for sub in subsystems for part in index.objects(sub, "vehicle_part")]
+            num_of_fault_conditions = sum(index.is_a(cond, "FaultCondition") for cond in conditions)
+            attributes["vehicle"] += [
+                (model, hsn, tsn, vin)
+                for diag_log in index.objects(dtc, "appearsIn") if index.is_a(diag_log, "DiagLog")
+                for vehicle in index.objects(diag_log, "createdFor") if index.is_a(vehicle, "Vehicle")
+                for hsn, tsn, vin, model in itertools.product(
+                    *(index.objects(vehicle, pred) for pred in ("HSN", "TSN", "VIN", "model"))
+                )
+            ] * num_of_fault_conditions
+
+            components = dtc_components.setdefault(code, {})
+            associations = sorted(
+                (int(prio), name, comp) for da in index.objects(dtc, "hasAssociation")
+                if index.is_a(da, "DiagnosticAssociation") for prio in index.objects(da, "priority_id")
+                for comp in index.objects(da, "pointsTo") if index.is_a(comp, "SuspectComponent")
+                for name in index.objects(comp, "component_name")
+            )
+            for prio, name, comp in associations:
+                comp_attributes = components.setdefault(name, {
+                    "priority": prio, "use_oscilloscope": [], "affected_by": [], "verifies": [], "contained_in": []
+                })
+                comp_attributes["use_oscilloscope"] += index.objects(comp, "use_oscilloscope")
+                comp_attributes["affected_by"] += index.objects(comp, "affected_by")
+                comp_attributes["verifies"] += [
+                    set_name for comp_set in index.objects(comp, "verifies") if index.is_a(comp_set, "ComponentSet")
+                    for set_name in index.objects(comp_set, "set_name")
+                ]
+                comp_attributes["contained_in"] += [
+                    sub_name for sub in index.subjects("contains", comp) if index.is_a(sub, "VehicleSubsystem")
+                    for sub_name in index.objects(sub, "subsystem_name")
+                ]
+
+        profiles = []
+        for code in (dtc_attributes.keys() if codes is None else codes):
+            if code not in dtc_attributes:
+                continue
+            attributes = {attr: sorted(values) for attr, values in dtc_attributes[code].items()}
+            suspect_components = [
+                SuspectComponentProfile(
+                    name, comp["priority"], len(comp["use_oscilloscope"]) > 0 and comp["use_oscilloscope"][0] == "true",
+                    sorted(comp["affected_by"]), sorted(comp["verifies"]), sorted(comp["contained_in"])
+                )
+                for name, comp in dtc_components[code].items()
+            ]
+            profiles.append(DTCProfile(
+                code, attributes["occurs_with"], self.first_or_default(attributes["category"]),
+                self.first_or_default(attributes["code_type"]), self.first_or_default(attributes["fault_condition"]),
+                attributes["vehicle"], attributes["symptom"], self.first_or_default(attributes["subsystem"]),
+                attributes["vehicle_part"], sorted(suspect_components, key=lambda comp_profile: comp_profile.priority)
+            ))
+        return profiles
+
+    @staticmethod
+    def first_or_default(values: List[str], default: str = "") -> str:
+        """
+        Returns the first of the specified (single-valued attribute) values.
+
+        :param values: values of the attribute
+        :param default: value to be returned if there are no values
+        :return: first value or default
+        """
+        return values[0] if len(values) > 0 else default
@@ -2,12 +2,19 @@
 # -*- coding: utf-8 -*-
 # @author Tim Bohne
 
-from typing import List, Tuple
+from typing import List, Tuple, Union
 
-from termcolor import colored
+import numpy as np
 
-from obd_ontology.config import ONTOLOGY_PREFIX, FUSEKI_URL
+from obd_ontology import query_catalogue
+from obd_ontology.blob_store import BlobStore, load_array
+from obd_ontology.config import ONTOLOGY_PREFIX, FUSEKI_URL, BLOB_STORE_DIR
 from obd_ontology.connection_controller import ConnectionController
+from obd_ontology.dtc_profile import DTCProfile, SuspectComponentProfile
+from obd_ontology.log import get_logger, log_banner, set_log_level
+from obd_ontology.sparql_terms import sparql_iri
+
+logger = get_logger(__name__)
 
 
 class KnowledgeGraphQueryTool:
@@ -16,14 +23,21 @@ class KnowledgeGraphQueryTool:
     the knowledge graph hosted on a Fuseki server.
     """
 
-    def __init__(self, kg_url: str = FUSEKI_URL) -> None:
+    def __init__(
+            self, kg_url: str = FUSEKI_URL, use_cache: bool = False, blob_dir: Union[str, None] = BLOB_STORE_DIR
+    ) -> None:
         """
         Initializes the KG query tool.
 
         :param kg_url: URL of the server hosting the knowledge graph
+        :param use_cache: whether query results should be cached (invalidated on KG modifications of this process)
+        :param blob_dir: directory of the blob store resolving array references (time series, heatmaps)
         """
         self.ontology_prefix = ONTOLOGY_PREFIX
-        self.fuseki_connection = ConnectionController(namespace=ONTOLOGY_PREFIX, fuseki_url=kg_url)
+        self.fuseki_connection = ConnectionController(
+            namespace=ONTOLOGY_PREFIX, fuseki_url=kg_url, use_cache=use_cache
+        )
+        self.blob_store = BlobStore(blob_dir) if blob_dir is not None else None
 
     def complete_ontology_entry(self, entry: str) -> str:
         """
@@ -32,36 +46,20 @@ class KnowledgeGraphQueryTool:
         :param entry: ontology entry (concept / relation) to be completed
         :return: completed ontology entry
         """
-        return "<" + self.ontology_prefix.replace('#', '#' + entry) + ">"
+        return sparql_iri(self.ontology_prefix.replace('#', '#' + entry))
 
-    def query_fault_causes_by_dtc(self, dtc: str) -> List[str]:
+    def query_fault_causes_by_dtc(self, dtc: str, verbose: bool = True) -> List[str]:
         """
         Queries the fault causes for the specified DTC.
 
         :param dtc: diagnostic trouble code to query fault causes for
+        :param verbose: if true, logging is activated
         :return: fault causes
         """
-        print("########################################################################")
-        print(colored("QUERY: fault causes for " + dtc, "green", "on_grey", ["bold"]))
-        print("########################################################################")
-        dtc_entry = self.complete_ontology_entry('DTC')
-        represents_entry = self.complete_ontology_entry('represents')
-        fault_cause_entry = self.complete_ontology_entry('FaultCause')
-        has_cause_entry = self.complete_ontology_entry('hasCause')
-        cause_desc_entry = self.complete_ontology_entry('cause_description')
-        code_entry = self.complete_ontology_entry('code')
-        s = f"""
-            SELECT ?cause_desc WHERE {{
-                ?dtc a {dtc_entry} .
-                ?dtc {represents_entry} ?condition .
-                ?dtc {code_entry} ?dtc_code .
-                ?cause a {fault_cause_entry} .
-                ?condition {has_cause_entry} ?cause .
-                ?cause {cause_desc_entry} ?cause_desc .
-                FILTER(STR(?dtc_code) = "{dtc}")
-            }}
-            """
-        return [row['cause_desc']['value'] for row in self.fuseki_connection.query_knowledge_graph(s, True)]
+        if verbose:
+            log_banner(logger, "QUERY: fault causes for %s", dtc)
+        s = query_catalogue.FAULT_CAUSES_BY_DTC.bind(dtc=dtc)
+        return [row['cause_desc']['value'] for row in self.fuseki_connection.query_knowledge_graph(s, verbose)]
 
     def query_fault_condition_by_dtc(self, dtc: str, verbose: bool = True) -> List[str]:
         """
@@ -72,44 +70,22 @@ class KnowledgeGraphQueryTool:
         :return: fault condition
         """
         if verbose:
-            print("########################################################################")
-            print(colored("QUERY: fault condition description for " + dtc, "green", "on_grey", ["bold"]))
-            print("########################################################################")
-        dtc_entry = self.complete_ontology_entry('DTC')
-        represents_entry = self.complete_ontology_entry('represents')
-        condition_desc_entry = self.complete_ontology_entry('condition_description')
-        code_entry = self.complete_ontology_entry('code')
-        s = f"""
-            SELECT ?condition_desc WHERE {{
-                ?dtc a {dtc_entry} .
-                ?dtc {represents_entry} ?condition .
-                ?dtc {code_entry} ?dtc_code .
-                ?condition {condition_desc_entry} ?condition_desc .
-                FILTER(STR(?dtc_code) = "{dtc}")
-            }}
-            """
+            log_banner(logger, "QUERY: fault condition description for %s", dtc)
+        s = query_catalogue.FAULT_CONDITION_BY_DTC.bind(dtc=dtc)
         return [row['condition_desc']['value'] for row in self.fuseki_connection.query_knowledge_graph(s, verbose)]
 
-    def query_fault_condition_by_description(self, desc: str) -> List[str]:
+    def query_fault_condition_by_description(self, desc: str, verbose: bool = True) -> List[str]:
         """
         Queries the fault condition instance for the specified description.
 
         :param desc: description to query fault condition instance for
+        :param verbose: if true, logging is activated
         :return: fault condition instance
         """
-        print("########################################################################")
-        print(colored("QUERY: fault condition for " + desc, "green", "on_grey", ["bold"]))
-        print("########################################################################")
-        fault_condition_entry = self.complete_ontology_entry('FaultCondition')
-        condition_desc_entry = self.complete_ontology_entry('condition_description')
-        s = f"""
-            SELECT ?fc WHERE {{
-                ?fc a {fault_condition_entry} .
-                ?fc {condition_desc_entry} ?desc
-                FILTER(STR(?desc) = "{desc}")
-            }}
-            """
-        return [row['fc']['value'] for row in self.fuseki_connection.query_knowledge_graph(s, True)]
+        if verbose:
+            log_banner(logger, "QUERY: fault condition for %s", desc)
+        s = query_catalogue.FAULT_CONDITION_BY_DESCRIPTION.bind(desc=desc)
+        return [row['fc']['value'] for row in self.fuseki_connection.query_knowledge_graph(s, verbose)]
 
     def query_symptoms_by_dtc(self, dtc: str, verbose: bool = True) -> List[str]:
         """
@@ -120,25 +96,8 @@ class KnowledgeGraphQueryTool:
         :return: symptoms
         """
         if verbose:
-            print("########################################################################")
-            print(colored("QUERY: symptoms for " + dtc, "green", "on_grey", ["bold"]))
-            print("########################################################################")
-        dtc_entry = self.complete_ontology_entry('DTC')
-        represents_entry = self.complete_ontology_entry('represents')
-        symptom_entry = self.complete_ontology_entry('Symptom')
-        manifested_by_entry = self.complete_ontology_entry('manifestedBy')
-        symptom_desc_entry = self.complete_ontology_entry('symptom_description')
-        code_entry = self.complete_ontology_entry('code')
-        s = f"""
-            SELECT ?symptom_desc WHERE {{
-                ?dtc a {dtc_entry} .
-                ?dtc {represents_entry} ?condition .
-                ?dtc {code_entry} "{dtc}" .
-                ?symptom a {symptom_entry} .
-                ?condition {manifested_by_entry} ?symptom .
-                ?symptom {symptom_desc_entry} ?symptom_desc .
-            }}
-            """
+            log_banner(logger, "QUERY: symptoms for %s", dtc)
+        s = query_catalogue.SYMPTOMS_BY_DTC.bind(dtc=dtc)
         return [row['symptom_desc']['value'] for row in self.fuseki_connection.query_knowledge_graph(s, verbose)]
 
     def query_indicates_by_dtc(self, dtc: str, verbose: bool = True) -> List[str]:
@@ -150,23 +109,8 @@ class KnowledgeGraphQueryTool:
         :return: indicated subsystem
         """
         if verbose:
-            print("########################################################################")
-            print(colored("QUERY: indicated subsystem for " + dtc, "green", "on_grey", ["bold"]))
-            print("########################################################################")
-        dtc_entry = self.complete_ontology_entry('DTC')
-        indicates_entry = self.complete_ontology_entry('indicates')
-        subsystem_entry = self.complete_ontology_entry('VehicleSubsystem')
-        sub_name_entry = self.complete_ontology_entry('subsystem_name')
-        code_entry = self.complete_ontology_entry('code')
-        s = f"""
-            SELECT ?sub_name WHERE {{
-                ?dtc a {dtc_entry} .
-                ?dtc {indicates_entry} ?subsystem .
-                ?dtc {code_entry} "{dtc}" .
-                ?subsystem a {subsystem_entry} .
-                ?subsystem {sub_name_entry} ?sub_name .
-            }}
-            """
+            log_banner(logger, "QUERY: indicated subsystem for %s", dtc)
+        s = query_catalogue.INDICATES_BY_DTC.bind(dtc=dtc)
         return [row['sub_name']['value'] for row in self.fuseki_connection.query_knowledge_graph(s, verbose)]
 
     def query_vehicle_part_by_subsystem(self, subsystem: str, verbose: bool = True) -> List[str]:
@@ -178,41 +122,22 @@ class KnowledgeGraphQueryTool:
         :return: vehicle part(s)
         """
         if verbose:
-            print("########################################################################")
-            print(colored("QUERY: vehicle part(s) for " + subsystem, "green", "on_grey", ["bold"]))
-            print("########################################################################")
-        subsystem_entry = self.complete_ontology_entry('VehicleSubsystem')
-        vehicle_part_entry = self.complete_ontology_entry('vehicle_part')
-        sub_name_entry = self.complete_ontology_entry('subsystem_name')
-        s = f"""
-            SELECT ?vehicle_part WHERE {{
-                ?subsystem a {subsystem_entry} .
-                ?subsystem {sub_name_entry} "{subsystem}" .
-                ?subsystem {vehicle_part_entry} ?vehicle_part .
-            }}
-            """
+            log_banner(logger, "QUERY: vehicle part(s) for %s", subsystem)
+        s = query_catalogue.VEHICLE_PART_BY_SUBSYSTEM.bind(subsystem=subsystem)
         return [row['vehicle_part']['value'] for row in self.fuseki_connection.query_knowledge_graph(s, verbose)]
 
-    def query_symptoms_by_desc(self, desc: str) -> List[str]:
+    def query_symptoms_by_desc(self, desc: str, verbose: bool = True) -> List[str]:
         """
         Queries the symptom instance for the specified description.
 
         :param desc: symptom description to query instance for
+        :param verbose: if true, logging is activated
         :return: symptom instance
         """
-        print("########################################################################")
-        print(colored("QUERY: symptom instance for " + desc, "green", "on_grey", ["bold"]))
-        print("########################################################################")
-        symptom_entry = self.complete_ontology_entry('Symptom')
-        symptom_desc_entry = self.complete_ontology_entry('symptom_description')
-        s = f"""
-            SELECT ?symptom WHERE {{
-                ?symptom a {symptom_entry} .
-                ?symptom {symptom_desc_entry} ?symptom_desc .
-                FILTER(STR(?symptom_desc) = "{desc}")
-            }}
-            """
-        return [row['symptom']['value'] for row in self.fuseki_connection.query_knowledge_graph(s, True)]
+        if verbose:
+            log_banner(logger, "QUERY: symptom instance for %s", desc)
+        s = query_catalogue.SYMPTOMS_BY_DESC.bind(desc=desc)
+        return [row['symptom']['value'] for row in self.fuseki_connection.query_knowledge_graph(s, verbose)]
 
     def query_fault_cat_by_dtc(self, dtc: str, verbose: bool = True) -> List[str]:
         """
@@ -223,46 +148,22 @@ class KnowledgeGraphQueryTool:
         :return: fault category
         """
         if verbose:
-            print("########################################################################")
-            print(colored("QUERY: fault category for " + dtc, "green", "on_grey", ["bold"]))
-            print("########################################################################")
-        dtc_entry = self.complete_ontology_entry('DTC')
-        has_cat_entry = self.complete_ontology_entry('hasCategory')
-        fault_cat = self.complete_ontology_entry('FaultCategory')
-        cat_desc_entry = self.complete_ontology_entry('category_description')
-        code_entry = self.complete_ontology_entry('code')
-        s = f"""
-            SELECT ?cat_desc WHERE {{
-                ?dtc a {dtc_entry} .
-                ?dtc {has_cat_entry} ?cat .
-                ?dtc {code_entry} ?dtc_code .
-                ?cat a {fault_cat} .
-                ?cat {cat_desc_entry} ?cat_desc .
-                FILTER(STR(?dtc_code) = "{dtc}")
-            }}
-            """
+            log_banner(logger, "QUERY: fault category for %s", dtc)
+        s = query_catalogue.FAULT_CAT_BY_DTC.bind(dtc=dtc)
         return [row['cat_desc']['value'] for row in self.fuseki_connection.query_knowledge_graph(s, verbose)]
 
-    def query_fault_cat_by_description(self, desc: str) -> List[str]:
+    def query_fault_cat_by_description(self, desc: str, verbose: bool = True) -> List[str]:
         """
         Queries the fault category instance by the specified fault description.
 
         :param desc: fault description to query fault category instance for
+        :param verbose: if true, logging is activated
         :return: fault category instance
         """
-        print("########################################################################")
-        print(colored("QUERY: fault category instance for " + desc, "green", "on_grey", ["bold"]))
-        print("########################################################################")
-        fault_cat = self.complete_ontology_entry('FaultCategory')
-        cat_desc_entry = self.complete_ontology_entry('category_description')
-        s = f"""
-            SELECT ?fc WHERE {{
-                ?fc a {fault_cat} .
-                ?fc {cat_desc_entry} ?fc_desc .
-                FILTER(STR(?fc_desc) = "{desc}")
-            }}
-            """
-        return [row['fc']['value'] for row in self.fuseki_connection.query_knowledge_graph(s, True)]
+        if verbose:
+            log_banner(logger, "QUERY: fault category instance for %s", desc)
+        s = query_catalogue.FAULT_CAT_BY_DESCRIPTION.bind(desc=desc)
+        return [row['fc']['value'] for row in self.fuseki_connection.query_knowledge_graph(s, verbose)]
 
     def query_suspect_components_by_dtc(self, dtc: str, verbose: bool = True) -> List[str]:
         """
@@ -273,27 +174,8 @@ class KnowledgeGraphQueryTool:
         :return: suspect components
         """
         if verbose:
-            print("########################################################################")
-            print(colored("QUERY: suspect components for " + dtc, "green", "on_grey", ["bold"]))
-            print("########################################################################")
-        dtc_entry = self.complete_ontology_entry('DTC')
-        suspect_comp_entry = self.complete_ontology_entry('SuspectComponent')
-        diag_association_entry = self.complete_ontology_entry('DiagnosticAssociation')
-        points_to_entry = self.complete_ontology_entry('pointsTo')
-        has_association_entry = self.complete_ontology_entry('hasAssociation')
-        component_name_entry = self.complete_ontology_entry('component_name')
-        code_entry = self.complete_ontology_entry('code')
-        s = f"""
-            SELECT ?comp_name WHERE {{
-                ?dtc a {dtc_entry} .
-                ?comp a {suspect_comp_entry} .
-                ?comp {component_name_entry} ?comp_name .
-                ?da a {diag_association_entry} .
-                ?dtc {code_entry} "{dtc}" .
-                ?da {points_to_entry} ?comp .
-                ?dtc {has_association_entry} ?da .
-            }}
-            """
+            log_banner(logger, "QUERY: suspect components for %s", dtc)
+        s = query_catalogue.SUSPECT_COMPONENTS_BY_DTC.bind(dtc=dtc)
         return [row['comp_name']['value'] for row in self.fuseki_connection.query_knowledge_graph(s, verbose)]
 
     def query_suspect_components_by_subsystem_name(self, subsystem_name: str, verbose: bool = True) -> List[str]:
@@ -305,149 +187,87 @@ class KnowledgeGraphQueryTool:
         :return: suspect components
         """
         if verbose:
-            print("########################################################################")
-            print(colored("QUERY: suspect components for " + subsystem_name, "green", "on_grey", ["bold"]))
-            print("########################################################################")
-        subsystem_entry = self.complete_ontology_entry('VehicleSubsystem')
-        contains_entry = self.complete_ontology_entry('contains')
-        sus_comp_entry = self.complete_ontology_entry('SuspectComponent')
-        subsystem_name_entry = self.complete_ontology_entry('subsystem_name')
-        comp_name_entry = self.complete_ontology_entry('component_name')
-        s = f"""
-            SELECT ?comp_name WHERE {{
-                ?sub a {subsystem_entry} .
-                ?sub {contains_entry} ?comp .
-                ?comp a {sus_comp_entry} .
-                ?sub {subsystem_name_entry} "{subsystem_name}" .
-                ?comp {comp_name_entry} ?comp_name .
-            }}
-            """
+            log_banner(logger, "QUERY: suspect components for %s", subsystem_name)
+        s = query_catalogue.SUSPECT_COMPONENTS_BY_SUBSYSTEM_NAME.bind(subsystem_name=subsystem_name)
         return [row['comp_name']['value'] for row in self.fuseki_connection.query_knowledge_graph(s, verbose)]
 
-    def query_suspect_component_by_name(self, component_name: str) -> List[str]:
+    def query_suspect_component_by_name(self, component_name: str, verbose: bool = True) -> List[str]:
         """
         Queries a suspect component by its component name.
 
         :param component_name: name to query suspect component for
+        :param verbose: if true, logging is activated
         :return: suspect component
         """
-        print("########################################################################")
-        print(colored("QUERY: suspect components by name - " + component_name, "green", "on_grey", ["bold"]))
-        print("########################################################################")
-        suspect_comp_entry = self.complete_ontology_entry('SuspectComponent')
-        component_name_entry = self.complete_ontology_entry('component_name')
-        s = f"""
-            SELECT ?comp WHERE {{
-                ?comp a {suspect_comp_entry} .
-                ?comp {component_name_entry} ?comp_name .
-                FILTER(STR(?comp_name) = "{component_name}")
-            }}
-            """
-        return [row['comp']['value'] for row in self.fuseki_connection.query_knowledge_graph(s, True)]
-
-    def query_sub_component_by_name(self, sub_component_name: str) -> List[str]:
+        if verbose:
+            log_banner(logger, "QUERY: suspect components by name - %s", component_name)
+        s = query_catalogue.SUSPECT_COMPONENT_BY_NAME.bind(component_name=component_name)
+        return [row['comp']['value'] for row in self.fuseki_connection.query_knowledge_graph(s, verbose)]
+
+    def query_sub_component_by_name(self, sub_component_name: str, verbose: bool = True) -> List[str]:
         """
         Queries a subcomponent by its name.
 
         :param sub_component_name: name to query subcomponent for
+        :param verbose: if true, logging is activated
         :return: subcomponent
         """
-        print("########################################################################")
-        print(colored("QUERY: subcomponents by name - " + sub_component_name, "green", "on_grey", ["bold"]))
-        print("########################################################################")
-        sub_comp_entry = self.complete_ontology_entry('SubComponent')
-        component_name_entry = self.complete_ontology_entry('component_name')
-        s = f"""
-            SELECT ?sub_comp WHERE {{
-                ?sub_comp a {sub_comp_entry} .
-                ?sub_comp {component_name_entry} ?comp_name .
-                FILTER(STR(?comp_name) = "{sub_component_name}")
-            }}
-            """
-        return [row['sub_comp']['value'] for row in self.fuseki_connection.query_knowledge_graph(s, True)]
-
-    def query_channel_by_name(self, chan_name: str) -> List[str]:
+        if verbose:
+            log_banner(logger, "QUERY: subcomponents by name - %s", sub_component_name)
+        s = query_catalogue.SUB_COMPONENT_BY_NAME.bind(sub_component_name=sub_component_name)
+        return [row['sub_comp']['value'] for row in self.fuseki_connection.query_knowledge_graph(s, verbose)]
+
+    def query_channel_by_name(self, chan_name: str, verbose: bool = True) -> List[str]:
         """
         Queries an oscilloscope channel by its name.
 
         :param chan_name: name to query channel for
+        :param verbose: if true, logging is activated
         :return: osci channel
         """
-        print("########################################################################")
-        print(colored("QUERY: osci channel by name - " + chan_name, "green", "on_grey", ["bold"]))
-        print("########################################################################")
-        chan_entry = self.complete_ontology_entry('Channel')
-        chan_name_entry = self.complete_ontology_entry('channel_name')
-        s = f"""
-            SELECT ?chan WHERE {{
-                ?chan a {chan_entry} .
-                ?chan {chan_name_entry} ?chan_name .
-                FILTER(STR(?chan_name) = "{chan_name}")
-            }}
-            """
-        return [row['chan']['value'] for row in self.fuseki_connection.query_knowledge_graph(s, True)]
-
-    def query_vehicle_subsystem_by_name(self, subsystem_name: str) -> List[str]:
+        if verbose:
+            log_banner(logger, "QUERY: osci channel by name - %s", chan_name)
+        s = query_catalogue.CHANNEL_BY_NAME.bind(chan_name=chan_name)
+        return [row['chan']['value'] for row in self.fuseki_connection.query_knowledge_graph(s, verbose)]
+
+    def query_vehicle_subsystem_by_name(self, subsystem_name: str, verbose: bool = True) -> List[str]:
         """
         Queries a vehicle subsystem by its name.
 
         :param subsystem_name: name to query subsystem for
+        :param verbose: if true, logging is activated
         :return: subsystem
         """
-        print("########################################################################")
-        print(colored("QUERY: vehicle subsystem by name - " + subsystem_name, "green", "on_grey", ["bold"]))
-        print("########################################################################")
-        subsystem_entry = self.complete_ontology_entry('VehicleSubsystem')
-        subsystem_name_entry = self.complete_ontology_entry('subsystem_name')
-        s = f"""
-            SELECT ?subsystem WHERE {{
-                ?subsystem a {subsystem_entry} .
-                ?subsystem {subsystem_name_entry} ?subsystem_name .
-                FILTER(STR(?subsystem_name) = "{subsystem_name}")
-            }}
-            """
-        return [row['subsystem']['value'] for row in self.fuseki_connection.query_knowledge_graph(s, True)]
-
-    def query_component_set_by_name(self, set_name: str) -> List[str]:
+        if verbose:
+            log_banner(logger, "QUERY: vehicle subsystem by name - %s", subsystem_name)
+        s = query_catalogue.VEHICLE_SUBSYSTEM_BY_NAME.bind(subsystem_name=subsystem_name)
+        return [row['subsystem']['value'] for row in self.fuseki_connection.query_knowledge_graph(s, verbose)]
+
+    def query_component_set_by_name(self, set_name: str, verbose: bool = True) -> List[str]:
         """
         Queries a component set by its name.
 
         :param set_name: name to query component set for
+        :param verbose: if true, logging is activated
         :return: component set
         """
-        print("########################################################################")
-        print(colored("QUERY: component set by name - " + set_name, "green", "on_grey", ["bold"]))
-        print("########################################################################")
-        component_set_entry = self.complete_ontology_entry('ComponentSet')
-        set_name_entry = self.complete_ontology_entry('set_name')
-        s = f"""
-            SELECT ?comp_set WHERE {{
-                ?comp_set a {component_set_entry} .
-                ?comp_set {set_name_entry} ?set_name .
-                FILTER(STR(?set_name) = "{set_name}")
-            }}
-            """
-        return [row['comp_set']['value'] for row in self.fuseki_connection.query_knowledge_graph(s, True)]
-
-    def query_vehicle_instance_by_vin(self, vin: str) -> List[str]:
+        if verbose:
+            log_banner(logger, "QUERY: component set by name - %s", set_name)
+        s = query_catalogue.COMPONENT_SET_BY_NAME.bind(set_name=set_name)
+        return [row['comp_set']['value'] for row in self.fuseki_connection.query_knowledge_graph(s, verbose)]
+
+    def query_vehicle_instance_by_vin(self, vin: str, verbose: bool = True) -> List[str]:
         """
         Queries a vehicle instance by the vehicle identification number.
 
         :param vin: vehicle identification number to query specific instance for
+        :param verbose: if true, logging is activated
         :return: vehicle instance
         """
-        print("########################################################################")
-        print(colored("QUERY: vehicle instance by VIN " + vin, "green", "on_grey", ["bold"]))
-        print("########################################################################")
-        vehicle_entry = self.complete_ontology_entry('Vehicle')
-        vin_entry = self.complete_ontology_entry('VIN')
-        s = f"""
-            SELECT ?car WHERE {{
-                ?car a {vehicle_entry} .
-                ?car {vin_entry} "{vin}" .
-            }}
-            """
-        return [row['car']['value'] for row in self.fuseki_connection.query_knowledge_graph(s, True)]
+        if verbose:
+            log_banner(logger, "QUERY: vehicle instance by VIN %s", vin)
+        s = query_catalogue.VEHICLE_INSTANCE_BY_VIN.bind(vin=vin)
+        return [row['car']['value'] for row in self.fuseki_connection.query_knowledge_graph(s, verbose)]
 
     def query_co_occurring_trouble_codes(self, dtc: str, verbose: bool = True) -> List[str]:
         """
@@ -458,20 +278,8 @@ class KnowledgeGraphQueryTool:
         :return: co-occurring DTCs
         """
         if verbose:
-            print("########################################################################")
-            print(colored("QUERY: DTCs occurring with " + dtc, "green", "on_grey", ["bold"]))
-            print("########################################################################")
-        dtc_entry = self.complete_ontology_entry('DTC')
-        occurs_with_dtc_entry = self.complete_ontology_entry('occurs_with_DTC')
-        code_entry = self.complete_ontology_entry('code')
-        s = f"""
-            SELECT ?other WHERE {{
-                ?dtc a {dtc_entry} .
-                ?dtc {occurs_with_dtc_entry} ?other .
-                ?dtc {code_entry} ?dtc_code .
-                FILTER(STR(?dtc_code) = "{dtc}")
-            }}
-            """
+            log_banner(logger, "QUERY: DTCs occurring with %s", dtc)
+        s = query_catalogue.CO_OCCURRING_TROUBLE_CODES.bind(dtc=dtc)
         return [row['other']['value'] for row in self.fuseki_connection.query_knowledge_graph(s, verbose)]
 
     def query_vehicle_by_dtc(self, dtc: str, verbose: bool = True) -> List[Tuple[str, str, str, str]]:
@@ -483,38 +291,8 @@ class KnowledgeGraphQueryTool:
         :return: vehicles (model, HSN, TSN, VIN)
         """
         if verbose:
-            print("########################################################################")
-            print(colored("QUERY: vehicle associated with DTC " + dtc, "green", "on_grey", ["bold"]))
-            print("########################################################################")
-        dtc_entry = self.complete_ontology_entry('DTC')
-        diag_log_entry = self.complete_ontology_entry('DiagLog')
-        appears_in_entry = self.complete_ontology_entry('appearsIn')
-        created_for_entry = self.complete_ontology_entry('createdFor')
-        fault_cond_class = self.complete_ontology_entry('FaultCondition')
-        vehicle_class = self.complete_ontology_entry('Vehicle')
-        represents_entry = self.complete_ontology_entry('represents')
-        hsn_entry = self.complete_ontology_entry('HSN')
-        tsn_entry = self.complete_ontology_entry('TSN')
-        vin_entry = self.complete_ontology_entry('VIN')
-        model_entry = self.complete_ontology_entry('model')
-        code_entry = self.complete_ontology_entry('code')
-        s = f"""
-            SELECT ?model ?hsn ?tsn ?vin WHERE {{
-                ?diag_log a {diag_log_entry} .
-                ?dtc {appears_in_entry} ?diag_log .
-                ?diag_log {created_for_entry} ?vehicle .
-                ?fc a {fault_cond_class} .
-                ?vehicle a {vehicle_class} .
-                ?dtc {represents_entry} ?fc .
-                ?dtc a {dtc_entry} .
-                ?dtc {code_entry} ?dtc_code .
-                ?vehicle {hsn_entry} ?hsn .
-                ?vehicle {tsn_entry} ?tsn .
-                ?vehicle {vin_entry} ?vin .
-                ?vehicle {model_entry} ?model .
-                FILTER(STR(?dtc_code) = "{dtc}")
-            }}
-            """
+            log_banner(logger, "QUERY: vehicle associated with DTC %s", dtc)
+        s = query_catalogue.VEHICLE_BY_DTC.bind(dtc=dtc)
         return [(row['model']['value'], row['hsn']['value'], row['tsn']['value'], row['vin']['value']) for row in
                 self.fuseki_connection.query_knowledge_graph(s, verbose)]
 
@@ -526,17 +304,8 @@ class KnowledgeGraphQueryTool:
         :return: all DTCs stored in the knowledge graph
         """
         if verbose:
-            print("########################################################################")
-            print(colored("QUERY: all DTC instances:", "green", "on_grey", ["bold"]))
-            print("########################################################################")
-        dtc_entry = self.complete_ontology_entry('DTC')
-        code_entry = self.complete_ontology_entry('code')
-        s = f"""
-            SELECT ?dtc WHERE {{
-                ?instance a {dtc_entry} .
-                ?instance {code_entry} ?dtc .
-            }}
-            """
+            log_banner(logger, "QUERY: all DTC instances:")
+        s = query_catalogue.ALL_DTC_INSTANCES.bind()
         return [row['dtc']['value'] for row in self.fuseki_connection.query_knowledge_graph(s, verbose)]
 
     def query_all_fault_condition_instances(self, verbose: bool = True) -> List[str]:
@@ -547,84 +316,48 @@ class KnowledgeGraphQueryTool:
         :return: all fault conditions stored in the knowledge graph
         """
         if verbose:
-            print("########################################################################")
-            print(colored("QUERY: all fault condition instances:", "green", "on_grey", ["bold"]))
-            print("########################################################################")
-        fault_condition_entry = self.complete_ontology_entry('FaultCondition')
-        condition_desc_entry = self.complete_ontology_entry('condition_description')
-        s = f"""
-            SELECT ?desc WHERE {{
-                ?instance a {fault_condition_entry} .
-                ?instance {condition_desc_entry} ?desc .
-            }}
-            """
+            log_banner(logger, "QUERY: all fault condition instances:")
+        s = query_catalogue.ALL_FAULT_CONDITION_INSTANCES.bind()
         return [row['desc']['value'] for row in self.fuseki_connection.query_knowledge_graph(s, verbose)]
 
-    def query_fault_condition_instance_by_code(self, dtc: str) -> List[str]:
+    def query_fault_condition_instance_by_code(self, dtc: str, verbose: bool = True) -> List[str]:
         """
         Queries the fault condition instance represented by the specified DTC.
 
         :param dtc: diagnostic trouble code to query fault condition instance for
+        :param verbose: if true, logging is activated
         :return: fault condition instance
         """
-        print("########################################################################")
-        print(colored("QUERY: fault condition instance by code " + dtc, "green", "on_grey", ["bold"]))
-        print("########################################################################")
-        dtc_entry = self.complete_ontology_entry('DTC')
-        code_entry = self.complete_ontology_entry('code')
-        represents_entry = self.complete_ontology_entry('represents')
-        s = f"""
-            SELECT ?fault_cond WHERE {{
-                ?dtc a {dtc_entry} .
-                ?dtc {code_entry} "{dtc}" .
-                ?dtc {represents_entry} ?fault_cond .
-            }}
-            """
-        return [row['fault_cond']['value'] for row in self.fuseki_connection.query_knowledge_graph(s, True)]
-
-    def query_fault_condition_instances_by_symptom(self, symptom: str) -> List[str]:
+        if verbose:
+            log_banner(logger, "QUERY: fault condition instance by code %s", dtc)
+        s = query_catalogue.FAULT_CONDITION_INSTANCE_BY_CODE.bind(dtc=dtc)
+        return [row['fault_cond']['value'] for row in self.fuseki_connection.query_knowledge_graph(s, verbose)]
+
+    def query_fault_condition_instances_by_symptom(self, symptom: str, verbose: bool = True) -> List[str]:
         """
         Queries the fault condition instances manifested by the specified symptom.
 
         :param symptom: symptom to query fault condition instances for
+        :param verbose: if true, logging is activated
         :return: fault condition instances
         """
-        print("########################################################################")
-        print(colored("QUERY: fault condition instances by symptom " + symptom, "green", "on_grey", ["bold"]))
-        print("########################################################################")
-        symptom_entry = self.complete_ontology_entry('Symptom')
-        fault_cond_entry = self.complete_ontology_entry('FaultCondition')
-        manifested_by_entry = self.complete_ontology_entry('manifestedBy')
-        symptom_desc_entry = self.complete_ontology_entry('symptom_description')
-        s = f"""
-            SELECT ?fault_cond WHERE {{
-                ?fault_cond a {fault_cond_entry} .
-                ?symptom a {symptom_entry} .
-                ?fault_cond {manifested_by_entry} ?symptom .
-                ?symptom {symptom_desc_entry} "{symptom}" .
-            }}
-            """
-        return [row['fault_cond']['value'] for row in self.fuseki_connection.query_knowledge_graph(s, True)]
-
-    def query_dtc_instance_by_code(self, code: str) -> List[str]:
+        if verbose:
+            log_banner(logger, "QUERY: fault condition instances by symptom %s", symptom)
+        s = query_catalogue.FAULT_CONDITION_INSTANCES_BY_SYMPTOM.bind(symptom=symptom)
+        return [row['fault_cond']['value'] for row in self.fuseki_connection.query_knowledge_graph(s, verbose)]
+
+    def query_dtc_instance_by_code(self, code: str, verbose: bool = True) -> List[str]:
         """
         Queries the DTC instance for the specified code.
 
         :param code: code to query DTC instance for
+        :param verbose: if true, logging is activated
         :return: DTC instance
         """
-        print("########################################################################")
-        print(colored("QUERY: DTC instance by code " + code, "green", "on_grey", ["bold"]))
-        print("########################################################################")
-        dtc_entry = self.complete_ontology_entry('DTC')
-        code_entry = self.complete_ontology_entry('code')
-        s = f"""
-            SELECT ?dtc WHERE {{
-                ?dtc a {dtc_entry} .
-                ?dtc {code_entry} "{code}" .
-            }}
-            """
-        return [row['dtc']['value'] for row in self.fuseki_connection.query_knowledge_graph(s, True)]
+        if verbose:
+            log_banner(logger, "QUERY: DTC instance by code %s", code)
+        s = query_catalogue.DTC_INSTANCE_BY_CODE.bind(code=code)
+        return [row['dtc']['value'] for row in self.fuseki_connection.query_knowledge_graph(s, verbose)]
 
     def query_dtcs_by_suspect_comp_and_vehicle_subsystem(
             self, comp: str, subsystem: str, verbose: bool = True
@@ -638,34 +371,8 @@ class KnowledgeGraphQueryTool:
         :return: DTCs
         """
         if verbose:
-            print("########################################################################")
-            print(colored("QUERY: DTCs by suspect component " + comp + " and subsystem " + subsystem,
-                          "green", "on_grey", ["bold"]))
-            print("########################################################################")
-        dtc_entry = self.complete_ontology_entry('DTC')
-        code_entry = self.complete_ontology_entry('code')
-        diag_association_entry = self.complete_ontology_entry('DiagnosticAssociation')
-        has_association_entry = self.complete_ontology_entry('hasAssociation')
-        comp_entry = self.complete_ontology_entry('SuspectComponent')
-        points_to_entry = self.complete_ontology_entry('pointsTo')
-        comp_name_entry = self.complete_ontology_entry('component_name')
-        subsystem_entry = self.complete_ontology_entry('VehicleSubsystem')
-        indicates_entry = self.complete_ontology_entry('indicates')
-        sub_name_entry = self.complete_ontology_entry('subsystem_name')
-        s = f"""
-            SELECT ?code WHERE {{
-                ?dtc a {dtc_entry} .
-                ?dtc {code_entry} ?code .
-                ?diag_association a {diag_association_entry} .
-                ?dtc {has_association_entry} ?diag_association .
-                ?comp a {comp_entry} .
-                ?diag_association {points_to_entry} ?comp .
-                ?comp {comp_name_entry} "{comp}" .
-                ?sub a {subsystem_entry} .
-                ?dtc {indicates_entry} ?sub .
-                ?sub {sub_name_entry} "{subsystem}" .
-            }}
-            """
+            log_banner(logger, "QUERY: DTCs by suspect component %s and subsystem %s", comp, subsystem)
+        s = query_catalogue.DTCS_BY_SUSPECT_COMP_AND_VEHICLE_SUBSYSTEM.bind(comp=comp, subsystem=subsystem)
         return [row['code']['value'] for row in self.fuseki_connection.query_knowledge_graph(s, verbose)]
 
     def query_diag_association_instance_by_dtc_and_sus_comp(
@@ -680,28 +387,8 @@ class KnowledgeGraphQueryTool:
         :return: diagnostic association instance
         """
         if verbose:
-            print("########################################################################")
-            print(colored("QUERY: diagnostic association by dtc + suspect component: " + dtc + ", " +
-                          comp, "green", "on_grey", ["bold"]))
-            print("########################################################################")
-        dtc_entry = self.complete_ontology_entry('DTC')
-        diag_association_entry = self.complete_ontology_entry('DiagnosticAssociation')
-        suspect_component_entry = self.complete_ontology_entry('SuspectComponent')
-        code_entry = self.complete_ontology_entry('code')
-        has_association_entry = self.complete_ontology_entry('hasAssociation')
-        comp_name_entry = self.complete_ontology_entry('component_name')
-        points_to_entry = self.complete_ontology_entry('pointsTo')
-        s = f"""
-            SELECT ?diag_association WHERE {{
-                ?diag_association a {diag_association_entry} .
-                ?dtc a {dtc_entry} .
-                ?dtc {code_entry} "{dtc}" .
-                ?dtc {has_association_entry} ?diag_association .
-                ?sus a {suspect_component_entry} .
-                ?sus {comp_name_entry} "{comp}" .
-                ?diag_association {points_to_entry} ?sus .
-            }}
-            """
+            log_banner(logger, "QUERY: diagnostic association by dtc + suspect component: %s, %s", dtc, comp)
+        s = query_catalogue.DIAG_ASSOCIATION_INSTANCE_BY_DTC_AND_SUS_COMP.bind(dtc=dtc, comp=comp)
         return [row['diag_association']['value'] for row in self.fuseki_connection.query_knowledge_graph(s, verbose)]
 
     def query_priority_id_by_dtc_and_sus_comp(self, dtc: str, comp: str, verbose: bool = True) -> List[str]:
@@ -714,30 +401,8 @@ class KnowledgeGraphQueryTool:
         :return: priority ID
         """
         if verbose:
-            print("########################################################################")
-            print(colored("QUERY: diagnostic association priority by dtc + suspect component: " + dtc + ", " +
-                          comp, "green", "on_grey", ["bold"]))
-            print("########################################################################")
-        dtc_entry = self.complete_ontology_entry('DTC')
-        diag_association_entry = self.complete_ontology_entry('DiagnosticAssociation')
-        suspect_component_entry = self.complete_ontology_entry('SuspectComponent')
-        code_entry = self.complete_ontology_entry('code')
-        has_association_entry = self.complete_ontology_entry('hasAssociation')
-        comp_name_entry = self.complete_ontology_entry('component_name')
-        points_to_entry = self.complete_ontology_entry('pointsTo')
-        prio_entry = self.complete_ontology_entry('priority_id')
-        s = f"""
-            SELECT ?prio WHERE {{
-                ?diag_association a {diag_association_entry} .
-                ?diag_association  {prio_entry} ?prio .
-                ?dtc a {dtc_entry} .
-                ?dtc {code_entry} "{dtc}" .
-                ?dtc {has_association_entry} ?diag_association .
-                ?sus a {suspect_component_entry} .
-                ?sus {comp_name_entry} "{comp}" .
-                ?diag_association {points_to_entry} ?sus .
-            }}
-            """
+            log_banner(logger, "QUERY: diagnostic association priority by dtc + suspect component: %s, %s", dtc, comp)
+        s = query_catalogue.PRIORITY_ID_BY_DTC_AND_SUS_COMP.bind(dtc=dtc, comp=comp)
         return [row['prio']['value'] for row in self.fuseki_connection.query_knowledge_graph(s, verbose)]
 
     def query_diag_association_by_dtc_and_sus_comp(self, dtc: str, comp: str, verbose: bool = True) -> List[str]:
@@ -750,28 +415,8 @@ class KnowledgeGraphQueryTool:
         :return: diagnostic association instance
         """
         if verbose:
-            print("########################################################################")
-            print(colored("QUERY: diagnostic association instance by dtc + suspect component: " + dtc + ", " +
-                          comp, "green", "on_grey", ["bold"]))
-            print("########################################################################")
-        dtc_entry = self.complete_ontology_entry('DTC')
-        diag_association_entry = self.complete_ontology_entry('DiagnosticAssociation')
-        suspect_component_entry = self.complete_ontology_entry('SuspectComponent')
-        code_entry = self.complete_ontology_entry('code')
-        has_association_entry = self.complete_ontology_entry('hasAssociation')
-        comp_name_entry = self.complete_ontology_entry('component_name')
-        points_to_entry = self.complete_ontology_entry('pointsTo')
-        s = f"""
-            SELECT ?diag_association WHERE {{
-                ?diag_association a {diag_association_entry} .
-                ?dtc a {dtc_entry} .
-                ?dtc {code_entry} "{dtc}" .
-                ?dtc {has_association_entry} ?diag_association .
-                ?sus a {suspect_component_entry} .
-                ?sus {comp_name_entry} "{comp}" .
-                ?diag_association {points_to_entry} ?sus .
-            }}
-            """
+            log_banner(logger, "QUERY: diagnostic association instance by dtc + suspect component: %s, %s", dtc, comp)
+        s = query_catalogue.DIAG_ASSOCIATION_BY_DTC_AND_SUS_COMP.bind(dtc=dtc, comp=comp)
         return [row['diag_association']['value'] for row in self.fuseki_connection.query_knowledge_graph(s, verbose)]
 
     def query_generated_heatmaps_by_dtc_and_sus_comp(self, dtc: str, comp: str, verbose: bool = True) -> List[str]:
@@ -784,79 +429,35 @@ class KnowledgeGraphQueryTool:
         :return: diagnostic association instance
         """
         if verbose:
-            print("########################################################################")
-            print(colored("QUERY: generated heatmaps by dtc + suspect component: " + dtc + ", " +
-                          comp, "green", "on_grey", ["bold"]))
-            print("########################################################################")
-        dtc_entry = self.complete_ontology_entry('DTC')
-        diag_association_entry = self.complete_ontology_entry('DiagnosticAssociation')
-        suspect_component_entry = self.complete_ontology_entry('SuspectComponent')
-        code_entry = self.complete_ontology_entry('code')
-        has_association_entry = self.complete_ontology_entry('hasAssociation')
-        comp_name_entry = self.complete_ontology_entry('component_name')
-        points_to_entry = self.complete_ontology_entry('pointsTo')
-        heatmap_entry = self.complete_ontology_entry('generated_heatmap')
-        s = f"""
-            SELECT ?heatmap_entry WHERE {{
-                ?diag_association a {diag_association_entry} .
-                ?diag_association {heatmap_entry} ?heatmap_entry .
-                ?dtc a {dtc_entry} .
-                ?dtc {code_entry} "{dtc}" .
-                ?dtc {has_association_entry} ?diag_association .
-                ?sus a {suspect_component_entry} .
-                ?sus {comp_name_entry} "{comp}" .
-                ?diag_association {points_to_entry} ?sus .
-            }}
-            """
+            log_banner(logger, "QUERY: generated heatmaps by dtc + suspect component: %s, %s", dtc, comp)
+        s = query_catalogue.GENERATED_HEATMAPS_BY_DTC_AND_SUS_COMP.bind(dtc=dtc, comp=comp)
         return [row['heatmap_entry']['value'] for row in self.fuseki_connection.query_knowledge_graph(s, verbose)]
 
-    def query_dtcs_by_vin(self, vin: str) -> List[str]:
+    def query_dtcs_by_vin(self, vin: str, verbose: bool = True) -> List[str]:
         """
         Queries the DTCs (diagnostic trouble codes) for the specified VIN (vehicle identification number).
 
         :param vin: VIN to query DTCs for
+        :param verbose: if true, logging is activated
         :return: DTCs
         """
-        print("########################################################################")
-        print(colored("QUERY: DTCs by VIN " + vin, "green", "on_grey", ["bold"]))
-        print("########################################################################")
-        dtc_entry = self.complete_ontology_entry('DTC')
-        vehicle_entry = self.complete_ontology_entry('Vehicle')
-        code_entry = self.complete_ontology_entry('code')
-        vin_entry = self.complete_ontology_entry('VIN')
-        s = f"""
-            SELECT ?code WHERE {{
-                ?dtc a {dtc_entry} .
-                ?dtc {code_entry} ?code .
-                ?vehicle a {vehicle_entry} .
-                ?vehicle {vin_entry} "{vin}" .
-            }}
-            """
-        return [row['code']['value'] for row in self.fuseki_connection.query_knowledge_graph(s, True)]
-
-    def query_dtcs_by_model(self, model: str) -> List[str]:
+        if verbose:
+            log_banner(logger, "QUERY: DTCs by VIN %s", vin)
+        s = query_catalogue.DTCS_BY_VIN.bind(vin=vin)
+        return [row['code']['value'] for row in self.fuseki_connection.query_knowledge_graph(s, verbose)]
+
+    def query_dtcs_by_model(self, model: str, verbose: bool = True) -> List[str]:
         """
         Queries the DTCs (diagnostic trouble codes) for the specified car model.
 
         :param model: car model to retrieve recorded DTCs for
+        :param verbose: if true, logging is activated
         :return: DTCs
         """
-        print("########################################################################")
-        print(colored("QUERY: DTCs by car model " + model, "green", "on_grey", ["bold"]))
-        print("########################################################################")
-        dtc_entry = self.complete_ontology_entry('DTC')
-        vehicle_entry = self.complete_ontology_entry('Vehicle')
-        code_entry = self.complete_ontology_entry('code')
-        model_entry = self.complete_ontology_entry('model')
-        s = f"""
-            SELECT ?code WHERE {{
-                ?dtc a {dtc_entry} .
-                ?dtc {code_entry} ?code .
-                ?vehicle a {vehicle_entry} .
-                ?vehicle {model_entry} "{model}" .
-            }}
-            """
-        return [row['code']['value'] for row in self.fuseki_connection.query_knowledge_graph(s, True)]
+        if verbose:
+            log_banner(logger, "QUERY: DTCs by car model %s", model)
+        s = query_catalogue.DTCS_BY_MODEL.bind(model=model)
+        return [row['code']['value'] for row in self.fuseki_connection.query_knowledge_graph(s, verbose)]
 
     def query_oscilloscope_usage_by_suspect_component(self, component_name: str, verbose: bool = True) -> List[bool]:
         """
@@ -867,20 +468,8 @@ class KnowledgeGraphQueryTool:
         :return: true / false
         """
         if verbose:
-            print("########################################################################")
-            print(colored("QUERY: oscilloscope usage by component name "
-                          + component_name, "green", "on_grey", ["bold"]))
-            print("########################################################################")
-        comp_entry = self.complete_ontology_entry('SuspectComponent')
-        name_entry = self.complete_ontology_entry('component_name')
-        oscilloscope_entry = self.complete_ontology_entry('use_oscilloscope')
-        s = f"""
-            SELECT ?use_oscilloscope WHERE {{
-                ?comp a {comp_entry} .
-                ?comp {name_entry} "{component_name}" .
-                ?comp {oscilloscope_entry} ?use_oscilloscope .
-            }}
-            """
+            log_banner(logger, "QUERY: oscilloscope usage by component name %s", component_name)
+        s = query_catalogue.OSCILLOSCOPE_USAGE_BY_SUSPECT_COMPONENT.bind(component_name=component_name)
         return [True if row['use_oscilloscope']['value'] == "true" else False
                 for row in self.fuseki_connection.query_knowledge_graph(s, verbose)]
 
@@ -893,20 +482,8 @@ class KnowledgeGraphQueryTool:
         :return: affecting components
         """
         if verbose:
-            print("########################################################################")
-            print(colored("QUERY: affecting components by component name "
-                          + component_name, "green", "on_grey", ["bold"]))
-            print("########################################################################")
-        comp_entry = self.complete_ontology_entry('SuspectComponent')
-        name_entry = self.complete_ontology_entry('component_name')
-        affected_by_entry = self.complete_ontology_entry('affected_by')
-        s = f"""
-            SELECT ?affected_by WHERE {{
-                ?comp a {comp_entry} .
-                ?comp {name_entry} "{component_name}" .
-                ?comp {affected_by_entry} ?affected_by .
-            }}
-            """
+            log_banner(logger, "QUERY: affecting components by component name %s", component_name)
+        s = query_catalogue.AFFECTED_BY_RELATIONS_BY_SUSPECT_COMPONENT.bind(component_name=component_name)
         return [row['affected_by']['value'] for row in self.fuseki_connection.query_knowledge_graph(s, verbose)]
 
     def query_verifies_relation_by_suspect_component(self, component_name: str, verbose: bool = True) -> List[str]:
@@ -918,24 +495,8 @@ class KnowledgeGraphQueryTool:
         :return: vehicle component set name
         """
         if verbose:
-            print("########################################################################")
-            print(colored("QUERY: verified component set by component name "
-                          + component_name, "green", "on_grey", ["bold"]))
-            print("########################################################################")
-        comp_entry = self.complete_ontology_entry('SuspectComponent')
-        name_entry = self.complete_ontology_entry('component_name')
-        set_entry = self.complete_ontology_entry('ComponentSet')
-        set_name_entry = self.complete_ontology_entry('set_name')
-        verifies_entry = self.complete_ontology_entry('verifies')
-        s = f"""
-            SELECT ?set_name WHERE {{
-                ?comp a {comp_entry} .
-                ?comp {name_entry} "{component_name}" .
-                ?set a {set_entry} .
-                ?set {set_name_entry} ?set_name .
-                ?comp {verifies_entry} ?set .
-            }}
-            """
+            log_banner(logger, "QUERY: verified component set by component name %s", component_name)
+        s = query_catalogue.VERIFIES_RELATION_BY_SUSPECT_COMPONENT.bind(component_name=component_name)
         return [row['set_name']['value'] for row in self.fuseki_connection.query_knowledge_graph(s, verbose)]
 
     def query_sub_components_by_component(self, component_name: str, verbose: bool = True) -> List[str]:
@@ -947,23 +508,8 @@ class KnowledgeGraphQueryTool:
         :return: subcomponents
         """
         if verbose:
-            print("########################################################################")
-            print(colored("QUERY: subcomponent(s) by component name "
-                          + component_name, "green", "on_grey", ["bold"]))
-            print("########################################################################")
-        comp_entry = self.complete_ontology_entry('SuspectComponent')
-        name_entry = self.complete_ontology_entry('component_name')
-        sub_comp_entry = self.complete_ontology_entry('SubComponent')
-        element_of_entry = self.complete_ontology_entry('elementOf')
-        s = f"""
-            SELECT ?sub_comp_name WHERE {{
-                ?comp a {comp_entry} .
-                ?comp {name_entry} "{component_name}" .
-                ?sub_comp a {sub_comp_entry} .
-                ?sub_comp {name_entry} ?sub_comp_name .
-                ?sub_comp {element_of_entry} ?comp .
-            }}
-            """
+            log_banner(logger, "QUERY: subcomponent(s) by component name %s", component_name)
+        s = query_catalogue.SUB_COMPONENTS_BY_COMPONENT.bind(component_name=component_name)
         return [row['sub_comp_name']['value'] for row in self.fuseki_connection.query_knowledge_graph(s, verbose)]
 
     def query_super_component(self, sub_component: str, verbose: bool = True) -> List[str]:
@@ -975,22 +521,8 @@ class KnowledgeGraphQueryTool:
         :return: super component
         """
         if verbose:
-            print("########################################################################")
-            print(colored("QUERY: super component by sub component " + sub_component, "green", "on_grey", ["bold"]))
-            print("########################################################################")
-        comp_entry = self.complete_ontology_entry('SuspectComponent')
-        name_entry = self.complete_ontology_entry('component_name')
-        sub_comp_entry = self.complete_ontology_entry('SubComponent')
-        element_of_entry = self.complete_ontology_entry('elementOf')
-        s = f"""
-            SELECT ?comp_name WHERE {{
-                ?sub_comp a {sub_comp_entry} .
-                ?sub_comp {name_entry} "{sub_component}" .
-                ?comp a {comp_entry} .
-                ?comp {name_entry} ?comp_name .
-                ?sub_comp {element_of_entry} ?comp .
-            }}
-            """
+            log_banner(logger, "QUERY: super component by sub component %s", sub_component)
+        s = query_catalogue.SUPER_COMPONENT.bind(sub_component=sub_component)
         return [row['comp_name']['value'] for row in self.fuseki_connection.query_knowledge_graph(s, verbose)]
 
     def query_verifies_relations_by_component_set(self, set_name: str, verbose: bool = True) -> List[str]:
@@ -1002,24 +534,8 @@ class KnowledgeGraphQueryTool:
         :return: suspect component names
         """
         if verbose:
-            print("########################################################################")
-            print(colored("QUERY: verifying components by component set name "
-                          + set_name, "green", "on_grey", ["bold"]))
-            print("########################################################################")
-        comp_entry = self.complete_ontology_entry('SuspectComponent')
-        name_entry = self.complete_ontology_entry('component_name')
-        component_set_entry = self.complete_ontology_entry('ComponentSet')
-        set_name_entry = self.complete_ontology_entry('set_name')
-        verifies_entry = self.complete_ontology_entry('verifies')
-        s = f"""
-            SELECT ?comp_name WHERE {{
-                ?comp_set a {component_set_entry} .
-                ?comp_set {set_name_entry} "{set_name}" .
-                ?comp a {comp_entry} .
-                ?comp {name_entry} ?comp_name .
-                ?comp {verifies_entry} ?comp_set .
-            }}
-            """
+            log_banner(logger, "QUERY: verifying components by component set name %s", set_name)
+        s = query_catalogue.VERIFIES_RELATIONS_BY_COMPONENT_SET.bind(set_name=set_name)
         return [row['comp_name']['value'] for row in self.fuseki_connection.query_knowledge_graph(s, verbose)]
 
     def query_contains_relation_by_suspect_component(self, component_name: str, verbose: bool = True) -> List[str]:
@@ -1031,24 +547,8 @@ class KnowledgeGraphQueryTool:
         :return: subsystem name
         """
         if verbose:
-            print("########################################################################")
-            print(colored("QUERY: superior subsystem by component name "
-                          + component_name, "green", "on_grey", ["bold"]))
-            print("########################################################################")
-        comp_entry = self.complete_ontology_entry('SuspectComponent')
-        name_entry = self.complete_ontology_entry('component_name')
-        subsystem_entry = self.complete_ontology_entry('VehicleSubsystem')
-        sub_name_entry = self.complete_ontology_entry('subsystem_name')
-        contains_entry = self.complete_ontology_entry('contains')
-        s = f"""
-            SELECT ?sub_name WHERE {{
-                ?comp a {comp_entry} .
-                ?comp {name_entry} "{component_name}" .
-                ?sub a {subsystem_entry} .
-                ?sub {sub_name_entry} ?sub_name .
-                ?sub {contains_entry} ?comp .
-            }}
-            """
+            log_banner(logger, "QUERY: superior subsystem by component name %s", component_name)
+        s = query_catalogue.CONTAINS_RELATION_BY_SUSPECT_COMPONENT.bind(component_name=component_name)
         return [row['sub_name']['value'] for row in self.fuseki_connection.query_knowledge_graph(s, verbose)]
 
     def query_contains_relation_by_subsystem(self, subsystem_name: str, verbose: bool = True) -> List[str]:
@@ -1060,23 +560,8 @@ class KnowledgeGraphQueryTool:
         :return: component names
         """
         if verbose:
-            print("########################################################################")
-            print(colored("QUERY: components by subsystem name " + subsystem_name, "green", "on_grey", ["bold"]))
-            print("########################################################################")
-        comp_entry = self.complete_ontology_entry('SuspectComponent')
-        name_entry = self.complete_ontology_entry('component_name')
-        subsystem_entry = self.complete_ontology_entry('VehicleSubsystem')
-        sub_name_entry = self.complete_ontology_entry('subsystem_name')
-        contains_entry = self.complete_ontology_entry('contains')
-        s = f"""
-            SELECT ?comp_name WHERE {{
-                ?sub a {subsystem_entry} .
-                ?sub {sub_name_entry} "{subsystem_name}" .
-                ?comp a {comp_entry} .
-                ?comp {name_entry} ?comp_name .
-                ?sub {contains_entry} ?comp .
-            }}
-            """
+            log_banner(logger, "QUERY: components by subsystem name %s", subsystem_name)
+        s = query_catalogue.CONTAINS_RELATION_BY_SUBSYSTEM.bind(subsystem_name=subsystem_name)
         return [row['comp_name']['value'] for row in self.fuseki_connection.query_knowledge_graph(s, verbose)]
 
     def query_includes_relation_by_component_set(self, comp_set_name: str, verbose: bool = True) -> List[str]:
@@ -1088,23 +573,8 @@ class KnowledgeGraphQueryTool:
         :return: component names
         """
         if verbose:
-            print("########################################################################")
-            print(colored("QUERY: components by component set name " + comp_set_name, "green", "on_grey", ["bold"]))
-            print("########################################################################")
-        comp_entry = self.complete_ontology_entry('SuspectComponent')
-        name_entry = self.complete_ontology_entry('component_name')
-        comp_set_entry = self.complete_ontology_entry('ComponentSet')
-        set_name_entry = self.complete_ontology_entry('set_name')
-        includes_entry = self.complete_ontology_entry('includes')
-        s = f"""
-            SELECT ?comp_name WHERE {{
-                ?comp_set a {comp_set_entry} .
-                ?comp_set {set_name_entry} "{comp_set_name}" .
-                ?comp a {comp_entry} .
-                ?comp {name_entry} ?comp_name .
-                ?comp_set {includes_entry} ?comp .
-            }}
-            """
+            log_banner(logger, "QUERY: components by component set name %s", comp_set_name)
+        s = query_catalogue.INCLUDES_RELATION_BY_COMPONENT_SET.bind(comp_set_name=comp_set_name)
         return [row['comp_name']['value'] for row in self.fuseki_connection.query_knowledge_graph(s, verbose)]
 
     def query_code_type_by_dtc(self, dtc: str, verbose: bool = True) -> List[str]:
@@ -1116,19 +586,8 @@ class KnowledgeGraphQueryTool:
         :return: code type
         """
         if verbose:
-            print("########################################################################")
-            print(colored("QUERY: code type by DTC " + dtc, "green", "on_grey", ["bold"]))
-            print("########################################################################")
-        dtc_entry = self.complete_ontology_entry('DTC')
-        code_entry = self.complete_ontology_entry('code')
-        type_entry = self.complete_ontology_entry('code_type')
-        s = f"""
-            SELECT ?code_type WHERE {{
-                ?dtc a {dtc_entry} .
-                ?dtc {type_entry} ?code_type .
-                ?dtc {code_entry} "{dtc}" .
-            }}
-            """
+            log_banner(logger, "QUERY: code type by DTC %s", dtc)
+        s = query_catalogue.CODE_TYPE_BY_DTC.bind(dtc=dtc)
         return [row['code_type']['value'] for row in self.fuseki_connection.query_knowledge_graph(s, verbose)]
 
     def query_all_component_instances(self, verbose: bool = True) -> List[str]:
@@ -1139,17 +598,8 @@ class KnowledgeGraphQueryTool:
         :return: all components stored in the knowledge graph
         """
         if verbose:
-            print("####################################")
-            print("QUERY: all component instances")
-            print("####################################")
-        comp_entry = self.complete_ontology_entry('SuspectComponent')
-        name_entry = self.complete_ontology_entry('component_name')
-        s = f"""
-            SELECT ?name WHERE {{
-                ?comp a {comp_entry} .
-                ?comp {name_entry} ?name.
-            }}
-            """
+            log_banner(logger, "QUERY: all component instances", color=None)
+        s = query_catalogue.ALL_COMPONENT_INSTANCES.bind()
         return [row['name']['value'] for row in self.fuseki_connection.query_knowledge_graph(s, verbose)]
 
     def query_all_vehicle_instances(self, verbose: bool = True) -> List[Tuple[str, str, str, str, str]]:
@@ -1160,23 +610,8 @@ class KnowledgeGraphQueryTool:
         :return: all vehicles stored in the knowledge graph (vehicle, HSN, TSN, VIN, model)
         """
         if verbose:
-            print("####################################")
-            print("QUERY: all vehicle instances")
-            print("####################################")
-        vehicle_entry = self.complete_ontology_entry('Vehicle')
-        model_entry = self.complete_ontology_entry('model')
-        hsn_entry = self.complete_ontology_entry('HSN')
-        tsn_entry = self.complete_ontology_entry('TSN')
-        vin_entry = self.complete_ontology_entry('VIN')
-        s = f"""
-            SELECT ?vehicle ?hsn ?tsn ?vin ?model WHERE {{
-                ?vehicle a {vehicle_entry} .
-                ?vehicle {hsn_entry} ?hsn .
-                ?vehicle {tsn_entry} ?tsn .
-                ?vehicle {vin_entry} ?vin .
-                ?vehicle {model_entry} ?model .
-            }}
-            """
+            log_banner(logger, "QUERY: all vehicle instances", color=None)
+        s = query_catalogue.ALL_VEHICLE_INSTANCES.bind()
         return [
             (row['vehicle']['value'], row['hsn']['value'], row['tsn']['value'], row['vin']['value'],
              row['model']['value'])
@@ -1191,25 +626,8 @@ class KnowledgeGraphQueryTool:
         :return: all models stored in the knowledge graph (model, in_len, norm_meth, measuring_inst, id, architecture)
         """
         if verbose:
-            print("####################################")
-            print("QUERY: all model instances")
-            print("####################################")
-        model_entry = self.complete_ontology_entry('Model')
-        input_len_entry = self.complete_ontology_entry('input_length')
-        exp_norm_meth_entry = self.complete_ontology_entry('exp_normalization_method')
-        measuring_instruction_entry = self.complete_ontology_entry('measuring_instruction')
-        model_id_entry = self.complete_ontology_entry('model_id')
-        architecture_entry = self.complete_ontology_entry('architecture')
-        s = f"""
-            SELECT ?model ?input_len ?exp_norm_meth ?measuring_instruction ?model_id ?archi WHERE {{
-                ?model a {model_entry} .
-                ?model {input_len_entry} ?input_len .
-                ?model {exp_norm_meth_entry} ?exp_norm_meth .
-                ?model {measuring_instruction_entry} ?measuring_instruction .
-                ?model {model_id_entry} ?model_id .
-                ?model {architecture_entry} ?archi .
-            }}
-            """
+            log_banner(logger, "QUERY: all model instances", color=None)
+        s = query_catalogue.ALL_MODEL_INSTANCES.bind()
         return [
             (row['model']['value'], row['input_len']['value'], row['exp_norm_meth']['value'],
              row['measuring_instruction']['value'], row['model_id']['value'], row['archi']['value'])
@@ -1224,17 +642,8 @@ class KnowledgeGraphQueryTool:
         :return: all channels stored in the knowledge graph
         """
         if verbose:
-            print("####################################")
-            print("QUERY: all channel instances")
-            print("####################################")
-        channel_entry = self.complete_ontology_entry('Channel')
-        channel_name_entry = self.complete_ontology_entry('channel_name')
-        s = f"""
-            SELECT ?chan ?chan_name WHERE {{
-                ?chan a {channel_entry} .
-                ?chan {channel_name_entry} ?chan_name .
-            }}
-            """
+            log_banner(logger, "QUERY: all channel instances", color=None)
+        s = query_catalogue.ALL_CHANNEL_INSTANCES.bind()
         return [
             (row['chan']['value'], row['chan_name']['value'])
             for row in self.fuseki_connection.query_knowledge_graph(s, verbose)
@@ -1248,15 +657,8 @@ class KnowledgeGraphQueryTool:
         :return: all parallel rec oscillogram sets stored in the knowledge graph
         """
         if verbose:
-            print("####################################")
-            print("QUERY: all parallel rec oscillogram set instances")
-            print("####################################")
-        parallel_rec_set_entry = self.complete_ontology_entry('ParallelRecOscillogramSet')
-        s = f"""
-            SELECT ?osci_set WHERE {{
-                ?osci_set a {parallel_rec_set_entry} .
-            }}
-            """
+            log_banner(logger, "QUERY: all parallel rec oscillogram set instances", color=None)
+        s = query_catalogue.ALL_PARALLEL_REC_OSCILLOGRAM_SET_INSTANCES.bind()
         return [row['osci_set']['value'] for row in self.fuseki_connection.query_knowledge_graph(s, verbose)]
 
     def query_all_recorded_oscillograms(self, verbose: bool = True) -> List[str]:
@@ -1267,15 +669,8 @@ class KnowledgeGraphQueryTool:
         :return: all rec oscillograms stored in the knowledge graph
         """
         if verbose:
-            print("####################################")
-            print("QUERY: all rec oscillogram instances")
-            print("####################################")
-        osci_entry = self.complete_ontology_entry('Oscillogram')
-        s = f"""
-            SELECT ?osci WHERE {{
-                ?osci a {osci_entry} .
-            }}
-            """
+            log_banner(logger, "QUERY: all rec oscillogram instances", color=None)
+        s = query_catalogue.ALL_RECORDED_OSCILLOGRAMS.bind()
         return [row['osci']['value'] for row in self.fuseki_connection.query_knowledge_graph(s, verbose)]
 
     def query_all_oscillogram_classifications(self, verbose: bool = True) -> List[str]:
@@ -1286,15 +681,8 @@ class KnowledgeGraphQueryTool:
         :return: all oscillogram classifications stored in the knowledge graph
         """
         if verbose:
-            print("####################################")
-            print("QUERY: all oscillogram classification instances")
-            print("####################################")
-        osci_classification_entry = self.complete_ontology_entry('OscillogramClassification')
-        s = f"""
-            SELECT ?osci_classification WHERE {{
-                ?osci_classification a {osci_classification_entry} .
-            }}
-            """
+            log_banner(logger, "QUERY: all oscillogram classification instances", color=None)
+        s = query_catalogue.ALL_OSCILLOGRAM_CLASSIFICATIONS.bind()
         return [row['osci_classification']['value'] for row in self.fuseki_connection.query_knowledge_graph(s, verbose)]
 
     def query_oscillogram_classification_by_heatmap(self, heatmap_id: str, verbose: bool = True) -> List[str]:
@@ -1306,22 +694,11 @@ class KnowledgeGraphQueryTool:
         :return: all oscillogram classifications stored in the knowledge graph
         """
         if verbose:
-            print("####################################")
-            print("QUERY: oscillogram classification instances for the specified heatmap:", heatmap_id)
-            print("####################################")
-        osci_classification_entry = self.complete_ontology_entry('OscillogramClassification')
-        heatmap_entry = self.complete_ontology_entry('Heatmap')
-        produces_entry = self.complete_ontology_entry('produces')
-        id_entry = self.complete_ontology_entry(heatmap_id)
-        id_entry = id_entry.replace('<', '').replace('>', '')
-        s = f"""
-            SELECT ?osci_classification WHERE {{
-                ?osci_classification a {osci_classification_entry} .
-                ?heatmap a {heatmap_entry} .
-                ?osci_classification {produces_entry} ?heatmap .
-                FILTER(STR(?heatmap) = "{id_entry}") .
-            }}
-            """
+            log_banner(
+                logger, "QUERY: oscillogram classification instances for the specified heatmap: %s",
+                heatmap_id, color=None
+            )
+        s = query_catalogue.OSCILLOGRAM_CLASSIFICATION_BY_HEATMAP.bind(heatmap_id=heatmap_id)
         return [row['osci_classification']['value'] for row in self.fuseki_connection.query_knowledge_graph(s, verbose)]
 
     def query_all_manual_inspection_instances(self, verbose: bool = True) -> List[str]:
@@ -1332,15 +709,8 @@ class KnowledgeGraphQueryTool:
         :return: all manual inspections stored in the knowledge graph
         """
         if verbose:
-            print("####################################")
-            print("QUERY: all manual inspection instances")
-            print("####################################")
-        manual_inspection_entry = self.complete_ontology_entry('ManualInspection')
-        s = f"""
-            SELECT ?manual_inspection WHERE {{
-                ?manual_inspection a {manual_inspection_entry} .
-            }}
-            """
+            log_banner(logger, "QUERY: all manual inspection instances", color=None)
+        s = query_catalogue.ALL_MANUAL_INSPECTION_INSTANCES.bind()
         return [row['manual_inspection']['value'] for row in self.fuseki_connection.query_knowledge_graph(s, verbose)]
 
     def query_all_diag_log_instances(self, verbose: bool = True) -> List[str]:
@@ -1351,15 +721,8 @@ class KnowledgeGraphQueryTool:
         :return: all diag logs stored in the knowledge graph
         """
         if verbose:
-            print("####################################")
-            print("QUERY: all diag log instances")
-            print("####################################")
-        diag_log_entry = self.complete_ontology_entry('DiagLog')
-        s = f"""
-            SELECT ?diag_log WHERE {{
-                ?diag_log a {diag_log_entry} .
-            }}
-            """
+            log_banner(logger, "QUERY: all diag log instances", color=None)
+        s = query_catalogue.ALL_DIAG_LOG_INSTANCES.bind()
         return [row['diag_log']['value'] for row in self.fuseki_connection.query_knowledge_graph(s, verbose)]
 
     def query_all_fault_path_instances(self, verbose: bool = True) -> List[str]:
@@ -1370,15 +733,8 @@ class KnowledgeGraphQueryTool:
         :return: all fault paths stored in the knowledge graph
         """
         if verbose:
-            print("####################################")
-            print("QUERY: all fault path instances")
-            print("####################################")
-        fault_path_entry = self.complete_ontology_entry('FaultPath')
-        s = f"""
-            SELECT ?fault_path WHERE {{
-                ?fault_path a {fault_path_entry} .
-            }}
-            """
+            log_banner(logger, "QUERY: all fault path instances", color=None)
+        s = query_catalogue.ALL_FAULT_PATH_INSTANCES.bind()
         return [row['fault_path']['value'] for row in self.fuseki_connection.query_knowledge_graph(s, verbose)]
 
     def query_model_id_by_osci_classification_id(self, osci_classification_id: str, verbose: bool = True) -> List[str]:
@@ -1390,20 +746,11 @@ class KnowledgeGraphQueryTool:
         :return: model ID for oscillogram classification instance
         """
         if verbose:
-            print("####################################")
-            print("QUERY: model ID for the specified oscillogram classification:", osci_classification_id)
-            print("####################################")
-        osci_classification_entry = self.complete_ontology_entry('OscillogramClassification')
-        id_entry = self.complete_ontology_entry(osci_classification_id)
-        id_entry = id_entry.replace('<', '').replace('>', '')
-        model_id_entry = self.complete_ontology_entry('model_id')
-        s = f"""
-            SELECT ?model_id WHERE {{
-                ?osci_classification a {osci_classification_entry} .
-                FILTER(STR(?osci_classification) = "{id_entry}") .
-                ?osci_classification {model_id_entry} ?model_id .
-            }}
-            """
+            log_banner(
+                logger, "QUERY: model ID for the specified oscillogram classification: %s",
+                osci_classification_id, color=None
+            )
+        s = query_catalogue.MODEL_ID_BY_OSCI_CLASSIFICATION_ID.bind(osci_classification_id=osci_classification_id)
         return [row['model_id']['value'] for row in self.fuseki_connection.query_knowledge_graph(s, verbose)]
 
     def query_rule_based_model_meta_info_by_component(
@@ -1418,31 +765,8 @@ class KnowledgeGraphQueryTool:
         :return: (normalization method, model id, input length)
         """
         if verbose:
-            print("####################################")
-            print("QUERY: model meta info for the specified component:", component)
-            print("####################################")
-        model_entry = self.complete_ontology_entry('Model')
-        input_len_entry = self.complete_ontology_entry('input_length')
-        model_id_entry = self.complete_ontology_entry('model_id')
-        norm_entry = self.complete_ontology_entry('exp_normalization_method')
-        assesses_entry = self.complete_ontology_entry('assesses')
-        comp_entry = self.complete_ontology_entry('SuspectComponent')
-        comp_name_entry = self.complete_ontology_entry('component_name')
-        archi_entry = self.complete_ontology_entry('architecture')
-        s = f"""
-            SELECT ?norm ?id ?in_len WHERE {{
-                ?model a {model_entry} .
-                ?model {norm_entry} ?norm .
-                ?model {model_id_entry} ?id .
-                ?model {input_len_entry} ?in_len .
-                ?model {archi_entry} ?archi .
-                FILTER(STR(?archi) = "rule-based")
-                ?comp a {comp_entry} .
-                ?model {assesses_entry} ?comp .
-                ?comp {comp_name_entry} ?comp_name .
-                FILTER(STR(?comp_name) = "{component}")
-            }}
-            """
+            log_banner(logger, "QUERY: model meta info for the specified component: %s", component, color=None)
+        s = query_catalogue.RULE_BASED_MODEL_META_INFO_BY_COMPONENT.bind(component=component)
         return [(row['norm']['value'], row['id']['value'], row['in_len']['value'])
                 for row in self.fuseki_connection.query_knowledge_graph(s, verbose)]
 
@@ -1458,31 +782,8 @@ class KnowledgeGraphQueryTool:
         :return: (normalization method, model id, input length)
         """
         if verbose:
-            print("####################################")
-            print("QUERY: model meta info for the specified component:", component)
-            print("####################################")
-        model_entry = self.complete_ontology_entry('Model')
-        input_len_entry = self.complete_ontology_entry('input_length')
-        model_id_entry = self.complete_ontology_entry('model_id')
-        norm_entry = self.complete_ontology_entry('exp_normalization_method')
-        assesses_entry = self.complete_ontology_entry('assesses')
-        comp_entry = self.complete_ontology_entry('SuspectComponent')
-        comp_name_entry = self.complete_ontology_entry('component_name')
-        archi_entry = self.complete_ontology_entry('architecture')
-        s = f"""
-            SELECT ?norm ?id ?in_len WHERE {{
-                ?model a {model_entry} .
-                ?model {norm_entry} ?norm .
-                ?model {model_id_entry} ?id .
-                ?model {input_len_entry} ?in_len .
-                ?model {archi_entry} ?archi .
-                FILTER(STR(?archi) = "XCM")
-                ?comp a {comp_entry} .
-                ?model {assesses_entry} ?comp .
-                ?comp {comp_name_entry} ?comp_name .
-                FILTER(STR(?comp_name) = "{component}")
-            }}
-            """
+            log_banner(logger, "QUERY: model meta info for the specified component: %s", component, color=None)
+        s = query_catalogue.XCM_MODEL_META_INFO_BY_COMPONENT.bind(component=component)
         return [(row['norm']['value'], row['id']['value'], row['in_len']['value'])
                 for row in self.fuseki_connection.query_knowledge_graph(s, verbose)]
 
@@ -1495,20 +796,8 @@ class KnowledgeGraphQueryTool:
         :return: component name for component instance
         """
         if verbose:
-            print("####################################")
-            print("QUERY: suspect component name for the specified instance:", component_id)
-            print("####################################")
-        suspect_comp_entry = self.complete_ontology_entry('SuspectComponent')
-        id_entry = self.complete_ontology_entry(component_id)
-        id_entry = id_entry.replace('<', '').replace('>', '')
-        comp_name_entry = self.complete_ontology_entry('component_name')
-        s = f"""
-            SELECT ?comp_name WHERE {{
-                ?sus_comp a {suspect_comp_entry} .
-                FILTER(STR(?sus_comp) = "{id_entry}") .
-                ?sus_comp {comp_name_entry} ?comp_name .
-            }}
-            """
+            log_banner(logger, "QUERY: suspect component name for the specified instance: %s", component_id, color=None)
+        s = query_catalogue.SUSPECT_COMPONENT_NAME_BY_ID.bind(component_id=component_id)
         return [row['comp_name']['value'] for row in self.fuseki_connection.query_knowledge_graph(s, verbose)]
 
     def query_uncertainty_by_osci_classification_id(
@@ -1522,20 +811,11 @@ class KnowledgeGraphQueryTool:
         :return: uncertainty for oscillogram classification instance
         """
         if verbose:
-            print("####################################")
-            print("QUERY: uncertainty for the specified oscillogram classification:", osci_classification_id)
-            print("####################################")
-        osci_classification_entry = self.complete_ontology_entry('OscillogramClassification')
-        id_entry = self.complete_ontology_entry(osci_classification_id)
-        id_entry = id_entry.replace('<', '').replace('>', '')
-        uncertainty_entry = self.complete_ontology_entry('uncertainty')
-        s = f"""
-            SELECT ?uncertainty WHERE {{
-                ?osci_classification a {osci_classification_entry} .
-                FILTER(STR(?osci_classification) = "{id_entry}") .
-                ?osci_classification {uncertainty_entry} ?uncertainty .
-            }}
-            """
+            log_banner(
+                logger, "QUERY: uncertainty for the specified oscillogram classification: %s",
+                osci_classification_id, color=None
+            )
+        s = query_catalogue.UNCERTAINTY_BY_OSCI_CLASSIFICATION_ID.bind(osci_classification_id=osci_classification_id)
         return [row['uncertainty']['value'] for row in self.fuseki_connection.query_knowledge_graph(s, verbose)]
 
     def query_date_by_diag_log(self, diag_log_id: str, verbose: bool = True) -> List[str]:
@@ -1547,20 +827,8 @@ class KnowledgeGraphQueryTool:
         :return: date for diag log instance
         """
         if verbose:
-            print("####################################")
-            print("QUERY: date for the specified diag log:", diag_log_id)
-            print("####################################")
-        diag_log_entry = self.complete_ontology_entry('DiagLog')
-        id_entry = self.complete_ontology_entry(diag_log_id)
-        id_entry = id_entry.replace('<', '').replace('>', '')
-        date_entry = self.complete_ontology_entry('date')
-        s = f"""
-            SELECT ?date WHERE {{
-                ?diag_log a {diag_log_entry} .
-                FILTER(STR(?diag_log) = "{id_entry}") .
-                ?diag_log {date_entry} ?date .
-            }}
-            """
+            log_banner(logger, "QUERY: date for the specified diag log: %s", diag_log_id, color=None)
+        s = query_catalogue.DATE_BY_DIAG_LOG.bind(diag_log_id=diag_log_id)
         return [row['date']['value'] for row in self.fuseki_connection.query_knowledge_graph(s, verbose)]
 
     def query_max_num_of_parallel_rec_by_diag_log(self, diag_log_id: str, verbose: bool = True) -> List[str]:
@@ -1572,20 +840,8 @@ class KnowledgeGraphQueryTool:
         :return: max num of parallel rec for diag log instance
         """
         if verbose:
-            print("####################################")
-            print("QUERY: max num of parallel rec for the specified diag log:", diag_log_id)
-            print("####################################")
-        diag_log_entry = self.complete_ontology_entry('DiagLog')
-        id_entry = self.complete_ontology_entry(diag_log_id)
-        id_entry = id_entry.replace('<', '').replace('>', '')
-        max_num_of_parallel_rec_entry = self.complete_ontology_entry('max_num_of_parallel_rec')
-        s = f"""
-            SELECT ?max_num_of_parallel_rec WHERE {{
-                ?diag_log a {diag_log_entry} .
-                FILTER(STR(?diag_log) = "{id_entry}") .
-                ?diag_log {max_num_of_parallel_rec_entry} ?max_num_of_parallel_rec .
-            }}
-            """
+            log_banner(logger, "QUERY: max num of parallel rec for the specified diag log: %s", diag_log_id, color=None)
+        s = query_catalogue.MAX_NUM_OF_PARALLEL_REC_BY_DIAG_LOG.bind(diag_log_id=diag_log_id)
         return [row['max_num_of_parallel_rec']['value'] for row in
                 self.fuseki_connection.query_knowledge_graph(s, verbose)]
 
@@ -1598,20 +854,8 @@ class KnowledgeGraphQueryTool:
         :return: fault conditions for fault path instance
         """
         if verbose:
-            print("####################################")
-            print("QUERY: fault conditions for the specified fault path:", fault_path_id)
-            print("####################################")
-        fault_path_entry = self.complete_ontology_entry('FaultPath')
-        id_entry = self.complete_ontology_entry(fault_path_id)
-        id_entry = id_entry.replace('<', '').replace('>', '')
-        resulted_in_entry = self.complete_ontology_entry('resultedIn')
-        s = f"""
-            SELECT ?fault_cond WHERE {{
-                ?fault_path a {fault_path_entry} .
-                FILTER(STR(?fault_path) = "{id_entry}") .
-                ?fault_cond {resulted_in_entry} ?fault_path .
-            }}
-            """
+            log_banner(logger, "QUERY: fault conditions for the specified fault path: %s", fault_path_id, color=None)
+        s = query_catalogue.RESULTED_IN_BY_FAULT_PATH.bind(fault_path_id=fault_path_id)
         return [row['fault_cond']['value'] for row in self.fuseki_connection.query_knowledge_graph(s, verbose)]
 
     def query_dtcs_recorded_in_vehicle(self, vehicle_id: str, verbose: bool = True) -> List[str]:
@@ -1623,28 +867,8 @@ class KnowledgeGraphQueryTool:
         :return: DTCs for the vehicle instance
         """
         if verbose:
-            print("####################################")
-            print("QUERY: DTCs for the specified vehicle:", vehicle_id)
-            print("####################################")
-        dtc_entry = self.complete_ontology_entry('DTC')
-        diag_log_entry = self.complete_ontology_entry('DiagLog')
-        vehicle_entry = self.complete_ontology_entry('Vehicle')
-        id_entry = self.complete_ontology_entry(vehicle_id)
-        id_entry = id_entry.replace('<', '').replace('>', '')
-        appears_in_entry = self.complete_ontology_entry('appearsIn')
-        created_for_entry = self.complete_ontology_entry('createdFor')
-        code_entry = self.complete_ontology_entry('code')
-        s = f"""
-            SELECT ?code WHERE {{
-                ?vehicle a {vehicle_entry} .
-                FILTER(STR(?vehicle) = "{id_entry}") .
-                ?diag_log a {diag_log_entry} .
-                ?dtc a {dtc_entry} .
-                ?dtc {appears_in_entry} ?diag_log .
-                ?diag_log {created_for_entry} ?vehicle .
-                ?dtc {code_entry} ?code .
-            }}
-            """
+            log_banner(logger, "QUERY: DTCs for the specified vehicle: %s", vehicle_id, color=None)
+        s = query_catalogue.DTCS_RECORDED_IN_VEHICLE.bind(vehicle_id=vehicle_id)
         return [row['code']['value'] for row in self.fuseki_connection.query_knowledge_graph(s, verbose)]
 
     def query_dtcs_by_diag_log(self, diag_log_id: str, verbose: bool = True) -> List[str]:
@@ -1656,20 +880,8 @@ class KnowledgeGraphQueryTool:
         :return: DTCs for diag log instance
         """
         if verbose:
-            print("####################################")
-            print("QUERY: DTCs for the specified diag log:", diag_log_id)
-            print("####################################")
-        diag_log_entry = self.complete_ontology_entry('DiagLog')
-        id_entry = self.complete_ontology_entry(diag_log_id)
-        id_entry = id_entry.replace('<', '').replace('>', '')
-        appears_in_entry = self.complete_ontology_entry('appearsIn')
-        s = f"""
-            SELECT ?dtc WHERE {{
-                ?diag_log a {diag_log_entry} .
-                FILTER(STR(?diag_log) = "{id_entry}") .
-                ?dtc {appears_in_entry} ?diag_log .
-            }}
-            """
+            log_banner(logger, "QUERY: DTCs for the specified diag log: %s", diag_log_id, color=None)
+        s = query_catalogue.DTCS_BY_DIAG_LOG.bind(diag_log_id=diag_log_id)
         return [row['dtc']['value'] for row in self.fuseki_connection.query_knowledge_graph(s, verbose)]
 
     def query_diag_steps_by_diag_log(self, diag_log_id: str, verbose: bool = True) -> List[str]:
@@ -1681,20 +893,8 @@ class KnowledgeGraphQueryTool:
         :return: diag steps for diag log instance
         """
         if verbose:
-            print("####################################")
-            print("QUERY: diag steps for the specified diag log:", diag_log_id)
-            print("####################################")
-        diag_log_entry = self.complete_ontology_entry('DiagLog')
-        id_entry = self.complete_ontology_entry(diag_log_id)
-        id_entry = id_entry.replace('<', '').replace('>', '')
-        diag_step_entry = self.complete_ontology_entry('diagStep')
-        s = f"""
-            SELECT ?classification WHERE {{
-                ?diag_log a {diag_log_entry} .
-                FILTER(STR(?diag_log) = "{id_entry}") .
-                ?classification {diag_step_entry} ?diag_log .
-            }}
-            """
+            log_banner(logger, "QUERY: diag steps for the specified diag log: %s", diag_log_id, color=None)
+        s = query_catalogue.DIAG_STEPS_BY_DIAG_LOG.bind(diag_log_id=diag_log_id)
         return [row['classification']['value'] for row in self.fuseki_connection.query_knowledge_graph(s, verbose)]
 
     def query_fault_path_by_diag_log(self, diag_log_id: str, verbose: bool = True) -> List[str]:
@@ -1706,20 +906,8 @@ class KnowledgeGraphQueryTool:
         :return: fault path for diag log instance
         """
         if verbose:
-            print("####################################")
-            print("QUERY: fault path for the specified diag log:", diag_log_id)
-            print("####################################")
-        diag_log_entry = self.complete_ontology_entry('DiagLog')
-        id_entry = self.complete_ontology_entry(diag_log_id)
-        id_entry = id_entry.replace('<', '').replace('>', '')
-        entails_entry = self.complete_ontology_entry('entails')
-        s = f"""
-            SELECT ?fault_path WHERE {{
-                ?diag_log a {diag_log_entry} .
-                FILTER(STR(?diag_log) = "{id_entry}") .
-                ?diag_log {entails_entry} ?fault_path .
-            }}
-            """
+            log_banner(logger, "QUERY: fault path for the specified diag log: %s", diag_log_id, color=None)
+        s = query_catalogue.FAULT_PATH_BY_DIAG_LOG.bind(diag_log_id=diag_log_id)
         return [row['fault_path']['value'] for row in self.fuseki_connection.query_knowledge_graph(s, verbose)]
 
     def query_fault_path_description_by_id(self, fault_path_id: str, verbose: bool = True) -> List[str]:
@@ -1731,20 +919,8 @@ class KnowledgeGraphQueryTool:
         :return: fault path description for the specified ID
         """
         if verbose:
-            print("####################################")
-            print("QUERY: fault path description for the specified ID:", fault_path_id)
-            print("####################################")
-        fault_path_entry = self.complete_ontology_entry('FaultPath')
-        id_entry = self.complete_ontology_entry(fault_path_id)
-        id_entry = id_entry.replace('<', '').replace('>', '')
-        desc_entry = self.complete_ontology_entry('path_description')
-        s = f"""
-            SELECT ?path_desc WHERE {{
-                ?fault_path a {fault_path_entry} .
-                FILTER(STR(?fault_path) = "{id_entry}") .
-                ?fault_path {desc_entry} ?path_desc .
-            }}
-            """
+            log_banner(logger, "QUERY: fault path description for the specified ID: %s", fault_path_id, color=None)
+        s = query_catalogue.FAULT_PATH_DESCRIPTION_BY_ID.bind(fault_path_id=fault_path_id)
         return [row['path_desc']['value'] for row in self.fuseki_connection.query_knowledge_graph(s, verbose)]
 
     def query_fault_condition_description_by_id(self, fault_condition_id: str, verbose: bool = True) -> List[str]:
@@ -1756,20 +932,11 @@ class KnowledgeGraphQueryTool:
         :return: fault condition description for the specified ID
         """
         if verbose:
-            print("####################################")
-            print("QUERY: fault condition description for the specified ID:", fault_condition_id)
-            print("####################################")
-        fault_condition_entry = self.complete_ontology_entry('FaultCondition')
-        id_entry = self.complete_ontology_entry(fault_condition_id)
-        id_entry = id_entry.replace('<', '').replace('>', '')
-        desc_entry = self.complete_ontology_entry('condition_description')
-        s = f"""
-            SELECT ?cond_desc WHERE {{
-                ?fault_cond a {fault_condition_entry} .
-                FILTER(STR(?fault_cond) = "{id_entry}") .
-                ?fault_cond {desc_entry} ?cond_desc .
-            }}
-            """
+            log_banner(
+                logger, "QUERY: fault condition description for the specified ID: %s",
+                fault_condition_id, color=None
+            )
+        s = query_catalogue.FAULT_CONDITION_DESCRIPTION_BY_ID.bind(fault_condition_id=fault_condition_id)
         return [row['cond_desc']['value'] for row in self.fuseki_connection.query_knowledge_graph(s, verbose)]
 
     def query_vehicle_by_diag_log(self, diag_log_id: str, verbose: bool = True) -> List[str]:
@@ -1781,20 +948,8 @@ class KnowledgeGraphQueryTool:
         :return: vehicle for diag log instance
         """
         if verbose:
-            print("####################################")
-            print("QUERY: vehicle for the specified diag log:", diag_log_id)
-            print("####################################")
-        diag_log_entry = self.complete_ontology_entry('DiagLog')
-        id_entry = self.complete_ontology_entry(diag_log_id)
-        id_entry = id_entry.replace('<', '').replace('>', '')
-        created_for_entry = self.complete_ontology_entry('createdFor')
-        s = f"""
-            SELECT ?vehicle WHERE {{
-                ?diag_log a {diag_log_entry} .
-                FILTER(STR(?diag_log) = "{id_entry}") .
-                ?diag_log {created_for_entry} ?vehicle .
-            }}
-            """
+            log_banner(logger, "QUERY: vehicle for the specified diag log: %s", diag_log_id, color=None)
+        s = query_catalogue.VEHICLE_BY_DIAG_LOG.bind(diag_log_id=diag_log_id)
         return [row['vehicle']['value'] for row in self.fuseki_connection.query_knowledge_graph(s, verbose)]
 
     def query_time_series_by_oscillogram_instance(self, osci_id: str, verbose: bool = True) -> List[str]:
@@ -1806,22 +961,23 @@ class KnowledgeGraphQueryTool:
         :return: time series for oscillogram instance
         """
         if verbose:
-            print("####################################")
-            print("QUERY: time series for the specified oscillogram:", osci_id)
-            print("####################################")
-        osci_entry = self.complete_ontology_entry('Oscillogram')
-        id_entry = self.complete_ontology_entry(osci_id)
-        id_entry = id_entry.replace('<', '').replace('>', '')
-        time_series_entry = self.complete_ontology_entry('time_series')
-        s = f"""
-            SELECT ?time_series WHERE {{
-                ?osci a {osci_entry} .
-                FILTER(STR(?osci) = "{id_entry}") .
-                ?osci {time_series_entry} ?time_series .
-            }}
-            """
+            log_banner(logger, "QUERY: time series for the specified oscillogram: %s", osci_id, color=None)
+        s = query_catalogue.TIME_SERIES_BY_OSCILLOGRAM_INSTANCE.bind(osci_id=osci_id)
         return [row['time_series']['value'] for row in self.fuseki_connection.query_knowledge_graph(s, verbose)]
 
+    def query_time_series_array_by_oscillogram_instance(self, osci_id: str, verbose: bool = True) -> List[np.ndarray]:
+        """
+        Queries the time series for the specified oscillogram instance, decoded as array (binary encoded as well as
+        legacy text literals) or, for blob store references, as read-only memory map (zero-copy). Legacy time series
+        stored as truncated pandas Series representation raise a `TruncatedArrayError`.
+
+        :param osci_id: ID of the oscillogram instance to query time series for
+        :param verbose: if true, logging is activated
+        :return: time series (array) for oscillogram instance
+        """
+        time_series = self.query_time_series_by_oscillogram_instance(osci_id, verbose)
+        return [load_array(ts, self.blob_store) for ts in time_series]
+
     def query_oscillograms_by_parallel_osci_set(self, osci_set_id: str, verbose: bool = True) -> List[str]:
         """
         Queries all parallel recorded oscillograms for the specified set.
@@ -1831,20 +987,11 @@ class KnowledgeGraphQueryTool:
         :return: parallel recorded oscillograms part of the set
         """
         if verbose:
-            print("####################################")
-            print("QUERY: all parallel rec oscillograms for the specified set:", osci_set_id)
-            print("####################################")
-        parallel_rec_set_entry = self.complete_ontology_entry('ParallelRecOscillogramSet')
-        id_entry = self.complete_ontology_entry(osci_set_id)
-        id_entry = id_entry.replace('<', '').replace('>', '')
-        part_of_entry = self.complete_ontology_entry('partOf')
-        s = f"""
-            SELECT ?oscillogram WHERE {{
-                ?osci_set a {parallel_rec_set_entry} .
-                FILTER(STR(?osci_set) = "{id_entry}") .
-                ?oscillogram {part_of_entry} ?osci_set .
-            }}
-            """
+            log_banner(
+                logger, "QUERY: all parallel rec oscillograms for the specified set: %s",
+                osci_set_id, color=None
+            )
+        s = query_catalogue.OSCILLOGRAMS_BY_PARALLEL_OSCI_SET.bind(osci_set_id=osci_set_id)
         return [row['oscillogram']['value'] for row in self.fuseki_connection.query_knowledge_graph(s, verbose)]
 
     def query_oscillogram_by_classification_instance(
@@ -1858,20 +1005,11 @@ class KnowledgeGraphQueryTool:
         :return: oscillogram instance
         """
         if verbose:
-            print("####################################")
-            print("QUERY: oscillogram instance for the specified classification:", osci_classification_id)
-            print("####################################")
-        osci_classification_entry = self.complete_ontology_entry('OscillogramClassification')
-        id_entry = self.complete_ontology_entry(osci_classification_id)
-        id_entry = id_entry.replace('<', '').replace('>', '')
-        classifies_entry = self.complete_ontology_entry('classifies')
-        s = f"""
-            SELECT ?oscillogram WHERE {{
-                ?osci_classification a {osci_classification_entry} .
-                FILTER(STR(?osci_classification) = "{id_entry}") .
-                ?osci_classification {classifies_entry} ?oscillogram .
-            }}
-            """
+            log_banner(
+                logger, "QUERY: oscillogram instance for the specified classification: %s",
+                osci_classification_id, color=None
+            )
+        s = query_catalogue.OSCILLOGRAM_BY_CLASSIFICATION_INSTANCE.bind(osci_classification_id=osci_classification_id)
         return [row['oscillogram']['value'] for row in self.fuseki_connection.query_knowledge_graph(s, verbose)]
 
     def query_suspect_component_by_classification(self, classification_id: str, verbose: bool = True) -> List[str]:
@@ -1883,23 +1021,11 @@ class KnowledgeGraphQueryTool:
         :return: suspect component
         """
         if verbose:
-            print("####################################")
-            print("QUERY: suspect component for the specified classification:", classification_id)
-            print("####################################")
-        osci_classification_entry = self.complete_ontology_entry('OscillogramClassification')
-        manual_inspection_entry = self.complete_ontology_entry('ManualInspection')
-        id_entry = self.complete_ontology_entry(classification_id)
-        id_entry = id_entry.replace('<', '').replace('>', '')
-        checks_entry = self.complete_ontology_entry('checks')
-        s = f"""
-            SELECT ?comp WHERE {{
-                {{ ?classification a {osci_classification_entry} . }}
-                UNION
-                {{ ?classification a {manual_inspection_entry} . }}
-                FILTER(STR(?classification) = "{id_entry}") .
-                ?classification {checks_entry} ?comp .
-            }}
-            """
+            log_banner(
+                logger, "QUERY: suspect component for the specified classification: %s",
+                classification_id, color=None
+            )
+        s = query_catalogue.SUSPECT_COMPONENT_BY_CLASSIFICATION.bind(classification_id=classification_id)
         return [row['comp']['value'] for row in self.fuseki_connection.query_knowledge_graph(s, verbose)]
 
     def query_suspect_component_name_by_model(self, model_id: str, verbose: bool = False) -> List[str]:
@@ -1911,22 +1037,11 @@ class KnowledgeGraphQueryTool:
         :return: suspect component
         """
         if verbose:
-            print("####################################")
-            print("QUERY: suspect component for the specified classification model:", model_id)
-            print("####################################")
-        model_entry = self.complete_ontology_entry('Model')
-        id_entry = self.complete_ontology_entry(model_id)
-        id_entry = id_entry.replace('<', '').replace('>', '')
-        assesses_entry = self.complete_ontology_entry('assesses')
-        comp_name_entry = self.complete_ontology_entry('component_name')
-        s = f"""
-            SELECT ?comp_name WHERE {{
-                {{ ?model a {model_entry} . }}
-                FILTER(STR(?model) = "{id_entry}") .
-                ?model {assesses_entry} ?comp .
-                ?comp {comp_name_entry} ?comp_name .
-            }}
-            """
+            log_banner(
+                logger, "QUERY: suspect component for the specified classification model: %s",
+                model_id, color=None
+            )
+        s = query_catalogue.SUSPECT_COMPONENT_NAME_BY_MODEL.bind(model_id=model_id)
         return [row['comp_name']['value'] for row in self.fuseki_connection.query_knowledge_graph(s, verbose)]
 
     def query_input_chan_req_by_model(self, model_id: str, verbose: bool = False) -> List[Tuple[str, str]]:
@@ -1938,22 +1053,8 @@ class KnowledgeGraphQueryTool:
         :return: (input channel requirements, channel idx)
         """
         if verbose:
-            print("####################################")
-            print("QUERY: input channel requirements for the specified model:", model_id)
-            print("####################################")
-        model_entry = self.complete_ontology_entry('Model')
-        id_entry = self.complete_ontology_entry(model_id)
-        id_entry = id_entry.replace('<', '').replace('>', '')
-        has_req_entry = self.complete_ontology_entry('hasRequirement')
-        chan_idx_entry = self.complete_ontology_entry('channel_idx')
-        s = f"""
-            SELECT ?input_chan_req ?chan_idx WHERE {{
-                {{ ?model a {model_entry} . }}
-                FILTER(STR(?model) = "{id_entry}") .
-                ?model {has_req_entry} ?input_chan_req .
-                ?input_chan_req {chan_idx_entry} ?chan_idx .
-            }}
-            """
+            log_banner(logger, "QUERY: input channel requirements for the specified model: %s", model_id, color=None)
+        s = query_catalogue.INPUT_CHAN_REQ_BY_MODEL.bind(model_id=model_id)
         return [(row['input_chan_req']['value'], row['chan_idx']['value']) for row in
                 self.fuseki_connection.query_knowledge_graph(s, verbose)]
 
@@ -1966,17 +1067,8 @@ class KnowledgeGraphQueryTool:
         :return: model
         """
         if verbose:
-            print("####################################")
-            print("QUERY: model for the specified model_id:", model_id)
-            print("####################################")
-        model_entry = self.complete_ontology_entry('Model')
-        model_id_entry = self.complete_ontology_entry('model_id')
-        s = f"""
-            SELECT ?model WHERE {{
-                {{ ?model a {model_entry} . }}
-                ?model {model_id_entry} "{model_id}" .
-            }}
-            """
+            log_banner(logger, "QUERY: model for the specified model_id: %s", model_id, color=None)
+        s = query_catalogue.MODEL_BY_MODEL_ID.bind(model_id=model_id)
         return [row['model']['value'] for row in self.fuseki_connection.query_knowledge_graph(s, verbose)]
 
     def query_channel_by_input_req(self, input_req_id: str, verbose: bool = False) -> List[Tuple[str, str]]:
@@ -1988,22 +1080,8 @@ class KnowledgeGraphQueryTool:
         :return: channel
         """
         if verbose:
-            print("####################################")
-            print("QUERY: channel for the specified input requirements:", input_req_id)
-            print("####################################")
-        input_req_entry = self.complete_ontology_entry('InputChannelRequirement')
-        id_entry = self.complete_ontology_entry(input_req_id)
-        id_entry = id_entry.replace('<', '').replace('>', '')
-        expects_entry = self.complete_ontology_entry('expects')
-        channel_name_entry = self.complete_ontology_entry('channel_name')
-        s = f"""
-            SELECT ?chan ?chan_name WHERE {{
-                {{ ?input_req a {input_req_entry} . }}
-                FILTER(STR(?input_req) = "{id_entry}") .
-                ?input_req {expects_entry} ?chan .
-                ?chan {channel_name_entry} ?chan_name .
-            }}
-            """
+            log_banner(logger, "QUERY: channel for the specified input requirements: %s", input_req_id, color=None)
+        s = query_catalogue.CHANNEL_BY_INPUT_REQ.bind(input_req_id=input_req_id)
         return [(row['chan']['value'], row['chan_name']['value']) for row in
                 self.fuseki_connection.query_knowledge_graph(s, verbose)]
 
@@ -2016,22 +1094,11 @@ class KnowledgeGraphQueryTool:
         :return: suspect component(s) (via 'hasChannel')
         """
         if verbose:
-            print("####################################")
-            print("QUERY: suspect component(s) ('hasChannel') for the specified channel:", channel_id)
-            print("####################################")
-        channel_entry = self.complete_ontology_entry('Channel')
-        id_entry = self.complete_ontology_entry(channel_id)
-        id_entry = id_entry.replace('<', '').replace('>', '')
-        has_chan_entry = self.complete_ontology_entry('hasChannel')
-        comp_name_entry = self.complete_ontology_entry('component_name')
-        s = f"""
-            SELECT ?comp ?comp_name WHERE {{
-                ?chan a {channel_entry} .
-                FILTER(STR(?chan) = "{id_entry}") .
-                ?comp {has_chan_entry} ?chan .
-                ?comp {comp_name_entry} ?comp_name .
-            }}
-            """
+            log_banner(
+                logger, "QUERY: suspect component(s) ('hasChannel') for the specified channel: %s",
+                channel_id, color=None
+            )
+        s = query_catalogue.SUSPECT_COMPONENT_NAMES_BY_CHANNEL.bind(channel_id=channel_id)
         return [(row['comp']['value'], row['comp_name']['value']) for row in
                 self.fuseki_connection.query_knowledge_graph(s, verbose)]
 
@@ -2044,24 +1111,8 @@ class KnowledgeGraphQueryTool:
         :return: models
         """
         if verbose:
-            print("####################################")
-            print("QUERY: classification models for the specified channel:", channel_id)
-            print("####################################")
-        channel_entry = self.complete_ontology_entry('Channel')
-        id_entry = self.complete_ontology_entry(channel_id)
-        id_entry = id_entry.replace('<', '').replace('>', '')
-        has_req_entry = self.complete_ontology_entry('hasRequirement')
-        expects_entry = self.complete_ontology_entry('expects')
-        model_entry = self.complete_ontology_entry('Model')
-        s = f"""
-            SELECT ?model WHERE {{
-                ?chan a {channel_entry} .
-                FILTER(STR(?chan) = "{id_entry}") .
-                ?model a {model_entry} .
-                ?model {has_req_entry} ?input_req .
-                ?input_req {expects_entry} ?chan .
-            }}
-            """
+            log_banner(logger, "QUERY: classification models for the specified channel: %s", channel_id, color=None)
+        s = query_catalogue.MODELS_BY_CHANNEL.bind(channel_id=channel_id)
         return [row['model']['value'] for row in self.fuseki_connection.query_knowledge_graph(s, verbose)]
 
     def query_suspect_components_by_channel(self, channel_id: str, verbose: bool = False) -> List[Tuple[str, str]]:
@@ -2073,22 +1124,11 @@ class KnowledgeGraphQueryTool:
         :return: suspect components (via 'hasCOI')
         """
         if verbose:
-            print("####################################")
-            print("QUERY: suspect components ('hasCOI') for the specified channel:", channel_id)
-            print("####################################")
-        channel_entry = self.complete_ontology_entry('Channel')
-        id_entry = self.complete_ontology_entry(channel_id)
-        id_entry = id_entry.replace('<', '').replace('>', '')
-        has_coi_entry = self.complete_ontology_entry('hasCOI')
-        comp_name_entry = self.complete_ontology_entry('component_name')
-        s = f"""
-            SELECT ?comp ?comp_name WHERE {{
-                ?chan a {channel_entry} .
-                FILTER(STR(?chan) = "{id_entry}") .
-                ?comp {has_coi_entry} ?chan .
-                ?comp {comp_name_entry} ?comp_name .
-            }}
-            """
+            log_banner(
+                logger, "QUERY: suspect components ('hasCOI') for the specified channel: %s",
+                channel_id, color=None
+            )
+        s = query_catalogue.SUSPECT_COMPONENTS_BY_CHANNEL.bind(channel_id=channel_id)
         return [(row['comp']['value'], row['comp_name']['value']) for row in
                 self.fuseki_connection.query_knowledge_graph(s, verbose)]
 
@@ -2101,20 +1141,11 @@ class KnowledgeGraphQueryTool:
         :return: classification reason
         """
         if verbose:
-            print("####################################")
-            print("QUERY: classification reason for the specified classification:", osci_classification_id)
-            print("####################################")
-        osci_classification_entry = self.complete_ontology_entry('OscillogramClassification')
-        id_entry = self.complete_ontology_entry(osci_classification_id)
-        id_entry = id_entry.replace('<', '').replace('>', '')
-        reason_for_entry = self.complete_ontology_entry('reasonFor')
-        s = f"""
-            SELECT ?reason_for WHERE {{
-                ?osci_classification a {osci_classification_entry} .
-                FILTER(STR(?osci_classification) = "{id_entry}") .
-                ?reason_for {reason_for_entry} ?osci_classification .
-            }}
-            """
+            log_banner(
+                logger, "QUERY: classification reason for the specified classification: %s",
+                osci_classification_id, color=None
+            )
+        s = query_catalogue.REASON_FOR_CLASSIFICATION.bind(osci_classification_id=osci_classification_id)
         return [row['reason_for']['value'] for row in self.fuseki_connection.query_knowledge_graph(s, verbose)]
 
     def query_led_to_for_classification(self, osci_classification_id: str, verbose: bool = True) -> List[str]:
@@ -2126,20 +1157,11 @@ class KnowledgeGraphQueryTool:
         :return: classification reason
         """
         if verbose:
-            print("####################################")
-            print("QUERY: classification reason for the specified classification:", osci_classification_id)
-            print("####################################")
-        osci_classification_entry = self.complete_ontology_entry('OscillogramClassification')
-        id_entry = self.complete_ontology_entry(osci_classification_id)
-        id_entry = id_entry.replace('<', '').replace('>', '')
-        led_to_entry = self.complete_ontology_entry('ledTo')
-        s = f"""
-            SELECT ?led_to WHERE {{
-                ?osci_classification a {osci_classification_entry} .
-                FILTER(STR(?osci_classification) = "{id_entry}") .
-                ?led_to {led_to_entry} ?osci_classification .
-            }}
-            """
+            log_banner(
+                logger, "QUERY: classification reason for the specified classification: %s",
+                osci_classification_id, color=None
+            )
+        s = query_catalogue.LED_TO_FOR_CLASSIFICATION.bind(osci_classification_id=osci_classification_id)
         return [row['led_to']['value'] for row in self.fuseki_connection.query_knowledge_graph(s, verbose)]
 
     def query_reason_for_inspection(self, manual_inspection_id: str, verbose: bool = True) -> List[str]:
@@ -2151,20 +1173,11 @@ class KnowledgeGraphQueryTool:
         :return: classification reason
         """
         if verbose:
-            print("####################################")
-            print("QUERY: classification reason for the specified manual inspection:", manual_inspection_id)
-            print("####################################")
-        manual_inspection_entry = self.complete_ontology_entry('ManualInspection')
-        id_entry = self.complete_ontology_entry(manual_inspection_id)
-        id_entry = id_entry.replace('<', '').replace('>', '')
-        reason_for_entry = self.complete_ontology_entry('reasonFor')
-        s = f"""
-            SELECT ?reason_for WHERE {{
-                ?manual_inspection a {manual_inspection_entry} .
-                FILTER(STR(?manual_inspection) = "{id_entry}") .
-                ?reason_for {reason_for_entry} ?manual_inspection .
-            }}
-            """
+            log_banner(
+                logger, "QUERY: classification reason for the specified manual inspection: %s",
+                manual_inspection_id, color=None
+            )
+        s = query_catalogue.REASON_FOR_INSPECTION.bind(manual_inspection_id=manual_inspection_id)
         return [row['reason_for']['value'] for row in self.fuseki_connection.query_knowledge_graph(s, verbose)]
 
     def query_led_to_for_inspection(self, manual_inspection_id: str, verbose: bool = True) -> List[str]:
@@ -2176,20 +1189,11 @@ class KnowledgeGraphQueryTool:
         :return: classification reason
         """
         if verbose:
-            print("####################################")
-            print("QUERY: classification reason for the specified manual inspection:", manual_inspection_id)
-            print("####################################")
-        manual_inspection_entry = self.complete_ontology_entry('ManualInspection')
-        id_entry = self.complete_ontology_entry(manual_inspection_id)
-        id_entry = id_entry.replace('<', '').replace('>', '')
-        led_to_entry = self.complete_ontology_entry('ledTo')
-        s = f"""
-            SELECT ?led_to WHERE {{
-                ?manual_inspection a {manual_inspection_entry} .
-                FILTER(STR(?manual_inspection) = "{id_entry}") .
-                ?led_to {led_to_entry} ?manual_inspection .
-            }}
-            """
+            log_banner(
+                logger, "QUERY: classification reason for the specified manual inspection: %s",
+                manual_inspection_id, color=None
+            )
+        s = query_catalogue.LED_TO_FOR_INSPECTION.bind(manual_inspection_id=manual_inspection_id)
         return [row['led_to']['value'] for row in self.fuseki_connection.query_knowledge_graph(s, verbose)]
 
     def query_prediction_by_classification(self, classification_id: str, verbose: bool = True) -> List[str]:
@@ -2201,23 +1205,8 @@ class KnowledgeGraphQueryTool:
         :return: prediction
         """
         if verbose:
-            print("####################################")
-            print("QUERY: prediction for the specified classification:", classification_id)
-            print("####################################")
-        osci_classification_entry = self.complete_ontology_entry('OscillogramClassification')
-        manual_classification_entry = self.complete_ontology_entry('ManualInspection')
-        id_entry = self.complete_ontology_entry(classification_id)
-        id_entry = id_entry.replace('<', '').replace('>', '')
-        pred_entry = self.complete_ontology_entry('prediction')
-        s = f"""
-            SELECT ?pred WHERE {{
-                {{ ?classification a {osci_classification_entry} . }}
-                UNION
-                {{ ?classification a {manual_classification_entry} . }}
-                FILTER(STR(?classification) = "{id_entry}") .
-                ?classification {pred_entry} ?pred .
-            }}
-            """
+            log_banner(logger, "QUERY: prediction for the specified classification: %s", classification_id, color=None)
+        s = query_catalogue.PREDICTION_BY_CLASSIFICATION.bind(classification_id=classification_id)
         return [row['pred']['value'] for row in self.fuseki_connection.query_knowledge_graph(s, verbose)]
 
     def query_heatmap_by_classification_instance(self, osci_classification_id: str, verbose: bool = True) -> List[str]:
@@ -2229,20 +1218,11 @@ class KnowledgeGraphQueryTool:
         :return: generated heatmap
         """
         if verbose:
-            print("####################################")
-            print("QUERY: heatmap instance for the specified classification:", osci_classification_id)
-            print("####################################")
-        osci_classification_entry = self.complete_ontology_entry('OscillogramClassification')
-        id_entry = self.complete_ontology_entry(osci_classification_id)
-        id_entry = id_entry.replace('<', '').replace('>', '')
-        produces_entry = self.complete_ontology_entry('produces')
-        s = f"""
-            SELECT ?heatmap WHERE {{
-                ?osci_classification a {osci_classification_entry} .
-                FILTER(STR(?osci_classification) = "{id_entry}") .
-                ?osci_classification {produces_entry} ?heatmap .
-            }}
-            """
+            log_banner(
+                logger, "QUERY: heatmap instance for the specified classification: %s",
+                osci_classification_id, color=None
+            )
+        s = query_catalogue.HEATMAP_BY_CLASSIFICATION_INSTANCE.bind(osci_classification_id=osci_classification_id)
         return [row['heatmap']['value'] for row in self.fuseki_connection.query_knowledge_graph(s, verbose)]
 
     def query_generation_method_by_heatmap(self, heatmap_id: str, verbose: bool = True) -> List[str]:
@@ -2254,20 +1234,11 @@ class KnowledgeGraphQueryTool:
         :return: heatmap generation method
         """
         if verbose:
-            print("####################################")
-            print("QUERY: heatmap generation method for the specified heatmap instance:", heatmap_id)
-            print("####################################")
-        heatmap_entry = self.complete_ontology_entry('Heatmap')
-        id_entry = self.complete_ontology_entry(heatmap_id)
-        id_entry = id_entry.replace('<', '').replace('>', '')
-        generation_method_entry = self.complete_ontology_entry('generation_method')
-        s = f"""
-            SELECT ?gen_method WHERE {{
-                ?heatmap a {heatmap_entry} .
-                FILTER(STR(?heatmap) = "{id_entry}") .
-                ?heatmap {generation_method_entry} ?gen_method .
-            }}
-            """
+            log_banner(
+                logger, "QUERY: heatmap generation method for the specified heatmap instance: %s",
+                heatmap_id, color=None
+            )
+        s = query_catalogue.GENERATION_METHOD_BY_HEATMAP.bind(heatmap_id=heatmap_id)
         return [row['gen_method']['value'] for row in self.fuseki_connection.query_knowledge_graph(s, verbose)]
 
     def query_heatmap_string_by_heatmap(self, heatmap_id: str, verbose: bool = True) -> List[str]:
@@ -2279,40 +1250,32 @@ class KnowledgeGraphQueryTool:
         :return: heatmap values (string)
         """
         if verbose:
-            print("####################################")
-            print("QUERY: heatmap values for the specified heatmap instance:", heatmap_id)
-            print("####################################")
-        heatmap_entry = self.complete_ontology_entry('Heatmap')
-        id_entry = self.complete_ontology_entry(heatmap_id)
-        id_entry = id_entry.replace('<', '').replace('>', '')
-        heatmap_values_entry = self.complete_ontology_entry('generated_heatmap')
-        s = f"""
-            SELECT ?gen_heatmap WHERE {{
-                ?heatmap a {heatmap_entry} .
-                FILTER(STR(?heatmap) = "{id_entry}") .
-                ?heatmap {heatmap_values_entry} ?gen_heatmap .
-            }}
-            """
+            log_banner(logger, "QUERY: heatmap values for the specified heatmap instance: %s", heatmap_id, color=None)
+        s = query_catalogue.HEATMAP_STRING_BY_HEATMAP.bind(heatmap_id=heatmap_id)
         return [row['gen_heatmap']['value'] for row in self.fuseki_connection.query_knowledge_graph(s, verbose)]
 
-    def query_all_symptom_instances(self) -> List[str]:
+    def query_heatmap_array_by_heatmap(self, heatmap_id: str, verbose: bool = True) -> List[np.ndarray]:
+        """
+        Queries the heatmap values for the specified heatmap instance, decoded as array (binary encoded as well as
+        legacy text literals) or, for blob store references, as read-only memory map (zero-copy).
+
+        :param heatmap_id: ID of heatmap instance
+        :param verbose: if true, logging is activated
+        :return: heatmap values (array)
+        """
+        return [load_array(hm, self.blob_store) for hm in self.query_heatmap_string_by_heatmap(heatmap_id, verbose)]
+
+    def query_all_symptom_instances(self, verbose: bool = True) -> List[str]:
         """
         Queries all symptom instances stored in the knowledge graph.
 
+        :param verbose: if true, logging is activated
         :return: all symptoms stored in the knowledge graph
         """
-        print("####################################")
-        print("QUERY: all symptom instances")
-        print("####################################")
-        symptom_entry = self.complete_ontology_entry('Symptom')
-        symptom_desc_entry = self.complete_ontology_entry('symptom_description')
-        s = f"""
-            SELECT ?desc WHERE {{
-                ?symp a {symptom_entry} .
-                ?symp {symptom_desc_entry} ?desc.
-            }}
-            """
-        return [row['desc']['value'] for row in self.fuseki_connection.query_knowledge_graph(s, False)]
+        if verbose:
+            log_banner(logger, "QUERY: all symptom instances", color=None)
+        s = query_catalogue.ALL_SYMPTOM_INSTANCES.bind()
+        return [row['desc']['value'] for row in self.fuseki_connection.query_knowledge_graph(s, verbose)]
 
     def query_all_vehicle_subsystem_instances(self, verbose: bool = True) -> List[str]:
         """
@@ -2322,17 +1285,8 @@ class KnowledgeGraphQueryTool:
         :return: all vehicle subsystems stored in the knowledge graph
         """
         if verbose:
-            print("####################################")
-            print("QUERY: all vehicle subsystem instances")
-            print("####################################")
-        subsystem_entry = self.complete_ontology_entry('VehicleSubsystem')
-        subsystem_name_entry = self.complete_ontology_entry('subsystem_name')
-        s = f"""
-            SELECT ?subsystem_name WHERE {{
-                ?subsystem a {subsystem_entry} .
-                ?subsystem {subsystem_name_entry} ?subsystem_name .
-            }}
-            """
+            log_banner(logger, "QUERY: all vehicle subsystem instances", color=None)
+        s = query_catalogue.ALL_VEHICLE_SUBSYSTEM_INSTANCES.bind()
         return [row['subsystem_name']['value'] for row in self.fuseki_connection.query_knowledge_graph(s, verbose)]
 
     def query_all_heatmap_instances(self, verbose: bool = True) -> List[str]:
@@ -2343,15 +1297,8 @@ class KnowledgeGraphQueryTool:
         :return: all heatmaps stored in the knowledge graph
         """
         if verbose:
-            print("####################################")
-            print("QUERY: all heatmap instances")
-            print("####################################")
-        heatmap_entry = self.complete_ontology_entry('Heatmap')
-        s = f"""
-            SELECT ?heatmap WHERE {{
-                ?heatmap a {heatmap_entry} .
-            }}
-            """
+            log_banner(logger, "QUERY: all heatmap instances", color=None)
+        s = query_catalogue.ALL_HEATMAP_INSTANCES.bind()
         return [row['heatmap']['value'] for row in self.fuseki_connection.query_knowledge_graph(s, verbose)]
 
     def query_all_component_set_instances(self, verbose: bool = True) -> List[str]:
@@ -2362,19 +1309,84 @@ class KnowledgeGraphQueryTool:
         :return: all component sets stored in the knowledge graph
         """
         if verbose:
-            print("####################################")
-            print("QUERY: all component set instances")
-            print("####################################")
-        component_set_entry = self.complete_ontology_entry('ComponentSet')
-        set_name_entry = self.complete_ontology_entry('set_name')
-        s = f"""
-            SELECT ?set_name WHERE {{
-                ?comp_set a {component_set_entry} .
-                ?comp_set {set_name_entry} ?set_name .
-            }}
-            """
+            log_banner(logger, "QUERY: all component set instances", color=None)
+        s = query_catalogue.ALL_COMPONENT_SET_INSTANCES.bind()
         return [row['set_name']['value'] for row in self.fuseki_connection.query_knowledge_graph(s, verbose)]
 
+    def query_dtc_profiles(self, codes: List[str] = None, verbose: bool = True) -> List[DTCProfile]:
+        """
+        Queries the complete profiles (all DTC-related knowledge incl. the priority-ordered suspect components) of the
+        specified DTCs.
+
+        Instead of one query per attribute (and per suspect component), the profiles of all DTCs are retrieved with two
+        joined queries - one for the DTC attributes and one for the suspect components and their attributes.
+
+        :param codes: diagnostic trouble codes to query profiles for (None: all DTCs stored in the KG)
+        :param verbose: if true, logging is activated
+        :return: DTC profiles (in the order of `codes`, DTCs not stored in the KG are omitted)
+        """
+        if verbose:
+            log_banner(logger, "QUERY: DTC profiles for %s", 'all DTCs' if codes is None else codes)
+        if codes is not None and len(codes) == 0:
+            return []
+        s = query_catalogue.DTC_PROFILE_ATTRIBUTES.bind(codes=codes)
+        dtc_attributes = {}
+        for row in self.fuseki_connection.query_knowledge_graph(s, verbose):
+            attributes = dtc_attributes.setdefault(row['dtc_code']['value'], {
+                "category": [], "code_type": [], "fault_condition": [], "occurs_with": [], "symptom": [],
+                "subsystem": [], "vehicle_part": [], "vehicle": []
+            })
+            attr = row['attr']['value']
+            if attr == "vehicle":
+                attributes[attr].append(
+                    (row['model']['value'], row['hsn']['value'], row['tsn']['value'], row['vin']['value'])
+                )
+            elif attr != "code":
+                attributes[attr].append(row['value']['value'])
+
+        s = query_catalogue.DTC_PROFILE_SUSPECT_COMPONENTS.bind(codes=codes)
+        dtc_components = {}
+        for row in self.fuseki_connection.query_knowledge_graph(s, verbose):
+            components = dtc_components.setdefault(row['dtc_code']['value'], {})
+            comp = components.setdefault(row['comp_name']['value'], {
+                "priority": int(row['prio']['value']), "use_oscilloscope": [], "affected_by": [], "verifies": [],
+                "contained_in": []
+            })
+            attr = row['attr']['value']
+            if attr != "component":
+                comp[attr].append(row['value']['value'])
+
+        profiles = []
+        for code in (dtc_attributes.keys() if codes is None else codes):
+            if code not in dtc_attributes:
+                continue
+            attributes = dtc_attributes[code]
+            suspect_components = [
+                SuspectComponentProfile(
+                    name, comp["priority"], len(comp["use_oscilloscope"]) > 0 and comp["use_oscilloscope"][0] == "true",
+                    comp["affected_by"], comp["verifies"], comp["contained_in"]
+                )
+                for name, comp in dtc_components.get(code, {}).items()
+            ]
+            profiles.append(DTCProfile(
+                code, attributes["occurs_with"], self.first_or_default(attributes["category"]),
+                self.first_or_default(attributes["code_type"]), self.first_or_default(attributes["fault_condition"]),
+                attributes["vehicle"], attributes["symptom"], self.first_or_default(attributes["subsystem"]),
+                attributes["vehicle_part"], sorted(suspect_components, key=lambda comp_profile: comp_profile.priority)
+            ))
+        return profiles
+
+    @staticmethod
+    def first_or_default(values: List[str], default: str = "") -> str:
+        """
+        Returns the first of the specified (single-valued attribute) values.
+
+        :param values: values of the attribute
+        :param default: value to be returned if there are no values
+        :return: first value or default
+        """
+        return values[0] if len(values) > 0 else default
+
     @staticmethod
     def print_res(res: List[str]) -> None:
         """
@@ -2387,6 +1399,7 @@ class KnowledgeGraphQueryTool:
 
 
 if __name__ == '__main__':
+    set_log_level("INFO")
     qt = KnowledgeGraphQueryTool()
 
     # some examples below
@@ -2424,5 +1437,6 @@ if __name__ == '__main__':
     qt.print_res(qt.query_oscilloscope_usage_by_suspect_component(suspect_comp_name))
     qt.print_res(qt.query_affected_by_relations_by_suspect_component(suspect_comp_name))
     qt.print_res(qt.query_code_type_by_dtc(error_code))
+    qt.print_res(qt.query_dtc_profiles([error_code]))
     qt.print_res(qt.query_all_component_set_instances(False))
     qt.print_res(qt.query_all_heatmap_instances(False))
@@ -3,430 +3,743 @@
 # @author Tim Bohne
 
 import argparse
+import io
+import sys
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterable, Iterator, List, TextIO, Tuple, Union
 
 from termcolor import colored
 
-from knowledge_graph_query_tool import KnowledgeGraphQueryTool
+from obd_ontology.config import FUSEKI_URL, SNAPSHOT_WORKERS
+from obd_ontology.dtc_profile import DTCProfile
+from obd_ontology.knowledge_graph_index import IndexedQueryTool
+from obd_ontology.knowledge_graph_query_tool import KnowledgeGraphQueryTool
 
+SEPARATOR = "\n----------------------------------------------------------------------\n"
 
-def knowledge_snapshot_dtc_perspective() -> None:
+
+class KnowledgeSnapshotRunner:
+    """
+    Renders the knowledge snapshot perspectives concurrently - the perspectives as well as the per-entity sections
+    within them are rendered on bounded thread pools (sharing the pooled connection of the global query tool), while
+    the output is written in the order of the sequential snapshot, i.e., it is identical to the sequential output.
+    """
+
+    def __init__(self, workers: int = SNAPSHOT_WORKERS) -> None:
+        """
+        Initializes the snapshot runner.
+
+        :param workers: max number of sections rendered (i.e., entities queried) concurrently
+        """
+        if workers < 1:
+            raise ValueError("number of workers has to be positive, got " + str(workers))
+        self.workers = workers
+        # separate pools - perspectives wait for their sections, which must not starve for workers
+        self.perspective_pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="snapshot_perspective")
+        self.section_pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="snapshot_section")
+
+    def map_ordered(self, fn: Callable[[Any], str], items: Iterable[Any]) -> Iterator[str]:
+        """
+        Applies the specified function concurrently to the specified items and yields the results in item order - at
+        most a few times the number of workers are in flight, i.e., the memory does not grow with the number of items.
+
+        :param fn: function to be applied to each item
+        :param items: items to apply the function to
+        :return: results in item order
+        """
+        window = 4 * self.workers
+        in_flight = deque()
+        for item in items:
+            in_flight.append(self.section_pool.submit(fn, item))
+            if len(in_flight) >= window:
+                yield in_flight.popleft().result()
+        while len(in_flight) > 0:
+            yield in_flight.popleft().result()
+
+    def run(self, perspectives: List[Callable[..., None]], out: Union[TextIO, None] = None) -> None:
+        """
+        Renders the specified perspectives concurrently and writes them in the specified order.
+
+        :param perspectives: perspective functions (`knowledge_snapshot_*_perspective`)
+        :param out: stream to write the snapshot to (None: stdout)
+        """
+        def render(perspective: Callable[..., None]) -> str:
+            buffer = io.StringIO()
+            perspective(out=buffer, runner=self)
+            return buffer.getvalue()
+
+        futures = [self.perspective_pool.submit(render, perspective) for perspective in perspectives]
+        for future in futures:
+            print(future.result(), end="", file=out)
+
+    def close(self) -> None:
+        """
+        Shuts the thread pools down.
+        """
+        self.perspective_pool.shutdown()
+        self.section_pool.shutdown()
+
+    def __enter__(self) -> "KnowledgeSnapshotRunner":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def print_sections(
+        entities: Iterable[Any], print_section: Callable[[Any, Union[TextIO, None]], None],
+        out: Union[TextIO, None] = None, runner: Union[KnowledgeSnapshotRunner, None] = None
+) -> None:
+    """
+    Prints the sections of the specified entities in entity order.
+
+    :param entities: entities to print sections for
+    :param print_section: prints the section of one entity to the specified stream
+    :param out: stream to print to (None: stdout)
+    :param runner: snapshot runner to render the sections concurrently (None: sequentially)
+    """
+    if runner is None:
+        for entity in entities:
+            print_section(entity, out)
+        return
+
+    def render(entity: Any) -> str:
+        buffer = io.StringIO()
+        print_section(entity, buffer)
+        return buffer.getvalue()
+
+    for section in runner.map_ordered(render, entities):
+        print(section, end="", file=out)
+
+
+def print_perspective_header(perspective: str, out: Union[TextIO, None] = None) -> None:
+    """
+    Prints the header of the specified perspective.
+
+    :param perspective: name of the perspective, e.g., "DTC PERSPECTIVE"
+    :param out: stream to print to (None: stdout)
+    """
+    print("###########################################################################", file=out)
+    print("KNOWLEDGE SNAPSHOT - " + perspective, file=out)
+    print("###########################################################################\n", file=out)
+
+
+def print_dtc_section(profile: DTCProfile, out: Union[TextIO, None] = None) -> None:
+    """
+    Prints the snapshot section of the specified DTC profile.
+
+    :param profile: DTC profile
+    :param out: stream to print to (None: stdout)
+    """
+    print(colored(profile.code, "yellow", "on_grey", ["bold"]), file=out)
+    print(colored("\t- occurs with:", "blue", "on_grey", ["bold"]), profile.occurs_with, file=out)
+    print(colored("\t- category:", "blue", "on_grey", ["bold"]), profile.category, file=out)
+    print(colored("\t- code type:", "blue", "on_grey", ["bold"]), profile.code_type, file=out)
+    print(colored("\t- fault condition:", "blue", "on_grey", ["bold"]), profile.fault_condition, file=out)
+    print(colored("\t- vehicle occurrences:", "blue", "on_grey", ["bold"]), file=out)
+    for vehicle_occ in profile.vehicles:
+        print("\t\t-", vehicle_occ, file=out)
+    print(colored("\t- symptoms:", "blue", "on_grey", ["bold"]), profile.symptoms, file=out)
+    print(colored("\t- indicates subsystem:", "blue", "on_grey", ["bold"]), profile.subsystem, file=out)
+    print(colored("\t- indicates vehicle part(s):", "blue", "on_grey", ["bold"]), profile.vehicle_parts, file=out)
+    print(colored("\t- ordered suspect components:", "blue", "on_grey", ["bold"]), file=out)
+    for comp in profile.suspect_components:
+        print(colored("\t\t- " + comp.name, "yellow", "on_grey", ["bold"]), file=out)
+        print(colored("\t\t\tuse oscilloscope:", "blue", "on_grey", ["bold"]), comp.use_oscilloscope, file=out)
+        print(colored("\t\t\taffected by:", "blue", "on_grey", ["bold"]), comp.affected_by, file=out)
+        print(colored("\t\t\tverifies:", "blue", "on_grey", ["bold"]), comp.verifies, file=out)
+        print(colored("\t\t\tcontained in subsystem:", "blue", "on_grey", ["bold"]), comp.contained_in, file=out)
+    print(file=out)
+
+
+def knowledge_snapshot_dtc_perspective(
+        out: Union[TextIO, None] = None, runner: Union[KnowledgeSnapshotRunner, None] = None
+) -> None:
     """
     Presents a snapshot of the knowledge currently stored in the KG from a DTC-centric perspective.
+
+    :param out: stream to print to (None: stdout)
+    :param runner: snapshot runner to render the sections concurrently (None: sequentially)
     """
-    print("###########################################################################")
-    print("KNOWLEDGE SNAPSHOT - DTC PERSPECTIVE")
-    print("###########################################################################\n")
-    for dtc in qt.query_all_dtc_instances(False):
-        print(colored(dtc, "yellow", "on_grey", ["bold"]))
-        print(colored("\t- occurs with:", "blue", "on_grey", ["bold"]), qt.query_co_occurring_trouble_codes(dtc, False))
-        print(colored("\t- category:", "blue", "on_grey", ["bold"]), qt.query_fault_cat_by_dtc(dtc, False)[0])
-        print(colored("\t- code type:", "blue", "on_grey", ["bold"]), qt.query_code_type_by_dtc(dtc, False)[0])
-        print(
-            colored("\t- fault condition:", "blue", "on_grey", ["bold"]), qt.query_fault_condition_by_dtc(dtc, False)[0]
-        )
-        print(colored("\t- vehicle occurrences:", "blue", "on_grey", ["bold"]))
-        vehicle_occurrences = qt.query_vehicle_by_dtc(dtc, False)
-        for vehicle_occ in vehicle_occurrences:
-            print("\t\t-", vehicle_occ)
-        print(colored("\t- symptoms:", "blue", "on_grey", ["bold"]), qt.query_symptoms_by_dtc(dtc, False))
-
-        sub_name = qt.query_indicates_by_dtc(dtc, False)
-        sub_name = "" if len(sub_name) == 0 else sub_name[0]
-        print(colored("\t- indicates subsystem:", "blue", "on_grey", ["bold"]), sub_name)
-        print(
-            colored("\t- indicates vehicle part(s):", "blue", "on_grey", ["bold"]),
-            qt.query_vehicle_part_by_subsystem(sub_name, False)
-        )
-        print(colored("\t- ordered suspect components:", "blue", "on_grey", ["bold"]))
-
-        suspect_components = qt.query_suspect_components_by_dtc(dtc, False)
-        ordered_sus_comp = {
-            int(qt.query_priority_id_by_dtc_and_sus_comp(dtc, comp, False)[0]): comp for comp in suspect_components
-        }
-        for i in range(len(suspect_components)):
-            print(colored("\t\t- " + ordered_sus_comp[i], "yellow", "on_grey", ["bold"]))
-            print(
-                colored("\t\t\tuse oscilloscope:", "blue", "on_grey", ["bold"]),
-                qt.query_oscilloscope_usage_by_suspect_component(ordered_sus_comp[i], False)[0]
-            )
-            print(
-                colored("\t\t\taffected by:", "blue", "on_grey", ["bold"]),
-                qt.query_affected_by_relations_by_suspect_component(ordered_sus_comp[i], False)
-            )
-            print(
-                colored("\t\t\tverifies:", "blue", "on_grey", ["bold"]),
-                qt.query_verifies_relation_by_suspect_component(ordered_sus_comp[i], False)
-            )
-            print(
-                colored("\t\t\tcontained in subsystem:", "blue", "on_grey", ["bold"]),
-                qt.query_contains_relation_by_suspect_component(ordered_sus_comp[i], False)
-            )
-        print()
-    print("\n----------------------------------------------------------------------\n")
-
-
-def knowledge_snapshot_subsystem_perspective() -> None:
+    print_perspective_header("DTC PERSPECTIVE", out)
+    print_sections(qt.query_dtc_profiles(verbose=False), print_dtc_section, out, runner)
+    print(SEPARATOR, file=out)
+
+
+def print_subsystem_section(subsystem: str, out: Union[TextIO, None] = None) -> None:
+    """
+    Prints the snapshot section of the specified vehicle subsystem.
+
+    :param subsystem: name of the vehicle subsystem
+    :param out: stream to print to (None: stdout)
+    """
+    print(colored(subsystem, "yellow", "on_grey", ["bold"]), file=out)
+    print(
+        colored("\t- contains:", "blue", "on_grey", ["bold"]),
+        qt.query_contains_relation_by_subsystem(subsystem, False), file=out
+    )
+    print(
+        colored("\t- vehicle part(s):", "blue", "on_grey", ["bold"]),
+        qt.query_vehicle_part_by_subsystem(subsystem, False), file=out
+    )
+
+
+def knowledge_snapshot_subsystem_perspective(
+        out: Union[TextIO, None] = None, runner: Union[KnowledgeSnapshotRunner, None] = None
+) -> None:
     """
     Presents a snapshot of the knowledge currently stored in the KG from a vehicle-subsystem-centric perspective.
+
+    :param out: stream to print to (None: stdout)
+    :param runner: snapshot runner to render the sections concurrently (None: sequentially)
     """
-    print("###########################################################################")
-    print("KNOWLEDGE SNAPSHOT - SUBSYSTEM PERSPECTIVE")
-    print("###########################################################################\n")
-    for subsystem in qt.query_all_vehicle_subsystem_instances(False):
-        print(colored(subsystem, "yellow", "on_grey", ["bold"]))
-        print(
-            colored("\t- contains:", "blue", "on_grey", ["bold"]),
-            qt.query_contains_relation_by_subsystem(subsystem, False)
-        )
-        print(
-            colored("\t- vehicle part(s):", "blue", "on_grey", ["bold"]),
-            qt.query_vehicle_part_by_subsystem(subsystem, False)
-        )
-    print("\n----------------------------------------------------------------------\n")
+    print_perspective_header("SUBSYSTEM PERSPECTIVE", out)
+    print_sections(qt.query_all_vehicle_subsystem_instances(False), print_subsystem_section, out, runner)
+    print(SEPARATOR, file=out)
+
+
+def print_component_set_section(comp_set: str, out: Union[TextIO, None] = None) -> None:
+    """
+    Prints the snapshot section of the specified component set.
 
+    :param comp_set: name of the component set
+    :param out: stream to print to (None: stdout)
+    """
+    print(colored(comp_set, "yellow", "on_grey", ["bold"]), file=out)
+    print(
+        colored("\t- verified by:", "blue", "on_grey", ["bold"]),
+        qt.query_verifies_relations_by_component_set(comp_set, False), file=out
+    )
+    print(
+        colored("\t- includes:", "blue", "on_grey", ["bold"]),
+        qt.query_includes_relation_by_component_set(comp_set, False), file=out
+    )
 
-def knowledge_snapshot_component_set_perspective() -> None:
+
+def knowledge_snapshot_component_set_perspective(
+        out: Union[TextIO, None] = None, runner: Union[KnowledgeSnapshotRunner, None] = None
+) -> None:
     """
     Presents a snapshot of the knowledge currently stored in the KG from a component-set-centric perspective.
+
+    :param out: stream to print to (None: stdout)
+    :param runner: snapshot runner to render the sections concurrently (None: sequentially)
     """
-    print("###########################################################################")
-    print("KNOWLEDGE SNAPSHOT - COMPONENT SET PERSPECTIVE")
-    print("###########################################################################\n")
-    for comp_set in qt.query_all_component_set_instances(False):
-        print(colored(comp_set, "yellow", "on_grey", ["bold"]))
-        print(
-            colored("\t- verified by:", "blue", "on_grey", ["bold"]),
-            qt.query_verifies_relations_by_component_set(comp_set, False)
-        )
-        print(
-            colored("\t- includes:", "blue", "on_grey", ["bold"]),
-            qt.query_includes_relation_by_component_set(comp_set, False)
-        )
-    print("\n----------------------------------------------------------------------\n")
+    print_perspective_header("COMPONENT SET PERSPECTIVE", out)
+    print_sections(qt.query_all_component_set_instances(False), print_component_set_section, out, runner)
+    print(SEPARATOR, file=out)
 
 
-def knowledge_snapshot_component_perspective() -> None:
+def print_component_section(comp: str, out: Union[TextIO, None] = None) -> None:
+    """
+    Prints the snapshot section of the specified suspect component.
+
+    :param comp: name of the suspect component
+    :param out: stream to print to (None: stdout)
+    """
+    print(colored(comp, "yellow", "on_grey", ["bold"]), file=out)
+    print(
+        colored("\t- oscilloscope:", "blue", "on_grey", ["bold"]),
+        qt.query_oscilloscope_usage_by_suspect_component(comp, False)[0], file=out
+    )
+    print(
+        colored("\t- affected by:", "blue", "on_grey", ["bold"]),
+        qt.query_affected_by_relations_by_suspect_component(comp, False), file=out
+    )
+    print(
+        colored("\t- verifies:", "blue", "on_grey", ["bold"]),
+        qt.query_verifies_relation_by_suspect_component(comp, False), file=out
+    )
+    print(colored("\t- has subcomponents:", "blue", "on_grey", ["bold"]), file=out)
+    for sub_comp in qt.query_sub_components_by_component(comp, False):
+        print(colored("\t\t- " + sub_comp, "blue", "on_grey", ["bold"]), file=out)
+
+
+def knowledge_snapshot_component_perspective(
+        out: Union[TextIO, None] = None, runner: Union[KnowledgeSnapshotRunner, None] = None
+) -> None:
     """
     Presents a snapshot of the knowledge currently stored in the KG from a component-centric perspective.
+
+    :param out: stream to print to (None: stdout)
+    :param runner: snapshot runner to render the sections concurrently (None: sequentially)
     """
-    print("###########################################################################")
-    print("KNOWLEDGE SNAPSHOT - COMPONENT PERSPECTIVE")
-    print("###########################################################################\n")
-    for comp in qt.query_all_component_instances(False):
-        print(colored(comp, "yellow", "on_grey", ["bold"]))
-        print(
-            colored("\t- oscilloscope:", "blue", "on_grey", ["bold"]),
-            qt.query_oscilloscope_usage_by_suspect_component(comp, False)[0]
-        )
-        print(
-            colored("\t- affected by:", "blue", "on_grey", ["bold"]),
-            qt.query_affected_by_relations_by_suspect_component(comp, False)
-        )
-        print(
-            colored("\t- verifies:", "blue", "on_grey", ["bold"]),
-            qt.query_verifies_relation_by_suspect_component(comp, False)
-        )
-        print(colored("\t- has subcomponents:", "blue", "on_grey", ["bold"]))
-        for sub_comp in qt.query_sub_components_by_component(comp, False):
-            print(colored("\t\t- " + sub_comp, "blue", "on_grey", ["bold"]))
-    print("\n----------------------------------------------------------------------\n")
+    print_perspective_header("COMPONENT PERSPECTIVE", out)
+    print_sections(qt.query_all_component_instances(False), print_component_section, out, runner)
+    print(SEPARATOR, file=out)
+
+
+def print_parallel_osci_section(osci_set_id: str, out: Union[TextIO, None] = None) -> None:
+    """
+    Prints the snapshot section of the specified parallel oscillogram set.
+
+    :param osci_set_id: parallel oscillogram set instance (IRI)
+    :param out: stream to print to (None: stdout)
+    """
+    osci_set_id = osci_set_id.split("#")[1]
+    print(colored(osci_set_id, "yellow", "on_grey", ["bold"]), file=out)
+    oscillogram_instances_by_set = qt.query_oscillograms_by_parallel_osci_set(osci_set_id, False)
+    for osci in oscillogram_instances_by_set:
+        print(colored("\t- oscillogram instance:", "blue", "on_grey", ["bold"]), osci.split("#")[1], file=out)
 
 
-def knowledge_snapshot_parallel_osci_perspective() -> None:
+def knowledge_snapshot_parallel_osci_perspective(
+        out: Union[TextIO, None] = None, runner: Union[KnowledgeSnapshotRunner, None] = None
+) -> None:
     """
     Presents a snapshot of the knowledge currently stored in the KG regarding parallel oscillogram sets.
+
+    :param out: stream to print to (None: stdout)
+    :param runner: snapshot runner to render the sections concurrently (None: sequentially)
+    """
+    print_perspective_header("PARALLEL OSCILLOGRAM SET PERSPECTIVE", out)
+    print_sections(
+        qt.query_all_parallel_rec_oscillogram_set_instances(False), print_parallel_osci_section, out, runner
+    )
+    print(SEPARATOR, file=out)
+
+
+def print_oscillogram_section(osci: str, out: Union[TextIO, None] = None) -> None:
+    """
+    Prints the snapshot section of the specified oscillogram.
+
+    :param osci: oscillogram instance (IRI)
+    :param out: stream to print to (None: stdout)
     """
-    print("###########################################################################")
-    print("KNOWLEDGE SNAPSHOT - PARALLEL OSCILLOGRAM SET PERSPECTIVE")
-    print("###########################################################################\n")
-    for osci_set_id in qt.query_all_parallel_rec_oscillogram_set_instances(False):
-        osci_set_id = osci_set_id.split("#")[1]
-        print(colored(osci_set_id, "yellow", "on_grey", ["bold"]))
-        oscillogram_instances_by_set = qt.query_oscillograms_by_parallel_osci_set(osci_set_id, False)
-        for osci in oscillogram_instances_by_set:
-            print(colored("\t- oscillogram instance:", "blue", "on_grey", ["bold"]), osci.split("#")[1])
-    print("\n----------------------------------------------------------------------\n")
+    osci_id = osci.split("#")[1]
+    print(colored("osci: " + osci.split("#")[1], "yellow", "on_grey", ["bold"]), file=out)
+    time_series = qt.query_time_series_by_oscillogram_instance(osci_id, False)[0]
+    print(colored("\t- time series excerpt:", "blue", "on_grey", ["bold"]), time_series[:50], "...", file=out)
 
 
-def knowledge_snapshot_oscillogram_perspective() -> None:
+def knowledge_snapshot_oscillogram_perspective(
+        out: Union[TextIO, None] = None, runner: Union[KnowledgeSnapshotRunner, None] = None
+) -> None:
     """
     Presents a snapshot of the knowledge currently stored in the KG regarding oscillograms.
+
+    :param out: stream to print to (None: stdout)
+    :param runner: snapshot runner to render the sections concurrently (None: sequentially)
     """
-    print("###########################################################################")
-    print("KNOWLEDGE SNAPSHOT - OSCILLOGRAM PERSPECTIVE")
-    print("###########################################################################\n")
-    for osci in qt.query_all_recorded_oscillograms(False):
-        osci_id = osci.split("#")[1]
-        print(colored("osci: " + osci.split("#")[1], "yellow", "on_grey", ["bold"]))
-        time_series = qt.query_time_series_by_oscillogram_instance(osci_id, False)[0]
-        print(colored("\t- time series excerpt:", "blue", "on_grey", ["bold"]), time_series[:50], "...")
-    print("\n----------------------------------------------------------------------\n")
+    print_perspective_header("OSCILLOGRAM PERSPECTIVE", out)
+    print_sections(qt.query_all_recorded_oscillograms(False), print_oscillogram_section, out, runner)
+    print(SEPARATOR, file=out)
 
 
-def knowledge_snapshot_oscillogram_classification_perspective() -> None:
+def print_oscillogram_classification_section(osci_classification: str, out: Union[TextIO, None] = None) -> None:
     """
-    Presents a snapshot of the knowledge currently stored in the KG regarding oscillogram classifications.
+    Prints the snapshot section of the specified oscillogram classification.
+
+    :param osci_classification: oscillogram classification instance (IRI)
+    :param out: stream to print to (None: stdout)
     """
-    print("###########################################################################")
-    print("KNOWLEDGE SNAPSHOT - OSCILLOGRAM CLASSIFICATION PERSPECTIVE")
-    print("###########################################################################\n")
-    for osci_classification in qt.query_all_oscillogram_classifications(False):
-        osci_classification_id = osci_classification.split("#")[1]
-        print(colored(osci_classification_id, "yellow", "on_grey", ["bold"]))
-        print(
-            colored("\t- model id:", "blue", "on_grey", ["bold"]),
-            qt.query_model_id_by_osci_classification_id(osci_classification_id, False)[0]
-        )
+    osci_classification_id = osci_classification.split("#")[1]
+    print(colored(osci_classification_id, "yellow", "on_grey", ["bold"]), file=out)
+    print(
+        colored("\t- model id:", "blue", "on_grey", ["bold"]),
+        qt.query_model_id_by_osci_classification_id(osci_classification_id, False)[0], file=out
+    )
+    print(
+        colored("\t- uncertainty:", "blue", "on_grey", ["bold"]),
+        qt.query_uncertainty_by_osci_classification_id(osci_classification_id, False)[0], file=out
+    )
+    osci_instance = qt.query_oscillogram_by_classification_instance(osci_classification_id, False)
+    print(
+        colored("\t- classifies:", "blue", "on_grey", ["bold"]),
+        osci_instance[0].split("#")[1] if len(osci_instance) > 0 else "", file=out
+    )
+
+    heatmap_instance = qt.query_heatmap_by_classification_instance(osci_classification_id, False)
+    heatmap_id = heatmap_instance[0].split("#")[1] if len(heatmap_instance) > 0 else ""
+    if len(heatmap_id) > 0:
+        print(colored("\t- produces:", "blue", "on_grey", ["bold"]), heatmap_id, file=out)
         print(
-            colored("\t- uncertainty:", "blue", "on_grey", ["bold"]),
-            qt.query_uncertainty_by_osci_classification_id(osci_classification_id, False)[0]
+            colored("\t\t- generation_method:", "blue", "on_grey", ["bold"]),
+            qt.query_generation_method_by_heatmap(heatmap_id, False)[0], file=out
         )
-        osci_instance = qt.query_oscillogram_by_classification_instance(osci_classification_id, False)
         print(
-            colored("\t- classifies:", "blue", "on_grey", ["bold"]),
-            osci_instance[0].split("#")[1] if len(osci_instance) > 0 else ""
+            colored("\t\t- generated heatmap:", "blue", "on_grey", ["bold"]),
+            qt.query_heatmap_string_by_heatmap(heatmap_id, False)[0], file=out
         )
 
-        heatmap_instance = qt.query_heatmap_by_classification_instance(osci_classification_id, False)
-        heatmap_id = heatmap_instance[0].split("#")[1] if len(heatmap_instance) > 0 else ""
-        if len(heatmap_id) > 0:
-            print(colored("\t- produces:", "blue", "on_grey", ["bold"]), heatmap_id)
-            print(
-                colored("\t\t- generation_method:", "blue", "on_grey", ["bold"]),
-                qt.query_generation_method_by_heatmap(heatmap_id, False)[0]
-            )
-            print(
-                colored("\t\t- generated heatmap:", "blue", "on_grey", ["bold"]),
-                qt.query_heatmap_string_by_heatmap(heatmap_id, False)[0]
-            )
-
-        suspect_comp_instance = qt.query_suspect_component_by_classification(osci_classification_id, False)
-        suspect_comp_id = suspect_comp_instance[0].split("#")[1] if len(suspect_comp_instance) > 0 else ""
-        print(colored("\t- checks:", "blue", "on_grey", ["bold"]), suspect_comp_id)
-
-        reason_for_instance = qt.query_reason_for_classification(osci_classification_id, False)
+    suspect_comp_instance = qt.query_suspect_component_by_classification(osci_classification_id, False)
+    suspect_comp_id = suspect_comp_instance[0].split("#")[1] if len(suspect_comp_instance) > 0 else ""
+    print(colored("\t- checks:", "blue", "on_grey", ["bold"]), suspect_comp_id, file=out)
+
+    reason_for_instance = qt.query_reason_for_classification(osci_classification_id, False)
+    reason_for_id = reason_for_instance[0].split("#")[1] if len(reason_for_instance) > 0 else ""
+    if reason_for_id == "":
+        reason_for_instance = qt.query_led_to_for_classification(osci_classification_id, False)
         reason_for_id = reason_for_instance[0].split("#")[1] if len(reason_for_instance) > 0 else ""
-        if reason_for_id == "":
-            reason_for_instance = qt.query_led_to_for_classification(osci_classification_id, False)
-            reason_for_id = reason_for_instance[0].split("#")[1] if len(reason_for_instance) > 0 else ""
-        print(colored("\t- reason for classification:", "blue", "on_grey", ["bold"]), reason_for_id)
-        prediction = qt.query_prediction_by_classification(osci_classification_id, False)
-        print(colored("\t- prediction:", "blue", "on_grey", ["bold"]), prediction[0] if len(prediction) > 0 else "")
-    print("\n----------------------------------------------------------------------\n")
+    print(colored("\t- reason for classification:", "blue", "on_grey", ["bold"]), reason_for_id, file=out)
+    prediction = qt.query_prediction_by_classification(osci_classification_id, False)
+    print(
+        colored("\t- prediction:", "blue", "on_grey", ["bold"]), prediction[0] if len(prediction) > 0 else "",
+        file=out
+    )
 
 
-def knowledge_snapshot_manual_inspection_perspective() -> None:
+def knowledge_snapshot_oscillogram_classification_perspective(
+        out: Union[TextIO, None] = None, runner: Union[KnowledgeSnapshotRunner, None] = None
+) -> None:
     """
-    Presents a snapshot of the knowledge currently stored in the KG regarding manual inspections.
+    Presents a snapshot of the knowledge currently stored in the KG regarding oscillogram classifications.
+
+    :param out: stream to print to (None: stdout)
+    :param runner: snapshot runner to render the sections concurrently (None: sequentially)
     """
-    print("###########################################################################")
-    print("KNOWLEDGE SNAPSHOT - MANUAL INSPECTION PERSPECTIVE")
-    print("###########################################################################\n")
-    for manual_inspection in qt.query_all_manual_inspection_instances(False):
-        manual_inspection_id = manual_inspection.split("#")[1]
-        print(colored(manual_inspection_id, "yellow", "on_grey", ["bold"]))
-        suspect_comp_instance = qt.query_suspect_component_by_classification(manual_inspection_id, False)
-        suspect_comp_id = suspect_comp_instance[0].split("#")[1] if len(suspect_comp_instance) > 0 else ""
-        print(colored("\t- checks:", "blue", "on_grey", ["bold"]), suspect_comp_id)
-        reason_for_instance = qt.query_reason_for_inspection(manual_inspection_id, False)
+    print_perspective_header("OSCILLOGRAM CLASSIFICATION PERSPECTIVE", out)
+    print_sections(
+        qt.query_all_oscillogram_classifications(False), print_oscillogram_classification_section, out, runner
+    )
+    print(SEPARATOR, file=out)
+
+
+def print_manual_inspection_section(manual_inspection: str, out: Union[TextIO, None] = None) -> None:
+    """
+    Prints the snapshot section of the specified manual inspection.
+
+    :param manual_inspection: manual inspection instance (IRI)
+    :param out: stream to print to (None: stdout)
+    """
+    manual_inspection_id = manual_inspection.split("#")[1]
+    print(colored(manual_inspection_id, "yellow", "on_grey", ["bold"]), file=out)
+    suspect_comp_instance = qt.query_suspect_component_by_classification(manual_inspection_id, False)
+    suspect_comp_id = suspect_comp_instance[0].split("#")[1] if len(suspect_comp_instance) > 0 else ""
+    print(colored("\t- checks:", "blue", "on_grey", ["bold"]), suspect_comp_id, file=out)
+    reason_for_instance = qt.query_reason_for_inspection(manual_inspection_id, False)
+    reason_for_id = reason_for_instance[0].split("#")[1] if len(reason_for_instance) > 0 else ""
+    if reason_for_id == "":
+        reason_for_instance = qt.query_led_to_for_inspection(manual_inspection_id, False)
         reason_for_id = reason_for_instance[0].split("#")[1] if len(reason_for_instance) > 0 else ""
-        if reason_for_id == "":
-            reason_for_instance = qt.query_led_to_for_inspection(manual_inspection_id, False)
-            reason_for_id = reason_for_instance[0].split("#")[1] if len(reason_for_instance) > 0 else ""
-        print(colored("\t- reason for inspection:", "blue", "on_grey", ["bold"]), reason_for_id)
-        prediction = qt.query_prediction_by_classification(manual_inspection_id, False)
-        print(colored("\t- prediction:", "blue", "on_grey", ["bold"]), prediction[0] if len(prediction) > 0 else "")
-    print("\n----------------------------------------------------------------------\n")
+    print(colored("\t- reason for inspection:", "blue", "on_grey", ["bold"]), reason_for_id, file=out)
+    prediction = qt.query_prediction_by_classification(manual_inspection_id, False)
+    print(
+        colored("\t- prediction:", "blue", "on_grey", ["bold"]), prediction[0] if len(prediction) > 0 else "",
+        file=out
+    )
 
 
-def knowledge_snapshot_diag_log_perspective() -> None:
+def knowledge_snapshot_manual_inspection_perspective(
+        out: Union[TextIO, None] = None, runner: Union[KnowledgeSnapshotRunner, None] = None
+) -> None:
     """
-    Presents a snapshot of the knowledge currently stored in the KG regarding diagnosis logs.
+    Presents a snapshot of the knowledge currently stored in the KG regarding manual inspections.
+
+    :param out: stream to print to (None: stdout)
+    :param runner: snapshot runner to render the sections concurrently (None: sequentially)
     """
-    print("###########################################################################")
-    print("KNOWLEDGE SNAPSHOT - DIAGNOSIS LOG PERSPECTIVE")
-    print("###########################################################################\n")
-    for diag_log in qt.query_all_diag_log_instances(False):
-        diag_log_id = diag_log.split("#")[1]
-        print(colored(diag_log_id, "yellow", "on_grey", ["bold"]))
-        print(colored("\t- date:", "blue", "on_grey", ["bold"]), qt.query_date_by_diag_log(diag_log_id, False)[0])
-        print(
-            colored("\t- max number of parallel rec:", "blue", "on_grey", ["bold"]),
-            qt.query_max_num_of_parallel_rec_by_diag_log(diag_log_id, False)[0]
-        )
-        print(colored("\t- appearing DTCs:", "blue", "on_grey", ["bold"]))
+    print_perspective_header("MANUAL INSPECTION PERSPECTIVE", out)
+    print_sections(qt.query_all_manual_inspection_instances(False), print_manual_inspection_section, out, runner)
+    print(SEPARATOR, file=out)
 
-        appearing_dtcs = qt.query_dtcs_by_diag_log(diag_log_id, False)
-        for dtc in appearing_dtcs:
-            print("\t\t-", dtc.split("#")[1])
 
-        fault_path_instance = qt.query_fault_path_by_diag_log(diag_log_id, False)
-        fault_path_id = fault_path_instance[0].split("#")[1] if len(fault_path_instance) > 0 else ""
-        print(colored("\t- entails fault path:", "blue", "on_grey", ["bold"]), fault_path_id)
+def print_diag_log_section(diag_log: str, out: Union[TextIO, None] = None) -> None:
+    """
+    Prints the snapshot section of the specified diagnosis log.
+
+    :param diag_log: diagnosis log instance (IRI)
+    :param out: stream to print to (None: stdout)
+    """
+    diag_log_id = diag_log.split("#")[1]
+    print(colored(diag_log_id, "yellow", "on_grey", ["bold"]), file=out)
+    print(
+        colored("\t- date:", "blue", "on_grey", ["bold"]), qt.query_date_by_diag_log(diag_log_id, False)[0], file=out
+    )
+    print(
+        colored("\t- max number of parallel rec:", "blue", "on_grey", ["bold"]),
+        qt.query_max_num_of_parallel_rec_by_diag_log(diag_log_id, False)[0], file=out
+    )
+    print(colored("\t- appearing DTCs:", "blue", "on_grey", ["bold"]), file=out)
+
+    appearing_dtcs = qt.query_dtcs_by_diag_log(diag_log_id, False)
+    for dtc in appearing_dtcs:
+        print("\t\t-", dtc.split("#")[1], file=out)
+
+    fault_path_instance = qt.query_fault_path_by_diag_log(diag_log_id, False)
+    fault_path_id = fault_path_instance[0].split("#")[1] if len(fault_path_instance) > 0 else ""
+    print(colored("\t- entails fault path:", "blue", "on_grey", ["bold"]), fault_path_id, file=out)
+
+    vehicle_instance = qt.query_vehicle_by_diag_log(diag_log_id, False)
+    vehicle_id = vehicle_instance[0].split("#")[1]
+    print(colored("\t- created for vehicle:", "blue", "on_grey", ["bold"]), vehicle_id, file=out)
+
+    print(colored("\t- diagnostic steps:", "blue", "on_grey", ["bold"]), file=out)
+    diag_steps = qt.query_diag_steps_by_diag_log(diag_log_id, False)
+    for diag_step in diag_steps:
+        print("\t\t-", diag_step.split("#")[1], file=out)
+
 
-        vehicle_instance = qt.query_vehicle_by_diag_log(diag_log_id, False)
-        vehicle_id = vehicle_instance[0].split("#")[1]
-        print(colored("\t- created for vehicle:", "blue", "on_grey", ["bold"]), vehicle_id)
+def knowledge_snapshot_diag_log_perspective(
+        out: Union[TextIO, None] = None, runner: Union[KnowledgeSnapshotRunner, None] = None
+) -> None:
+    """
+    Presents a snapshot of the knowledge currently stored in the KG regarding diagnosis logs.
 
-        print(colored("\t- diagnostic steps:", "blue", "on_grey", ["bold"]))
-        diag_steps = qt.query_diag_steps_by_diag_log(diag_log_id, False)
-        for diag_step in diag_steps:
-            print("\t\t-", diag_step.split("#")[1])
-    print("\n----------------------------------------------------------------------\n")
+    :param out: stream to print to (None: stdout)
+    :param runner: snapshot runner to render the sections concurrently (None: sequentially)
+    """
+    print_perspective_header("DIAGNOSIS LOG PERSPECTIVE", out)
+    print_sections(qt.query_all_diag_log_instances(False), print_diag_log_section, out, runner)
+    print(SEPARATOR, file=out)
 
 
-def knowledge_snapshot_fault_path_perspective() -> None:
+def print_fault_path_section(fault_path: str, out: Union[TextIO, None] = None) -> None:
+    """
+    Prints the snapshot section of the specified fault path.
+
+    :param fault_path: fault path instance (IRI)
+    :param out: stream to print to (None: stdout)
+    """
+    fault_path_id = fault_path.split("#")[1]
+    fault_path_desc = qt.query_fault_path_description_by_id(fault_path_id, False)
+    print(colored("fault path: " + fault_path_id, "yellow", "on_grey", ["bold"]), file=out)
+    print(colored("\t- path description:" + str(fault_path_desc), "blue", "on_grey", ["bold"]), file=out)
+    print(colored("\t- fault conditions that resulted in this fault path:", "blue", "on_grey", ["bold"]), file=out)
+    fault_conditions = qt.query_resulted_in_by_fault_path(fault_path_id, False)
+    for fc in fault_conditions:
+        fault_condition_desc = qt.query_fault_condition_description_by_id(fc.split("#")[1], False)[0]
+        print("\t\t-", fault_condition_desc, file=out)
+
+
+def knowledge_snapshot_fault_path_perspective(
+        out: Union[TextIO, None] = None, runner: Union[KnowledgeSnapshotRunner, None] = None
+) -> None:
     """
     Presents a snapshot of the knowledge currently stored in the KG regarding fault paths.
+
+    :param out: stream to print to (None: stdout)
+    :param runner: snapshot runner to render the sections concurrently (None: sequentially)
     """
-    print("###########################################################################")
-    print("KNOWLEDGE SNAPSHOT - FAULT PATH PERSPECTIVE")
-    print("###########################################################################\n")
-    for fault_path in qt.query_all_fault_path_instances(False):
-        fault_path_id = fault_path.split("#")[1]
-        fault_path_desc = qt.query_fault_path_description_by_id(fault_path_id, False)
-        print(colored("fault path: " + fault_path_id, "yellow", "on_grey", ["bold"]))
-        print(colored("\t- path description:" + str(fault_path_desc), "blue", "on_grey", ["bold"]))
-        print(colored("\t- fault conditions that resulted in this fault path:", "blue", "on_grey", ["bold"]))
-        fault_conditions = qt.query_resulted_in_by_fault_path(fault_path_id, False)
-        for fc in fault_conditions:
-            fault_condition_desc = qt.query_fault_condition_description_by_id(fc.split("#")[1], False)[0]
-            print("\t\t-", fault_condition_desc)
-    print("\n----------------------------------------------------------------------\n")
+    print_perspective_header("FAULT PATH PERSPECTIVE", out)
+    print_sections(qt.query_all_fault_path_instances(False), print_fault_path_section, out, runner)
+    print(SEPARATOR, file=out)
 
 
-def knowledge_snapshot_vehicle_perspective() -> None:
+def print_vehicle_section(vehicle: Tuple[str, str, str, str, str], out: Union[TextIO, None] = None) -> None:
     """
-    Presents a snapshot of the knowledge currently stored in the KG regarding vehicles.
+    Prints the snapshot section of the specified vehicle.
+
+    :param vehicle: vehicle instance (IRI), HSN, TSN, VIN, model
+    :param out: stream to print to (None: stdout)
     """
-    print("###########################################################################")
-    print("KNOWLEDGE SNAPSHOT - VEHICLE PERSPECTIVE")
-    print("###########################################################################\n")
-    for vehicle_id, hsn, tsn, vin, model in qt.query_all_vehicle_instances(False):
-        vehicle_id = vehicle_id.split("#")[1]
-        print(colored(vehicle_id, "yellow", "on_grey", ["bold"]))
-        print(colored("\t- HSN: " + hsn, "blue", "on_grey", ["bold"]))
-        print(colored("\t- TSN: " + tsn, "blue", "on_grey", ["bold"]))
-        print(colored("\t- VIN: " + vin, "blue", "on_grey", ["bold"]))
-        print(colored("\t- model: " + model, "blue", "on_grey", ["bold"]))
-        print(colored("\t- DTCs recorded in this vehicle:", "blue", "on_grey", ["bold"]))
-        dtcs = qt.query_dtcs_recorded_in_vehicle(vehicle_id, False)
-        for dtc in dtcs:
-            print("\t\t-", dtc)
-    print("\n----------------------------------------------------------------------\n")
-
-
-def knowledge_snapshot_model_perspective() -> None:
+    vehicle_id, hsn, tsn, vin, model = vehicle
+    vehicle_id = vehicle_id.split("#")[1]
+    print(colored(vehicle_id, "yellow", "on_grey", ["bold"]), file=out)
+    print(colored("\t- HSN: " + hsn, "blue", "on_grey", ["bold"]), file=out)
+    print(colored("\t- TSN: " + tsn, "blue", "on_grey", ["bold"]), file=out)
+    print(colored("\t- VIN: " + vin, "blue", "on_grey", ["bold"]), file=out)
+    print(colored("\t- model: " + model, "blue", "on_grey", ["bold"]), file=out)
+    print(colored("\t- DTCs recorded in this vehicle:", "blue", "on_grey", ["bold"]), file=out)
+    dtcs = qt.query_dtcs_recorded_in_vehicle(vehicle_id, False)
+    for dtc in dtcs:
+        print("\t\t-", dtc, file=out)
+
+
+def knowledge_snapshot_vehicle_perspective(
+        out: Union[TextIO, None] = None, runner: Union[KnowledgeSnapshotRunner, None] = None
+) -> None:
     """
-    Presents a snapshot of the knowledge currently stored in the KG regarding classification models.
+    Presents a snapshot of the knowledge currently stored in the KG regarding vehicles.
+
+    :param out: stream to print to (None: stdout)
+    :param runner: snapshot runner to render the sections concurrently (None: sequentially)
     """
-    print("###########################################################################")
-    print("KNOWLEDGE SNAPSHOT - MODEL PERSPECTIVE")
-    print("###########################################################################\n")
-    model_instances = qt.query_all_model_instances(False)
-    for model_instance, input_len, exp_norm_meth, measuring_instruction, model_id, architecture in model_instances:
-        model_uuid = model_instance.split("#")[1]
-        sus_comp = qt.query_suspect_component_name_by_model(model_uuid)[0]
-        print(colored(model_uuid, "yellow", "on_grey", ["bold"]))
-        print(colored("\t- input len: " + input_len, "blue", "on_grey", ["bold"]))
-        print(colored("\t- exp. norm. meth.: " + exp_norm_meth, "blue", "on_grey", ["bold"]))
-        print(colored("\t- measuring inst.: " + measuring_instruction, "blue", "on_grey", ["bold"]))
-        print(colored("\t- model ID: " + model_id, "blue", "on_grey", ["bold"]))
-        print(colored("\t- architecture: " + architecture, "blue", "on_grey", ["bold"]))
-        print(colored("\t- assesses: " + sus_comp, "blue", "on_grey", ["bold"]))
-
-        for input_chan_req_instance, chan_idx in qt.query_input_chan_req_by_model(model_uuid):
-            input_chan_req_uuid = input_chan_req_instance.split("#")[1]
-            print(colored("\t- has requirement: " + input_chan_req_uuid, "blue", "on_grey", ["bold"]))
-            print(colored("\t\t- chan idx: " + chan_idx, "blue", "on_grey", ["bold"]))
-            chan_instance, chan_name = qt.query_channel_by_input_req(input_chan_req_uuid)[0]
-            chan_uuid = chan_instance.split("#")[1]
-            print(colored("\t\t- expected channel: " + chan_uuid, "blue", "on_grey", ["bold"]))
-            print(colored("\t\t- channel name: " + chan_name, "blue", "on_grey", ["bold"]))
-
-            # 'hasChannel' relation -- not available for every channel
-            has_chan_res = qt.query_suspect_component_names_by_channel(chan_uuid)
-            if len(has_chan_res) > 0:
-                for chan_res in has_chan_res:
-                    comp_instance, comp_name = chan_res
-                    comp_instance_uuid = comp_instance.split("#")[1]
-                    print(colored(
-                        "\t\t\t- associated with component ('hasChannel'): " + comp_instance_uuid,
-                        "yellow", "on_grey", ["bold"]
-                    ))
-                    print(colored("\t\t\t- comp name: " + comp_name, "yellow", "on_grey", ["bold"]))
-
-            # 'hasCOI' relation -- not available for every channel
-            has_coi_res = qt.query_suspect_components_by_channel(chan_uuid)
-            if len(has_coi_res) > 0:
-                comp_instance, comp_name = has_coi_res[0]
-                comp_instance_uuid = comp_instance.split("#")[1]
-                print(colored(
-                    "\t\t\t- associated with component ('hasCOI'): " + comp_instance_uuid,
-                    "yellow", "on_grey", ["bold"]
-                ))
-                print(colored("\t\t\t- comp name: " + comp_name, "yellow", "on_grey", ["bold"]))
-    print("\n----------------------------------------------------------------------\n")
+    print_perspective_header("VEHICLE PERSPECTIVE", out)
+    print_sections(qt.query_all_vehicle_instances(False), print_vehicle_section, out, runner)
+    print(SEPARATOR, file=out)
 
 
-def knowledge_snapshot_channel_perspective() -> None:
+def print_model_section(model: Tuple[str, str, str, str, str, str], out: Union[TextIO, None] = None) -> None:
     """
-    Presents a snapshot of the knowledge currently stored in the KG regarding channels.
+    Prints the snapshot section of the specified classification model.
+
+    :param model: model instance (IRI), input length, exp. normalization method, measuring instruction, model ID,
+                  architecture
+    :param out: stream to print to (None: stdout)
     """
-    print("###########################################################################")
-    print("KNOWLEDGE SNAPSHOT - CHANNEL PERSPECTIVE")
-    print("###########################################################################\n")
-    for chan_instance, chan_name in qt.query_all_channel_instances(False):
+    model_instance, input_len, exp_norm_meth, measuring_instruction, model_id, architecture = model
+    model_uuid = model_instance.split("#")[1]
+    sus_comp = qt.query_suspect_component_name_by_model(model_uuid)[0]
+    print(colored(model_uuid, "yellow", "on_grey", ["bold"]), file=out)
+    print(colored("\t- input len: " + input_len, "blue", "on_grey", ["bold"]), file=out)
+    print(colored("\t- exp. norm. meth.: " + exp_norm_meth, "blue", "on_grey", ["bold"]), file=out)
+    print(colored("\t- measuring inst.: " + measuring_instruction, "blue", "on_grey", ["bold"]), file=out)
+    print(colored("\t- model ID: " + model_id, "blue", "on_grey", ["bold"]), file=out)
+    print(colored("\t- architecture: " + architecture, "blue", "on_grey", ["bold"]), file=out)
+    print(colored("\t- assesses: " + sus_comp, "blue", "on_grey", ["bold"]), file=out)
+
+    for input_chan_req_instance, chan_idx in qt.query_input_chan_req_by_model(model_uuid):
+        input_chan_req_uuid = input_chan_req_instance.split("#")[1]
+        print(colored("\t- has requirement: " + input_chan_req_uuid, "blue", "on_grey", ["bold"]), file=out)
+        print(colored("\t\t- chan idx: " + chan_idx, "blue", "on_grey", ["bold"]), file=out)
+        chan_instance, chan_name = qt.query_channel_by_input_req(input_chan_req_uuid)[0]
         chan_uuid = chan_instance.split("#")[1]
-        print(colored(chan_uuid, "yellow", "on_grey", ["bold"]))
-        print(colored("\t- chan name: " + chan_name, "blue", "on_grey", ["bold"]))
-        models = qt.query_models_by_channel(chan_uuid)
-        for m in models:
-            print(colored("\t- input for model: " + str(m).split("#")[1], "blue", "on_grey", ["bold"]))
+        print(colored("\t\t- expected channel: " + chan_uuid, "blue", "on_grey", ["bold"]), file=out)
+        print(colored("\t\t- channel name: " + chan_name, "blue", "on_grey", ["bold"]), file=out)
+
+        # 'hasChannel' relation -- not available for every channel
         has_chan_res = qt.query_suspect_component_names_by_channel(chan_uuid)
-        has_chan_str = "belongs to component(s):"
         if len(has_chan_res) > 0:
-            components = "; ".join([chan_res[1] for chan_res in has_chan_res])
-            print(colored("\t- " + has_chan_str + " " + components, "blue", "on_grey", ["bold"]))
-        else:
-            print(colored("\t- " + has_chan_str + " ---", "blue", "on_grey", ["bold"]))
+            for chan_res in has_chan_res:
+                comp_instance, comp_name = chan_res
+                comp_instance_uuid = comp_instance.split("#")[1]
+                print(colored(
+                    "\t\t\t- associated with component ('hasChannel'): " + comp_instance_uuid,
+                    "yellow", "on_grey", ["bold"]
+                ), file=out)
+                print(colored("\t\t\t- comp name: " + comp_name, "yellow", "on_grey", ["bold"]), file=out)
+
+        # 'hasCOI' relation -- not available for every channel
         has_coi_res = qt.query_suspect_components_by_channel(chan_uuid)
         if len(has_coi_res) > 0:
-            cois = "; ".join([coi[1] for coi in has_coi_res])
-            print(colored("\t- is of interest for component(s):" + " " + cois, "blue", "on_grey", ["bold"]))
-    print("\n----------------------------------------------------------------------\n")
+            comp_instance, comp_name = has_coi_res[0]
+            comp_instance_uuid = comp_instance.split("#")[1]
+            print(colored(
+                "\t\t\t- associated with component ('hasCOI'): " + comp_instance_uuid,
+                "yellow", "on_grey", ["bold"]
+            ), file=out)
+            print(colored("\t\t\t- comp name: " + comp_name, "yellow", "on_grey", ["bold"]), file=out)
+
+
+def knowledge_snapshot_model_perspective(
+        out: Union[TextIO, None] = None, runner: Union[KnowledgeSnapshotRunner, None] = None
+) -> None:
+    """
+    Presents a snapshot of the knowledge currently stored in the KG regarding classification models.
+
+    :param out: stream to print to (None: stdout)
+    :param runner: snapshot runner to render the sections concurrently (None: sequentially)
+    """
+    print_perspective_header("MODEL PERSPECTIVE", out)
+    print_sections(qt.query_all_model_instances(False), print_model_section, out, runner)
+    print(SEPARATOR, file=out)
+
+
+def print_channel_section(channel: Tuple[str, str], out: Union[TextIO, None] = None) -> None:
+    """
+    Prints the snapshot section of the specified channel.
+
+    :param channel: channel instance (IRI), channel name
+    :param out: stream to print to (None: stdout)
+    """
+    chan_instance, chan_name = channel
+    chan_uuid = chan_instance.split("#")[1]
+    print(colored(chan_uuid, "yellow", "on_grey", ["bold"]), file=out)
+    print(colored("\t- chan name: " + chan_name, "blue", "on_grey", ["bold"]), file=out)
+    models = qt.query_models_by_channel(chan_uuid)
+    for m in models:
+        print(colored("\t- input for model: " + str(m).split("#")[1], "blue", "on_grey", ["bold"]), file=out)
+    has_chan_res = qt.query_suspect_component_names_by_channel(chan_uuid)
+    has_chan_str = "belongs to component(s):"
+    if len(has_chan_res) > 0:
+        components = "; ".join([chan_res[1] for chan_res in has_chan_res])
+        print(colored("\t- " + has_chan_str + " " + components, "blue", "on_grey", ["bold"]), file=out)
+    else:
+        print(colored("\t- " + has_chan_str + " ---", "blue", "on_grey", ["bold"]), file=out)
+    has_coi_res = qt.query_suspect_components_by_channel(chan_uuid)
+    if len(has_coi_res) > 0:
+        cois = "; ".join([coi[1] for coi in has_coi_res])
+        print(colored("\t- is of interest for component(s):" + " " + cois, "blue", "on_grey", ["bold"]), file=out)
+
+
+def knowledge_snapshot_channel_perspective(
+        out: Union[TextIO, None] = None, runner: Union[KnowledgeSnapshotRunner, None] = None
+) -> None:
+    """
+    Presents a snapshot of the knowledge currently stored in the KG regarding channels.
+
+    :param out: stream to print to (None: stdout)
+    :param runner: snapshot runner to render the sections concurrently (None: sequentially)
+    """
+    print_perspective_header("CHANNEL PERSPECTIVE", out)
+    print_sections(qt.query_all_channel_instances(False), print_channel_section, out, runner)
+    print(SEPARATOR, file=out)
+
+
+def print_expert_header(
+        out: Union[TextIO, None] = None, runner: Union[KnowledgeSnapshotRunner, None] = None
+) -> None:
+    """
+    Prints the header of the expert knowledge snapshot.
+
+    :param out: stream to print to (None: stdout)
+    :param runner: unused (signature of the perspective functions)
+    """
+    print("###########################################################################", file=out)
+    print("###########################################################################", file=out)
+    print("#################### EXPERT KNOWLEDGE STORED IN THE KG ####################", file=out)
+    print("###########################################################################", file=out)
+    print("###########################################################################\n", file=out)
+
+
+def print_diag_header(
+        out: Union[TextIO, None] = None, runner: Union[KnowledgeSnapshotRunner, None] = None
+) -> None:
+    """
+    Prints the header of the diagnosis knowledge snapshot.
+
+    :param out: stream to print to (None: stdout)
+    :param runner: unused (signature of the perspective functions)
+    """
+    print("###########################################################################", file=out)
+    print("###########################################################################", file=out)
+    print("################## DIAGNOSIS KNOWLEDGE STORED IN THE KG ###################", file=out)
+    print("###########################################################################", file=out)
+    print("###########################################################################\n", file=out)
+
+
+# perspectives (incl. header) of the snapshots in output order
+EXPERT_PERSPECTIVES = [
+    print_expert_header,
+    knowledge_snapshot_dtc_perspective,
+    knowledge_snapshot_subsystem_perspective,
+    knowledge_snapshot_component_perspective,
+    knowledge_snapshot_component_set_perspective,
+    knowledge_snapshot_model_perspective,
+    knowledge_snapshot_channel_perspective
+]
+DIAG_PERSPECTIVES = [
+    print_diag_header,
+    knowledge_snapshot_parallel_osci_perspective,
+    knowledge_snapshot_oscillogram_perspective,
+    knowledge_snapshot_oscillogram_classification_perspective,
+    knowledge_snapshot_manual_inspection_perspective,
+    knowledge_snapshot_diag_log_perspective,
+    knowledge_snapshot_fault_path_perspective,
+    knowledge_snapshot_vehicle_perspective
+]
+PERSPECTIVES = {
+    "expert": EXPERT_PERSPECTIVES, "diag": DIAG_PERSPECTIVES, "all": EXPERT_PERSPECTIVES + DIAG_PERSPECTIVES
+}
 
 
 if __name__ == '__main__':
     parser = argparse.ArgumentParser(description='Knowledge snapshot - shows current content of KG')
     parser.add_argument(
-        '--perspective', type=str, help='perspective of snapshot [expert | diag]', required=False, default='expert'
+        '--perspective', type=str, choices=list(PERSPECTIVES.keys()), required=False, default='expert',
+        help='perspective of snapshot [expert | diag | all] - all: expert and diag in one run'
+    )
+    parser.add_argument(
+        '--kg_url', type=str, default=FUSEKI_URL, required=False,
+        help='URL of the KG server or embedded KG file, e.g., file://<backup>.nt.gz'
+    )
+    parser.add_argument(
+        '--mode', type=str, choices=['index', 'query'], default='index', required=False,
+        help='index: fetch the KG in one N-Triples dump and answer from an in-memory index (deterministic order), '
+             'query: one SPARQL query per entity and attribute'
+    )
+    parser.add_argument(
+        '--workers', type=int, default=SNAPSHOT_WORKERS, required=False,
+        help='max number of snapshot sections rendered concurrently (1: sequential)'
     )
     args = parser.parse_args()
-    qt = KnowledgeGraphQueryTool()
-
-    if args.perspective == 'expert':  # expert knowledge
-        print("###########################################################################")
-        print("###########################################################################")
-        print("#################### EXPERT KNOWLEDGE STORED IN THE KG ####################")
-        print("###########################################################################")
-        print("###########################################################################\n")
-        knowledge_snapshot_dtc_perspective()
-        knowledge_snapshot_subsystem_perspective()
-        knowledge_snapshot_component_perspective()
-        knowledge_snapshot_component_set_perspective()
-        knowledge_snapshot_model_perspective()
-        knowledge_snapshot_channel_perspective()
-    elif args.perspective == 'diag':  # diagnosis
-        print("###########################################################################")
-        print("###########################################################################")
-        print("################## DIAGNOSIS KNOWLEDGE STORED IN THE KG ###################")
-        print("###########################################################################")
-        print("###########################################################################\n")
-        knowledge_snapshot_parallel_osci_perspective()
-        knowledge_snapshot_oscillogram_perspective()
-        knowledge_snapshot_oscillogram_classification_perspective()
-        knowledge_snapshot_manual_inspection_perspective()
-        knowledge_snapshot_diag_log_perspective()
-        knowledge_snapshot_fault_path_perspective()
-        knowledge_snapshot_vehicle_perspective()
+    qt = IndexedQueryTool(kg_url=args.kg_url) if args.mode == 'index' else KnowledgeGraphQueryTool(kg_url=args.kg_url)
+
+    if args.workers == 1:
+        for perspective_fn in PERSPECTIVES[args.perspective]:
+            perspective_fn()
+    else:
+        with KnowledgeSnapshotRunner(args.workers) as snapshot_runner:
+            snapshot_runner.run(PERSPECTIVES[args.perspective], sys.stdout)
@@ -0,0 +1,128 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# @author Tim Bohne
+
+import logging
+import sys
+import threading
+from contextlib import contextmanager
+from typing import Any, Iterator, List, Union
+
+from termcolor import colored
+
+from obd_ontology.config import LOG_LEVEL
+
+# all loggers of the package are children of this logger, e.g., "obd_ontology.connection_controller"
+PACKAGE_LOGGER = "obd_ontology"
+BANNER_WIDTH = 72
+
+# per-thread quiet mode (see `quiet`)
+_quiet_state = threading.local()
+
+
+class QuietFilter(logging.Filter):
+    """
+    Drops all records below WARNING that are emitted while the emitting thread is in quiet mode.
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """
+        Checks whether the specified record should be emitted.
+
+        :param record: log record
+        :return: whether the record should be emitted
+        """
+        return record.levelno >= logging.WARNING or getattr(_quiet_state, "depth", 0) == 0
+
+
+def configure_logging(level: Union[int, str] = LOG_LEVEL) -> logging.Logger:
+    """
+    Configures the package logger - messages are written to stderr without decoration (stdout is reserved for the
+    data written by the CLIs, e.g., snapshots or JSON Lines exports), the package logger does not propagate to the
+    root logger.
+
+    :param level: log level of the package, e.g., "WARNING" (default: silent apart from warnings and errors), "INFO"
+                  (progress, query banners), "DEBUG" (queries, individual facts)
+    :return: package logger
+    """
+    logger = logging.getLogger(PACKAGE_LOGGER)
+    if not any(isinstance(handler_filter, QuietFilter) for handler in logger.handlers
+               for handler_filter in handler.filters):
+        handler = logging.StreamHandler(sys.stderr)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        handler.addFilter(QuietFilter())
+        logger.addHandler(handler)
+        logger.propagate = False
+    logger.setLevel(level)
+    return logger
+
+
+def set_log_level(level: Union[int, str]) -> None:
+    """
+    Sets the log level of the package (per process).
+
+    :param level: log level, e.g., "WARNING", "INFO", "DEBUG" or `logging.INFO`
+    """
+    logging.getLogger(PACKAGE_LOGGER).setLevel(level)
+
+
+def get_logger(name: str) -> logging.Logger:
+    """
+    Returns the logger for the specified module of the package.
+
+    :param name: module name (`__name__`)
+    :return: logger
+    """
+    if name == "__main__" or not name.startswith(PACKAGE_LOGGER):
+        name = PACKAGE_LOGGER + "." + name.split(".")[-1]
+    return logging.getLogger(name)
+
+
+@contextmanager
+def quiet() -> Iterator[None]:
+    """
+    Quiet mode for the current thread (per call), i.e., only warnings and errors are emitted within the context.
+    """
+    _quiet_state.depth = getattr(_quiet_state, "depth", 0) + 1
+    try:
+        yield
+    finally:
+        _quiet_state.depth -= 1
+
+
+def log_banner(logger: logging.Logger, msg: str, *args: Any, color: Union[str, None] = "green",
+               level: int = logging.INFO) -> None:
+    """
+    Logs the specified message framed by '#' lines (e.g., query banners) - formatted only if the level is enabled.
+
+    :param logger: logger to be used
+    :param msg: message (%-style format string)
+    :param args: arguments of the format string
+    :param color: text color of the message (None: uncolored)
+    :param level: log level
+    """
+    if logger.isEnabledFor(level):
+        text = msg % args if len(args) > 0 else msg
+        if color is not None:
+            text = colored(text, color, "on_grey", ["bold"])
+        logger.log(level, "%s\n%s\n%s", "#" * BANNER_WIDTH, text, "#" * BANNER_WIDTH)
+
+
+def log_lines(logger: logging.Logger, level: int, prefix: str, items: List[Any], max_len: int = 200) -> None:
+    """
+    Logs each of the specified items in a separate line (truncated to `max_len` characters, e.g., long facts) -
+    the items are only converted to strings if the level is enabled.
+
+    :param logger: logger to be used
+    :param level: log level
+    :param prefix: prefix of each line, e.g., "fact:"
+    :param items: items to be logged
+    :param max_len: max number of characters per item
+    """
+    if logger.isEnabledFor(level):
+        for item in items:
+            item_str = str(item)
+            logger.log(level, "%s %s", prefix, item_str[:max_len] + "..." if len(item_str) > max_len else item_str)
+
+
+configure_logging()
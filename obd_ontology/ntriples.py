@@ -0,0 +1,209 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# @author Tim Bohne
+
+import re
+from typing import Any, Callable, Iterable, Iterator, List, Tuple, Union
+
+from rdflib import Literal
+
+# literal that is already serialized as typed N-Triples term, e.g., "true"^^<http://www.w3.org/2001/XMLSchema#boolean>
+SERIALIZED_TYPED_LITERAL = re.compile(r'^"(?:[^"\\]|\\.)*"\^\^<[^<>"{}|^`\\\s]+>$')
+STRING_ESCAPES = str.maketrans({"\\": "\\\\", "\"": "\\\"", "\n": "\\n", "\r": "\\r"})
+# N-Triples statement: subject (IRI / blank node), predicate (IRI), object (IRI / blank node / literal) - the lexical
+# form is matched as runs of ordinary characters between escape sequences (long literals, e.g., time series)
+NTRIPLES_STATEMENT = re.compile(
+    r'(<[^>]*>|_:\S+)\s+<([^>]*)>\s+(<[^>]*>|_:\S+|"([^"\\]*(?:\\.[^"\\]*)*)"(?:\^\^<[^>]*>|@[a-zA-Z0-9-]+)?)\s*\.\s*$'
+)
+STRING_UNESCAPES = {"t": "\t", "b": "\b", "n": "\n", "r": "\r", "f": "\f", "\"": "\"", "'": "'", "\\": "\\"}
+ESCAPE_SEQUENCE = re.compile(r'\\(u[0-9A-Fa-f]{4}|U[0-9A-Fa-f]{8}|.)')
+BOOLEAN_LITERALS = {
+    value: "\"" + str(value).lower() + "\"^^<http://www.w3.org/2001/XMLSchema#boolean>" for value in (True, False)
+}
+
+
+def escape_string(value: str) -> str:
+    """
+    Escapes the specified string so that it can be used as lexical form of an N-Triples (or SPARQL) literal.
+
+    :param value: string to be escaped
+    :return: escaped string (without surrounding quotes)
+    """
+    return value.translate(STRING_ESCAPES)
+
+
+def serialize_iri(iri: str) -> str:
+    """
+    Serializes the specified IRI as N-Triples term.
+
+    :param iri: IRI to be serialized
+    :return: N-Triples IRI term
+    """
+    return "<" + iri + ">"
+
+
+def serialize_literal(value: Any) -> str:
+    """
+    Serializes the specified value as N-Triples literal term.
+
+    Python values are mapped to the same (typed) literals as in `rdflib`, e.g., `True` is serialized as
+    "true"^^<http://www.w3.org/2001/XMLSchema#boolean>, integers as xsd:integer and floats as xsd:double, i.e., the
+    serialization matches the facts that are entered into the KG. Strings are always escaped, i.e., stored as plain
+    string literals.
+
+    :param value: value to be serialized
+    :return: N-Triples literal term
+    """
+    if type(value) is str:
+        # fast path for plain strings (most property values) - same term as via `Literal`
+        return "\"" + escape_string(value) + "\""
+    if type(value) is bool:
+        return BOOLEAN_LITERALS[value]
+    return serialize_rdflib_literal(Literal(value))
+
+
+def serialize_deletion_literal(value: Any) -> str:
+    """
+    Serializes the specified value as N-Triples literal term of a fact to be removed.
+
+    In contrast to `serialize_literal`, strings that are already serialized typed literals (used to address the
+    xsd:boolean facts to be removed) are taken as they are.
+
+    :param value: value to be serialized
+    :return: N-Triples literal term
+    """
+    if isinstance(value, str) and SERIALIZED_TYPED_LITERAL.match(value):
+        return value
+    return serialize_literal(value)
+
+
+def serialize_rdflib_literal(lit: Literal) -> str:
+    """
+    Serializes the specified rdflib literal as N-Triples literal term (lexical form, datatype / language tag).
+
+    :param lit: literal to be serialized
+    :return: N-Triples literal term
+    """
+    term = "\"" + escape_string(str(lit)) + "\""
+    if lit.language is not None:
+        return term + "@" + lit.language
+    if lit.datatype is not None:
+        return term + "^^" + serialize_iri(str(lit.datatype))
+    return term
+
+
+class NTriplesStream:
+    """
+    N-Triples request body that is serialized and encoded while it is sent (chunked transfer encoding), i.e., the
+    complete serialization is never held in memory. The stream is re-iterable (each iteration serializes the facts
+    again), so that a retried request sends the complete body again.
+    """
+
+    def __init__(self, facts: List[Any], serialize: Callable[[Any], str], chunk_bytes: int) -> None:
+        """
+        Initializes the N-Triples stream.
+
+        :param facts: facts to be serialized
+        :param serialize: function serializing a fact as N-Triples statement
+        :param chunk_bytes: (approximate) size of the encoded chunks
+        """
+        self.facts = facts
+        self.serialize = serialize
+        self.chunk_bytes = chunk_bytes
+
+    def __iter__(self) -> Iterator[bytes]:
+        """
+        Serializes the facts chunk by chunk.
+
+        :return: encoded chunks of N-Triples statements
+        """
+        chunk = []
+        chunk_len = 0
+        for fact in self.facts:
+            statement = self.serialize(fact)
+            chunk.append(statement)
+            chunk_len += len(statement) + 1
+            if chunk_len >= self.chunk_bytes:
+                chunk.append("")
+                yield "\n".join(chunk).encode()
+                chunk = []
+                chunk_len = 0
+        if len(chunk) > 0:
+            chunk.append("")
+            yield "\n".join(chunk).encode()
+
+
+def unescape_string(value: str) -> str:
+    """
+    Resolves the escape sequences (e.g., \\n, \\", \\u00fc) of the lexical form of an N-Triples literal.
+
+    :param value: escaped string (without surrounding quotes)
+    :return: unescaped string
+    """
+    if "\\" not in value:
+        return value
+    return ESCAPE_SEQUENCE.sub(
+        lambda m: chr(int(m.group(1)[1:], 16)) if len(m.group(1)) > 1 else STRING_UNESCAPES.get(m.group(1), m.group(1)),
+        value
+    )
+
+
+def canonicalize_ntriples_line(line: str) -> Union[str, None]:
+    """
+    Brings one line of an N-Triples serialization into canonical form, i.e., the terms separated by single spaces
+    and terminated by " ." (the terms themselves are kept as serialized), so that the same statement serialized by
+    different dumps yields the same line.
+
+    :param line: N-Triples line
+    :return: canonical statement (without line break), None for empty lines and comments
+    """
+    line = line.strip()
+    if line == "" or line[0] == "#":
+        return None
+    match = NTRIPLES_STATEMENT.match(line)
+    if match is None:
+        raise ValueError("invalid N-Triples statement: " + line[:200])
+    return match.group(1) + " <" + match.group(2) + "> " + match.group(3) + " ."
+
+
+def parse_ntriples(chunks: Iterable[bytes]) -> Iterator[Tuple[str, str, str, bool]]:
+    """
+    Parses the specified N-Triples serialization (e.g., a streamed KG dump) statement by statement - chunk
+    boundaries do not have to be aligned with line breaks.
+
+    IRIs are returned without angle brackets, blank nodes as "_:<label>", literals as their (unescaped) lexical form,
+    i.e., as the values in SPARQL JSON results.
+
+    :param chunks: encoded N-Triples chunks
+    :return: (subject, predicate, object, whether the object is a literal) for each statement
+    """
+    rest = b""
+    for chunk in chunks:
+        lines = (rest + chunk).split(b"\n")
+        rest = lines.pop()
+        for line in lines:
+            statement = parse_ntriples_line(line.decode())
+            if statement is not None:
+                yield statement
+    statement = parse_ntriples_line(rest.decode())
+    if statement is not None:
+        yield statement
+
+
+def parse_ntriples_line(line: str) -> Union[Tuple[str, str, str, bool], None]:
+    """
+    Parses one line of an N-Triples serialization.
+
+    :param line: N-Triples line
+    :return: (subject, predicate, object, whether the object is a literal), None for empty lines and comments
+    """
+    line = line.strip()
+    if line == "" or line[0] == "#":
+        return None
+    match = NTRIPLES_STATEMENT.match(line)
+    if match is None:
+        raise ValueError("invalid N-Triples statement: " + line[:200])
+    subj, pred, obj, lexical_form = match.groups()
+    if lexical_form is not None:
+        return subj.strip("<>"), pred, unescape_string(lexical_form), True
+    return subj.strip("<>"), pred, obj[1:-1] if obj[0] == "<" else obj, False
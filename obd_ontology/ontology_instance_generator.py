@@ -3,15 +3,25 @@
 # @author Tim Bohne
 
 import uuid
-from typing import List, Union
+from contextlib import contextmanager
+from typing import Iterator, List, Tuple, Union
 
+import numpy as np
 from owlready2 import *
 from rdflib import Namespace, RDF
 
-from obd_ontology.config import ONTOLOGY_PREFIX, FUSEKI_URL
+from obd_ontology.array_codec import ARRAY_DTYPES, encode_array, encode_arrays
+from obd_ontology.blob_store import BlobStore
+from obd_ontology.config import ONTOLOGY_PREFIX, FUSEKI_URL, ARRAY_ENCODING, ARRAY_COMPRESSION, BLOB_STORE_DIR, \
+    FACT_BUFFER_FLUSH_SIZE, FACT_BUFFER_FLUSH_INTERVAL
 from obd_ontology.connection_controller import ConnectionController
 from obd_ontology.fact import Fact
+from obd_ontology.fact_buffer import FactBuffer
+from obd_ontology.instance_resolver import InstanceResolver
 from obd_ontology.knowledge_graph_query_tool import KnowledgeGraphQueryTool
+from obd_ontology.log import get_logger
+
+logger = get_logger(__name__)
 
 
 class OntologyInstanceGenerator:
@@ -21,16 +31,143 @@ class OntologyInstanceGenerator:
     process, with corresponding background knowledge stored in the KG.
     """
 
-    def __init__(self, kg_url: str = FUSEKI_URL) -> None:
+    def __init__(
+            self, kg_url: str = FUSEKI_URL, array_encoding: str = ARRAY_ENCODING,
+            array_compression: bool = ARRAY_COMPRESSION, blob_dir: Union[str, None] = BLOB_STORE_DIR
+    ) -> None:
         """
         Initializes the ontology instance generator.
 
         :param kg_url: URL of the knowledge graph server
+        :param array_encoding: encoding of time series and heatmaps - "text" | "float32" | "float16" (see `array_codec`)
+        :param array_compression: whether binary encoded arrays should be zlib compressed
+        :param blob_dir: directory of the blob store the arrays are saved in (KG only contains references), None: arrays
+                         are entered into the KG as encoded literals
         """
         # establish connection to Apache Jena Fuseki server
         self.fuseki_connection = ConnectionController(namespace=ONTOLOGY_PREFIX, fuseki_url=kg_url)
         self.knowledge_graph_query_tool = KnowledgeGraphQueryTool(kg_url=kg_url)
+        self.instance_resolver = InstanceResolver(kg_url=kg_url)
         self.onto_namespace = Namespace(ONTOLOGY_PREFIX)
+        self.array_encoding = array_encoding
+        self.array_compression = array_compression
+        self.blob_store = BlobStore(blob_dir) if blob_dir is not None else None
+        # write-behind buffer of the current diagnosis session (None: facts are entered immediately)
+        self.fact_buffer: Union[FactBuffer, None] = None
+
+    def begin_session(
+            self, flush_size: Union[int, None] = FACT_BUFFER_FLUSH_SIZE,
+            flush_interval: Union[float, None] = FACT_BUFFER_FLUSH_INTERVAL
+    ) -> FactBuffer:
+        """
+        Starts a diagnosis session, i.e., the facts of all subsequent extensions are buffered (IDs are returned right
+        away) and entered into the KG in bulk on flush / commit (see `FactBuffer`).
+
+        Note: facts of the session are not visible to KG queries until they are flushed, e.g., a vehicle added in the
+        session is not yet found by its VIN.
+
+        :param flush_size: number of buffered facts triggering a flush (None: only explicit flushes / commit)
+        :param flush_interval: seconds between background flushes (None: no background flushes)
+        :return: fact buffer of the session
+        """
+        if self.fact_buffer is not None:
+            raise RuntimeError("diagnosis session already started")
+        self.fact_buffer = FactBuffer(self.fuseki_connection, flush_size, flush_interval)
+        return self.fact_buffer
+
+    def flush_session(self) -> List[int]:
+        """
+        Enters the facts buffered in the current diagnosis session into the KG (the session continues).
+
+        :return: HTTP status code for each sent request (chunk)
+        """
+        return self.fact_buffer.flush() if self.fact_buffer is not None else []
+
+    def commit_session(self) -> List[int]:
+        """
+        Ends the current diagnosis session and enters all remaining buffered facts into the KG. If the final flush fails,
+        the session is not ended, i.e., the facts remain buffered and the commit can be retried (or the session rolled
+        back).
+
+        :return: HTTP status code for each sent request (chunk) of the final flush
+        """
+        if self.fact_buffer is None:
+            return []
+        status_codes = self.fact_buffer.close(commit=True)
+        self.fact_buffer = None
+        return status_codes
+
+    def rollback_session(self) -> int:
+        """
+        Ends the current diagnosis session and discards all facts that are not flushed yet.
+
+        :return: number of discarded facts
+        """
+        fact_buffer, self.fact_buffer = self.fact_buffer, None
+        if fact_buffer is None:
+            return 0
+        num_of_facts = len(fact_buffer)
+        fact_buffer.close(commit=False)
+        return num_of_facts
+
+    @contextmanager
+    def diagnosis_session(
+            self, flush_size: Union[int, None] = FACT_BUFFER_FLUSH_SIZE,
+            flush_interval: Union[float, None] = FACT_BUFFER_FLUSH_INTERVAL
+    ) -> Iterator[FactBuffer]:
+        """
+        Diagnosis session as context - committed on exit, rolled back if an exception is raised. If the commit fails,
+        the session remains open (see `commit_session`).
+
+        :param flush_size: number of buffered facts triggering a flush (None: only explicit flushes / commit)
+        :param flush_interval: seconds between background flushes (None: no background flushes)
+        :return: fact buffer of the session
+        """
+        fact_buffer = self.begin_session(flush_size, flush_interval)
+        try:
+            yield fact_buffer
+        except BaseException:
+            self.rollback_session()
+            raise
+        self.commit_session()
+
+    def extend_knowledge_graph(self, facts: List[Fact], bulk: bool = False) -> None:
+        """
+        Enters the specified facts into the KG - buffered if a diagnosis session is active.
+
+        :param facts: facts to be entered into the knowledge graph
+        :param bulk: whether the facts should be uploaded as (chunked) N-Triples without logging each fact
+        """
+        if self.fact_buffer is not None:
+            self.fact_buffer.extend_knowledge_graph(facts)
+        elif bulk:
+            self.fuseki_connection.extend_knowledge_graph_in_chunks(facts)
+        else:
+            self.fuseki_connection.extend_knowledge_graph(facts)
+
+    def encode_arrays(self, values: np.ndarray) -> List[str]:
+        """
+        Encodes each row of the specified two-dimensional array as literal (or blob reference), see `encode_array`.
+
+        :param values: array to be encoded (one row per literal)
+        :return: encoded literal / blob reference for each row
+        """
+        if self.blob_store is not None:
+            dtype = ARRAY_DTYPES.get(self.array_encoding)
+            return [self.blob_store.put(row, dtype) for row in np.asarray(values, dtype=dtype)]
+        return encode_arrays(values, self.array_encoding, self.array_compression)
+
+    def encode_array(self, values: Union[List[float], np.ndarray]) -> str:
+        """
+        Encodes the specified array (time series, heatmap) as literal according to the configured array encoding, or
+        saves it in the blob store (with the dtype of the configured binary encoding) and returns the reference.
+
+        :param values: array to be encoded
+        :return: encoded literal / blob reference
+        """
+        if self.blob_store is not None:
+            return self.blob_store.put(values, ARRAY_DTYPES.get(self.array_encoding))
+        return encode_array(values, self.array_encoding, self.array_compression)
 
     def extend_knowledge_graph_with_vehicle_data(self, model: str, hsn: str, tsn: str, vin: str) -> None:
         """
@@ -45,7 +182,7 @@ class OntologyInstanceGenerator:
         fact_list = []
         vehicle_instance = self.knowledge_graph_query_tool.query_vehicle_instance_by_vin(vin)
         if len(vehicle_instance) > 0:
-            print("Vehicle (" + vin + ") already part of the KG")
+            logger.info("Vehicle (%s) already part of the KG", vin)
         else:
             fact_list = [
                 Fact((vehicle_uuid, RDF.type, self.onto_namespace["Vehicle"].toPython())),
@@ -54,7 +191,7 @@ class OntologyInstanceGenerator:
                 Fact((vehicle_uuid, self.onto_namespace.TSN, tsn), property_fact=True),
                 Fact((vehicle_uuid, self.onto_namespace.VIN, vin), property_fact=True)
             ]
-        self.fuseki_connection.extend_knowledge_graph(fact_list)
+        self.extend_knowledge_graph(fact_list)
 
     def extend_knowledge_graph_with_diag_log(
             self, diag_date: str, max_num_of_parallel_rec: int, dtc_instances: List[str],
@@ -91,7 +228,7 @@ class OntologyInstanceGenerator:
         for classification_id in classification_instances:
             fact_list.append(Fact((classification_id, self.onto_namespace.diagStep, diag_log_uuid)))
         fact_list.append(Fact((diag_log_uuid, self.onto_namespace.createdFor, vehicle_id)))
-        self.fuseki_connection.extend_knowledge_graph(fact_list)
+        self.extend_knowledge_graph(fact_list)
         return diag_log_uuid
 
     def extend_knowledge_graph_with_fault_path(self, description: str, fault_cond_id: str) -> str:
@@ -108,7 +245,7 @@ class OntologyInstanceGenerator:
             Fact((fault_path_uuid, self.onto_namespace.path_description, description), property_fact=True),
             Fact((fault_cond_id, self.onto_namespace.resultedIn, fault_path_uuid))
         ]
-        self.fuseki_connection.extend_knowledge_graph(fact_list)
+        self.extend_knowledge_graph(fact_list)
         return fault_path_uuid
 
     def extend_knowledge_graph_with_oscillogram_classification(
@@ -154,10 +291,10 @@ class OntologyInstanceGenerator:
             fact_list.append(Fact((classification_reason, self.onto_namespace.ledTo, classification_uuid)))
         else:  # the reason is a classification instance (manual or osci)
             fact_list.append(Fact((classification_reason, self.onto_namespace.reasonFor, classification_uuid)))
-        self.fuseki_connection.extend_knowledge_graph(fact_list)
+        self.extend_knowledge_graph(fact_list)
         return classification_uuid
 
-    def extend_knowledge_graph_with_heatmap(self, gen_method: str, heatmap: List[float]) -> str:
+    def extend_knowledge_graph_with_heatmap(self, gen_method: str, heatmap: Union[List[float], np.ndarray]) -> str:
         """
         Extends the knowledge graph with semantic facts for a heatmap.
 
@@ -169,12 +306,14 @@ class OntologyInstanceGenerator:
         fact_list = [
             Fact((heatmap_uuid, RDF.type, self.onto_namespace["Heatmap"].toPython())),
             Fact((heatmap_uuid, self.onto_namespace.generation_method, gen_method), property_fact=True),
-            Fact((heatmap_uuid, self.onto_namespace.generated_heatmap, str(heatmap)), property_fact=True)
+            Fact((heatmap_uuid, self.onto_namespace.generated_heatmap, self.encode_array(heatmap)), property_fact=True)
         ]
-        self.fuseki_connection.extend_knowledge_graph(fact_list)
+        self.extend_knowledge_graph(fact_list)
         return heatmap_uuid
 
-    def extend_knowledge_graph_with_oscillogram(self, time_series: List[float], parallel_rec_set_id: str = "") -> str:
+    def extend_knowledge_graph_with_oscillogram(
+            self, time_series: Union[List[float], np.ndarray], parallel_rec_set_id: str = ""
+    ) -> str:
         """
         Extends the knowledge graph with semantic facts for an oscillogram.
 
@@ -185,11 +324,11 @@ class OntologyInstanceGenerator:
         osci_uuid = "oscillogram_" + uuid.uuid4().hex
         fact_list = [
             Fact((osci_uuid, RDF.type, self.onto_namespace["Oscillogram"].toPython())),
-            Fact((osci_uuid, self.onto_namespace.time_series, str(time_series)), property_fact=True)
+            Fact((osci_uuid, self.onto_namespace.time_series, self.encode_array(time_series)), property_fact=True)
         ]
         if parallel_rec_set_id != "":  # oscillogram part of parallelly recorded set?
             fact_list.append(Fact((osci_uuid, self.onto_namespace.partOf, parallel_rec_set_id)))
-        self.fuseki_connection.extend_knowledge_graph(fact_list)
+        self.extend_knowledge_graph(fact_list)
         return osci_uuid
 
     def extend_knowledge_graph_with_overlays_relation(self, heatmap_id: str, osci_id: str) -> None:
@@ -200,7 +339,7 @@ class OntologyInstanceGenerator:
         :param osci_id: ID of the oscillogram
         """
         fact_list = [Fact((heatmap_id, self.onto_namespace.overlays, osci_id))]
-        self.fuseki_connection.extend_knowledge_graph(fact_list)
+        self.extend_knowledge_graph(fact_list)
 
     def extend_knowledge_graph_with_parallel_rec_osci_set(self) -> str:
         """
@@ -210,9 +349,47 @@ class OntologyInstanceGenerator:
         """
         osci_set_uuid = "parallel_rec_oscillogram_set_" + uuid.uuid4().hex
         fact_list = [Fact((osci_set_uuid, RDF.type, self.onto_namespace["ParallelRecOscillogramSet"].toPython()))]
-        self.fuseki_connection.extend_knowledge_graph(fact_list)
+        self.extend_knowledge_graph(fact_list)
         return osci_set_uuid
 
+    def extend_knowledge_graph_with_parallel_recording(
+            self, channels: Union[np.ndarray, List[List[float]]], channel_names: Union[List[str], None] = None
+    ) -> Tuple[str, List[str]]:
+        """
+        Extends the knowledge graph with semantic facts for a set of parallel recorded oscillograms, i.e., the set, an
+        oscillogram for each recorded channel, the 'partOf' relations and, if the channel names are specified, the
+        'records' relations to the channels - all time series are encoded at once and entered with a single upload.
+
+        :param channels: parallel recorded time series (voltage values), shape: (num_of_channels, num_of_samples)
+        :param channel_names: optional names of the recorded channels (one per time series)
+        :return: (oscillogram set ID, oscillogram ID for each channel)
+        """
+        if channel_names is not None and len(channel_names) != len(channels):
+            raise ValueError(str(len(channels)) + " time series, but " + str(len(channel_names)) + " channel names")
+        osci_set_uuid = "parallel_rec_oscillogram_set_" + uuid.uuid4().hex
+        osci_type = self.onto_namespace["Oscillogram"].toPython()
+        fact_list = [Fact((osci_set_uuid, RDF.type, self.onto_namespace["ParallelRecOscillogramSet"].toPython()))]
+        osci_uuids = []
+        for time_series in self.encode_arrays(channels):
+            osci_uuid = "oscillogram_" + uuid.uuid4().hex
+            osci_uuids.append(osci_uuid)
+            fact_list += [
+                Fact((osci_uuid, RDF.type, osci_type)),
+                Fact((osci_uuid, self.onto_namespace.time_series, time_series), property_fact=True),
+                Fact((osci_uuid, self.onto_namespace.partOf, osci_set_uuid))
+            ]
+        if channel_names is not None:
+            # all channels resolved with one query
+            self.instance_resolver.clear()
+            chan_ids = self.instance_resolver.resolve("Channel", channel_names)
+            for osci_uuid, chan_name in zip(osci_uuids, channel_names):
+                if len(chan_ids[chan_name]) > 0:
+                    fact_list.append(Fact((osci_uuid, self.onto_namespace.records, chan_ids[chan_name][0])))
+                else:
+                    logger.warning("Channel (%s) not part of the KG - no 'records' relation", chan_name)
+        self.extend_knowledge_graph(fact_list, bulk=True)
+        return osci_set_uuid, osci_uuids
+
     def extend_knowledge_graph_with_manual_inspection(
             self, prediction: bool, classification_reason: str, comp: str
     ) -> str:
@@ -239,7 +416,7 @@ class OntologyInstanceGenerator:
             fact_list.append(Fact((classification_reason, self.onto_namespace.ledTo, classification_uuid)))
         else:  # the reason is a classification instance (manual or osci)
             fact_list.append(Fact((classification_reason, self.onto_namespace.reasonFor, classification_uuid)))
-        self.fuseki_connection.extend_knowledge_graph(fact_list)
+        self.extend_knowledge_graph(fact_list)
         return classification_uuid
 
 
@@ -262,6 +439,10 @@ if __name__ == '__main__':
     sus_comp = "VTG-Abgasturbolader"
     manual_sus_comp = "Ladedruck-Magnetventil"
     test_osci_id = instance_gen.extend_knowledge_graph_with_oscillogram(oscillogram)
+    # set of parallel recorded oscillograms (one time series per channel) entered at once
+    parallel_rec_set_id, parallel_rec_osci_ids = instance_gen.extend_knowledge_graph_with_parallel_recording(
+        np.array([oscillogram, oscillogram[::-1]]), ["Plusleitung der Lambdasonde", "Masseleitung der Lambdasonde"]
+    )
     test_heatmap_id = instance_gen.extend_knowledge_graph_with_heatmap("GradCAM", test_heatmap)
     test_fault_path_id = instance_gen.extend_knowledge_graph_with_fault_path(fault_path, fault_cond_uuid)
 
@@ -0,0 +1,168 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# @author Tim Bohne
+
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Union
+
+from obd_ontology.config import QUERY_CACHE_MAX_ENTRIES, QUERY_CACHE_MAX_BYTES, QUERY_CACHE_TTL
+
+# whitespace outside of string literals (quoted strings are matched as a whole and kept as they are)
+WHITESPACE_OUTSIDE_LITERALS = re.compile(r'("(?:[^"\\]|\\.)*"|\'(?:[^\'\\]|\\.)*\')|\s+')
+
+
+class QueryCache:
+    """
+    Thread-safe LRU cache for query results, bounded by number of entries and (approximate) memory.
+    Entries optionally expire after a TTL. Cached results are shared between callers and must not be modified.
+    """
+
+    def __init__(
+            self, max_entries: int = QUERY_CACHE_MAX_ENTRIES, max_bytes: int = QUERY_CACHE_MAX_BYTES,
+            ttl: Union[float, None] = QUERY_CACHE_TTL
+    ) -> None:
+        """
+        Initializes the query cache.
+
+        :param max_entries: max number of cached query results
+        :param max_bytes: max accumulated size (bytes of the server responses) of the cached query results
+        :param ttl: seconds until a cached result expires (None: no expiry)
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        # normalized query -> (expiry timestamp, size, result)
+        self.entries = OrderedDict()
+        self.num_of_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # also serves as generation of the cache - results of queries started before an invalidation are not cached
+        self.invalidations = 0
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def normalize_query(query: str) -> str:
+        """
+        Normalizes the specified query text, i.e., collapses whitespace outside of string literals.
+
+        :param query: query to be normalized
+        :return: normalized query
+        """
+        return WHITESPACE_OUTSIDE_LITERALS.sub(lambda m: m.group(1) or " ", query).strip()
+
+    def get(self, query: str) -> Union[List[Dict], None]:
+        """
+        Returns the cached result for the specified query.
+
+        :param query: query to return cached result for
+        :return: cached result (None if not cached or expired)
+        """
+        key = self.normalize_query(query)
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None and entry[0] is not None and entry[0] < time.monotonic():
+                self.remove_entry(key)
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry[2]
+
+    def generation(self) -> int:
+        """
+        Returns the current generation of the cache, i.e., the number of invalidations so far. Has to be read before
+        the query is sent and passed to `put`.
+
+        :return: current generation
+        """
+        with self.lock:
+            return self.invalidations
+
+    def put(self, query: str, result: List[Dict], size: int, generation: int) -> None:
+        """
+        Caches the result for the specified query - unless the cache was invalidated since the query was started,
+        i.e., the result may not reflect a KG modification.
+
+        :param query: query to cache result for
+        :param result: query result
+        :param size: size (bytes) of the server response the result is parsed from
+        :param generation: generation of the cache (see `generation`) read before the query was sent
+        """
+        if size > self.max_bytes:
+            return
+        key = self.normalize_query(query)
+        expiry = None if self.ttl is None else time.monotonic() + self.ttl
+        with self.lock:
+            if generation != self.invalidations:
+                return
+            if key in self.entries:
+                self.remove_entry(key)
+            self.entries[key] = (expiry, size, result)
+            self.num_of_bytes += size
+            while len(self.entries) > self.max_entries or self.num_of_bytes > self.max_bytes:
+                self.remove_entry(next(iter(self.entries)))
+                self.evictions += 1
+
+    def remove_entry(self, key: str) -> None:
+        """
+        Removes the specified entry (lock has to be held).
+
+        :param key: normalized query of the entry to be removed
+        """
+        self.num_of_bytes -= self.entries.pop(key)[1]
+
+    def invalidate(self) -> None:
+        """
+        Invalidates all cached results (called whenever the KG is modified).
+        """
+        with self.lock:
+            self.entries.clear()
+            self.num_of_bytes = 0
+            self.invalidations += 1
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Returns the cache statistics.
+
+        :return: cache statistics (hits, misses, etc.)
+        """
+        with self.lock:
+            return {
+                "hits": self.hits, "misses": self.misses, "evictions": self.evictions,
+                "invalidations": self.invalidations, "entries": len(self.entries), "bytes": self.num_of_bytes
+            }
+
+
+_shared_caches: Dict[str, QueryCache] = {}
+_shared_caches_lock = threading.Lock()
+
+
+def get_shared_query_cache(kg_url: str) -> QueryCache:
+    """
+    Returns the query cache shared by all cached connections to the specified KG server (created on first use).
+
+    :param kg_url: URL of the server hosting the knowledge graph
+    :return: shared query cache
+    """
+    with _shared_caches_lock:
+        if kg_url not in _shared_caches:
+            _shared_caches[kg_url] = QueryCache()
+        return _shared_caches[kg_url]
+
+
+def invalidate_shared_query_cache(kg_url: str) -> None:
+    """
+    Invalidates the query cache for the specified KG server (if there is one).
+
+    :param kg_url: URL of the modified knowledge graph
+    """
+    with _shared_caches_lock:
+        cache = _shared_caches.get(kg_url)
+    if cache is not None:
+        cache.invalidate()
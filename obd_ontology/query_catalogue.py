@@ -0,0 +1,973 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# @author Tim Bohne
+
+from obd_ontology.sparql_template import SparqlTemplate
+
+# catalogue of the SPARQL queries of the KG query tool - each query is defined exactly once and prepared at import time,
+# the query tool (and everything built on top of it, e.g., the async query tool) only binds the parameters;
+# patterns with bound terms come first, since the query engines evaluate the patterns in the written order
+
+FAULT_CAUSES_BY_DTC = SparqlTemplate("""
+    SELECT ?cause_desc WHERE {
+        ?dtc :code $dtc .
+        ?dtc a :DTC .
+        ?dtc :represents ?condition .
+        ?cause a :FaultCause .
+        ?condition :hasCause ?cause .
+        ?cause :cause_description ?cause_desc .
+    }
+    """)
+
+FAULT_CONDITION_BY_DTC = SparqlTemplate("""
+    SELECT ?condition_desc WHERE {
+        ?dtc :code $dtc .
+        ?dtc a :DTC .
+        ?dtc :represents ?condition .
+        ?condition :condition_description ?condition_desc .
+    }
+    """)
+
+FAULT_CONDITION_BY_DESCRIPTION = SparqlTemplate("""
+    SELECT ?fc WHERE {
+        ?fc :condition_description $desc .
+        ?fc a :FaultCondition .
+    }
+    """)
+
+SYMPTOMS_BY_DTC = SparqlTemplate("""
+    SELECT ?symptom_desc WHERE {
+        ?dtc :code $dtc .
+        ?dtc a :DTC .
+        ?dtc :represents ?condition .
+        ?symptom a :Symptom .
+        ?condition :manifestedBy ?symptom .
+        ?symptom :symptom_description ?symptom_desc .
+    }
+    """)
+
+INDICATES_BY_DTC = SparqlTemplate("""
+    SELECT ?sub_name WHERE {
+        ?dtc :code $dtc .
+        ?dtc a :DTC .
+        ?dtc :indicates ?subsystem .
+        ?subsystem a :VehicleSubsystem .
+        ?subsystem :subsystem_name ?sub_name .
+    }
+    """)
+
+VEHICLE_PART_BY_SUBSYSTEM = SparqlTemplate("""
+    SELECT ?vehicle_part WHERE {
+        ?subsystem :subsystem_name $subsystem .
+        ?subsystem a :VehicleSubsystem .
+        ?subsystem :vehicle_part ?vehicle_part .
+    }
+    """)
+
+SYMPTOMS_BY_DESC = SparqlTemplate("""
+    SELECT ?symptom WHERE {
+        ?symptom :symptom_description $desc .
+        ?symptom a :Symptom .
+    }
+    """)
+
+FAULT_CAT_BY_DTC = SparqlTemplate("""
+    SELECT ?cat_desc WHERE {
+        ?dtc :code $dtc .
+        ?dtc a :DTC .
+        ?dtc :hasCategory ?cat .
+        ?cat a :FaultCategory .
+        ?cat :category_description ?cat_desc .
+    }
+    """)
+
+FAULT_CAT_BY_DESCRIPTION = SparqlTemplate("""
+    SELECT ?fc WHERE {
+        ?fc :category_description $desc .
+        ?fc a :FaultCategory .
+    }
+    """)
+
+SUSPECT_COMPONENTS_BY_DTC = SparqlTemplate("""
+    SELECT ?comp_name WHERE {
+        ?dtc :code $dtc .
+        ?dtc a :DTC .
+        ?comp a :SuspectComponent .
+        ?comp :component_name ?comp_name .
+        ?da a :DiagnosticAssociation .
+        ?da :pointsTo ?comp .
+        ?dtc :hasAssociation ?da .
+    }
+    """)
+
+SUSPECT_COMPONENTS_BY_SUBSYSTEM_NAME = SparqlTemplate("""
+    SELECT ?comp_name WHERE {
+        ?sub :subsystem_name $subsystem_name .
+        ?sub a :VehicleSubsystem .
+        ?sub :contains ?comp .
+        ?comp a :SuspectComponent .
+        ?comp :component_name ?comp_name .
+    }
+    """)
+
+SUSPECT_COMPONENT_BY_NAME = SparqlTemplate("""
+    SELECT ?comp WHERE {
+        ?comp :component_name $component_name .
+        ?comp a :SuspectComponent .
+    }
+    """)
+
+SUB_COMPONENT_BY_NAME = SparqlTemplate("""
+    SELECT ?sub_comp WHERE {
+        ?sub_comp :component_name $sub_component_name .
+        ?sub_comp a :SubComponent .
+    }
+    """)
+
+CHANNEL_BY_NAME = SparqlTemplate("""
+    SELECT ?chan WHERE {
+        ?chan :channel_name $chan_name .
+        ?chan a :Channel .
+    }
+    """)
+
+VEHICLE_SUBSYSTEM_BY_NAME = SparqlTemplate("""
+    SELECT ?subsystem WHERE {
+        ?subsystem :subsystem_name $subsystem_name .
+        ?subsystem a :VehicleSubsystem .
+    }
+    """)
+
+COMPONENT_SET_BY_NAME = SparqlTemplate("""
+    SELECT ?comp_set WHERE {
+        ?comp_set :set_name $set_name .
+        ?comp_set a :ComponentSet .
+    }
+    """)
+
+VEHICLE_INSTANCE_BY_VIN = SparqlTemplate("""
+    SELECT ?car WHERE {
+        ?car :VIN $vin .
+        ?car a :Vehicle .
+    }
+    """)
+
+CO_OCCURRING_TROUBLE_CODES = SparqlTemplate("""
+    SELECT ?other WHERE {
+        ?dtc :code $dtc .
+        ?dtc a :DTC .
+        ?dtc :occurs_with_DTC ?other .
+    }
+    """)
+
+VEHICLE_BY_DTC = SparqlTemplate("""
+    SELECT ?model ?hsn ?tsn ?vin WHERE {
+        ?dtc :code $dtc .
+        ?diag_log a :DiagLog .
+        ?dtc :appearsIn ?diag_log .
+        ?diag_log :createdFor ?vehicle .
+        ?fc a :FaultCondition .
+        ?vehicle a :Vehicle .
+        ?dtc :represents ?fc .
+        ?dtc a :DTC .
+        ?vehicle :HSN ?hsn .
+        ?vehicle :TSN ?tsn .
+        ?vehicle :VIN ?vin .
+        ?vehicle :model ?model .
+    }
+    """)
+
+ALL_DTC_INSTANCES = SparqlTemplate("""
+    SELECT ?dtc WHERE {
+        ?instance a :DTC .
+        ?instance :code ?dtc .
+    }
+    """)
+
+ALL_FAULT_CONDITION_INSTANCES = SparqlTemplate("""
+    SELECT ?desc WHERE {
+        ?instance a :FaultCondition .
+        ?instance :condition_description ?desc .
+    }
+    """)
+
+FAULT_CONDITION_INSTANCE_BY_CODE = SparqlTemplate("""
+    SELECT ?fault_cond WHERE {
+        ?dtc :code $dtc .
+        ?dtc a :DTC .
+        ?dtc :represents ?fault_cond .
+    }
+    """)
+
+FAULT_CONDITION_INSTANCES_BY_SYMPTOM = SparqlTemplate("""
+    SELECT ?fault_cond WHERE {
+        ?symptom :symptom_description $symptom .
+        ?fault_cond a :FaultCondition .
+        ?symptom a :Symptom .
+        ?fault_cond :manifestedBy ?symptom .
+    }
+    """)
+
+DTC_INSTANCE_BY_CODE = SparqlTemplate("""
+    SELECT ?dtc WHERE {
+        ?dtc :code $code .
+        ?dtc a :DTC .
+    }
+    """)
+
+DTCS_BY_SUSPECT_COMP_AND_VEHICLE_SUBSYSTEM = SparqlTemplate("""
+    SELECT ?code WHERE {
+        ?comp :component_name $comp .
+        ?sub :subsystem_name $subsystem .
+        ?dtc a :DTC .
+        ?dtc :code ?code .
+        ?diag_association a :DiagnosticAssociation .
+        ?dtc :hasAssociation ?diag_association .
+        ?comp a :SuspectComponent .
+        ?diag_association :pointsTo ?comp .
+        ?sub a :VehicleSubsystem .
+        ?dtc :indicates ?sub .
+    }
+    """)
+
+DIAG_ASSOCIATION_INSTANCE_BY_DTC_AND_SUS_COMP = SparqlTemplate("""
+    SELECT ?diag_association WHERE {
+        ?dtc :code $dtc .
+        ?sus :component_name $comp .
+        ?diag_association a :DiagnosticAssociation .
+        ?dtc a :DTC .
+        ?dtc :hasAssociation ?diag_association .
+        ?sus a :SuspectComponent .
+        ?diag_association :pointsTo ?sus .
+    }
+    """)
+
+PRIORITY_ID_BY_DTC_AND_SUS_COMP = SparqlTemplate("""
+    SELECT ?prio WHERE {
+        ?dtc :code $dtc .
+        ?sus :component_name $comp .
+        ?diag_association a :DiagnosticAssociation .
+        ?diag_association  :priority_id ?prio .
+        ?dtc a :DTC .
+        ?dtc :hasAssociation ?diag_association .
+        ?sus a :SuspectComponent .
+        ?diag_association :pointsTo ?sus .
+    }
+    """)
+
+DIAG_ASSOCIATION_BY_DTC_AND_SUS_COMP = SparqlTemplate("""
+    SELECT ?diag_association WHERE {
+        ?dtc :code $dtc .
+        ?sus :component_name $comp .
+        ?diag_association a :DiagnosticAssociation .
+        ?dtc a :DTC .
+        ?dtc :hasAssociation ?diag_association .
+        ?sus a :SuspectComponent .
+        ?diag_association :pointsTo ?sus .
+    }
+    """)
+
+GENERATED_HEATMAPS_BY_DTC_AND_SUS_COMP = SparqlTemplate("""
+    SELECT ?heatmap_entry WHERE {
+        ?dtc :code $dtc .
+        ?sus :component_name $comp .
+        ?diag_association a :DiagnosticAssociation .
+        ?diag_association :generated_heatmap ?heatmap_entry .
+        ?dtc a :DTC .
+        ?dtc :hasAssociation ?diag_association .
+        ?sus a :SuspectComponent .
+        ?diag_association :pointsTo ?sus .
+    }
+    """)
+
+DTCS_BY_VIN = SparqlTemplate("""
+    SELECT ?code WHERE {
+        ?vehicle :VIN $vin .
+        ?dtc a :DTC .
+        ?dtc :code ?code .
+        ?vehicle a :Vehicle .
+    }
+    """)
+
+DTCS_BY_MODEL = SparqlTemplate("""
+    SELECT ?code WHERE {
+        ?vehicle :model $model .
+        ?dtc a :DTC .
+        ?dtc :code ?code .
+        ?vehicle a :Vehicle .
+    }
+    """)
+
+OSCILLOSCOPE_USAGE_BY_SUSPECT_COMPONENT = SparqlTemplate("""
+    SELECT ?use_oscilloscope WHERE {
+        ?comp :component_name $component_name .
+        ?comp a :SuspectComponent .
+        ?comp :use_oscilloscope ?use_oscilloscope .
+    }
+    """)
+
+AFFECTED_BY_RELATIONS_BY_SUSPECT_COMPONENT = SparqlTemplate("""
+    SELECT ?affected_by WHERE {
+        ?comp :component_name $component_name .
+        ?comp a :SuspectComponent .
+        ?comp :affected_by ?affected_by .
+    }
+    """)
+
+VERIFIES_RELATION_BY_SUSPECT_COMPONENT = SparqlTemplate("""
+    SELECT ?set_name WHERE {
+        ?comp :component_name $component_name .
+        ?comp a :SuspectComponent .
+        ?set a :ComponentSet .
+        ?set :set_name ?set_name .
+        ?comp :verifies ?set .
+    }
+    """)
+
+SUB_COMPONENTS_BY_COMPONENT = SparqlTemplate("""
+    SELECT ?sub_comp_name WHERE {
+        ?comp :component_name $component_name .
+        ?comp a :SuspectComponent .
+        ?sub_comp a :SubComponent .
+        ?sub_comp :component_name ?sub_comp_name .
+        ?sub_comp :elementOf ?comp .
+    }
+    """)
+
+SUPER_COMPONENT = SparqlTemplate("""
+    SELECT ?comp_name WHERE {
+        ?sub_comp :component_name $sub_component .
+        ?sub_comp a :SubComponent .
+        ?comp a :SuspectComponent .
+        ?comp :component_name ?comp_name .
+        ?sub_comp :elementOf ?comp .
+    }
+    """)
+
+VERIFIES_RELATIONS_BY_COMPONENT_SET = SparqlTemplate("""
+    SELECT ?comp_name WHERE {
+        ?comp_set :set_name $set_name .
+        ?comp_set a :ComponentSet .
+        ?comp a :SuspectComponent .
+        ?comp :component_name ?comp_name .
+        ?comp :verifies ?comp_set .
+    }
+    """)
+
+CONTAINS_RELATION_BY_SUSPECT_COMPONENT = SparqlTemplate("""
+    SELECT ?sub_name WHERE {
+        ?comp :component_name $component_name .
+        ?comp a :SuspectComponent .
+        ?sub a :VehicleSubsystem .
+        ?sub :subsystem_name ?sub_name .
+        ?sub :contains ?comp .
+    }
+    """)
+
+CONTAINS_RELATION_BY_SUBSYSTEM = SparqlTemplate("""
+    SELECT ?comp_name WHERE {
+        ?sub :subsystem_name $subsystem_name .
+        ?sub a :VehicleSubsystem .
+        ?comp a :SuspectComponent .
+        ?comp :component_name ?comp_name .
+        ?sub :contains ?comp .
+    }
+    """)
+
+INCLUDES_RELATION_BY_COMPONENT_SET = SparqlTemplate("""
+    SELECT ?comp_name WHERE {
+        ?comp_set :set_name $comp_set_name .
+        ?comp_set a :ComponentSet .
+        ?comp a :SuspectComponent .
+        ?comp :component_name ?comp_name .
+        ?comp_set :includes ?comp .
+    }
+    """)
+
+CODE_TYPE_BY_DTC = SparqlTemplate("""
+    SELECT ?code_type WHERE {
+        ?dtc :code $dtc .
+        ?dtc a :DTC .
+        ?dtc :code_type ?code_type .
+    }
+    """)
+
+ALL_COMPONENT_INSTANCES = SparqlTemplate("""
+    SELECT ?name WHERE {
+        ?comp a :SuspectComponent .
+        ?comp :component_name ?name.
+    }
+    """)
+
+ALL_VEHICLE_INSTANCES = SparqlTemplate("""
+    SELECT ?vehicle ?hsn ?tsn ?vin ?model WHERE {
+        ?vehicle a :Vehicle .
+        ?vehicle :HSN ?hsn .
+        ?vehicle :TSN ?tsn .
+        ?vehicle :VIN ?vin .
+        ?vehicle :model ?model .
+    }
+    """)
+
+ALL_MODEL_INSTANCES = SparqlTemplate("""
+    SELECT ?model ?input_len ?exp_norm_meth ?measuring_instruction ?model_id ?archi WHERE {
+        ?model a :Model .
+        ?model :input_length ?input_len .
+        ?model :exp_normalization_method ?exp_norm_meth .
+        ?model :measuring_instruction ?measuring_instruction .
+        ?model :model_id ?model_id .
+        ?model :architecture ?archi .
+    }
+    """)
+
+ALL_CHANNEL_INSTANCES = SparqlTemplate("""
+    SELECT ?chan ?chan_name WHERE {
+        ?chan a :Channel .
+        ?chan :channel_name ?chan_name .
+    }
+    """)
+
+ALL_PARALLEL_REC_OSCILLOGRAM_SET_INSTANCES = SparqlTemplate("""
+    SELECT ?osci_set WHERE {
+        ?osci_set a :ParallelRecOscillogramSet .
+    }
+    """)
+
+ALL_RECORDED_OSCILLOGRAMS = SparqlTemplate("""
+    SELECT ?osci WHERE {
+        ?osci a :Oscillogram .
+    }
+    """)
+
+ALL_OSCILLOGRAM_CLASSIFICATIONS = SparqlTemplate("""
+    SELECT ?osci_classification WHERE {
+        ?osci_classification a :OscillogramClassification .
+    }
+    """)
+
+OSCILLOGRAM_CLASSIFICATION_BY_HEATMAP = SparqlTemplate("""
+    SELECT ?osci_classification WHERE {
+        $heatmap_id a :Heatmap .
+        ?osci_classification :produces $heatmap_id .
+        ?osci_classification a :OscillogramClassification .
+    }
+    """, instance_params=('heatmap_id',))
+
+ALL_MANUAL_INSPECTION_INSTANCES = SparqlTemplate("""
+    SELECT ?manual_inspection WHERE {
+        ?manual_inspection a :ManualInspection .
+    }
+    """)
+
+ALL_DIAG_LOG_INSTANCES = SparqlTemplate("""
+    SELECT ?diag_log WHERE {
+        ?diag_log a :DiagLog .
+    }
+    """)
+
+ALL_FAULT_PATH_INSTANCES = SparqlTemplate("""
+    SELECT ?fault_path WHERE {
+        ?fault_path a :FaultPath .
+    }
+    """)
+
+MODEL_ID_BY_OSCI_CLASSIFICATION_ID = SparqlTemplate("""
+    SELECT ?model_id WHERE {
+        $osci_classification_id a :OscillogramClassification .
+        $osci_classification_id :model_id ?model_id .
+    }
+    """, instance_params=('osci_classification_id',))
+
+RULE_BASED_MODEL_META_INFO_BY_COMPONENT = SparqlTemplate("""
+    SELECT ?norm ?id ?in_len WHERE {
+        ?model :architecture "rule-based" .
+        ?comp :component_name $component .
+        ?model a :Model .
+        ?model :exp_normalization_method ?norm .
+        ?model :model_id ?id .
+        ?model :input_length ?in_len .
+        ?comp a :SuspectComponent .
+        ?model :assesses ?comp .
+    }
+    """)
+
+XCM_MODEL_META_INFO_BY_COMPONENT = SparqlTemplate("""
+    SELECT ?norm ?id ?in_len WHERE {
+        ?model :architecture "XCM" .
+        ?comp :component_name $component .
+        ?model a :Model .
+        ?model :exp_normalization_method ?norm .
+        ?model :model_id ?id .
+        ?model :input_length ?in_len .
+        ?comp a :SuspectComponent .
+        ?model :assesses ?comp .
+    }
+    """)
+
+SUSPECT_COMPONENT_NAME_BY_ID = SparqlTemplate("""
+    SELECT ?comp_name WHERE {
+        $component_id a :SuspectComponent .
+        $component_id :component_name ?comp_name .
+    }
+    """, instance_params=('component_id',))
+
+UNCERTAINTY_BY_OSCI_CLASSIFICATION_ID = SparqlTemplate("""
+    SELECT ?uncertainty WHERE {
+        $osci_classification_id a :OscillogramClassification .
+        $osci_classification_id :uncertainty ?uncertainty .
+    }
+    """, instance_params=('osci_classification_id',))
+
+DATE_BY_DIAG_LOG = SparqlTemplate("""
+    SELECT ?date WHERE {
+        $diag_log_id a :DiagLog .
+        $diag_log_id :date ?date .
+    }
+    """, instance_params=('diag_log_id',))
+
+MAX_NUM_OF_PARALLEL_REC_BY_DIAG_LOG = SparqlTemplate("""
+    SELECT ?max_num_of_parallel_rec WHERE {
+        $diag_log_id a :DiagLog .
+        $diag_log_id :max_num_of_parallel_rec ?max_num_of_parallel_rec .
+    }
+    """, instance_params=('diag_log_id',))
+
+RESULTED_IN_BY_FAULT_PATH = SparqlTemplate("""
+    SELECT ?fault_cond WHERE {
+        $fault_path_id a :FaultPath .
+        ?fault_cond :resultedIn $fault_path_id .
+    }
+    """, instance_params=('fault_path_id',))
+
+DTCS_RECORDED_IN_VEHICLE = SparqlTemplate("""
+    SELECT ?code WHERE {
+        $vehicle_id a :Vehicle .
+        ?diag_log :createdFor $vehicle_id .
+        ?diag_log a :DiagLog .
+        ?dtc a :DTC .
+        ?dtc :appearsIn ?diag_log .
+        ?dtc :code ?code .
+    }
+    """, instance_params=('vehicle_id',))
+
+DTCS_BY_DIAG_LOG = SparqlTemplate("""
+    SELECT ?dtc WHERE {
+        $diag_log_id a :DiagLog .
+        ?dtc :appearsIn $diag_log_id .
+    }
+    """, instance_params=('diag_log_id',))
+
+DIAG_STEPS_BY_DIAG_LOG = SparqlTemplate("""
+    SELECT ?classification WHERE {
+        $diag_log_id a :DiagLog .
+        ?classification :diagStep $diag_log_id .
+    }
+    """, instance_params=('diag_log_id',))
+
+FAULT_PATH_BY_DIAG_LOG = SparqlTemplate("""
+    SELECT ?fault_path WHERE {
+        $diag_log_id a :DiagLog .
+        $diag_log_id :entails ?fault_path .
+    }
+    """, instance_params=('diag_log_id',))
+
+FAULT_PATH_DESCRIPTION_BY_ID = SparqlTemplate("""
+    SELECT ?path_desc WHERE {
+        $fault_path_id a :FaultPath .
+        $fault_path_id :path_description ?path_desc .
+    }
+    """, instance_params=('fault_path_id',))
+
+FAULT_CONDITION_DESCRIPTION_BY_ID = SparqlTemplate("""
+    SELECT ?cond_desc WHERE {
+        $fault_condition_id a :FaultCondition .
+        $fault_condition_id :condition_description ?cond_desc .
+    }
+    """, instance_params=('fault_condition_id',))
+
+VEHICLE_BY_DIAG_LOG = SparqlTemplate("""
+    SELECT ?vehicle WHERE {
+        $diag_log_id a :DiagLog .
+        $diag_log_id :createdFor ?vehicle .
+    }
+    """, instance_params=('diag_log_id',))
+
+TIME_SERIES_BY_OSCILLOGRAM_INSTANCE = SparqlTemplate("""
+    SELECT ?time_series WHERE {
+        $osci_id a :Oscillogram .
+        $osci_id :time_series ?time_series .
+    }
+    """, instance_params=('osci_id',))
+
+OSCILLOGRAMS_BY_PARALLEL_OSCI_SET = SparqlTemplate("""
+    SELECT ?oscillogram WHERE {
+        $osci_set_id a :ParallelRecOscillogramSet .
+        ?oscillogram :partOf $osci_set_id .
+    }
+    """, instance_params=('osci_set_id',))
+
+OSCILLOGRAM_BY_CLASSIFICATION_INSTANCE = SparqlTemplate("""
+    SELECT ?oscillogram WHERE {
+        $osci_classification_id a :OscillogramClassification .
+        $osci_classification_id :classifies ?oscillogram .
+    }
+    """, instance_params=('osci_classification_id',))
+
+SUSPECT_COMPONENT_BY_CLASSIFICATION = SparqlTemplate("""
+    SELECT ?comp WHERE {
+        $classification_id :checks ?comp .
+        { $classification_id a :OscillogramClassification . }
+        UNION
+        { $classification_id a :ManualInspection . }
+    }
+    """, instance_params=('classification_id',))
+
+SUSPECT_COMPONENT_NAME_BY_MODEL = SparqlTemplate("""
+    SELECT ?comp_name WHERE {
+        $model_id :assesses ?comp .
+        { $model_id a :Model . }
+        ?comp :component_name ?comp_name .
+    }
+    """, instance_params=('model_id',))
+
+INPUT_CHAN_REQ_BY_MODEL = SparqlTemplate("""
+    SELECT ?input_chan_req ?chan_idx WHERE {
+        $model_id :hasRequirement ?input_chan_req .
+        { $model_id a :Model . }
+        ?input_chan_req :channel_idx ?chan_idx .
+    }
+    """, instance_params=('model_id',))
+
+MODEL_BY_MODEL_ID = SparqlTemplate("""
+    SELECT ?model WHERE {
+        ?model :model_id $model_id .
+        { ?model a :Model . }
+    }
+    """)
+
+CHANNEL_BY_INPUT_REQ = SparqlTemplate("""
+    SELECT ?chan ?chan_name WHERE {
+        $input_req_id :expects ?chan .
+        { $input_req_id a :InputChannelRequirement . }
+        ?chan :channel_name ?chan_name .
+    }
+    """, instance_params=('input_req_id',))
+
+SUSPECT_COMPONENT_NAMES_BY_CHANNEL = SparqlTemplate("""
+    SELECT ?comp ?comp_name WHERE {
+        $channel_id a :Channel .
+        ?comp :hasChannel $channel_id .
+        ?comp :component_name ?comp_name .
+    }
+    """, instance_params=('channel_id',))
+
+MODELS_BY_CHANNEL = SparqlTemplate("""
+    SELECT ?model WHERE {
+        $channel_id a :Channel .
+        ?input_req :expects $channel_id .
+        ?model a :Model .
+        ?model :hasRequirement ?input_req .
+    }
+    """, instance_params=('channel_id',))
+
+SUSPECT_COMPONENTS_BY_CHANNEL = SparqlTemplate("""
+    SELECT ?comp ?comp_name WHERE {
+        $channel_id a :Channel .
+        ?comp :hasCOI $channel_id .
+        ?comp :component_name ?comp_name .
+    }
+    """, instance_params=('channel_id',))
+
+REASON_FOR_CLASSIFICATION = SparqlTemplate("""
+    SELECT ?reason_for WHERE {
+        $osci_classification_id a :OscillogramClassification .
+        ?reason_for :reasonFor $osci_classification_id .
+    }
+    """, instance_params=('osci_classification_id',))
+
+LED_TO_FOR_CLASSIFICATION = SparqlTemplate("""
+    SELECT ?led_to WHERE {
+        $osci_classification_id a :OscillogramClassification .
+        ?led_to :ledTo $osci_classification_id .
+    }
+    """, instance_params=('osci_classification_id',))
+
+REASON_FOR_INSPECTION = SparqlTemplate("""
+    SELECT ?reason_for WHERE {
+        $manual_inspection_id a :ManualInspection .
+        ?reason_for :reasonFor $manual_inspection_id .
+    }
+    """, instance_params=('manual_inspection_id',))
+
+LED_TO_FOR_INSPECTION = SparqlTemplate("""
+    SELECT ?led_to WHERE {
+        $manual_inspection_id a :ManualInspection .
+        ?led_to :ledTo $manual_inspection_id .
+    }
+    """, instance_params=('manual_inspection_id',))
+
+PREDICTION_BY_CLASSIFICATION = SparqlTemplate("""
+    SELECT ?pred WHERE {
+        $classification_id :prediction ?pred .
+        { $classification_id a :OscillogramClassification . }
+        UNION
+        { $classification_id a :ManualInspection . }
+    }
+    """, instance_params=('classification_id',))
+
+HEATMAP_BY_CLASSIFICATION_INSTANCE = SparqlTemplate("""
+    SELECT ?heatmap WHERE {
+        $osci_classification_id a :OscillogramClassification .
+        $osci_classification_id :produces ?heatmap .
+    }
+    """, instance_params=('osci_classification_id',))
+
+GENERATION_METHOD_BY_HEATMAP = SparqlTemplate("""
+    SELECT ?gen_method WHERE {
+        $heatmap_id a :Heatmap .
+        $heatmap_id :generation_method ?gen_method .
+    }
+    """, instance_params=('heatmap_id',))
+
+HEATMAP_STRING_BY_HEATMAP = SparqlTemplate("""
+    SELECT ?gen_heatmap WHERE {
+        $heatmap_id a :Heatmap .
+        $heatmap_id :generated_heatmap ?gen_heatmap .
+    }
+    """, instance_params=('heatmap_id',))
+
+ALL_SYMPTOM_INSTANCES = SparqlTemplate("""
+    SELECT ?desc WHERE {
+        ?symp a :Symptom .
+        ?symp :symptom_description ?desc.
+    }
+    """)
+
+ALL_VEHICLE_SUBSYSTEM_INSTANCES = SparqlTemplate("""
+    SELECT ?subsystem_name WHERE {
+        ?subsystem a :VehicleSubsystem .
+        ?subsystem :subsystem_name ?subsystem_name .
+    }
+    """)
+
+ALL_HEATMAP_INSTANCES = SparqlTemplate("""
+    SELECT ?heatmap WHERE {
+        ?heatmap a :Heatmap .
+    }
+    """)
+
+ALL_COMPONENT_SET_INSTANCES = SparqlTemplate("""
+    SELECT ?set_name WHERE {
+        ?comp_set a :ComponentSet .
+        ?comp_set :set_name ?set_name .
+    }
+    """)
+
+DTC_PROFILE_ATTRIBUTES = SparqlTemplate("""
+    SELECT ?dtc_code ?attr ?value ?model ?hsn ?tsn ?vin WHERE {
+        VALUES ?dtc_code { $codes }
+        ?dtc a :DTC .
+        ?dtc :code ?dtc_code .
+        { BIND("code" AS ?attr) }
+        UNION {
+            ?dtc :hasCategory ?cat .
+            ?cat a :FaultCategory .
+            ?cat :category_description ?value .
+            BIND("category" AS ?attr)
+        }
+        UNION {
+            ?dtc :code_type ?value .
+            BIND("code_type" AS ?attr)
+        }
+        UNION {
+            ?dtc :represents ?condition .
+            ?condition :condition_description ?value .
+            BIND("fault_condition" AS ?attr)
+        }
+        UNION {
+            ?dtc :occurs_with_DTC ?value .
+            BIND("occurs_with" AS ?attr)
+        }
+        UNION {
+            ?dtc :represents ?condition .
+            ?symptom a :Symptom .
+            ?condition :manifestedBy ?symptom .
+            ?symptom :symptom_description ?value .
+            BIND("symptom" AS ?attr)
+        }
+        UNION {
+            ?dtc :indicates ?subsystem .
+            ?subsystem a :VehicleSubsystem .
+            ?subsystem :subsystem_name ?value .
+            BIND("subsystem" AS ?attr)
+        }
+        UNION {
+            ?dtc :indicates ?subsystem .
+            ?subsystem a :VehicleSubsystem .
+            ?subsystem :vehicle_part ?value .
+            BIND("vehicle_part" AS ?attr)
+        }
+        UNION {
+            ?diag_log a :DiagLog .
+            ?dtc :appearsIn ?diag_log .
+            ?diag_log :createdFor ?vehicle .
+            ?fc a :FaultCondition .
+            ?vehicle a :Vehicle .
+            ?dtc :represents ?fc .
+            ?vehicle :HSN ?hsn .
+            ?vehicle :TSN ?tsn .
+            ?vehicle :VIN ?vin .
+            ?vehicle :model ?model .
+            BIND("vehicle" AS ?attr)
+        }
+    }
+    """)
+
+DTC_PROFILE_SUSPECT_COMPONENTS = SparqlTemplate("""
+    SELECT ?dtc_code ?comp_name ?prio ?attr ?value WHERE {
+        VALUES ?dtc_code { $codes }
+        ?dtc a :DTC .
+        ?dtc :code ?dtc_code .
+        ?dtc :hasAssociation ?da .
+        ?da a :DiagnosticAssociation .
+        ?da :priority_id ?prio .
+        ?da :pointsTo ?comp .
+        ?comp a :SuspectComponent .
+        ?comp :component_name ?comp_name .
+        { BIND("component" AS ?attr) }
+        UNION {
+            ?comp :use_oscilloscope ?value .
+            BIND("use_oscilloscope" AS ?attr)
+        }
+        UNION {
+            ?comp :affected_by ?value .
+            BIND("affected_by" AS ?attr)
+        }
+        UNION {
+            ?set a :ComponentSet .
+            ?set :set_name ?value .
+            ?comp :verifies ?set .
+            BIND("verifies" AS ?attr)
+        }
+        UNION {
+            ?sub a :VehicleSubsystem .
+            ?sub :subsystem_name ?value .
+            ?sub :contains ?comp .
+            BIND("contained_in" AS ?attr)
+        }
+    }
+    """)
+
+# bulk name -> instance / relation resolution (one `VALUES` query for a whole batch of names, cf. `InstanceResolver`)
+
+SUSPECT_COMPONENTS_BY_NAMES = SparqlTemplate("""
+    SELECT ?name ?value WHERE {
+        VALUES ?name { $names }
+        ?value :component_name ?name .
+        ?value a :SuspectComponent .
+    }
+    """)
+
+SUB_COMPONENTS_BY_NAMES = SparqlTemplate("""
+    SELECT ?name ?value WHERE {
+        VALUES ?name { $names }
+        ?value :component_name ?name .
+        ?value a :SubComponent .
+    }
+    """)
+
+CHANNELS_BY_NAMES = SparqlTemplate("""
+    SELECT ?name ?value WHERE {
+        VALUES ?name { $names }
+        ?value :channel_name ?name .
+        ?value a :Channel .
+    }
+    """)
+
+VEHICLE_SUBSYSTEMS_BY_NAMES = SparqlTemplate("""
+    SELECT ?name ?value WHERE {
+        VALUES ?name { $names }
+        ?value :subsystem_name ?name .
+        ?value a :VehicleSubsystem .
+    }
+    """)
+
+COMPONENT_SETS_BY_NAMES = SparqlTemplate("""
+    SELECT ?name ?value WHERE {
+        VALUES ?name { $names }
+        ?value :set_name ?name .
+        ?value a :ComponentSet .
+    }
+    """)
+
+SYMPTOMS_BY_DESCRIPTIONS = SparqlTemplate("""
+    SELECT ?name ?value WHERE {
+        VALUES ?name { $names }
+        ?value :symptom_description ?name .
+        ?value a :Symptom .
+    }
+    """)
+
+FAULT_CONDITIONS_BY_DESCRIPTIONS = SparqlTemplate("""
+    SELECT ?name ?value WHERE {
+        VALUES ?name { $names }
+        ?value :condition_description ?name .
+        ?value a :FaultCondition .
+    }
+    """)
+
+FAULT_CATS_BY_DESCRIPTIONS = SparqlTemplate("""
+    SELECT ?name ?value WHERE {
+        VALUES ?name { $names }
+        ?value :category_description ?name .
+        ?value a :FaultCategory .
+    }
+    """)
+
+DTCS_BY_CODES = SparqlTemplate("""
+    SELECT ?name ?value WHERE {
+        VALUES ?name { $names }
+        ?value :code ?name .
+        ?value a :DTC .
+    }
+    """)
+
+FAULT_CONDITIONS_BY_SYMPTOM_DESCRIPTIONS = SparqlTemplate("""
+    SELECT ?name ?value WHERE {
+        VALUES ?name { $names }
+        ?symptom :symptom_description ?name .
+        ?symptom a :Symptom .
+        ?value :manifestedBy ?symptom .
+        ?value a :FaultCondition .
+    }
+    """)
+
+ASSOCIATED_COMPONENT_NAMES_BY_CODES = SparqlTemplate("""
+    SELECT ?name ?value WHERE {
+        VALUES ?name { $names }
+        ?dtc :code ?name .
+        ?dtc a :DTC .
+        ?dtc :hasAssociation ?diag_association .
+        ?diag_association a :DiagnosticAssociation .
+        ?diag_association :priority_id ?prio .
+        ?diag_association :pointsTo ?comp .
+        ?comp a :SuspectComponent .
+        ?comp :component_name ?value .
+    }
+    """)
+
+CONTAINED_COMPONENT_NAMES_BY_SUBSYSTEM_NAMES = SparqlTemplate("""
+    SELECT ?name ?value WHERE {
+        VALUES ?name { $names }
+        ?sub :subsystem_name ?name .
+        ?sub a :VehicleSubsystem .
+        ?sub :contains ?comp .
+        ?comp a :SuspectComponent .
+        ?comp :component_name ?value .
+    }
+    """)
+
+# each template is named after its catalogue entry, e.g., "SYMPTOMS_BY_DTC" (query metrics, slow-query log)
+for _name, _template in list(globals().items()):
+    if isinstance(_template, SparqlTemplate):
+        _template.name = _name
@@ -0,0 +1,293 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# @author Tim Bohne
+
+import bisect
+import json
+import logging
+import sys
+import threading
+import time
+from collections import deque
+from typing import Any, Dict, List, Union
+
+from obd_ontology.config import SLOW_QUERY_THRESHOLD, SLOW_QUERY_LOG_SIZE, SLOW_QUERY_LOG_FILE
+from obd_ontology.log import get_logger
+
+slow_query_logger = get_logger("obd_ontology.slow_queries")
+
+# name under which queries that are not bound from a (named) template are recorded
+UNNAMED_QUERY = "unnamed"
+# cache status of a query: served from the query cache, not cached yet, or sent by a connection without cache
+CACHE_STATUSES = ("hit", "miss", "uncached")
+# upper bounds (seconds) of the wall time histogram buckets (Prometheus export)
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+PROMETHEUS_PREFIX = "obd_ontology_query"
+
+
+def configure_slow_query_logging(path: Union[str, None] = SLOW_QUERY_LOG_FILE) -> logging.Logger:
+    """
+    Configures the slow-query logger - it has its own handler (stderr or file) and does not propagate to the package
+    logger, i.e., query parameters and SPARQL never end up in the console output of the package.
+
+    :param path: file the slow queries are appended to (None: stderr)
+    :return: slow-query logger
+    """
+    for handler in list(slow_query_logger.handlers):
+        slow_query_logger.removeHandler(handler)
+        handler.close()
+    handler = logging.StreamHandler(sys.stderr) if path is None else logging.FileHandler(path, encoding="utf-8")
+    handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+    slow_query_logger.addHandler(handler)
+    slow_query_logger.setLevel(logging.WARNING)
+    slow_query_logger.propagate = False
+    return slow_query_logger
+
+
+class QueryMetrics:
+    """
+    Accumulated measurements of one named query.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes the (empty) query metrics.
+        """
+        self.count = 0
+        self.errors = 0
+        self.slow = 0
+        self.cache = {status: 0 for status in CACHE_STATUSES}
+        self.wall_seconds = 0.0
+        self.max_wall_seconds = 0.0
+        self.server_seconds = 0.0
+        self.max_server_seconds = 0.0
+        self.num_of_bytes = 0
+        self.num_of_rows = 0
+        # number of queries per wall time bucket (last bucket: > max bound)
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+
+    def add(
+            self, wall_seconds: float, server_seconds: float, num_of_bytes: int, num_of_rows: int, cache_status: str,
+            error: bool
+    ) -> None:
+        """
+        Adds the measurements of one query execution.
+
+        :param wall_seconds: duration of the query call (incl. cache lookup and result parsing)
+        :param server_seconds: duration of the server round trip (0 for cache hits)
+        :param num_of_bytes: size of the server response (0 for cache hits)
+        :param num_of_rows: number of result rows
+        :param cache_status: "hit" | "miss" | "uncached"
+        :param error: whether the server responded with an error status
+        """
+        self.count += 1
+        self.errors += error
+        self.cache[cache_status] += 1
+        self.wall_seconds += wall_seconds
+        self.max_wall_seconds = max(self.max_wall_seconds, wall_seconds)
+        self.server_seconds += server_seconds
+        self.max_server_seconds = max(self.max_server_seconds, server_seconds)
+        self.num_of_bytes += num_of_bytes
+        self.num_of_rows += num_of_rows
+        self.buckets[bisect.bisect_left(LATENCY_BUCKETS, wall_seconds)] += 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Returns the query metrics as dictionary.
+
+        :return: query metrics
+        """
+        return {
+            "count": self.count, "errors": self.errors, "slow": self.slow, "cache": dict(self.cache),
+            "wall_seconds": self.wall_seconds, "mean_wall_seconds": self.wall_seconds / self.count,
+            "max_wall_seconds": self.max_wall_seconds, "server_seconds": self.server_seconds,
+            "max_server_seconds": self.max_server_seconds, "bytes": self.num_of_bytes, "rows": self.num_of_rows
+        }
+
+
+class QueryMetricsRegistry:
+    """
+    Thread-safe in-process registry of the query measurements (per named query) recorded by the connection
+    controllers, exportable as JSON or Prometheus text.
+
+    Queries exceeding the slow-query threshold are logged (WARNING, logger "obd_ontology.slow_queries", see
+    `configure_slow_query_logging`) with their name, parameters and SPARQL - the most recent ones are additionally kept in memory (`slow_queries`).
+    """
+
+    def __init__(
+            self, slow_query_threshold: Union[float, None] = SLOW_QUERY_THRESHOLD,
+            slow_query_log_size: int = SLOW_QUERY_LOG_SIZE
+    ) -> None:
+        """
+        Initializes the query metrics registry.
+
+        :param slow_query_threshold: wall time (seconds) above which queries are logged as slow (None: no logging)
+        :param slow_query_log_size: number of most recent slow queries kept in memory
+        """
+        self.slow_query_threshold = slow_query_threshold
+        self.metrics: Dict[str, QueryMetrics] = {}
+        self.slow_queries = deque(maxlen=slow_query_log_size)
+        self.lock = threading.Lock()
+
+    def record(
+            self, name: Union[str, None], params: Union[Dict[str, Any], None], query: str, wall_seconds: float,
+            server_seconds: float, num_of_bytes: int, num_of_rows: int, cache_status: str, error: bool = False
+    ) -> None:
+        """
+        Records the measurements of one query execution.
+
+        :param name: name of the query (None: unnamed query)
+        :param params: parameter values the query was bound to
+        :param query: SPARQL query
+        :param wall_seconds: duration of the query call (incl. cache lookup and result parsing)
+        :param server_seconds: duration of the server round trip (0 for cache hits)
+        :param num_of_bytes: size of the server response (0 for cache hits)
+        :param num_of_rows: number of result rows
+        :param cache_status: "hit" | "miss" | "uncached"
+        :param error: whether the server responded with an error status
+        """
+        name = UNNAMED_QUERY if name is None else name
+        slow = self.slow_query_threshold is not None and wall_seconds > self.slow_query_threshold
+        with self.lock:
+            metrics = self.metrics.get(name)
+            if metrics is None:
+                metrics = self.metrics[name] = QueryMetrics()
+            metrics.add(wall_seconds, server_seconds, num_of_bytes, num_of_rows, cache_status, error)
+            if slow:
+                metrics.slow += 1
+                self.slow_queries.append({
+                    "query": name, "params": params, "sparql": query, "wall_seconds": wall_seconds,
+                    "server_seconds": server_seconds, "rows": num_of_rows, "cache": cache_status, "time": time.time()
+                })
+        if slow:
+            slow_query_logger.warning(
+                "slow query: %s - %.3f s (server: %.3f s, %d rows) - params: %s\n%s", name, wall_seconds,
+                server_seconds, num_of_rows, params, query
+            )
+
+    def reset(self) -> None:
+        """
+        Discards all recorded measurements and slow queries.
+        """
+        with self.lock:
+            self.metrics.clear()
+            self.slow_queries.clear()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Returns the current metrics of all queries (sorted by accumulated wall time) and the recent slow queries.
+
+        :return: query name -> metrics, slow queries
+        """
+        with self.lock:
+            queries = {name: metrics.to_dict() for name, metrics in self.metrics.items()}
+            slow_queries = list(self.slow_queries)
+        return {
+            "queries": dict(sorted(queries.items(), key=lambda item: item[1]["wall_seconds"], reverse=True)),
+            "slow_query_threshold": self.slow_query_threshold,
+            "slow_queries": slow_queries
+        }
+
+    def to_json(self, indent: Union[int, None] = None) -> str:
+        """
+        Returns the current metrics as JSON document.
+
+        :param indent: indentation of the JSON document (None: compact)
+        :return: JSON document
+        """
+        return json.dumps(self.snapshot(), indent=indent, default=str)
+
+    def to_prometheus(self) -> str:
+        """
+        Returns the current metrics in the Prometheus text exposition format.
+
+        :return: metrics in Prometheus text format
+        """
+        with self.lock:
+            metrics = sorted(self.metrics.items())
+            lines = []
+            self.add_prometheus_metric(lines, "total", "counter", "number of queries", [
+                (self.labels(name, cache=status), m.cache[status]) for name, m in metrics for status in CACHE_STATUSES
+            ])
+            self.add_prometheus_metric(lines, "errors_total", "counter", "number of queries with error status", [
+                (self.labels(name), m.errors) for name, m in metrics
+            ])
+            self.add_prometheus_metric(lines, "slow_total", "counter", "number of slow queries", [
+                (self.labels(name), m.slow) for name, m in metrics
+            ])
+            lines.append("# HELP " + PROMETHEUS_PREFIX + "_wall_seconds wall time of the query calls")
+            lines.append("# TYPE " + PROMETHEUS_PREFIX + "_wall_seconds histogram")
+            for name, m in metrics:
+                cumulative = 0
+                for bound, count in zip(LATENCY_BUCKETS + ("+Inf",), m.buckets):
+                    cumulative += count
+                    lines.append(
+                        PROMETHEUS_PREFIX + "_wall_seconds_bucket" + self.labels(name, le=str(bound)) + " "
+                        + str(cumulative)
+                    )
+                lines.append(PROMETHEUS_PREFIX + "_wall_seconds_sum" + self.labels(name) + " " + repr(m.wall_seconds))
+                lines.append(PROMETHEUS_PREFIX + "_wall_seconds_count" + self.labels(name) + " " + str(m.count))
+            self.add_prometheus_metric(lines, "server_seconds_total", "counter", "server round trip time", [
+                (self.labels(name), m.server_seconds) for name, m in metrics
+            ])
+            self.add_prometheus_metric(lines, "bytes_total", "counter", "size of the server responses", [
+                (self.labels(name), m.num_of_bytes) for name, m in metrics
+            ])
+            self.add_prometheus_metric(lines, "rows_total", "counter", "number of result rows", [
+                (self.labels(name), m.num_of_rows) for name, m in metrics
+            ])
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def add_prometheus_metric(lines: List[str], metric: str, metric_type: str, description: str, samples: List) -> None:
+        """
+        Adds the specified metric (help, type and samples) to the lines of the Prometheus export.
+
+        :param lines: lines of the Prometheus export
+        :param metric: name of the metric (without prefix)
+        :param metric_type: Prometheus metric type, e.g., "counter"
+        :param description: description of the metric
+        :param samples: (labels, value) for each sample
+        """
+        lines.append("# HELP " + PROMETHEUS_PREFIX + "_" + metric + " " + description)
+        lines.append("# TYPE " + PROMETHEUS_PREFIX + "_" + metric + " " + metric_type)
+        lines.extend(PROMETHEUS_PREFIX + "_" + metric + labels + " " + repr(value) for labels, value in samples)
+
+    @staticmethod
+    def labels(name: str, **labels: str) -> str:
+        """
+        Returns the Prometheus label set for the specified query (label values escaped).
+
+        :param name: name of the query
+        :param labels: additional labels
+        :return: label set, e.g., '{query="SYMPTOMS_BY_DTC",cache="hit"}'
+        """
+        labels = {"query": name, **labels}
+        return "{" + ",".join(
+            key + '="' + value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") + '"'
+            for key, value in labels.items()
+        ) + "}"
+
+
+_registry = QueryMetricsRegistry()
+
+
+def get_query_metrics_registry() -> QueryMetricsRegistry:
+    """
+    Returns the query metrics registry shared by all connection controllers of the process.
+
+    :return: shared query metrics registry
+    """
+    return _registry
+
+
+configure_slow_query_logging()
+
+
+if __name__ == '__main__':
+    registry = QueryMetricsRegistry(slow_query_threshold=0.5)
+    registry.record("SYMPTOMS_BY_DTC", {"dtc": "P0172"}, "SELECT ...", 0.012, 0.010, 512, 3, "miss")
+    registry.record("SYMPTOMS_BY_DTC", {"dtc": "P0172"}, "SELECT ...", 0.0001, 0.0, 0, 3, "hit")
+    registry.record("ALL_DTC_INSTANCES", {}, "SELECT ...", 0.8, 0.75, 4096, 120, "uncached")
+    print(registry.to_json(indent=2))
+    print(registry.to_prometheus())
@@ -0,0 +1,461 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# @author Tim Bohne
+
+import argparse
+import json
+import os
+import sys
+import time
+from typing import Any, Callable, Dict, Iterator, List, TextIO, Tuple, Union
+
+from obd_ontology.array_codec import TruncatedArrayError
+from obd_ontology.blob_store import load_array
+from obd_ontology.config import FUSEKI_URL, SNAPSHOT_WORKERS
+from obd_ontology.dtc_profile import DTCProfile
+from obd_ontology.knowledge_graph_index import IndexedQueryTool
+from obd_ontology.knowledge_graph_query_tool import KnowledgeGraphQueryTool
+from obd_ontology.knowledge_snapshot import KnowledgeSnapshotRunner
+from obd_ontology.log import get_logger
+
+logger = get_logger(__name__)
+
+# file extensions of the columnar formats (one file per perspective)
+COLUMNAR_FORMATS = {"parquet": ".parquet", "arrow": ".arrow"}
+# number of (decoded) values exported per time series
+TIME_SERIES_EXCERPT_LENGTH = 50
+
+
+def first(values: List[Any]) -> Any:
+    """
+    Returns the first of the specified (single-valued attribute) values.
+
+    :param values: values of the attribute
+    :return: first value or None if there are no values
+    """
+    return values[0] if len(values) > 0 else None
+
+
+def local_name(iri: Union[str, None]) -> Union[str, None]:
+    """
+    Returns the local name (ID) of the specified instance.
+
+    :param iri: IRI of the instance (or None)
+    :return: local name (or None)
+    """
+    return None if iri is None else iri.split("#")[1]
+
+
+def dtc_record(qt: Any, profile: DTCProfile) -> Dict[str, Any]:
+    return {
+        "code": profile.code, "occurs_with": profile.occurs_with, "category": profile.category,
+        "code_type": profile.code_type, "fault_condition": profile.fault_condition,
+        "vehicles": [{"model": model, "hsn": hsn, "tsn": tsn, "vin": vin} for model, hsn, tsn, vin in profile.vehicles],
+        "symptoms": profile.symptoms, "subsystem": profile.subsystem, "vehicle_parts": profile.vehicle_parts,
+        "suspect_components": [
+            {
+                "name": comp.name, "priority": comp.priority, "use_oscilloscope": comp.use_oscilloscope,
+                "affected_by": comp.affected_by, "verifies": comp.verifies, "contained_in": comp.contained_in
+            }
+            for comp in profile.suspect_components
+        ]
+    }
+
+
+def subsystem_record(qt: Any, subsystem: str) -> Dict[str, Any]:
+    return {
+        "name": subsystem, "contains": qt.query_contains_relation_by_subsystem(subsystem, False),
+        "vehicle_parts": qt.query_vehicle_part_by_subsystem(subsystem, False)
+    }
+
+
+def component_record(qt: Any, comp: str) -> Dict[str, Any]:
+    return {
+        "name": comp, "use_oscilloscope": first(qt.query_oscilloscope_usage_by_suspect_component(comp, False)),
+        "affected_by": qt.query_affected_by_relations_by_suspect_component(comp, False),
+        "verifies": qt.query_verifies_relation_by_suspect_component(comp, False),
+        "sub_components": qt.query_sub_components_by_component(comp, False)
+    }
+
+
+def component_set_record(qt: Any, comp_set: str) -> Dict[str, Any]:
+    return {
+        "name": comp_set, "verified_by": qt.query_verifies_relations_by_component_set(comp_set, False),
+        "includes": qt.query_includes_relation_by_component_set(comp_set, False)
+    }
+
+
+def model_record(qt: Any, model: Tuple[str, str, str, str, str, str]) -> Dict[str, Any]:
+    model_instance, input_len, exp_norm_meth, measuring_instruction, model_id, architecture = model
+    model_uuid = local_name(model_instance)
+    requirements = []
+    for input_chan_req_instance, chan_idx in qt.query_input_chan_req_by_model(model_uuid, False):
+        input_chan_req_uuid = local_name(input_chan_req_instance)
+        chan_instance, chan_name = first(qt.query_channel_by_input_req(input_chan_req_uuid, False)) or (None, None)
+        chan_uuid = local_name(chan_instance)
+        requirements.append({
+            "id": input_chan_req_uuid, "channel_idx": chan_idx, "channel": chan_uuid, "channel_name": chan_name,
+            "has_channel": [] if chan_uuid is None else [
+                {"id": local_name(comp), "name": name}
+                for comp, name in qt.query_suspect_component_names_by_channel(chan_uuid, False)
+            ],
+            "has_coi": [] if chan_uuid is None else [
+                {"id": local_name(comp), "name": name}
+                for comp, name in qt.query_suspect_components_by_channel(chan_uuid, False)
+            ]
+        })
+    return {
+        "id": model_uuid, "input_length": input_len, "exp_normalization_method": exp_norm_meth,
+        "measuring_instruction": measuring_instruction, "model_id": model_id, "architecture": architecture,
+        "assesses": first(qt.query_suspect_component_name_by_model(model_uuid, False)), "requirements": requirements
+    }
+
+
+def channel_record(qt: Any, channel: Tuple[str, str]) -> Dict[str, Any]:
+    chan_instance, chan_name = channel
+    chan_uuid = local_name(chan_instance)
+    return {
+        "id": chan_uuid, "name": chan_name,
+        "models": [local_name(model) for model in qt.query_models_by_channel(chan_uuid, False)],
+        "components": [name for _, name in qt.query_suspect_component_names_by_channel(chan_uuid, False)],
+        "cois": [name for _, name in qt.query_suspect_components_by_channel(chan_uuid, False)]
+    }
+
+
+def parallel_osci_record(qt: Any, osci_set: str) -> Dict[str, Any]:
+    osci_set_id = local_name(osci_set)
+    return {
+        "id": osci_set_id,
+        "oscillograms": [local_name(osci) for osci in qt.query_oscillograms_by_parallel_osci_set(osci_set_id, False)]
+    }
+
+
+def oscillogram_record(qt: Any, osci: str) -> Dict[str, Any]:
+    osci_id = local_name(osci)
+    time_series = first(qt.query_time_series_by_oscillogram_instance(osci_id, False))
+    excerpt = None
+    if time_series is not None:
+        # decoded, i.e., independent of the array encoding (text, binary, blob reference)
+        try:
+            excerpt = load_array(time_series, qt.blob_store)[:TIME_SERIES_EXCERPT_LENGTH].tolist()
+        except TruncatedArrayError as e:
+            logger.warning("no time series excerpt for %s - %s", osci_id, e)
+    return {"id": osci_id, "time_series_excerpt": excerpt}
+
+
+def reason_for(qt: Any, classification_id: str, inspection: bool) -> Union[str, None]:
+    """
+    Returns the diagnostic entity (e.g., DTC, previous classification) the specified classification / inspection was
+    performed for.
+
+    :param qt: query tool
+    :param classification_id: ID of the oscillogram classification / manual inspection
+    :param inspection: whether it is a manual inspection
+    :return: ID of the entity the classification was performed for (None if not available)
+    """
+    if inspection:
+        reason = qt.query_reason_for_inspection(classification_id, False)
+        return local_name(first(reason or qt.query_led_to_for_inspection(classification_id, False)))
+    reason = qt.query_reason_for_classification(classification_id, False)
+    return local_name(first(reason or qt.query_led_to_for_classification(classification_id, False)))
+
+
+def oscillogram_classification_record(qt: Any, osci_classification: str) -> Dict[str, Any]:
+    classification_id = local_name(osci_classification)
+    heatmap_id = local_name(first(qt.query_heatmap_by_classification_instance(classification_id, False)))
+    return {
+        "id": classification_id,
+        "model_id": first(qt.query_model_id_by_osci_classification_id(classification_id, False)),
+        "uncertainty": first(qt.query_uncertainty_by_osci_classification_id(classification_id, False)),
+        "classifies": local_name(first(qt.query_oscillogram_by_classification_instance(classification_id, False))),
+        "heatmap": heatmap_id,
+        "heatmap_generation_method": None if heatmap_id is None else first(
+            qt.query_generation_method_by_heatmap(heatmap_id, False)
+        ),
+        "generated_heatmap": None if heatmap_id is None else first(
+            qt.query_heatmap_string_by_heatmap(heatmap_id, False)
+        ),
+        "checks": local_name(first(qt.query_suspect_component_by_classification(classification_id, False))),
+        "reason_for": reason_for(qt, classification_id, False),
+        "prediction": first(qt.query_prediction_by_classification(classification_id, False))
+    }
+
+
+def manual_inspection_record(qt: Any, manual_inspection: str) -> Dict[str, Any]:
+    inspection_id = local_name(manual_inspection)
+    return {
+        "id": inspection_id,
+        "checks": local_name(first(qt.query_suspect_component_by_classification(inspection_id, False))),
+        "reason_for": reason_for(qt, inspection_id, True),
+        "prediction": first(qt.query_prediction_by_classification(inspection_id, False))
+    }
+
+
+def diag_log_record(qt: Any, diag_log: str) -> Dict[str, Any]:
+    diag_log_id = local_name(diag_log)
+    return {
+        "id": diag_log_id, "date": first(qt.query_date_by_diag_log(diag_log_id, False)),
+        "max_num_of_parallel_rec": first(qt.query_max_num_of_parallel_rec_by_diag_log(diag_log_id, False)),
+        "dtcs": [local_name(dtc) for dtc in qt.query_dtcs_by_diag_log(diag_log_id, False)],
+        "fault_path": local_name(first(qt.query_fault_path_by_diag_log(diag_log_id, False))),
+        "vehicle": local_name(first(qt.query_vehicle_by_diag_log(diag_log_id, False))),
+        "diag_steps": [local_name(step) for step in qt.query_diag_steps_by_diag_log(diag_log_id, False)]
+    }
+
+
+def fault_path_record(qt: Any, fault_path: str) -> Dict[str, Any]:
+    fault_path_id = local_name(fault_path)
+    return {
+        "id": fault_path_id, "description": first(qt.query_fault_path_description_by_id(fault_path_id, False)),
+        "fault_conditions": [
+            first(qt.query_fault_condition_description_by_id(local_name(fc), False))
+            for fc in qt.query_resulted_in_by_fault_path(fault_path_id, False)
+        ]
+    }
+
+
+def vehicle_record(qt: Any, vehicle: Tuple[str, str, str, str, str]) -> Dict[str, Any]:
+    vehicle_instance, hsn, tsn, vin, model = vehicle
+    vehicle_id = local_name(vehicle_instance)
+    return {
+        "id": vehicle_id, "hsn": hsn, "tsn": tsn, "vin": vin, "model": model,
+        "dtcs": qt.query_dtcs_recorded_in_vehicle(vehicle_id, False)
+    }
+
+
+# perspectives in snapshot order - entity listing and record builder (one record per entity), cf. the
+# `knowledge_snapshot_*_perspective` functions
+EXPERT_RECORDS = {
+    "dtc": (lambda qt: qt.query_dtc_profiles(verbose=False), dtc_record),
+    "subsystem": (lambda qt: qt.query_all_vehicle_subsystem_instances(False), subsystem_record),
+    "component": (lambda qt: qt.query_all_component_instances(False), component_record),
+    "component_set": (lambda qt: qt.query_all_component_set_instances(False), component_set_record),
+    "model": (lambda qt: qt.query_all_model_instances(False), model_record),
+    "channel": (lambda qt: qt.query_all_channel_instances(False), channel_record)
+}
+DIAG_RECORDS = {
+    "parallel_osci": (lambda qt: qt.query_all_parallel_rec_oscillogram_set_instances(False), parallel_osci_record),
+    "oscillogram": (lambda qt: qt.query_all_recorded_oscillograms(False), oscillogram_record),
+    "oscillogram_classification": (
+        lambda qt: qt.query_all_oscillogram_classifications(False), oscillogram_classification_record
+    ),
+    "manual_inspection": (lambda qt: qt.query_all_manual_inspection_instances(False), manual_inspection_record),
+    "diag_log": (lambda qt: qt.query_all_diag_log_instances(False), diag_log_record),
+    "fault_path": (lambda qt: qt.query_all_fault_path_instances(False), fault_path_record),
+    "vehicle": (lambda qt: qt.query_all_vehicle_instances(False), vehicle_record)
+}
+RECORDS = {**EXPERT_RECORDS, **DIAG_RECORDS}
+PERSPECTIVE_GROUPS = {"expert": list(EXPERT_RECORDS), "diag": list(DIAG_RECORDS), "all": list(RECORDS)}
+
+
+def arrow_schema(perspective: str) -> Any:
+    """
+    Returns the Arrow schema of the records of the specified perspective (columns in record order).
+
+    :param perspective: name of the perspective, e.g., "dtc"
+    :return: `pyarrow.Schema`
+    """
+    pa = import_pyarrow()
+    text = pa.string()
+    texts = pa.list_(text)
+    component_refs = pa.list_(pa.struct([("id", text), ("name", text)]))
+    fields = {
+        "dtc": [
+            ("code", text), ("occurs_with", texts), ("category", text), ("code_type", text),
+            ("fault_condition", text),
+            ("vehicles", pa.list_(pa.struct([("model", text), ("hsn", text), ("tsn", text), ("vin", text)]))),
+            ("symptoms", texts), ("subsystem", text), ("vehicle_parts", texts),
+            ("suspect_components", pa.list_(pa.struct([
+                ("name", text), ("priority", pa.int64()), ("use_oscilloscope", pa.bool_()), ("affected_by", texts),
+                ("verifies", texts), ("contained_in", texts)
+            ])))
+        ],
+        "subsystem": [("name", text), ("contains", texts), ("vehicle_parts", texts)],
+        "component": [
+            ("name", text), ("use_oscilloscope", pa.bool_()), ("affected_by", texts), ("verifies", texts),
+            ("sub_components", texts)
+        ],
+        "component_set": [("name", text), ("verified_by", texts), ("includes", texts)],
+        "model": [
+            ("id", text), ("input_length", text), ("exp_normalization_method", text), ("measuring_instruction", text),
+            ("model_id", text), ("architecture", text), ("assesses", text),
+            ("requirements", pa.list_(pa.struct([
+                ("id", text), ("channel_idx", text), ("channel", text), ("channel_name", text),
+                ("has_channel", component_refs), ("has_coi", component_refs)
+            ])))
+        ],
+        "channel": [("id", text), ("name", text), ("models", texts), ("components", texts), ("cois", texts)],
+        "parallel_osci": [("id", text), ("oscillograms", texts)],
+        "oscillogram": [("id", text), ("time_series_excerpt", pa.list_(pa.float64()))],
+        "oscillogram_classification": [
+            ("id", text), ("model_id", text), ("uncertainty", text), ("classifies", text), ("heatmap", text),
+            ("heatmap_generation_method", text), ("generated_heatmap", text), ("checks", text), ("reason_for", text),
+            ("prediction", text)
+        ],
+        "manual_inspection": [("id", text), ("checks", text), ("reason_for", text), ("prediction", text)],
+        "diag_log": [
+            ("id", text), ("date", text), ("max_num_of_parallel_rec", text), ("dtcs", texts), ("fault_path", text),
+            ("vehicle", text), ("diag_steps", texts)
+        ],
+        "fault_path": [("id", text), ("description", text), ("fault_conditions", texts)],
+        "vehicle": [("id", text), ("hsn", text), ("tsn", text), ("vin", text), ("model", text), ("dtcs", texts)]
+    }
+    return pa.schema(fields[perspective])
+
+
+def import_pyarrow() -> Any:
+    """
+    Imports the optional `pyarrow` package (required for the columnar export).
+
+    :return: `pyarrow` module
+    """
+    try:
+        import pyarrow
+        return pyarrow
+    except ImportError:
+        raise RuntimeError("the columnar snapshot export (Parquet / Arrow) requires the optional pyarrow package")
+
+
+class SnapshotExporter:
+    """
+    Machine-readable knowledge snapshot - one record (dictionary of plain values) per entity instead of colored
+    text, exported as JSON Lines (streamed, one object per entity as soon as it is assembled) or as one columnar file
+    (Parquet / Arrow IPC) per perspective.
+    """
+
+    def __init__(self, qt: Any, workers: int = SNAPSHOT_WORKERS) -> None:
+        """
+        Initializes the snapshot exporter.
+
+        :param qt: query tool (`IndexedQueryTool` or `KnowledgeGraphQueryTool`)
+        :param workers: max number of records assembled concurrently (1: sequential)
+        """
+        self.qt = qt
+        self.workers = workers
+
+    def records(self, perspective: str, runner: Union[KnowledgeSnapshotRunner, None] = None) -> Iterator[Dict]:
+        """
+        Assembles the records of the entities of the specified perspective (in snapshot order).
+
+        :param perspective: name of the perspective, e.g., "dtc"
+        :param runner: snapshot runner to assemble the records concurrently (None: sequentially)
+        :return: records
+        """
+        if perspective not in RECORDS:
+            raise ValueError("unknown perspective: " + perspective)
+        list_entities, build_record = RECORDS[perspective]
+        entities = list_entities(self.qt)
+        if runner is None:
+            return (build_record(self.qt, entity) for entity in entities)
+        return runner.map_ordered(lambda entity: build_record(self.qt, entity), entities)
+
+    def export(self, perspectives: List[str], consume: Callable[[str, Iterator[Dict]], None]) -> None:
+        """
+        Passes the records of each of the specified perspectives to the specified consumer.
+
+        :param perspectives: names of the perspectives
+        :param consume: consumer of the records of one perspective
+        """
+        if self.workers == 1:
+            for perspective in perspectives:
+                consume(perspective, self.records(perspective))
+            return
+        with KnowledgeSnapshotRunner(self.workers) as runner:
+            for perspective in perspectives:
+                consume(perspective, self.records(perspective, runner))
+
+    def write_jsonl(self, perspectives: List[str], out: TextIO) -> int:
+        """
+        Streams the records of the specified perspectives as JSON Lines (field "perspective" added to each record).
+
+        :param perspectives: names of the perspectives
+        :param out: stream to write to
+        :return: number of written records
+        """
+        num_of_records = 0
+
+        def consume(perspective: str, records: Iterator[Dict]) -> None:
+            nonlocal num_of_records
+            for record in records:
+                out.write(json.dumps({"perspective": perspective, **record}, ensure_ascii=False) + "\n")
+                num_of_records += 1
+
+        self.export(perspectives, consume)
+        return num_of_records
+
+    def write_columnar(self, perspectives: List[str], directory: str, file_format: str = "parquet") -> List[str]:
+        """
+        Writes the records of each of the specified perspectives to a columnar file (`<directory>/<perspective>.*`).
+
+        :param perspectives: names of the perspectives
+        :param directory: output directory
+        :param file_format: "parquet" | "arrow" (Arrow IPC / Feather v2, memory-mappable)
+        :return: paths of the written files
+        """
+        if file_format not in COLUMNAR_FORMATS:
+            raise ValueError("unknown columnar format: " + file_format)
+        pa = import_pyarrow()
+        import pyarrow.feather
+        import pyarrow.parquet
+        os.makedirs(directory, exist_ok=True)
+        paths = []
+
+        def consume(perspective: str, records: Iterator[Dict]) -> None:
+            table = pa.Table.from_pylist(list(records), schema=arrow_schema(perspective))
+            path = os.path.join(directory, perspective + COLUMNAR_FORMATS[file_format])
+            if file_format == "parquet":
+                pyarrow.parquet.write_table(table, path)
+            else:
+                pyarrow.feather.write_feather(table, path, compression="uncompressed")
+            paths.append(path)
+
+        self.export(perspectives, consume)
+        return paths
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Machine-readable knowledge snapshot (JSON Lines / Parquet / Arrow)')
+    parser.add_argument(
+        '--format', type=str, choices=['jsonl'] + list(COLUMNAR_FORMATS.keys()), default='jsonl', required=False,
+        help='jsonl: one JSON object per entity (streamed), parquet / arrow: one columnar file per perspective'
+    )
+    parser.add_argument(
+        '--output', type=str, default=None, required=False,
+        help='output file (jsonl, default: stdout) or output directory (parquet / arrow, required)'
+    )
+    parser.add_argument(
+        '--perspective', type=str, choices=list(PERSPECTIVE_GROUPS.keys()) + list(RECORDS.keys()), default='all',
+        required=False, help='perspective group [expert | diag | all] or single perspective, e.g., dtc'
+    )
+    parser.add_argument(
+        '--kg_url', type=str, default=FUSEKI_URL, required=False,
+        help='URL of the KG server or embedded KG file, e.g., file://<backup>.nt.gz'
+    )
+    parser.add_argument(
+        '--mode', type=str, choices=['index', 'query'], default='index', required=False,
+        help='index: fetch the KG in one N-Triples dump and answer from an in-memory index (deterministic order), '
+             'query: one SPARQL query per entity and attribute'
+    )
+    parser.add_argument(
+        '--workers', type=int, default=SNAPSHOT_WORKERS, required=False,
+        help='max number of records assembled concurrently (1: sequential)'
+    )
+    args = parser.parse_args()
+    selected = PERSPECTIVE_GROUPS.get(args.perspective, [args.perspective])
+    query_tool = IndexedQueryTool(kg_url=args.kg_url) if args.mode == 'index' \
+        else KnowledgeGraphQueryTool(kg_url=args.kg_url)
+    exporter = SnapshotExporter(query_tool, args.workers)
+    start = time.perf_counter()
+    if args.format == 'jsonl':
+        if args.output is None:
+            num = exporter.write_jsonl(selected, sys.stdout)
+        else:
+            with open(args.output, "w", encoding="utf-8") as f:
+                num = exporter.write_jsonl(selected, f)
+        logger.info("%d records exported in %.2f s", num, time.perf_counter() - start)
+    else:
+        if args.output is None:
+            parser.error("--output (directory) is required for the columnar formats")
+        for file_path in exporter.write_columnar(selected, args.output, args.format):
+            logger.info("written: %s", file_path)
+        logger.info("export took %.2f s", time.perf_counter() - start)
@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# @author Tim Bohne
+
+import re
+from typing import Any, Dict, Iterable, List, Union
+
+from obd_ontology.config import ONTOLOGY_PREFIX
+from obd_ontology.sparql_terms import sparql_iri, sparql_literal
+
+# string literals and IRIs are kept as they are, `$name` is a parameter, `:Name` an ontology term
+TEMPLATE_TOKEN = re.compile(r'("(?:[^"\\\n]|\\.)*"|<[^<>"{}|^`\\\s]*>)|\$([A-Za-z_]\w*)|(?<![\w:?$]):([A-Za-z_]\w*)')
+
+
+class BoundQuery(str):
+    """
+    SPARQL query bound from a template - the plain query string, additionally carrying the name of the template and
+    the parameter values (e.g., for the per-query metrics of the connection controller).
+    """
+
+    name: Union[str, None]
+    params: Dict[str, Any]
+
+
+class SparqlTemplate:
+    """
+    SPARQL query defined once with named parameters, prepared when the template is created (i.e., at import time for
+    the query catalogue) and bound to escaped parameter values per call.
+
+    Template syntax:
+        - `:Name` - ontology term, e.g., `:SuspectComponent` (expanded to the full IRI when the template is prepared)
+        - `$name` - parameter, bound as literal (typed according to the Python value, strings as plain literals),
+                    as ontology instance IRI for the parameters listed in `instance_params`, as space-separated terms
+                    for lists / tuples (e.g., in `VALUES` clauses) and as `UNDEF` for `None`
+
+    Preparing the template splits the query into static segments (including the expanded ontology terms) and parameter
+    slots, so that binding is a plain concatenation of the static segments and the serialized parameter values. Since
+    the values are serialized as SPARQL terms, quotes, backslashes, line breaks, etc. cannot alter the query.
+    """
+
+    def __init__(
+            self, text: str, instance_params: Iterable[str] = (), namespace: str = ONTOLOGY_PREFIX,
+            name: Union[str, None] = None
+    ) -> None:
+        """
+        Prepares the SPARQL template.
+
+        :param text: template text
+        :param instance_params: names of the parameters referring to ontology instances (bound as IRIs)
+        :param namespace: ontology namespace used for `:Name` terms and instance parameters
+        :param name: name of the query, e.g., "SYMPTOMS_BY_DTC" (set for all templates of the query catalogue)
+        """
+        self.text = text
+        self.name = name
+        self.namespace = namespace
+        self.instance_params = frozenset(instance_params)
+        # static segments, the parameter slot `i` is located between segments `i` and `i + 1`
+        self.segments: List[str] = []
+        self.slots: List[str] = []
+        segment = []
+        pos = 0
+        for match in TEMPLATE_TOKEN.finditer(text):
+            segment.append(text[pos:match.start()])
+            pos = match.end()
+            verbatim, param, term = match.groups()
+            if verbatim is not None:
+                segment.append(verbatim)
+            elif term is not None:
+                segment.append(sparql_iri(namespace + term))
+            else:
+                self.segments.append("".join(segment))
+                self.slots.append(param)
+                segment = []
+        segment.append(text[pos:])
+        self.segments.append("".join(segment))
+        self.params = frozenset(self.slots)
+        if not self.instance_params <= self.params:
+            raise ValueError("unknown instance parameters: " + str(sorted(self.instance_params - self.params)))
+
+    def serialize_value(self, param: str, value: Any) -> str:
+        """
+        Serializes the specified parameter value as SPARQL term(s).
+
+        :param param: name of the parameter
+        :param value: value to be serialized
+        :return: SPARQL term(s)
+        """
+        if value is None:
+            return "UNDEF"
+        if isinstance(value, (list, tuple)):
+            return " ".join(self.serialize_value(param, val) for val in value)
+        if param in self.instance_params:
+            return sparql_iri(self.namespace + value)
+        return sparql_literal(value)
+
+    def bind(self, **values: Any) -> BoundQuery:
+        """
+        Binds the template parameters to the specified values.
+
+        :param values: value for each parameter of the template
+        :return: SPARQL query (string carrying the template name and the parameter values)
+        """
+        if values.keys() != self.params:
+            raise TypeError("template parameters " + str(sorted(self.params)) + " - got " + str(sorted(values)))
+        serialized = {param: self.serialize_value(param, value) for param, value in values.items()}
+        parts = [self.segments[0]]
+        for param, segment in zip(self.slots, self.segments[1:]):
+            parts.append(serialized[param])
+            parts.append(segment)
+        query = BoundQuery("".join(parts))
+        query.name = self.name
+        query.params = values
+        return query
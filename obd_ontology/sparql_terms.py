@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# @author Tim Bohne
+
+import re
+from typing import Any
+
+from rdflib import Literal, URIRef
+
+from obd_ontology.ntriples import escape_string, serialize_rdflib_literal
+
+# characters that must not occur in a SPARQL IRIREF
+INVALID_IRI_CHARS = re.compile(r'[<>"{}|^`\\\x00-\x20]')
+
+
+def sparql_iri(iri: str) -> str:
+    """
+    Creates the SPARQL term for the specified IRI, i.e., the IRI can be bound directly in a triple pattern instead of
+    filtering on its string value.
+
+    :param iri: IRI to create term for
+    :return: SPARQL IRI term
+    """
+    if INVALID_IRI_CHARS.search(iri):
+        raise ValueError("invalid IRI: " + repr(iri))
+    return "<" + iri + ">"
+
+
+def sparql_literal(value: Any, datatype: str = None, lang: str = None) -> str:
+    """
+    Creates the (escaped) SPARQL term for the specified literal value, i.e., the literal can be bound directly in a
+    triple pattern instead of matching `FILTER(STR(?var) = "...")`. Bound literals are resolved via the store's
+    indexes, whereas the filter requires enumerating all candidates first.
+
+    Without explicit datatype or language tag, the datatype corresponds to the Python type exactly as for the facts
+    entered into the KG, e.g., strings are plain literals, integers are xsd:integer and booleans xsd:boolean.
+
+    :param value: literal value
+    :param datatype: optional datatype IRI, e.g., `http://www.w3.org/2001/XMLSchema#string`
+    :param lang: optional language tag (only for strings)
+    :return: SPARQL literal term
+    """
+    if isinstance(value, str) and datatype is None and lang is None:
+        # plain literal - by far the most common case, no need for the rdflib round trip
+        return "\"" + escape_string(value) + "\""
+    lit = Literal(value, lang=lang, datatype=None if datatype is None else URIRef(datatype))
+    if lit.language is not None and not re.fullmatch(r"[a-zA-Z]+(-[a-zA-Z0-9]+)*", lit.language):
+        raise ValueError("invalid language tag: " + repr(lang))
+    if lit.datatype is not None:
+        sparql_iri(str(lit.datatype))
+    return serialize_rdflib_literal(lit)
@@ -31,6 +31,15 @@ setup(
     ],
     python_requires='>=3.7, <3.11',
     install_requires=required,
+    extras_require={
+        # embedded KG stores evaluated by Oxigraph (rdflib otherwise)
+        'oxigraph': ['pyoxigraph'],
+        # columnar snapshot export (Parquet / Arrow)
+        'export': ['pyarrow'],
+        # zstd compressed KG backups
+        'zstd': ['zstandard'],
+        'all': ['pyoxigraph', 'pyarrow', 'zstandard'],
+    },
     packages=find_packages(),
     include_package_data=True,
 )
@@ -0,0 +1,45 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# @author Tim Bohne
+
+import os
+
+import numpy as np
+import pytest
+
+from obd_ontology.array_codec import ARRAY_ENCODINGS, TruncatedArrayError, decode_array, encode_array, encode_arrays
+from obd_ontology.knowledge_graph_query_tool import KnowledgeGraphQueryTool
+
+TIME_SERIES = [13.3, 13.6, 14.6, 16.7, 8.5, 9.7, 5.5, 3.6, 12.5, 12.7]
+# legacy time series stored as (truncated) pandas Series representation
+LEGACY_BACKUP = "file://" + os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "knowledge_base/live_kg_backups/backup_2025_03_04-15_05_07.nt.gz"
+)
+
+
+@pytest.mark.parametrize("encoding", ARRAY_ENCODINGS)
+@pytest.mark.parametrize("compress", [False, True])
+def test_round_trip(encoding, compress):
+    decoded = decode_array(encode_array(TIME_SERIES, encoding, compress))
+    np.testing.assert_allclose(decoded, TIME_SERIES, rtol=1e-3)
+    rows = encode_arrays(np.array([TIME_SERIES, TIME_SERIES[::-1]]), encoding, compress)
+    np.testing.assert_allclose(decode_array(rows[1]), TIME_SERIES[::-1], rtol=1e-3)
+
+
+def test_empty_text_literal():
+    assert decode_array("[]").size == 0
+
+
+def test_complete_pandas_series_literal():
+    decoded = decode_array("0    13.3\n1    13.6\n2    14.6\nName: Kanal A, dtype: float64")
+    np.testing.assert_array_equal(decoded, [13.3, 13.6, 14.6])
+
+
+def test_truncated_pandas_series_literals_of_legacy_backup():
+    qt = KnowledgeGraphQueryTool(kg_url=LEGACY_BACKUP)
+    oscillograms = qt.query_all_recorded_oscillograms(False)
+    assert len(oscillograms) > 0
+    for osci in oscillograms:
+        with pytest.raises(TruncatedArrayError, match="only contains 10 of 42676 values"):
+            qt.query_time_series_array_by_oscillogram_instance(osci.split("#")[-1], False)
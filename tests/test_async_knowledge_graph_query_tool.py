@@ -0,0 +1,24 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# @author Tim Bohne
+
+import asyncio
+
+from obd_ontology.async_knowledge_graph_query_tool import AsyncKnowledgeGraphQueryTool
+from obd_ontology.ontology_instance_generator import OntologyInstanceGenerator
+
+
+def test_concurrent_queries_match_sync_tool():
+    kg_url = "memory://test_async_query_tool"
+    instance_gen = OntologyInstanceGenerator(kg_url=kg_url)
+    osci_set = instance_gen.extend_knowledge_graph_with_parallel_rec_osci_set()
+    oscis = [instance_gen.extend_knowledge_graph_with_oscillogram([float(i)] * 3, osci_set) for i in range(4)]
+
+    async def query() -> list:
+        async_qt = AsyncKnowledgeGraphQueryTool(kg_url=kg_url, max_concurrency=2)
+        try:
+            return await asyncio.gather(*[async_qt.query_time_series_by_oscillogram_instance(o, False) for o in oscis])
+        finally:
+            async_qt.close()
+
+    assert asyncio.run(query()) == [[str([float(i)] * 3)] for i in range(4)]
@@ -0,0 +1,28 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# @author Tim Bohne
+
+import numpy as np
+
+from obd_ontology.blob_store import BlobStore, load_array
+from obd_ontology.knowledge_graph_query_tool import KnowledgeGraphQueryTool
+from obd_ontology.ontology_instance_generator import OntologyInstanceGenerator
+
+
+def test_arrays_are_content_addressed(tmp_path):
+    store = BlobStore(str(tmp_path))
+    ref = store.put([13.3, 13.6, 14.6], dtype="<f4")
+    assert store.put(np.array([13.3, 13.6, 14.6]), dtype="<f4") == ref
+    assert ref.endswith(";dtype=<f4;length=3")
+    np.testing.assert_allclose(load_array(ref, store), [13.3, 13.6, 14.6], rtol=1e-6)
+
+
+def test_heatmap_shape_is_kept(tmp_path):
+    heatmap = np.arange(12, dtype=float).reshape(3, 4)
+    store = BlobStore(str(tmp_path))
+    assert store.put(heatmap) != store.put(heatmap.ravel())
+    kg_url = "memory://test_blob_store_heatmap"
+    instance_gen = OntologyInstanceGenerator(kg_url=kg_url, array_encoding="float32", blob_dir=str(tmp_path))
+    heatmap_id = instance_gen.extend_knowledge_graph_with_heatmap("GradCAM", heatmap)
+    qt = KnowledgeGraphQueryTool(kg_url=kg_url, blob_dir=str(tmp_path))
+    np.testing.assert_array_equal(qt.query_heatmap_array_by_heatmap(heatmap_id, False)[0], heatmap)
@@ -0,0 +1,28 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# @author Tim Bohne
+
+import pytest
+
+from obd_ontology.config import ONTOLOGY_PREFIX
+from obd_ontology.connection_controller import ConnectionController
+from obd_ontology.expert_knowledge_enhancer import ExpertKnowledgeEnhancer
+
+
+def test_bulk_import():
+    enhancer = ExpertKnowledgeEnhancer(kg_url="memory://test_bulk_import")
+    stats = enhancer.bulk_import(channels=["chan0", "chan1"])
+    assert (stats["entities"], stats["facts"], stats["requests"]) == (2, 4, 1)
+    channels = enhancer.knowledge_graph_query_tool.query_all_channel_instances(False)
+    assert sorted(name for _, name in channels) == ["chan0", "chan1"]
+
+
+def test_bulk_import_reports_failed_chunks(flaky_server):
+    enhancer = ExpertKnowledgeEnhancer(kg_url="memory://test_bulk_import_failure")
+    # name resolution against the embedded KG, upload to a server failing the first request
+    enhancer.fuseki_connection = ConnectionController(
+        namespace=ONTOLOGY_PREFIX, fuseki_url="http://127.0.0.1:%d" % flaky_server.server_address[1]
+    )
+    with pytest.raises(RuntimeError, match="1 of 1 chunks not entered.*503"):
+        enhancer.bulk_import(channels=["chan0"])
+    assert enhancer.instance_resolver.resolved["Channel"] == {}
@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# @author Tim Bohne
+
+import pytest
+
+from obd_ontology.config import ONTOLOGY_PREFIX
+from obd_ontology.connection_controller import ConnectionController
+from obd_ontology.fact import Fact
+from obd_ontology.fact_buffer import FactBuffer
+from obd_ontology.ontology_instance_generator import OntologyInstanceGenerator
+
+FACTS = [Fact(("vehicle_%d" % i, "hasVIN", "VIN%d" % i), property_fact=True) for i in range(5)]
+
+
+def count_facts(kg_url: str) -> int:
+    connection = ConnectionController(namespace=ONTOLOGY_PREFIX, fuseki_url=kg_url)
+    return int(connection.query_knowledge_graph("SELECT (COUNT(*) AS ?n) WHERE { ?s ?p ?o }", False)[0]["n"]["value"])
+
+
+def test_facts_are_only_visible_after_flush():
+    kg_url = "memory://test_fact_buffer_flush"
+    fact_buffer = FactBuffer(ConnectionController(namespace=ONTOLOGY_PREFIX, fuseki_url=kg_url), flush_interval=None)
+    fact_buffer.extend_knowledge_graph(FACTS)
+    assert len(fact_buffer) == len(FACTS) and count_facts(kg_url) == 0
+    fact_buffer.flush()
+    assert len(fact_buffer) == 0 and count_facts(kg_url) == len(FACTS)
+
+
+def test_rollback_discards_buffered_facts():
+    kg_url = "memory://test_fact_buffer_rollback"
+    fact_buffer = FactBuffer(ConnectionController(namespace=ONTOLOGY_PREFIX, fuseki_url=kg_url), flush_interval=None)
+    fact_buffer.extend_knowledge_graph(FACTS)
+    assert fact_buffer.close(commit=False) == []
+    assert count_facts(kg_url) == 0
+
+
+def test_size_triggered_background_flush():
+    kg_url = "memory://test_fact_buffer_background"
+    fact_buffer = FactBuffer(
+        ConnectionController(namespace=ONTOLOGY_PREFIX, fuseki_url=kg_url), flush_size=len(FACTS), flush_interval=60
+    )
+    fact_buffer.extend_knowledge_graph(FACTS)
+    fact_buffer.close(commit=True)
+    assert fact_buffer.num_of_flushed_facts == len(FACTS) and count_facts(kg_url) == len(FACTS)
+
+
+def test_failed_commit_keeps_session(flaky_server):
+    instance_gen = OntologyInstanceGenerator(kg_url="http://127.0.0.1:%d" % flaky_server.server_address[1])
+    instance_gen.begin_session(flush_size=None, flush_interval=None)
+    instance_gen.fact_buffer.extend_knowledge_graph(FACTS)
+    with pytest.raises(RuntimeError, match="503"):
+        instance_gen.commit_session()
+    assert len(instance_gen.fact_buffer) == len(FACTS)
+    assert instance_gen.commit_session() == [200]
+    assert instance_gen.fact_buffer is None
+    assert len(flaky_server.requests) == 2 and flaky_server.requests[0] == flaky_server.requests[1]
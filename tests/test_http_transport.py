@@ -0,0 +1,28 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# @author Tim Bohne
+
+from http.server import ThreadingHTTPServer
+
+from obd_ontology.http_transport import PooledTransport
+
+
+def create_transport(server: ThreadingHTTPServer) -> PooledTransport:
+    return PooledTransport("http://127.0.0.1:%d" % server.server_address[1], max_retries=2, backoff_factor=0)
+
+
+def test_read_only_post_is_retried_on_temporary_server_error(flaky_server):
+    transport = create_transport(flaky_server)
+    res = transport.post("/OBD/sparql", b"ASK {}", headers={}, read_only=True)
+    transport.close()
+    assert res.status_code == 200
+    assert [body for _, body in flaky_server.requests] == [b"ASK {}", b"ASK {}"]
+
+
+def test_modifying_post_is_not_resent_after_server_error(flaky_server):
+    transport = create_transport(flaky_server)
+    chunks = (chunk for chunk in [b"_:b0 <http://ex.org/p> <http://ex.org/o> .\n"])
+    res = transport.post("/OBD/data", chunks, headers={"Content-Type": "application/n-triples"})
+    transport.close()
+    assert res.status_code == 503
+    assert [body for _, body in flaky_server.requests] == [b"_:b0 <http://ex.org/p> <http://ex.org/o> .\n"]
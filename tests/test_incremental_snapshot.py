@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# @author Tim Bohne
+
+import os
+import shutil
+
+import pytest
+from rdflib import Namespace, RDF
+
+from obd_ontology.config import ONTOLOGY_PREFIX
+from obd_ontology.connection_controller import ConnectionController
+from obd_ontology.fact import Fact
+from obd_ontology.incremental_snapshot import IncrementalSnapshot
+
+ONTO = Namespace(ONTOLOGY_PREFIX)
+BACKUP = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "knowledge_base/live_kg_backups/backup_2025_03_04-15_05_07.nt.gz"
+)
+
+
+def generate(kg_url: str, output_path: str, previous_path: str = None) -> int:
+    """
+    Generates the snapshot and returns the number of rendered (not reused) sections.
+    """
+    snapshot = IncrementalSnapshot(kg_url=kg_url)
+    render_section = snapshot.render_section
+    rendered = []
+
+    def count_rendered(print_section, entity):
+        rendered.append(entity)
+        return render_section(print_section, entity)
+
+    snapshot.render_section = count_rendered
+    snapshot.generate(output_path, "all", previous_path)
+    return len(rendered)
+
+
+def read(path) -> bytes:
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def test_incremental_snapshot_matches_full_snapshot(tmp_path):
+    kg_path = tmp_path / "kg.nt.gz"
+    shutil.copyfile(BACKUP, kg_path)
+    kg_url = "file://" + str(kg_path)
+    num_of_sections = generate(kg_url, str(tmp_path / "full_0.txt"))
+    assert num_of_sections > 0
+
+    # unchanged KG - every section is reused
+    assert generate(kg_url, str(tmp_path / "incremental_0.txt"), str(tmp_path / "full_0.txt")) == 0
+    assert read(tmp_path / "incremental_0.txt") == read(tmp_path / "full_0.txt")
+
+    ConnectionController(namespace=ONTOLOGY_PREFIX, fuseki_url=kg_url).extend_knowledge_graph([
+        Fact(("channel_test", RDF.type, ONTO["Channel"].toPython())),
+        Fact(("channel_test", ONTO.channel_name, "Kanal Z"), property_fact=True)
+    ])
+    num_of_rendered = generate(kg_url, str(tmp_path / "incremental_1.txt"), str(tmp_path / "full_0.txt"))
+    assert 0 < num_of_rendered < num_of_sections
+    generate(kg_url, str(tmp_path / "full_1.txt"))
+    assert read(tmp_path / "incremental_1.txt") == read(tmp_path / "full_1.txt")
+    assert b"Kanal Z" in read(tmp_path / "full_1.txt")
+
+
+def test_dataset_is_passed_to_backend():
+    # datasets only exist on KG servers - the selection must not be silently ignored
+    with pytest.raises(ValueError, match="datasets"):
+        IncrementalSnapshot(kg_url="memory://test_incremental_snapshot_dataset", dataset="OBD")
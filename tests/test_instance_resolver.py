@@ -0,0 +1,56 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# @author Tim Bohne
+
+import pytest
+from rdflib import Namespace, RDF
+
+from obd_ontology.config import ONTOLOGY_PREFIX
+from obd_ontology.connection_controller import ConnectionController
+from obd_ontology.fact import Fact
+from obd_ontology.instance_resolver import InstanceResolver
+
+ONTO = Namespace(ONTOLOGY_PREFIX)
+NAMES = ["Batterie", 'Lambdasonde "vorne"', "Ladedruck\\Regelung"]
+
+
+def add_component(connection: ConnectionController, comp_id: str, name: str) -> None:
+    connection.extend_knowledge_graph([
+        Fact((comp_id, RDF.type, ONTO["SuspectComponent"].toPython())),
+        Fact((comp_id, ONTO.component_name, name), property_fact=True)
+    ])
+
+
+@pytest.fixture
+def kg_url(request):
+    kg_url = "memory://" + request.node.name
+    connection = ConnectionController(namespace=ONTOLOGY_PREFIX, fuseki_url=kg_url)
+    for idx, name in enumerate(NAMES):
+        add_component(connection, "comp_%d" % idx, name)
+    return kg_url
+
+
+def test_batched_resolution(kg_url):
+    resolver = InstanceResolver(kg_url=kg_url, batch_size=2)
+    res = resolver.resolve("SuspectComponent", NAMES + ["unknown", NAMES[0]])
+    assert res == {**{name: ["comp_%d" % idx] for idx, name in enumerate(NAMES)}, "unknown": []}
+    assert resolver.get_id("Channel", "Batterie") is None
+    with pytest.raises(ValueError):
+        resolver.resolve("Vehicle", ["x"])
+
+
+def test_resolutions_are_memoized_until_cleared(kg_url):
+    resolver = InstanceResolver(kg_url=kg_url)
+    assert resolver.get_ids("SuspectComponent", "Anlasser") == []
+    add_component(ConnectionController(namespace=ONTOLOGY_PREFIX, fuseki_url=kg_url), "comp_new", "Anlasser")
+    assert resolver.get_ids("SuspectComponent", "Anlasser") == []
+    resolver.clear()
+    assert resolver.get_ids("SuspectComponent", "Anlasser") == ["comp_new"]
+
+
+def test_registered_instances_are_resolved_within_batch(kg_url):
+    resolver = InstanceResolver(kg_url=kg_url)
+    resolver.register("SuspectComponent", "Anlasser", "comp_batch")
+    resolver.register("SuspectComponent", "Batterie", "comp_batch_2")
+    assert resolver.get_id("SuspectComponent", "Anlasser") == "comp_batch"
+    assert resolver.get_ids("SuspectComponent", "Batterie") == ["comp_0", "comp_batch_2"]
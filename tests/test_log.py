@@ -0,0 +1,18 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# @author Tim Bohne
+
+import os
+import subprocess
+import sys
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_log_output_is_kept_off_stdout():
+    # fresh process - the package handler is bound to the streams of the process when the package is imported
+    code = "from obd_ontology.log import get_logger; get_logger('test').warning('HTTP status code: %s', 503)"
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join([REPO_DIR, os.environ.get("PYTHONPATH", "")])}
+    res = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, env=env, check=True)
+    assert res.stdout == ""
+    assert "HTTP status code: 503" in res.stderr
@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# @author Tim Bohne
+
+import pytest
+from rdflib import Graph, Literal
+
+from obd_ontology.config import ONTOLOGY_PREFIX
+from obd_ontology.connection_controller import ConnectionController
+from obd_ontology.fact import Fact
+from obd_ontology.ntriples import NTriplesStream, canonicalize_ntriples_line, parse_ntriples, serialize_literal
+
+VALUES = ['plain', 'quote " and backslash \\', 'line\nbreak\r\ttab', 'umlaut äöü', True, False, 42, 1.5]
+
+
+@pytest.mark.parametrize("value", VALUES)
+def test_literal_serialization_matches_rdflib(value):
+    statement = '<http://ex.org/s> <http://ex.org/p> ' + serialize_literal(value) + ' .\n'
+    graph = Graph().parse(data=statement, format="nt")
+    assert list(graph.objects()) == [Literal(value)]
+
+
+@pytest.mark.parametrize("value", [v for v in VALUES if isinstance(v, str)])
+def test_parse_round_trip(value):
+    statement = '<http://ex.org/s> <http://ex.org/p> ' + serialize_literal(value) + ' .\n'
+    # chunk boundaries in the middle of the statement
+    chunks = [statement.encode()[i:i + 7] for i in range(0, len(statement.encode()), 7)]
+    assert list(parse_ntriples(chunks)) == [("http://ex.org/s", "http://ex.org/p", value, True)]
+
+
+def test_canonicalization():
+    assert canonicalize_ntriples_line('  <http://ex.org/s>   <http://ex.org/p>\t"a  b"@en  .  ') \
+        == '<http://ex.org/s> <http://ex.org/p> "a  b"@en .'
+    assert canonicalize_ntriples_line("# comment") is None
+    with pytest.raises(ValueError):
+        canonicalize_ntriples_line("<http://ex.org/s> <http://ex.org/p>")
+
+
+def test_stream_is_re_iterable():
+    stream = NTriplesStream(list(range(100)), lambda i: '<http://ex.org/s> <http://ex.org/p> "%d" .' % i, 256)
+    first = list(stream)
+    assert len(first) > 1 and all(chunk.endswith(b"\n") for chunk in first)
+    assert list(stream) == first
+    assert len(list(parse_ntriples(first))) == 100
+
+
+def test_chunks_only_deduplicate_within_each_chunk():
+    connection = ConnectionController(namespace=ONTOLOGY_PREFIX, fuseki_url="memory://test_ntriples_chunks")
+    facts = [Fact(("vehicle_%d" % (i // 3), "hasVIN", "VIN%d" % (i // 3)), property_fact=True) for i in range(9)]
+    chunks = list(connection.serialize_in_chunks(facts, 2))
+    assert all(len(set(chunk)) == len(chunk) for chunk in chunks)
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    num_of_statements, status_codes = connection.extend_knowledge_graph_in_chunks(facts, 2)
+    assert set(status_codes) == {200}
+    res = connection.query_knowledge_graph("SELECT (COUNT(*) AS ?n) WHERE { ?s ?p ?o }", False)
+    assert res[0]["n"]["value"] == "3"
+
+
+def test_serialized_typed_literals_only_pass_through_for_deletions():
+    connection = ConnectionController(namespace=ONTOLOGY_PREFIX, fuseki_url="memory://test_ntriples_typed_literals")
+    typed = '"true"^^<http://www.w3.org/2001/XMLSchema#boolean>'
+    connection.extend_knowledge_graph([
+        Fact(("component_0", "hasName", '"x"^^<http://ex.org/t>'), property_fact=True),
+        Fact(("component_0", "use_oscilloscope", True), property_fact=True)
+    ])
+    query = "SELECT ?o WHERE { <%scomponent_0> <%s%s> ?o }"
+    res = connection.query_knowledge_graph(query % (ONTOLOGY_PREFIX, ONTOLOGY_PREFIX, "hasName"), False)
+    assert res[0]["o"]["value"] == '"x"^^<http://ex.org/t>' and "datatype" not in res[0]["o"]
+    connection.remove_outdated_facts_from_knowledge_graph(
+        [Fact(("component_0", "use_oscilloscope", typed), property_fact=True)]
+    )
+    assert connection.query_knowledge_graph(query % (ONTOLOGY_PREFIX, ONTOLOGY_PREFIX, "use_oscilloscope"), False) == []
@@ -0,0 +1,52 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# @author Tim Bohne
+
+from obd_ontology.config import ONTOLOGY_PREFIX
+from obd_ontology.connection_controller import ConnectionController
+from obd_ontology.fact import Fact
+from obd_ontology.query_cache import QueryCache
+
+RESULT = [{"s": {"type": "uri", "value": "http://ex.org/a"}}]
+
+
+def test_queries_are_normalized_outside_of_literals():
+    cache = QueryCache()
+    cache.put('SELECT ?s WHERE {\n  ?s ?p "a  b" }', RESULT, 10, cache.generation())
+    assert cache.get('SELECT ?s   WHERE { ?s ?p "a  b" }') is RESULT
+    assert cache.get('SELECT ?s WHERE { ?s ?p "a b" }') is None
+
+
+def test_eviction_by_entries_and_bytes():
+    cache = QueryCache(max_entries=2, max_bytes=100, ttl=None)
+    for i in range(3):
+        cache.put("q%d" % i, RESULT, 10, cache.generation())
+    assert cache.get("q0") is None and cache.get("q2") is RESULT
+    cache.put("large", RESULT, 101, cache.generation())
+    assert cache.get("large") is None
+    assert cache.stats()["evictions"] == 1
+
+
+def test_ttl_expiry():
+    cache = QueryCache(ttl=-1)
+    cache.put("q", RESULT, 10, cache.generation())
+    assert cache.get("q") is None
+
+
+def test_result_of_query_started_before_invalidation_is_dropped():
+    cache = QueryCache()
+    generation = cache.generation()
+    cache.invalidate()
+    cache.put("q", RESULT, 10, generation)
+    assert cache.get("q") is None
+    cache.put("q", RESULT, 10, cache.generation())
+    assert cache.get("q") is RESULT
+
+
+def test_kg_extension_invalidates_cached_results():
+    kg_url = "memory://test_query_cache"
+    connection = ConnectionController(namespace=ONTOLOGY_PREFIX, fuseki_url=kg_url, use_cache=True)
+    query = "SELECT ?o WHERE { ?s ?p ?o }"
+    assert connection.query_knowledge_graph(query, False) == []
+    connection.extend_knowledge_graph([Fact(("vehicle_0", "hasVIN", "VIN0"), property_fact=True)])
+    assert len(connection.query_knowledge_graph(query, False)) == 1
@@ -0,0 +1,28 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# @author Tim Bohne
+
+from obd_ontology.query_metrics import QueryMetricsRegistry, configure_slow_query_logging, slow_query_logger
+
+
+def test_metrics_are_recorded_per_query_name():
+    registry = QueryMetricsRegistry(slow_query_threshold=None)
+    registry.record("DTC_PROFILE", {"dtc": "P0172"}, "SELECT ...", 0.2, 0.1, 100, 3, "miss")
+    registry.record("DTC_PROFILE", {"dtc": "P0172"}, "SELECT ...", 0.001, 0.0, 0, 3, "hit")
+    snapshot = registry.snapshot()
+    assert "DTC_PROFILE" in snapshot["queries"]
+    assert snapshot["slow_queries"] == []
+
+
+def test_slow_queries_are_logged_separately(tmp_path):
+    path = tmp_path / "slow_queries.log"
+    configure_slow_query_logging(str(path))
+    try:
+        registry = QueryMetricsRegistry(slow_query_threshold=0.5)
+        registry.record("DTC_PROFILE", {"dtc": "P0172"}, "SELECT ?x WHERE { ?x ?p ?o }", 0.8, 0.7, 100, 3, "miss")
+        assert not slow_query_logger.propagate
+    finally:
+        configure_slow_query_logging()
+    log = path.read_text(encoding="utf-8")
+    assert "slow query: DTC_PROFILE" in log and "SELECT ?x WHERE" in log
+    assert len(registry.snapshot()["slow_queries"]) == 1
@@ -0,0 +1,42 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# @author Tim Bohne
+
+import json
+
+import numpy as np
+import pytest
+
+from obd_ontology.knowledge_graph_index import IndexedQueryTool
+from obd_ontology.knowledge_graph_query_tool import KnowledgeGraphQueryTool
+from obd_ontology.ontology_instance_generator import OntologyInstanceGenerator
+from obd_ontology.snapshot_export import TIME_SERIES_EXCERPT_LENGTH, SnapshotExporter
+
+TIME_SERIES = np.linspace(0.0, 14.0, 200)
+
+
+@pytest.mark.parametrize("encoding, use_blob_store", [("text", False), ("float16", False), ("float32", True)])
+def test_time_series_excerpt_is_decoded(tmp_path, encoding, use_blob_store):
+    kg_url = "memory://test_snapshot_export_" + encoding
+    blob_dir = str(tmp_path) if use_blob_store else None
+    instance_gen = OntologyInstanceGenerator(kg_url=kg_url, array_encoding=encoding, blob_dir=blob_dir)
+    osci_set = instance_gen.extend_knowledge_graph_with_parallel_rec_osci_set()
+    instance_gen.extend_knowledge_graph_with_oscillogram(TIME_SERIES, osci_set)
+    for qt in (KnowledgeGraphQueryTool(kg_url=kg_url, blob_dir=blob_dir), IndexedQueryTool(kg_url, blob_dir=blob_dir)):
+        records = list(SnapshotExporter(qt).records("oscillogram"))
+        assert len(records) == 1
+        excerpt = records[0]["time_series_excerpt"]
+        np.testing.assert_allclose(excerpt, TIME_SERIES[:TIME_SERIES_EXCERPT_LENGTH], rtol=1e-3)
+        json.dumps(records[0])
+
+
+def test_columnar_export(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    kg_url = "memory://test_snapshot_export_columnar"
+    instance_gen = OntologyInstanceGenerator(kg_url=kg_url, array_encoding="float32")
+    osci_set = instance_gen.extend_knowledge_graph_with_parallel_rec_osci_set()
+    instance_gen.extend_knowledge_graph_with_oscillogram(TIME_SERIES, osci_set)
+    paths = SnapshotExporter(IndexedQueryTool(kg_url)).write_columnar(["oscillogram"], str(tmp_path))
+    table = pq.read_table(paths[0])
+    assert table.num_rows == 1
+    assert len(table.column("time_series_excerpt")[0].as_py()) == TIME_SERIES_EXCERPT_LENGTH